@@ -1,9 +1,16 @@
 import argparse
+import concurrent.futures
 import glob
+import importlib.util
+import io
 import json
+import multiprocessing
 import os
-import subprocess
+import re
+import shutil
 import sys
+import tarfile
+import time
 from warnings import warn
 
 import numpy as np
@@ -48,6 +55,58 @@ def _get_args():
         default="False",
     )
 
+    # only combine the new simulation cycles into an existing folder
+    arg_parser.add_argument(
+        "-a",
+        "--append",
+        help="bool (True, true, T, t, False, false, F, or f). Only reads the hybrid "
+        "NAMD/GOMC simulation cycles which are new since the data was last combined "
+        "in the folder, and appends them to the combined data files, using the "
+        "combine_manifest.json file in the folder. The combined dcd files are "
+        "also appended, and are only combined again from all the cycles if their "
+        "dcd variables change or the combine_dcd_files_max_frames limit is "
+        "exceeded.",
+        type=str,
+        default="False",
+    )
+
+    # the binary formats which the combined data tables are also written in
+    arg_parser.add_argument(
+        "-of",
+        "--output_formats",
+        help="str (npy, npz, hdf5, and/or parquet). The binary formats which the "
+        "combined data tables are also written in, in addition to the tab separated "
+        "text files. The npy format is a folder per table with a .npy file per column, "
+        "which can be loaded as a memory map. The hdf5 format requires the h5py "
+        "package, and the parquet format requires the pyarrow or fastparquet package.",
+        type=str,
+        nargs="+",
+        choices=["npy", "npz", "hdf5", "parquet"],
+        default=[],
+    )
+
+    # the float type of the binary combined data tables
+    arg_parser.add_argument(
+        "-ot",
+        "--output_float_type",
+        help="str (float64 or float32). The float type of the binary combined data "
+        "tables. The steps are always written as int64.",
+        type=str,
+        choices=["float64", "float32"],
+        default="float64",
+    )
+
+    # the number of worker processes used to read the log files
+    arg_parser.add_argument(
+        "-j",
+        "--jobs",
+        help="int (>=1). The number of worker processes used to read the NAMD and GOMC "
+        "log files from the individual simulation directories at the same time, "
+        "and to write the combined data tables.",
+        type=int,
+        default=1,
+    )
+
     parser_arguments = arg_parser.parse_args()
 
     # check to see if the file exists
@@ -79,6 +138,24 @@ def _get_args():
     else:
         raise TypeError("ERROR: -o or --overwrite flag is not a boolean.")
 
+    # set check if append is set to true, if not set to False
+    if parser_arguments.append in ["False", "false", "F", "f"]:
+        parser_arguments.append = False
+    elif parser_arguments.append in ["True", "true", "T", "t"]:
+        print(
+            "INFO: Only the new simulation cycles will be appended to the "
+            "combining folder."
+        )
+        parser_arguments.append = True
+    else:
+        raise TypeError("ERROR: -a or --append flag is not a boolean.")
+
+    if parser_arguments.overwrite is True and parser_arguments.append is True:
+        raise ValueError(
+            "ERROR: The -o or --overwrite flag and the -a or --append flag "
+            "can not both be True."
+        )
+
     # set check if the combining data file folder name is provided
     if isinstance(parser_arguments.write_folder_name, str) is True:
         print(
@@ -96,6 +173,7 @@ def _get_args():
     if (
         os.path.exists(parser_arguments.write_folder_name)
         and parser_arguments.overwrite is False
+        and parser_arguments.append is False
     ):
         raise IOError(
             "ERROR: The file folder <{}> already exists. If you want to overwrite it, set the "
@@ -112,10 +190,59 @@ def _get_args():
             "".format(parser_arguments.write_folder_name)
         )
 
+    # check that the binary output formats can be written
+    if "hdf5" in parser_arguments.output_formats and (
+        importlib.util.find_spec("h5py") is None
+    ):
+        raise ImportError(
+            "ERROR: The hdf5 output format requires the h5py package, "
+            "which is not installed."
+        )
+    if "parquet" in parser_arguments.output_formats and (
+        importlib.util.find_spec("pyarrow") is None
+        and importlib.util.find_spec("fastparquet") is None
+    ):
+        raise ImportError(
+            "ERROR: The parquet output format requires the pyarrow or "
+            "fastparquet package, which is not installed."
+        )
+    if len(parser_arguments.output_formats) > 0 and (
+        parser_arguments.append is True
+    ):
+        raise ValueError(
+            "ERROR: The -of or --output_formats flag can not be used with the "
+            "-a or --append flag, as the binary combined data tables are only "
+            "written when all the simulation cycles are combined."
+        )
+    if len(parser_arguments.output_formats) > 0:
+        print(
+            "INFO: The combined data tables will also be written in the {} "
+            "format(s) with the {} float type.".format(
+                parser_arguments.output_formats,
+                parser_arguments.output_float_type,
+            )
+        )
+
+    # check the number of worker processes
+    if parser_arguments.jobs < 1:
+        raise ValueError(
+            "ERROR: The -j or --jobs flag must be an integer greater than or "
+            "equal to 1."
+        )
+    print(
+        "INFO: The log files will be read with {} worker process(es).".format(
+            parser_arguments.jobs
+        )
+    )
+
     return [
         parser_arguments.file,
         parser_arguments.write_folder_name,
         parser_arguments.overwrite,
+        parser_arguments.append,
+        parser_arguments.output_formats,
+        parser_arguments.output_float_type,
+        parser_arguments.jobs,
     ]
 
 
@@ -124,14 +251,299 @@ def _get_args():
 # *************************************************
 
 
+# *************************************************
+# Read the NAMD and GOMC run folders and archives (start)
+# *************************************************
+# the finished NAMD and GOMC run folders may be packed into archives by the
+# run_NAMD_GOMC.py file (compact_cycles_block_size), which are read here
+# without extracting them
+run_archive_filename_regex = re.compile(
+    r"^archive_runs_(\d+)_(\d+)\.tar\.(gz|xz)$"
+)
+
+# the archives in each NAMD or GOMC folder, {folder: list of archive dicts},
+# and the last archive which a run file was read from, which is kept open
+# with its member index, so each archive is only indexed once when the runs
+# are read in order (the process id is the process which opened it)
+run_archive_list_dict = {}
+opened_run_archive_dict = {
+    "archive_filename": None,
+    "archive_file": None,
+    "member_info_dict": {},
+    "process_id": None,
+}
+
+
+def get_run_archive_list(path_engine_runs):
+    """
+    Gets the archives in the NAMD or GOMC folder, from the archive index,
+    which is the first file in each archive.  The archives are only
+    listed the first time for each folder.
+
+    Parameters
+    ----------
+    path_engine_runs : str
+        The main folder/directory in which the NAMD or GOMC individual
+        runs are stored.
+
+    Returns
+    ---------
+    run_archive_list : list of dict
+        The archives with the keys:
+        'archive_filename' (str, including the path),
+        'first_run_no' (int), 'last_run_no' (int),
+        'run_directory_list' (list of str, the run folders in the archive),
+        'member_set' (set of str, the run files in the archive, i.e.,
+        '0000000001/out.dat').
+    """
+    path_engine_runs_key = os.path.abspath(path_engine_runs)
+    if path_engine_runs_key not in run_archive_list_dict:
+        run_archive_list = []
+        for archive_filename_only in sorted(os.listdir(path_engine_runs)):
+            archive_filename_match = run_archive_filename_regex.match(
+                archive_filename_only
+            )
+            if archive_filename_match is None:
+                continue
+
+            archive_filename = "{}/{}".format(
+                path_engine_runs, archive_filename_only
+            )
+            with tarfile.open(archive_filename, "r|*") as archive_file:
+                archive_index_info = archive_file.next()
+                if (
+                    archive_index_info is None
+                    or archive_index_info.name != "archive_index.json"
+                ):
+                    raise ValueError(
+                        "ERROR: The archive <{}> does not start with the "
+                        "archive_index.json file, so it can not be read."
+                        "".format(archive_filename)
+                    )
+                archive_index = json.load(
+                    archive_file.extractfile(archive_index_info)
+                )
+
+            run_archive_list.append(
+                {
+                    "archive_filename": archive_filename,
+                    "first_run_no": int(archive_filename_match.group(1)),
+                    "last_run_no": int(archive_filename_match.group(2)),
+                    "run_directory_list": archive_index["run_directory_list"],
+                    "member_set": set(archive_index["member_list"]),
+                }
+            )
+        run_archive_list_dict[path_engine_runs_key] = run_archive_list
+
+    return run_archive_list_dict[path_engine_runs_key]
+
+
+def get_run_directory_list(path_engine_runs):
+    """
+    Gets the sorted NAMD or GOMC run folder names, which are the run folders
+    and the run folders packed into the archives.  A run folder which is
+    in both (i.e., the simulation was stopped before the packed folder was
+    deleted) is only listed once.
+
+    Parameters
+    ----------
+    path_engine_runs : str
+        The main folder/directory in which the NAMD or GOMC individual
+        runs are stored.
+
+    Returns
+    ---------
+    run_directory_list : list of str
+        The sorted run folder names.
+    """
+    run_directory_set = {
+        run_directory
+        for run_directory in os.listdir(path_engine_runs)
+        if run_archive_filename_regex.match(run_directory) is None
+        and not (
+            run_directory.startswith("archive_runs_")
+            and run_directory.endswith(".tmp")
+        )
+    }
+    for run_archive in get_run_archive_list(path_engine_runs):
+        run_directory_set.update(run_archive["run_directory_list"])
+
+    return sorted(run_directory_set)
+
+
+def get_archived_run_file_info(run_filename):
+    """
+    Gets a NAMD or GOMC run file from the archive it was packed into.
+    The archive is indexed (getmembers) when the first run file is read from
+    it, and is kept open until a run file is read from another archive, so
+    only the requested run files are extracted, and only while they are read.
+
+    Parameters
+    ----------
+    run_filename : str
+        The run filename, including the path (i.e., GOMC/0000000001/out.dat).
+
+    Returns
+    ---------
+    archive_file : tarfile.TarFile
+        The opened archive.
+    run_file_info : tarfile.TarInfo
+        The run file member of the archive.
+    """
+    run_directory = os.path.dirname(run_filename)
+    path_engine_runs = os.path.dirname(run_directory)
+    member_name = "{}/{}".format(
+        os.path.basename(run_directory), os.path.basename(run_filename)
+    )
+    for run_archive in get_run_archive_list(path_engine_runs):
+        if member_name in run_archive["member_set"]:
+            break
+    else:
+        raise FileNotFoundError(
+            "ERROR: The file <{}> is not in its run folder or in an "
+            "archive.".format(run_filename)
+        )
+
+    archive_filename = run_archive["archive_filename"]
+    # the forked worker processes open the archive again, since the file
+    # position of the archive opened by the parent process is shared
+    if (
+        opened_run_archive_dict["archive_filename"] != archive_filename
+        or opened_run_archive_dict["process_id"] != os.getpid()
+    ):
+        if opened_run_archive_dict["process_id"] == os.getpid():
+            opened_run_archive_dict["archive_file"].close()
+        archive_file = tarfile.open(archive_filename, "r:*")
+        opened_run_archive_dict.update(
+            {
+                "archive_filename": archive_filename,
+                "archive_file": archive_file,
+                "member_info_dict": {
+                    archive_member_info.name: archive_member_info
+                    for archive_member_info in archive_file.getmembers()
+                    if archive_member_info.isfile()
+                },
+                "process_id": os.getpid(),
+            }
+        )
+
+    return (
+        opened_run_archive_dict["archive_file"],
+        opened_run_archive_dict["member_info_dict"][member_name],
+    )
+
+
+def open_run_file(run_filename, mode="r"):
+    """
+    Opens a NAMD or GOMC run file for reading, from its run folder, or
+    from the archive it was packed into.
+
+    Parameters
+    ----------
+    run_filename : str
+        The run filename, including the path (i.e., GOMC/0000000001/out.dat).
+    mode : str ('r' or 'rb'), default='r'
+        The file mode, text or binary.
+
+    Returns
+    ---------
+    run_file : readable opened file
+        The opened run file.  The archived run files are extracted from
+        the archive while they are read.
+    """
+    if os.path.exists(run_filename):
+        return open(run_filename, mode)
+
+    archive_file, run_file_info = get_archived_run_file_info(run_filename)
+    run_file = archive_file.extractfile(run_file_info)
+    if "b" in mode:
+        return run_file
+    return io.TextIOWrapper(run_file)
+
+
+def get_run_file_size(run_filename):
+    """
+    Gets the size of a NAMD or GOMC run file, from its run folder, or
+    from the archive it was packed into.
+
+    Parameters
+    ----------
+    run_filename : str
+        The run filename, including the path.
+
+    Returns
+    ---------
+    int
+        The file size in bytes.
+    """
+    if os.path.exists(run_filename):
+        return os.path.getsize(run_filename)
+
+    return get_archived_run_file_info(run_filename)[1].size
+
+
+def get_run_filename_list(run_directory, filename_suffix):
+    """
+    Gets the sorted run filenames which end with the filename_suffix, from
+    the run folder, or from the archive it was packed into
+    (i.e., the same as glob.glob(run_directory/*filename_suffix)).
+
+    Parameters
+    ----------
+    run_directory : str
+        The run folder, including the path.
+    filename_suffix : str
+        The end of the filenames (i.e., 'dis1a.dat').
+
+    Returns
+    ---------
+    run_filename_list : list of str
+        The sorted run filenames, including the path.
+    """
+    if os.path.isdir(run_directory):
+        return sorted(
+            glob.glob("{}/*{}".format(run_directory, filename_suffix))
+        )
+
+    path_engine_runs = os.path.dirname(run_directory)
+    run_directory_name = os.path.basename(run_directory)
+    for run_archive in get_run_archive_list(path_engine_runs):
+        if run_directory_name in run_archive["run_directory_list"]:
+            return sorted(
+                "{}/{}".format(path_engine_runs, member_name)
+                for member_name in run_archive["member_set"]
+                if os.path.dirname(member_name) == run_directory_name
+                and member_name.endswith(filename_suffix)
+            )
+
+    return []
+
+
+# *************************************************
+# Read the NAMD and GOMC run folders and archives (end)
+# *************************************************
+
+
 # *************************************************
 # Import read and check the user input file for errors (start)
 # *************************************************
 # import and read the users json file
-[json_filename, write_folder_name, overwrite_folder] = _get_args()
+[
+    json_filename,
+    write_folder_name,
+    overwrite_folder,
+    append_folder,
+    output_format_list,
+    output_float_type,
+    jobs,
+] = _get_args()
 print("arg_parser.file = {}".format(json_filename))
 print("parser_arguments.write_folder_name = {}".format(write_folder_name))
 print("parser_arguments.overwrite = {}".format(overwrite_folder))
+print("parser_arguments.append = {}".format(append_folder))
+print("parser_arguments.output_formats = {}".format(output_format_list))
+print("parser_arguments.output_float_type = {}".format(output_float_type))
+print("parser_arguments.jobs = {}".format(jobs))
 
 json_file_data = json.load(open(json_filename))
 # json_file_data = json.load(open("user_input_combine_data_NAMD_GOMC.json"))
@@ -180,6 +592,12 @@ if simulation_engine_options not in ["Hybrid", "GOMC-only", "NAMD-only"]:
         "which are entered in the json file.\n"
     )
 
+if append_folder is True and simulation_engine_options != "Hybrid":
+    raise ValueError(
+        "The -a or --append flag can only be True for the Hybrid "
+        "simulation_engine_options.\n"
+    )
+
 # get the gomc_or_namd_only_log_filename variable from the json file
 if "gomc_or_namd_only_log_filename" not in json_file_data_keys_list:
     raise TypeError("The gomc_or_namd_only_log_filename key is not provided.\n")
@@ -224,6 +642,32 @@ else:
             "greater than or equal to zero (>=1.\n"
         )
 
+# get the combine_dcd_files_frame_stride variable from the json file (optional)
+combine_dcd_files_frame_stride = json_file_data.get(
+    "combine_dcd_files_frame_stride", 1
+)
+if (
+    not isinstance(combine_dcd_files_frame_stride, int)
+    or combine_dcd_files_frame_stride < 1
+):
+    raise TypeError(
+        "The combine_dcd_files_frame_stride values must be an integer "
+        "greater than or equal to one (>=1).\n"
+    )
+
+# get the combine_dcd_files_max_frames variable from the json file (optional)
+combine_dcd_files_max_frames = json_file_data.get(
+    "combine_dcd_files_max_frames", None
+)
+if combine_dcd_files_max_frames is not None and (
+    not isinstance(combine_dcd_files_max_frames, int)
+    or combine_dcd_files_max_frames < 1
+):
+    raise TypeError(
+        "The combine_dcd_files_max_frames values must be null or an integer "
+        "greater than or equal to one (>=1).\n"
+    )
+
 # get the get_initial_gomc_dcd variable from the json file
 if "get_initial_gomc_dcd" not in json_file_data_keys_list:
     raise TypeError("The get_initial_gomc_dcd key is not provided.\n")
@@ -233,22 +677,17 @@ if get_initial_gomc_dcd is not True and get_initial_gomc_dcd is not False:
         "The get_initial_gomc_dcd not true or false in the json file.\n"
     )
 
-# get the rel_path_to_combine_binary_catdcd variable from the json file
-if "rel_path_to_combine_binary_catdcd" not in json_file_data_keys_list:
-    raise TypeError(
-        "The rel_path_to_combine_binary_catdcd key is not provided.\n"
-    )
-rel_path_to_combine_binary_catdcd = json_file_data[
-    "rel_path_to_combine_binary_catdcd"
-]
-if not isinstance(rel_path_to_combine_binary_catdcd, str):
-    raise TypeError(
-        "The rel_path_to_combine_binary_catdcd must be entered as a string in the json file.\n"
+# the rel_path_to_combine_binary_catdcd variable is no longer used, since the
+# dcd files are combined in Python, but it is still allowed in the json file
+if "rel_path_to_combine_binary_catdcd" in json_file_data_keys_list:
+    warn(
+        "WARNING: The rel_path_to_combine_binary_catdcd variable is no longer "
+        "used, since the dcd files are combined without the catdcd program."
     )
 
 warn(
     "If the combining file fails without a set reason/error, please check the "
-    '"simulation_engine_options", "out.dat", and the "rel_path_to_combine_binary_catdcd" variables. '
+    '"simulation_engine_options" and "out.dat" variables. '
     "The user needs to ensure that these are proper paths and file types, since these variables "
     "are currently only checked to confirm they are strings."
 )
@@ -276,6 +715,23 @@ full_path_to_gomc_data_folder = (
 full_path_to_combined_data_folder = (
     python_file_directory + "/" + str(path_combined_data_folder)
 )
+
+# the manifest of the simulation cycles which are already in the combined data
+combine_manifest_filename = "{}/{}".format(
+    full_path_to_combined_data_folder, "combine_manifest.json"
+)
+if append_folder is True and not os.path.exists(combine_manifest_filename):
+    print(
+        "INFO: The combine manifest file <{}> does not exist, so all the "
+        "simulation cycles will be combined.".format(combine_manifest_filename)
+    )
+append_to_combined_data = append_folder is True and os.path.exists(
+    combine_manifest_filename
+)
+if append_to_combined_data is True:
+    combined_data_file_mode = "a"
+else:
+    combined_data_file_mode = "w"
 # *************************************************
 # create NAMD and GOMC folders (end)
 # *************************************************
@@ -291,8 +747,8 @@ if simulation_engine_options == "Hybrid":
     ):
         namd_directory_a_list = []
         namd_directory_b_list = []
-        total_namd_directory_list = sorted(
-            os.listdir(python_file_directory + "/" + str(path_namd_runs))
+        total_namd_directory_list = get_run_directory_list(
+            python_file_directory + "/" + str(path_namd_runs)
         )
         no_total_namd_directory_list = len(total_namd_directory_list)
         for i in range(0, len(total_namd_directory_list)):
@@ -316,8 +772,8 @@ if simulation_engine_options == "Hybrid":
 
     else:
         namd_directory_a_list = []
-        total_namd_directory_list = sorted(
-            os.listdir(python_file_directory + "/" + str(path_namd_runs))
+        total_namd_directory_list = get_run_directory_list(
+            python_file_directory + "/" + str(path_namd_runs)
         )
         no_total_namd_directory_list = len(total_namd_directory_list)
         for i in range(0, len(total_namd_directory_list)):
@@ -331,8 +787,8 @@ if simulation_engine_options == "Hybrid":
                 "WARNING: The total NAMD directories does not match the '..._a (NAMD liq box)' directories"
             )
 
-    gomc_directory_list = sorted(
-        os.listdir(python_file_directory + "/" + str(path_gomc_runs))
+    gomc_directory_list = get_run_directory_list(
+        python_file_directory + "/" + str(path_gomc_runs)
     )
     no_gomc_directory = len(gomc_directory_list)
 
@@ -356,9 +812,7 @@ if simulation_engine_options == "Hybrid":
         simulation_type in ["GEMC"]
         and only_use_box_0_for_namd_for_gemc is False
     ):
-        try:
-            namd_interation = str(namd_directory_b_list[namd_interation])
-        except:
+        if len(namd_directory_b_list) == 0:
             raise ValueError(
                 "Box 1 data does not exist for NAMD, maybe use "
                 "only_use_box_0_for_namd_for_gemc == True"
@@ -416,23 +870,34 @@ if simulation_engine_options in ["Hybrid", "GOMC-only"]:
             "GOMC_Energies_Stat_kcal_per_mol_box_1.txt",
         )
 
-    gomc_box_0_data_file = open(gomc_box_0_data_filename, "w")
+    gomc_box_0_data_file = open(
+        gomc_box_0_data_filename, combined_data_file_mode
+    )
     if simulation_type in ["GEMC"]:
-        gomc_box_1_data_file = open(gomc_box_1_data_filename, "w")
+        gomc_box_1_data_file = open(
+            gomc_box_1_data_filename, combined_data_file_mode
+        )
 
     gomc_box_0_hist_filename = "{}/{}".format(
         full_path_to_combined_data_folder, "GOMC_hist_data_box_0.txt"
     )
     if simulation_type in ["GCMC"]:
-        gomc_box_0_hist_file = open(gomc_box_0_hist_filename, "w")
+        # the hist files are copied as bytes, so it is a binary file
+        gomc_box_0_hist_file = open(
+            gomc_box_0_hist_filename, "{}b".format(combined_data_file_mode)
+        )
 
 if simulation_engine_options in ["Hybrid", "NAMD-only"]:
-    namd_box_0_data_file = open(namd_box_0_data_filename, "w")
+    namd_box_0_data_file = open(
+        namd_box_0_data_filename, combined_data_file_mode
+    )
     if (
         simulation_type in ["GEMC"]
         and only_use_box_0_for_namd_for_gemc is False
     ):
-        namd_box_1_data_file = open(namd_box_1_data_filename, "w")
+        namd_box_1_data_file = open(
+            namd_box_1_data_filename, combined_data_file_mode
+        )
         e_values_namd_box_1_density_list = []
 
 if simulation_engine_options in ["Hybrid"]:
@@ -456,13 +921,13 @@ combined_box_1_data_filename = "{}/{}".format(
 if simulation_engine_options in ["Hybrid"]:
     # starting point for the GOMC dist dicts for GCMC only
     if simulation_type in ["GCMC"]:
-        full_path_dist_files_only_run_0_list = glob.glob(
-            "{}/{}/{}/{}".format(
+        full_path_dist_files_only_run_0_list = get_run_filename_list(
+            "{}/{}/{}".format(
                 python_file_directory,
                 path_gomc_runs,
                 gomc_directory_list[0],
-                "*dis1a.dat",
-            )
+            ),
+            "dis1a.dat",
         )
 
         no_dist_files_only_run_0_list = len(
@@ -473,566 +938,2352 @@ if simulation_engine_options in ["Hybrid"]:
             dict_of_current_dist_dicts.update({i + 1: {}})
 
 
-def get_namd_log_data(
-    read_namd_box_x_log_file,
-    namd_box_x_data_file,
-    run_no,
-    e_values_namd_box_x_density_list=None,
-    e_titles_namd_box_x_iteration=None,
-    e_titles_namd_box_x_density_iteration=None,
-):
+def get_log_value_array(log_value_line_list, label_length, error_message):
     """
-    Extracts the NAMD log data from every run (energy and state properties),
-    combining it into a list while adding the system density,
-    and also keeping the exact output lines from NAMD.
+    Converts the value lines of a NAMD or GOMC log file into one typed
+    NumPy array, converting all the lines at once instead of line by line.
 
     Parameters
     ----------
-    read_namd_box_x_log_file : readable opened file with .readlines()
-        The read loaded namd log file with .readlines().
-    namd_box_x_data_file : writeable opened file
-        The writeable opened file, which is used to write the combined
-        and compact data from the NAMD log file.
-    run_no : int
-        Simulation run number
-    e_values_namd_box_x_density_list : list, default = []
-        The NAMD log data output with the density added.
-        If the default value (empty list) is not used, the
-        provided list will be appended.  This needs provided not
-        reading 1st NAMD simulation.
-    e_titles_namd_box_x_iteration : list, default = None
-        The titles of the NAMD energy and state data from the systems log file.
-        This needs provided not reading 1st NAMD simulation.
-    e_titles_namd_box_x_density_iteration : list, default = None
-        The titles of the NAMD energy and state data from the systems log file,
-        adding a # sybol on the first entry and 'DENSITY' at the end of the
-        list. This needs provided not reading 1st NAMD simulation.
+    log_value_line_list : list of str
+        The log file lines, which all start with the same label
+        (i.e., 'ENERGY:', 'ENER_0:', or 'STAT_0:').
+    label_length : int
+        The number of characters in the label, which is removed.
+    error_message : str
+        The error message, which is raised if the values can not be
+        read as numbers or the lines do not have the same number of values.
 
     Returns
     ---------
-    e_titles_namd_box_x_iteration : list
-        The titles of the NAMD energy and state data from the systems log file.
-    e_titles_namd_box_x_density_iteration : list
-        The titles of the NAMD energy and state data from the systems log file,
-        adding a # sybol on the first entry and 'DENSITY' at the end of the
-        list. This needs provided not reading 1st NAMD simulation.
-    e_values_namd_box_x_iteration : list
-        The NAMD log data output with the density added.
-    e_values_namd_box_x_density_list : list
-        The reorganized and combined NAMD log data from the current NAMD run,
-        and the past runs that were entered via the flag ().
-
-    e_property_values_namd_box_x_list list:
-        The NAMD log data from the current NAMD run, which does not
-        include the calculated density value.  This includes the first item
-        in the list being 'ENERGY:'.
-
-    Notes
-    --------
-    The timesteps are rescaled so that the NAMD and GOMC data are added
-    properly in order.
-
-    The 2 timestep 0 values will appear if system is minimized.
-    The minimization timesteps are rescaled to 0 for the actual run start,
-    not minimization.
+    log_value_array : numpy.ndarray, dtype=numpy.float64
+        The log file values with one row per line, which has the shape
+        (number of lines, number of values per line).
     """
+    no_log_value_lines = len(log_value_line_list)
+    if no_log_value_lines == 0:
+        return np.empty((0, 0), dtype=np.float64)
 
-    error_for_bad_namd_input_file_data = (
-        "ERROR: This NAMD file output file does not contain all "
-        "the required information. The Energy titles/values "
-        "are missing from the NAMD output/log file(s) in "
-        "run number {}.".format(run_no)
-    )
-
-    if e_values_namd_box_x_density_list is None:
-        e_values_namd_box_x_density_list = []
-    else:
-        e_values_namd_box_x_density_list
-
-    for i, line in enumerate(read_namd_box_x_log_file):
-        split_line = line.split()
-        if line.startswith("Info:") is True:
-            if split_line[0] == "Info:" and len(split_line) >= 6:
-                if (
-                    split_line[1] == "TOTAL"
-                    and split_line[2] == "MASS"
-                    and split_line[3] == "="
-                ):
-                    namd_sim_total_mass_box_x_amu = float(split_line[4])
-            if split_line[0] == "Info:" and len(split_line) >= 5:
-                if (
-                    split_line[1] == "ENERGY"
-                    and split_line[2] == "OUTPUT"
-                    and split_line[3] == "STEPS"
-                ):
-                    namd_sim_e_output_steps_box_x = float(split_line[4])
-
-    # note NAMD energy units in kcal/mol (no modifications required)
-    # generate energy file data for box X
-    if run_no == 0:
-        get_e_namd_box_x_titles = True
-    else:
-        get_e_namd_box_x_titles = False
-    e_property_values_namd_box_x_list = []
-    for i, line in enumerate(read_namd_box_x_log_file):
-        if (
-            line.startswith("ETITLE:") is True
-            and get_e_namd_box_x_titles is True
-        ):
-            namd_box_x_data_file.write("%s" % read_namd_box_x_log_file[i])
-            e_titles_namd_box_x_iteration = read_namd_box_x_log_file[i]
-            e_titles_namd_box_x_iteration = (
-                e_titles_namd_box_x_iteration.split()
-            )
-            e_titles_namd_box_x_iteration = e_titles_namd_box_x_iteration[:]
-
-            e_titles_namd_box_x_density_iteration = read_namd_box_x_log_file[i]
-            e_titles_namd_box_x_density_iteration = (
-                e_titles_namd_box_x_density_iteration.split()
-            )
-            e_titles_namd_box_x_density_iteration = (
-                e_titles_namd_box_x_density_iteration[1:]
-            )
-            e_titles_namd_box_x_density_iteration.append("DENSITY")
+    log_value_list = " ".join(
+        [line[label_length:] for line in log_value_line_list]
+    ).split()
+    if len(log_value_list) % no_log_value_lines != 0:
+        raise ValueError(error_message)
 
-            if get_e_namd_box_x_titles is True:
-                get_e_namd_box_x_titles = False
+    try:
+        log_value_array = np.array(log_value_list, dtype=np.float64)
+    except ValueError:
+        raise ValueError(error_message)
 
-        if line.startswith("ENERGY:") is True:
-            e_values_namd_box_x_iteration = read_namd_box_x_log_file[i]
-            e_values_namd_box_x_iteration = (
-                e_values_namd_box_x_iteration.split()
-            )
-            e_values_namd_box_x_iteration = e_values_namd_box_x_iteration[:]
-            for y in range(0, len(e_titles_namd_box_x_iteration)):
-                if e_titles_namd_box_x_iteration[y] == "TS":
-                    e_values_namd_box_x_iteration[y] = str(
-                        int(
-                            int(e_values_namd_box_x_iteration[y]) + current_step
-                        )
-                    )
-                    array_ts_location = y
-                elif e_titles_namd_box_x_iteration[y] == "VOLUME":
-                    e_volume_data_namd_box_x_iteration = float(
-                        e_values_namd_box_x_iteration[y]
-                    )
-                    e_density_data_namd_box_x_iteration = (
-                        1.6605402
-                        * namd_sim_total_mass_box_x_amu
-                        / e_volume_data_namd_box_x_iteration
-                    )
+    return log_value_array.reshape(no_log_value_lines, -1)
 
-            if int(e_values_namd_box_x_iteration[array_ts_location]) >= 0:
-                namd_box_x_data_file.write(
-                    "%s \n" % str("\t ".join(e_values_namd_box_x_iteration))
-                )
-                e_property_values_namd_box_x_list.append(
-                    e_values_namd_box_x_iteration
-                )
 
-                e_values_namd_box_x_density_iteration = (
-                    e_values_namd_box_x_iteration[1:]
-                )
-                e_values_namd_box_x_density_iteration.append(
-                    e_density_data_namd_box_x_iteration
-                )
-                e_values_namd_box_x_density_list.append(
-                    e_values_namd_box_x_density_iteration
-                )
+# the title prefix of the columns which hold the values of a combined data
+# table as the text printed by the engine, which are not written as columns
+text_column_title_prefix = "ENGINE_TEXT:"
 
-    if (
-        e_titles_namd_box_x_iteration is None
-        or e_titles_namd_box_x_density_iteration is None
-    ) and run_no != 0:
-        warn(
-            "enter the e_titles_namd_box_x_iteration variable in the get_namd_log_data, as "
-            " it is not in the NAMD log file to read."
-        )
-    else:
-        e_titles_namd_box_x_iteration = e_titles_namd_box_x_iteration
-        e_titles_namd_box_x_density_iteration = (
-            e_titles_namd_box_x_density_iteration
-        )
 
-    # add a pound symbol (#) before some of the titles
-    if str(e_titles_namd_box_x_density_iteration[0][0]) != "#":
-        e_titles_namd_box_x_density_iteration[0] = "#" + str(
-            e_titles_namd_box_x_density_iteration[0]
-        )
+def get_text_column_title(table_title):
+    """
+    Gets the title of the column which holds the engine text of a combined
+    data table column (see get_data_table_df).
 
-    try:
-        isinstance(e_titles_namd_box_x_iteration, list)
-        isinstance(e_titles_namd_box_x_density_iteration, list)
-        isinstance(e_values_namd_box_x_iteration, list)
-        isinstance(e_values_namd_box_x_density_list, list)
-        isinstance(e_property_values_namd_box_x_list, list)
-    except:
-        raise ValueError(error_for_bad_namd_input_file_data)
+    Parameters
+    ----------
+    table_title : str
+        The table title.
 
-    return (
-        e_titles_namd_box_x_iteration,
-        e_titles_namd_box_x_density_iteration,
-        e_values_namd_box_x_iteration,
-        e_values_namd_box_x_density_list,
-        e_property_values_namd_box_x_list,
-    )
+    Returns
+    ---------
+    text_column_title : str
+        The title of the engine text column.
+    """
+    return "{}{}".format(text_column_title_prefix, table_title)
 
 
-def get_gomc_hist_data(read_gomc_box_0_hist_file, gomc_box_0_hist_file, run_no):
+def get_data_table_df(table_values, table_titles, step_title, table_texts=None):
     """
-    This reads in the current simulation histogram (hist) data
-    and appends it add to a histrogram file, which was created
-    when the first GOMC simulation was read. In the end, this
-    function writes and combines all the hist data from all
-    the GOMC runs.
+    Builds the DataFrame of a combined data table, which is used to write
+    the table to a file.
 
     Parameters
     ----------
-    read_gomc_box_0_hist_file : readable opened file with .readlines()
-        The read loaded GOMC hist file with .readlines().
-    gomc_box_0_hist_file : writeable opened file
-        The writeable opened file, which is used to write the combined
-        and compact data from the GOMC hist files.
-    run_no : int
-        Simulation run number
+    table_values : numpy.ndarray, dtype=numpy.float64
+        The table values, with one row per table entry and one column
+        per table title.
+    table_titles : list of str
+        The table titles.
+    step_title : str
+        The table title of the step column, which is written as an integer.
+    table_texts : numpy.ndarray, dtype=object, or None, default=None
+        The table values as the text printed by the engine, with the same
+        shape as the table values, and None where there is no text.
+        The text is written in the text tables instead of the value,
+        so the values are written the same as the engine printed them
+        (i.e., NAMD's '12.3400').  If None, all the values are written
+        as numbers.
 
+    Returns
+    ---------
+    table_df : pandas.DataFrame
+        The table with the step column as an integer and all other
+        columns as floats.  The engine text of a column is in the
+        column titled get_text_column_title(table_title), which is only
+        used to write the text tables.
     """
+    table_df = pd.DataFrame(
+        data=table_values.reshape(-1, len(table_titles)), columns=table_titles
+    )
+    table_df[step_title] = table_df[step_title].astype(np.int64)
+
+    if table_texts is not None:
+        table_texts = table_texts.reshape(-1, len(table_titles))
+        for title_i, table_title in enumerate(table_titles):
+            column_texts = table_texts[:, title_i]
+            if table_title != step_title and any(
+                text is not None for text in column_texts.tolist()
+            ):
+                table_df[get_text_column_title(table_title)] = column_texts
 
-    # create the combined histogram
-    for i, line in enumerate(read_gomc_box_0_hist_file):
-        # if the first iteration for the GOMC hist file print the 1st line
-        if run_no == 1 and i == 0:
-            gomc_box_0_hist_file.write("%s" % read_gomc_box_0_hist_file[i])
-        elif run_no >= 1 and i >= 1:
-            gomc_box_0_hist_file.write("%s" % read_gomc_box_0_hist_file[i])
+    return table_df
 
 
-def get_gomc_dist_data(read_gomc_box_0_dist_file, current_dist_dict):
+def get_log_line_parts(split_log_line_list, step_index):
     """
-    This reads in the current simulation distribution (dist) data
-    and adds it to the current dist data dictionary which is also
-    and input variable.
+    Splits the log file value lines into the text before and after the
+    step, so the lines can be written again with a shifted step, without
+    splitting or formatting the values again.
 
     Parameters
     ----------
-    read_gomc_box_0_dist_file : readable opened file with .readlines()
-        The read loaded GOMC dist file with .readlines().
-    current_dist_dict : the current dist dictionary while reading
-    thru all the files. This is an empty dictionary when the first GOMC
-    simulation is started (i.e. simulation 1). The data is added to the
-    dictionary every time the next GOMC distribution (dist) data is
-    input here and the new data is read (see current_dist_dict
-    definition in the return variables).
+    split_log_line_list : list of list of str
+        The split log file value lines, including the labels.
+    step_index : int
+        The index of the step in the split log file value lines.
 
     Returns
-    --------
-    current_dist_dict : the updated current dist dictionary after reading
-    and adding the current simulations distribution (dist) data.
+    ---------
+    log_line_parts : list of tuple of (str, str)
+        The text before the step and the text after the step, for every
+        log file value line.  The lines are written as
+        head + '\t ' + str(step) + tail + ' \n'.
+    """
+    if len(split_log_line_list) == 0:
+        return []
+
+    # the step is the last value if there is no text after it
+    if len(split_log_line_list[0]) == step_index + 1:
+        return [
+            ("\t ".join(split_line[:step_index]), "")
+            for split_line in split_log_line_list
+        ]
+
+    return [
+        (
+            "\t ".join(split_line[:step_index]),
+            "\t " + "\t ".join(split_line[step_index + 1 :]),
+        )
+        for split_line in split_log_line_list
+    ]
+
+
+def get_column_strings(column_values, column_texts=None):
+    """
+    Converts a data table column to text, with the shortest text which gives
+    the same float (i.e., Python's str(float)), or the text printed by the
+    engine where it is given.  Missing values are written as 'NA'.
+
+    Parameters
+    ----------
+    column_values : numpy.ndarray
+        The column values.
+    column_texts : numpy.ndarray, dtype=object, or None, default=None
+        The column values as the text printed by the engine, and None
+        (or NaN) where there is no text.  If None, all the values are written
+        as numbers.
+
+    Returns
+    ---------
+    column_strings : list of str
+        The column values as text.
+    """
+    column_strings = [str(value) for value in column_values.tolist()]
+    if column_values.dtype.kind == "f" and np.isnan(column_values).any():
+        for row_i in np.flatnonzero(np.isnan(column_values)).tolist():
+            column_strings[row_i] = "NA"
+    if column_texts is not None:
+        # pandas may store the missing text as None or NaN
+        column_strings = [
+            column_text if isinstance(column_text, str) else column_string
+            for column_string, column_text in zip(
+                column_strings, column_texts.tolist()
+            )
+        ]
+
+    return column_strings
+
+
+def write_data_table(
+    table_df, table_filename, process_pool_executor=None, append=False
+):
+    """
+    Writes a combined data table as a tab separated text file.  The float
+    columns are written with the shortest text which gives the same float
+    (i.e., Python's str(float)), the same as pandas.DataFrame.to_csv,
+    but converting all the values at once, which is much faster for
+    the large combined tables.  The values with an engine text column
+    (see get_data_table_df) are written as the text printed by the engine.
+    Missing values are written as 'NA'.
+
+    Parameters
+    ----------
+    table_df : pandas.DataFrame
+        The table, which is written with the column titles as the header.
+    table_filename : str
+        The table filename, including the path.
+    process_pool_executor : concurrent.futures.ProcessPoolExecutor or None,
+        default=None
+        The worker processes used to convert the columns to text at the same
+        time. If None, the columns are converted in this process.
+    append : bool, default=False
+        If True, the rows are appended to the existing table file, without
+        the header.
+    """
+    table_title_list = [
+        table_title
+        for table_title in table_df.columns
+        if not table_title.startswith(text_column_title_prefix)
+    ]
+    column_values_list = [
+        table_df[table_title].to_numpy() for table_title in table_title_list
+    ]
+    column_texts_list = [
+        (
+            table_df[get_text_column_title(table_title)].to_numpy()
+            if get_text_column_title(table_title) in table_df.columns
+            else None
+        )
+        for table_title in table_title_list
+    ]
+    if process_pool_executor is None:
+        column_string_list = list(
+            map(get_column_strings, column_values_list, column_texts_list)
+        )
+    else:
+        column_string_list = list(
+            process_pool_executor.map(
+                get_column_strings, column_values_list, column_texts_list
+            )
+        )
+
+    if append is True:
+        table_file = open(table_filename, "a")
+    else:
+        table_file = open(table_filename, "w")
+        table_file.write("%s\n" % str("\t".join(table_title_list)))
+    with table_file:
+        table_file.writelines(
+            ["%s\n" % str("\t".join(row)) for row in zip(*column_string_list)]
+        )
+
+
+def get_binary_data_table_columns(table_df, output_float_type):
+    """
+    Gets the columns of a combined data table as typed NumPy arrays, which
+    are written in the binary formats.
+
+    Parameters
+    ----------
+    table_df : pandas.DataFrame
+        The table.
+    output_float_type : str ('float64' or 'float32')
+        The float type of the float columns.
+
+    Returns
+    ---------
+    binary_column_dict : dict
+        The column titles, without the # symbol, as the keys and the columns
+        as the values.  The step columns are int64, the float columns are
+        output_float_type, and the engine names are bytes.
+    """
+    binary_column_dict = {}
+    for table_title in table_df.columns:
+        if table_title.startswith(text_column_title_prefix):
+            continue
+        column_values = table_df[table_title].to_numpy()
+        if column_values.dtype.kind == "f":
+            column_values = column_values.astype(output_float_type)
+        elif column_values.dtype.kind in ["i", "u"]:
+            column_values = column_values.astype(np.int64)
+        else:
+            column_values = np.array(column_values.tolist(), dtype=np.bytes_)
+        binary_column_dict.update({table_title.lstrip("#"): column_values})
+
+    return binary_column_dict
+
+
+def write_binary_data_tables(
+    table_df, table_filename, output_format_list, output_float_type
+):
+    """
+    Writes a combined data table in the binary formats, next to the tab
+    separated text file, so it can be loaded without parsing the text.
+    Missing values are written as NaN.
+
+    The binary tables are written as:
+    'npy' : a <table name>_npy folder, with a <column title>.npy file per
+    column, which can be loaded as a memory map
+    (i.e., numpy.load(filename, mmap_mode='r')).
+    'npz' : a <table name>.npz file, with the column titles as the keys.
+    'hdf5' : a <table name>.h5 file, with a dataset per column.
+    'parquet' : a <table name>.parquet file.
+
+    Parameters
+    ----------
+    table_df : pandas.DataFrame
+        The table.
+    table_filename : str
+        The text table filename, including the path, which ends in '.txt'.
+    output_format_list : list of str ('npy', 'npz', 'hdf5', or 'parquet')
+        The binary formats which the table is written in.
+    output_float_type : str ('float64' or 'float32')
+        The float type of the float columns.
+    """
+    if len(output_format_list) == 0:
+        return
+
+    table_filename_stem = os.path.splitext(table_filename)[0]
+    binary_column_dict = get_binary_data_table_columns(
+        table_df, output_float_type
+    )
+
+    if "npy" in output_format_list:
+        os.makedirs("{}_npy".format(table_filename_stem), exist_ok=True)
+        for binary_title, binary_column in binary_column_dict.items():
+            np.save(
+                "{}_npy/{}.npy".format(table_filename_stem, binary_title),
+                binary_column,
+            )
+
+    if "npz" in output_format_list:
+        np.savez("{}.npz".format(table_filename_stem), **binary_column_dict)
+
+    if "hdf5" in output_format_list:
+        import h5py
+
+        with h5py.File("{}.h5".format(table_filename_stem), "w") as h5_file:
+            for binary_title, binary_column in binary_column_dict.items():
+                h5_file.create_dataset(binary_title, data=binary_column)
+
+    if "parquet" in output_format_list:
+        pd.DataFrame(
+            {
+                binary_title: (
+                    binary_column.astype(str)
+                    if binary_column.dtype.kind == "S"
+                    else binary_column
+                )
+                for binary_title, binary_column in binary_column_dict.items()
+            }
+        ).to_parquet("{}.parquet".format(table_filename_stem), index=False)
+
+
+def get_process_pool_executor(jobs):
+    """
+    Gets the worker processes used to read the log files from the
+    individual simulation directories at the same time.
+
+    The worker processes are forked, since this file runs all the data
+    combining when it is imported, so a spawned worker process would rerun
+    it.  If forking is not available, the log files are read one at a time.
+
+    Parameters
+    ----------
+    jobs : int
+        The number of worker processes.
+
+    Returns
+    ---------
+    process_pool_executor : concurrent.futures.ProcessPoolExecutor or None
+        The worker processes, or None if the log files are read one at a time
+        in this process (i.e., jobs = 1 or forking is not available).
+    """
+    if jobs == 1:
+        return None
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        warn(
+            "WARNING: The worker processes can not be forked on this system, "
+            "so the log files will be read one at a time."
+        )
+        return None
+
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, mp_context=multiprocessing.get_context("fork")
+    )
+
+
+def get_run_data_list(
+    read_function, read_function_arguments_list, jobs, process_pool_executor
+):
+    """
+    Reads the log data from every simulation run, with each run read on
+    its own, in the worker processes if they are available.
+
+    Parameters
+    ----------
+    read_function : function
+        The function which reads the log data from one simulation run.
+    read_function_arguments_list : list of tuple
+        The read_function arguments for every simulation run.
+    jobs : int
+        The number of worker processes.
+    process_pool_executor : concurrent.futures.ProcessPoolExecutor or None
+        The worker processes. If None, the runs are read in this process.
+
+    Returns
+    ---------
+    run_data_list : list
+        The read_function results, in the same order as the runs in
+        read_function_arguments_list.
+    """
+    if process_pool_executor is None:
+        return [
+            read_function(*read_function_arguments)
+            for read_function_arguments in read_function_arguments_list
+        ]
+
+    # send the runs to the worker processes in chunks, to limit the overhead
+    chunk_size = max(1, len(read_function_arguments_list) // (4 * jobs))
+    return list(
+        process_pool_executor.map(
+            read_function,
+            *zip(*read_function_arguments_list),
+            chunksize=chunk_size,
+        )
+    )
+
+
+def read_namd_log_data(read_namd_box_x_log_filename, run_no):
+    """
+    Reads the NAMD log data (energy and state properties) in a single
+    pass, streaming the file line by line and converting all the energy
+    values into one typed NumPy array.  The timesteps are not shifted here,
+    so every NAMD log file can be read on its own.
+
+    Parameters
+    ----------
+    read_namd_box_x_log_filename : str
+        The NAMD log (out.dat) filename, including the path.
+    run_no : int
+        Simulation run number
+
+    Returns
+    ---------
+    namd_box_x_log_data : dict
+        The NAMD log data with the keys:
+        'e_title_line' : str, the first 'ETITLE:' line, unmodified.
+        'e_titles' : list of str, the titles in the 'ETITLE:' line.
+        'e_value_line_parts' : list of tuple of (str, str), the 'ENERGY:'
+        lines split before and after the timestep (see get_log_line_parts).
+        'e_values' : numpy.ndarray (float64), the 'ENERGY:' values,
+        without the 'ENERGY:' label.
+        'e_value_texts' : numpy.ndarray (object), the 'ENERGY:' values
+        as the text printed by NAMD, without the 'ENERGY:' label.
+        'minimizing_steps' : float, the total NAMD minimization steps.
+        'total_mass_amu' : float, the total mass of the system in amu.
+        'last_step' : int, the last timestep in the NAMD log file, which
+        is not shifted.
+    """
+    error_for_bad_namd_input_file_data = (
+        "ERROR: This NAMD file output file does not contain all "
+        "the required information. The Energy titles/values "
+        "are missing from the NAMD output/log file(s) in "
+        "run number {}.".format(run_no)
+    )
+
+    e_title_line = None
+    e_value_line_list = []
+    namd_minimizing_steps = 0
+    namd_sim_total_mass_amu = None
+    with open_run_file(read_namd_box_x_log_filename, "r") as read_namd_log_file:
+        for line in read_namd_log_file:
+            if line.startswith("ENERGY:") is True:
+                e_value_line_list.append(line)
+            elif line.startswith("ETITLE:") is True:
+                if e_title_line is None:
+                    e_title_line = line
+            elif line.startswith("Info:") is True:
+                split_line = line.split()
+                if (
+                    len(split_line) >= 6
+                    and split_line[1] == "TOTAL"
+                    and split_line[2] == "MASS"
+                    and split_line[3] == "="
+                ):
+                    namd_sim_total_mass_amu = float(split_line[4])
+            elif line.startswith("TCL:") is True:
+                split_line = line.split()
+                if (
+                    len(split_line) >= 5
+                    and split_line[1] == "Minimizing"
+                    and split_line[2] == "for"
+                    and split_line[4] == "steps"
+                ):
+                    namd_minimizing_steps += float(split_line[3])
+
+    if e_title_line is None or namd_sim_total_mass_amu is None:
+        raise ValueError(error_for_bad_namd_input_file_data)
+    e_titles = e_title_line.split()
+    if "TS" not in e_titles or "VOLUME" not in e_titles:
+        raise ValueError(error_for_bad_namd_input_file_data)
+    if len(e_value_line_list) == 0:
+        raise ValueError(
+            "ERROR: The NAMD output/log file in run number {} does not "
+            "contain any energy values.".format(run_no)
+        )
+
+    e_values = get_log_value_array(
+        e_value_line_list,
+        len("ENERGY:"),
+        error_for_bad_namd_input_file_data,
+    )
+    if e_values.shape[1] != len(e_titles) - 1:
+        raise ValueError(error_for_bad_namd_input_file_data)
+    split_e_value_line_list = [line.split() for line in e_value_line_list]
+
+    return {
+        "e_title_line": e_title_line,
+        "e_titles": e_titles,
+        "e_value_line_parts": get_log_line_parts(
+            split_e_value_line_list, e_titles.index("TS")
+        ),
+        "e_values": e_values,
+        "e_value_texts": np.array(
+            [split_line[1:] for split_line in split_e_value_line_list],
+            dtype=object,
+        ).reshape(e_values.shape),
+        "minimizing_steps": namd_minimizing_steps,
+        "total_mass_amu": namd_sim_total_mass_amu,
+        "last_step": int(e_values[-1, e_titles.index("TS") - 1]),
+    }
+
+
+def write_namd_log_data(
+    namd_box_x_log_data, namd_box_x_data_file, run_no, step_offset
+):
+    """
+    Shifts the timesteps of the NAMD log data, writes the exact output lines
+    from NAMD with the shifted timesteps, and adds the system density.
+
+    Parameters
+    ----------
+    namd_box_x_log_data : dict
+        The NAMD log data, from the read_namd_log_data function.
+    namd_box_x_data_file : writeable opened file
+        The writeable opened file, which is used to write the combined
+        and compact data from the NAMD log file.
+    run_no : int
+        Simulation run number
+    step_offset : int
+        The step offset which is added to the NAMD timesteps.
+
+    Returns
+    ---------
+    e_values_namd_box_x_density : numpy.ndarray, dtype=numpy.float64
+        The NAMD log data with the shifted timesteps and the system density
+        added as the last column.  Only the timesteps >= 0 are kept.
+    e_value_texts_namd_box_x_density : numpy.ndarray, dtype=object
+        The NAMD log data as the text printed by NAMD, which is written in
+        the combined data tables, with None for the timesteps and the
+        system density.
+
+    Notes
+    --------
+    The timesteps are rescaled so that the NAMD and GOMC data are added
+    properly in order.
+
+    The 2 timestep 0 values will appear if system is minimized.
+    The minimization timesteps are rescaled to 0 for the actual run start,
+    not minimization.
+    """
+    e_titles = namd_box_x_log_data["e_titles"]
+    e_values = namd_box_x_log_data["e_values"]
+    e_value_line_parts = namd_box_x_log_data["e_value_line_parts"]
+
+    # the values do not include the 'ENERGY:' label
+    ts_index = e_titles.index("TS") - 1
+    volume_index = e_titles.index("VOLUME") - 1
+
+    shifted_ts = e_values[:, ts_index].astype(np.int64) + int(step_offset)
+    kept_row_indices = np.flatnonzero(shifted_ts >= 0)
+    if len(kept_row_indices) == 0:
+        raise ValueError(
+            "ERROR: The NAMD output/log file in run number {} does not "
+            "contain any energy values.".format(run_no)
+        )
+
+    # write the exact output lines from NAMD, only changing the timesteps
+    namd_data_line_list = []
+    if run_no == 0:
+        namd_data_line_list.append(namd_box_x_log_data["e_title_line"])
+    shifted_ts_list = shifted_ts.tolist()
+    for row_i in kept_row_indices.tolist():
+        line_head, line_tail = e_value_line_parts[row_i]
+        namd_data_line_list.append(
+            "%s\t %s%s \n" % (line_head, shifted_ts_list[row_i], line_tail)
+        )
+    namd_box_x_data_file.writelines(namd_data_line_list)
+
+    e_values_namd_box_x_density = np.empty(
+        (len(kept_row_indices), e_values.shape[1] + 1), dtype=np.float64
+    )
+    e_values_namd_box_x_density[:, :-1] = e_values[kept_row_indices]
+    e_values_namd_box_x_density[:, ts_index] = shifted_ts[kept_row_indices]
+    e_values_namd_box_x_density[:, -1] = (
+        1.6605402
+        * namd_box_x_log_data["total_mass_amu"]
+        / e_values[kept_row_indices, volume_index]
+    )
+
+    e_value_texts_namd_box_x_density = np.full(
+        e_values_namd_box_x_density.shape, None, dtype=object
+    )
+    e_value_texts_namd_box_x_density[:, :-1] = namd_box_x_log_data[
+        "e_value_texts"
+    ][kept_row_indices]
+    e_value_texts_namd_box_x_density[:, ts_index] = None
+
+    return e_values_namd_box_x_density, e_value_texts_namd_box_x_density
+
+
+def get_namd_density_titles(e_titles_namd_box_x):
+    """
+    Gets the NAMD titles of the energy and state data with the
+    system density.
+
+    Parameters
+    ----------
+    e_titles_namd_box_x : list of str
+        The titles in the NAMD 'ETITLE:' line.
+
+    Returns
+    ---------
+    e_titles_namd_box_x_density : list of str
+        The NAMD titles without the 'ETITLE:' label, adding a # symbol
+        on the first entry and 'DENSITY' at the end of the list.
+    """
+    e_titles_namd_box_x_density = e_titles_namd_box_x[1:] + ["DENSITY"]
+    if str(e_titles_namd_box_x_density[0][0]) != "#":
+        e_titles_namd_box_x_density[0] = "#" + str(
+            e_titles_namd_box_x_density[0]
+        )
+
+    return e_titles_namd_box_x_density
+
+
+def copy_file_data(read_file, write_file):
+    """
+    Copies the rest of a file, from its current position, to the end of
+    another file.  The data is copied by the operating system (sendfile)
+    if possible, or otherwise in large blocks, without reading it line
+    by line.
+
+    Parameters
+    ----------
+    read_file : readable opened binary file
+        The file which is copied, from its current position.
+    write_file : writeable opened binary file
+        The file which the data is added to.
+    """
+    write_file.flush()
+    read_offset = read_file.tell()
+    try:
+        no_bytes = os.fstat(read_file.fileno()).st_size - read_offset
+        while no_bytes > 0:
+            no_sent_bytes = os.sendfile(
+                write_file.fileno(), read_file.fileno(), read_offset, no_bytes
+            )
+            if no_sent_bytes == 0:
+                break
+            read_offset += no_sent_bytes
+            no_bytes -= no_sent_bytes
+    except (AttributeError, OSError):
+        # sendfile is not available on this system, or for this file
+        # (e.g., a file opened in append mode on some systems, or a file
+        # read from an archive, which has no file descriptor)
+        read_file.seek(read_offset)
+        shutil.copyfileobj(read_file, write_file, 2**24)
+
+
+def get_gomc_hist_data(read_gomc_box_0_hist_file, gomc_box_0_hist_file, run_no):
+    """
+    This reads in the current simulation histogram (hist) data
+    and appends it add to a histrogram file, which was created
+    when the first GOMC simulation was read. In the end, this
+    function writes and combines all the hist data from all
+    the GOMC runs.
+
+    The header line is only written for the first GOMC run, and the
+    rest of the hist file is copied as one block.
+
+    Parameters
+    ----------
+    read_gomc_box_0_hist_file : readable opened binary file
+        The GOMC hist file, opened at the start of the file
+        (see the open_run_file function).
+    gomc_box_0_hist_file : writeable opened binary file
+        The writeable opened file, which is used to write the combined
+        and compact data from the GOMC hist files.
+    run_no : int
+        Simulation run number
+
+    """
+
+    # create the combined histogram
+    hist_header_line = read_gomc_box_0_hist_file.readline()
+    # if the first iteration for the GOMC hist file print the 1st line
+    if run_no == 1:
+        gomc_box_0_hist_file.write(hist_header_line)
+    copy_file_data(read_gomc_box_0_hist_file, gomc_box_0_hist_file)
+
+
+def get_gomc_dist_histogram(dist_data_dict):
+    """
+    Gets the distribution (dist) histogram from the dist data dictionary,
+    which grows on demand as the GOMC dist data is added.
+
+    Parameters
+    ----------
+    dist_data_dict : dict
+        The number of molecules as the keys and the counts as the values.
+        This is an empty dictionary before the first GOMC simulation.
+
+    Returns
+    --------
+    dist_histogram_dict : dict
+        The 'counts' (numpy.ndarray of int64, the summed counts for each
+        number of molecules) and 'seen' (numpy.ndarray of bool, True for
+        the number of molecules which are in any dist file).
+    """
+    return add_gomc_dist_data(
+        {
+            "counts": np.zeros(0, dtype=np.int64),
+            "seen": np.zeros(0, dtype=bool),
+        },
+        np.array(
+            [int(dist_key) for dist_key in dist_data_dict], dtype=np.int64
+        ),
+        np.array(
+            [int(dist_value) for dist_value in dist_data_dict.values()],
+            dtype=np.int64,
+        ),
+    )
+
+
+def add_gomc_dist_data(dist_histogram_dict, dist_keys, dist_values):
+    """
+    Adds the distribution (dist) data to the dist histogram, in place.
+    The histogram is doubled in size when a larger number of molecules
+    is added.
+
+    Parameters
+    ----------
+    dist_histogram_dict : dict
+        The dist histogram, from the get_gomc_dist_histogram function.
+    dist_keys : numpy.ndarray of int64
+        The number of molecules (the first column of the dist file).
+    dist_values : numpy.ndarray of int64
+        The counts (the second column of the dist file).
+
+    Returns
+    --------
+    dist_histogram_dict : dict
+        The updated dist histogram.
+    """
+    if len(dist_keys) == 0:
+        return dist_histogram_dict
+    if np.min(dist_keys) < 0:
+        raise ValueError(
+            "ERROR: The GOMC dist data has a negative number of molecules."
+        )
+
+    no_bins = int(np.max(dist_keys)) + 1
+    if no_bins > len(dist_histogram_dict["counts"]):
+        no_bins = max(no_bins, 2 * len(dist_histogram_dict["counts"]))
+        for histogram_key in ["counts", "seen"]:
+            grown_histogram = np.zeros(
+                no_bins, dtype=dist_histogram_dict[histogram_key].dtype
+            )
+            grown_histogram[: len(dist_histogram_dict[histogram_key])] = (
+                dist_histogram_dict[histogram_key]
+            )
+            dist_histogram_dict[histogram_key] = grown_histogram
+
+    np.add.at(dist_histogram_dict["counts"], dist_keys, dist_values)
+    dist_histogram_dict["seen"][dist_keys] = True
+
+    return dist_histogram_dict
+
+
+def get_gomc_dist_data(read_gomc_box_0_dist_filename, current_dist_histogram):
+    """
+    This reads in the current simulation distribution (dist) data
+    and adds it to the current dist histogram, which is also an
+    input variable.
+
+    Parameters
+    ----------
+    read_gomc_box_0_dist_filename : str
+        The GOMC dist file name, including the path.
+    current_dist_histogram : dict
+        The current dist histogram while reading thru all the files.
+
+    Returns
+    --------
+    current_dist_histogram : dict
+        The updated current dist histogram after adding the current
+        simulations distribution (dist) data.
     """
+    with open_run_file(
+        read_gomc_box_0_dist_filename, "r"
+    ) as read_gomc_box_0_dist_file:
+        dist_data = np.array(
+            read_gomc_box_0_dist_file.read().split(), dtype=np.int64
+        ).reshape(-1, 2)
+
+    return add_gomc_dist_data(
+        current_dist_histogram, dist_data[:, 0], dist_data[:, 1]
+    )
+
+
+def get_gomc_residue_dist_data(
+    dist_filename_list, provisional_dist_filename_list, current_dist_histogram
+):
+    """
+    Adds the distribution (dist) data of one residue or molecule from all
+    the GOMC simulations to the dist histogram.  Each residue is added on
+    its own, so the residues can be added at the same time in the worker
+    processes.
+
+    Parameters
+    ----------
+    dist_filename_list : list of str
+        The dist file names, before the last simulation cycle.
+    provisional_dist_filename_list : list of str
+        The dist file names in the last simulation cycle.
+    current_dist_histogram : dict
+        The dist histogram before the first dist file.
+
+    Returns
+    --------
+    provisional_dist_data_dict : dict
+        The dist data before the last simulation cycle, with the number
+        of molecules (str) as the keys and the counts (int) as the values,
+        which is written in the combine manifest.
+    current_dist_histogram : dict
+        The dist histogram after all the dist files.
+    """
+    for dist_filename in dist_filename_list:
+        current_dist_histogram = get_gomc_dist_data(
+            dist_filename, current_dist_histogram
+        )
+    provisional_dist_data_dict = get_gomc_dist_data_dict(current_dist_histogram)
+    for dist_filename in provisional_dist_filename_list:
+        current_dist_histogram = get_gomc_dist_data(
+            dist_filename, current_dist_histogram
+        )
+
+    return provisional_dist_data_dict, current_dist_histogram
+
+
+def get_gomc_dist_data_dict(dist_histogram_dict):
+    """
+    Gets the distribution (dist) data in the dist histogram as a dictionary,
+    so it can be written in the combine manifest.
+
+    Parameters
+    ----------
+    dist_histogram_dict : dict
+        The dist histogram.
+
+    Returns
+    --------
+    dist_data_dict : dict
+        The number of molecules (str) as the keys and the counts (int)
+        as the values.
+    """
+    dist_keys = np.flatnonzero(dist_histogram_dict["seen"])
+    return {
+        str(dist_key): int(dist_value)
+        for dist_key, dist_value in zip(
+            dist_keys, dist_histogram_dict["counts"][dist_keys]
+        )
+    }
+
+
+def write_gomc_dist_data(dist_histogram_dict, gomc_box_0_dist_filename):
+    """
+    Writes the combined distribution (dist) data, in order of the number of
+    molecules as text (i.e., 10 is after 1 and before 2), which is the
+    order the combined dist files have always been written in.
+
+    Parameters
+    ----------
+    dist_histogram_dict : dict
+        The dist histogram.
+    gomc_box_0_dist_filename : str
+        The combined dist file name, including the path.
+    """
+    dist_keys = np.flatnonzero(dist_histogram_dict["seen"])
+    dist_keys = dist_keys[np.argsort(dist_keys.astype(str), kind="stable")]
+    np.savetxt(
+        gomc_box_0_dist_filename,
+        np.column_stack((dist_keys, dist_histogram_dict["counts"][dist_keys])),
+        fmt="%d",
+    )
+
+
+def read_gomc_log_data(read_gomc_log_filename, run_no, box_no_list):
+    """
+    Reads the GOMC log data (energy and stat properties) for all the
+    simulation boxes in a single pass, streaming the file line by line
+    and converting all the energy and stat values into typed NumPy arrays.
+    The steps are not shifted here, so every GOMC log file can be read
+    on its own.
+
+    Parameters
+    ----------
+    read_gomc_log_filename : str
+        The GOMC log (out.dat) filename, including the path.
+    run_no : int
+        Simulation run number
+    box_no_list : list of int
+        The simulation box numbers, which can only be 0 or 1
+
+    Returns
+    ---------
+    gomc_log_data : dict
+        The GOMC log data with the keys:
+        'e_title_line' : str, the first 'ETITLE:' line, unmodified.
+        'e_titles' : list of str, the titles in the 'ETITLE:' line.
+        'stat_title_line' : str, the first 'STITLE:' line, unmodified.
+        'stat_titles' : list of str, the titles in the 'STITLE:' line.
+        'record_kinds' : numpy.ndarray (int8), the kind of every title and
+        value line in the order they are in the log file
+        (0 = 'ETITLE:', 1 = 'STITLE:', 2 + 2 * box_no = 'ENER_box_no:',
+        and 3 + 2 * box_no = 'STAT_box_no:').
+        'box_data' : dict, with the box numbers as the keys and a dict as
+        the values with the keys:
+        'e_values' and 'stat_values' : numpy.ndarray (float64), the values
+        without the labels.
+        'e_value_line_parts' and 'stat_value_line_parts' : list of tuple of
+        (str, str), the value lines split before and after the step
+        (see get_log_line_parts).
+        'e_row_indices_for_stat' : numpy.ndarray (int64), the 'ENER_X:' row
+        before each 'STAT_X:' row.
+        'last_step' : int, the last step with both the energy and stat
+        values, which is not shifted.
+    """
+    # all the labels are 7 characters long (i.e., 'ETITLE:' and 'ENER_0:')
+    label_length = 7
+    record_kind_dict = {"ETITLE:": 0, "STITLE:": 1}
+    value_line_dict = {}
+    for box_no in box_no_list:
+        record_kind_dict.update(
+            {
+                "ENER_{}:".format(box_no): 2 + 2 * box_no,
+                "STAT_{}:".format(box_no): 3 + 2 * box_no,
+            }
+        )
+        value_line_dict.update(
+            {"ENER_{}:".format(box_no): [], "STAT_{}:".format(box_no): []}
+        )
+
+    title_line_dict = {"ETITLE:": None, "STITLE:": None}
+    record_kind_list = []
+    with open_run_file(read_gomc_log_filename, "r") as read_gomc_log_file:
+        for line in read_gomc_log_file:
+            line_label = line[:label_length]
+            if line_label in value_line_dict:
+                value_line_dict[line_label].append(line)
+                record_kind_list.append(record_kind_dict[line_label])
+            elif line_label in title_line_dict:
+                if title_line_dict[line_label] is None:
+                    title_line_dict[line_label] = line
+                    record_kind_list.append(record_kind_dict[line_label])
+    record_kinds = np.array(record_kind_list, dtype=np.int8)
+
+    if title_line_dict["ETITLE:"] is None or title_line_dict["STITLE:"] is None:
+        raise ValueError(
+            "ERROR: This GOMC file output file does not contain all "
+            "the required information. The Energy and Stat titles/values "
+            "are missing from the GOMC output/log file in "
+            "run number {} in box {}.".format(run_no, box_no_list)
+        )
+    e_titles = title_line_dict["ETITLE:"].split()
+    stat_titles = title_line_dict["STITLE:"].split()
+
+    box_data_dict = {}
+    for box_no in box_no_list:
+        error_for_bad_gomc_input_file_data = (
+            "ERROR: This GOMC file output file does not contain all "
+            "the required information. The Energy and Stat titles/values "
+            "are missing from the GOMC output/log file in "
+            "run number {} in box {}.".format(run_no, box_no)
+        )
+        if "STEP" not in e_titles or "STEP" not in stat_titles:
+            raise ValueError(error_for_bad_gomc_input_file_data)
+        energy_string_label = "ENER_{}:".format(box_no)
+        stat_string_label = "STAT_{}:".format(box_no)
+
+        e_values = get_log_value_array(
+            value_line_dict[energy_string_label],
+            label_length,
+            error_for_bad_gomc_input_file_data,
+        )
+        stat_values = get_log_value_array(
+            value_line_dict[stat_string_label],
+            label_length,
+            error_for_bad_gomc_input_file_data,
+        )
+        if (len(e_values) > 0 and e_values.shape[1] != len(e_titles) - 1) or (
+            len(stat_values) > 0
+            and stat_values.shape[1] != len(stat_titles) - 1
+        ):
+            raise ValueError(error_for_bad_gomc_input_file_data)
+
+        # each STAT_X line is combined with the last ENER_X line before it
+        e_row_indices_for_stat = (
+            np.cumsum(record_kinds == 2 + 2 * box_no)[
+                record_kinds == 3 + 2 * box_no
+            ]
+            - 1
+        )
+        if len(stat_values) == 0 or np.any(e_row_indices_for_stat < 0):
+            raise ValueError(error_for_bad_gomc_input_file_data)
+
+        # the values do not include the 'ENER_X:' and 'STAT_X:' labels
+        e_step_index = e_titles.index("STEP") - 1
+        box_data_dict.update(
+            {
+                box_no: {
+                    "e_values": e_values,
+                    "stat_values": stat_values,
+                    "e_value_line_parts": get_log_line_parts(
+                        [
+                            [energy_string_label] + list(map(str, value_list))
+                            for value_list in e_values.tolist()
+                        ],
+                        e_titles.index("STEP"),
+                    ),
+                    "stat_value_line_parts": get_log_line_parts(
+                        [
+                            [stat_string_label] + list(map(str, value_list))
+                            for value_list in stat_values.tolist()
+                        ],
+                        stat_titles.index("STEP"),
+                    ),
+                    "e_row_indices_for_stat": e_row_indices_for_stat,
+                    "last_step": int(
+                        e_values[e_row_indices_for_stat[-1], e_step_index]
+                    ),
+                }
+            }
+        )
+
+    return {
+        "e_title_line": title_line_dict["ETITLE:"],
+        "e_titles": e_titles,
+        "stat_title_line": title_line_dict["STITLE:"],
+        "stat_titles": stat_titles,
+        "record_kinds": record_kinds,
+        "box_data": box_data_dict,
+    }
+
+
+def write_gomc_log_data(
+    gomc_log_data, gomc_box_x_data_file, run_no, box_no, step_offset
+):
+    """
+    Shifts the steps of the GOMC log data for one simulation box, writes
+    the GOMC output lines with the shifted steps, and combines the energy
+    and stat data (ENER_X and STAT_X) of each step into one row.
+
+    Parameters
+    ----------
+    gomc_log_data : dict
+        The GOMC log data, from the read_gomc_log_data function.
+    gomc_box_x_data_file : writeable opened file
+        The writeable opened file, which is used to write the combined
+        and compact data from the GOMC log file.
+    run_no : int
+        Simulation run number
+    box_no : int
+        The simulation box number, which can only be 0 or 1
+    step_offset : int
+        The step offset which is added to the GOMC steps.
+
+    Returns
+    ---------
+    e_stat_values_gomc_box_x : numpy.ndarray, dtype=numpy.float64
+        The combined energy and stat values in the standard GOMC units
+        (energy = K and density = kg/m^3) with the shifted steps, with
+        one row per 'STAT_X:' line.
+
+    Notes
+    --------
+    The timesteps are rescaled so that the NAMD and GOMC data are added
+    properly in order.
+    """
+    box_data = gomc_log_data["box_data"][box_no]
+    e_values = box_data["e_values"]
+    stat_values = box_data["stat_values"]
+    energy_record_kind = 2 + 2 * box_no
+    stat_record_kind = 3 + 2 * box_no
+
+    # the values do not include the 'ENER_X:' and 'STAT_X:' labels
+    e_step_index = gomc_log_data["e_titles"].index("STEP") - 1
+    stat_step_index = gomc_log_data["stat_titles"].index("STEP") - 1
+    shifted_e_step_list = (
+        e_values[:, e_step_index].astype(np.int64) + int(step_offset)
+    ).tolist()
+    shifted_stat_step_list = (
+        stat_values[:, stat_step_index].astype(np.int64) + int(step_offset)
+    ).tolist()
+
+    # write the GOMC output lines, in the order they are in the log file
+    gomc_data_line_list = []
+    energy_row_i = 0
+    stat_row_i = 0
+    for record_kind in gomc_log_data["record_kinds"].tolist():
+        if record_kind == energy_record_kind:
+            line_head, line_tail = box_data["e_value_line_parts"][energy_row_i]
+            gomc_data_line_list.append(
+                "%s\t %s%s \n"
+                % (line_head, shifted_e_step_list[energy_row_i], line_tail)
+            )
+            energy_row_i += 1
+        elif record_kind == stat_record_kind:
+            line_head, line_tail = box_data["stat_value_line_parts"][stat_row_i]
+            gomc_data_line_list.append(
+                "%s\t %s%s \n"
+                % (line_head, shifted_stat_step_list[stat_row_i], line_tail)
+            )
+            stat_row_i += 1
+        elif record_kind == 0 and run_no == 1:
+            gomc_data_line_list.append(gomc_log_data["e_title_line"])
+        elif record_kind == 1 and run_no == 1:
+            gomc_data_line_list.append(gomc_log_data["stat_title_line"])
+    gomc_box_x_data_file.writelines(gomc_data_line_list)
+
+    # combine the energy and stat data (ENER_X and STAT_X) into 1 row,
+    # removing the ENER_X and STAT_X labels and the STAT_X step
+    e_stat_values_gomc_box_x = np.hstack(
+        (e_values[box_data["e_row_indices_for_stat"]], stat_values[:, 1:])
+    )
+    e_stat_values_gomc_box_x[:, e_step_index] = e_stat_values_gomc_box_x[
+        :, e_step_index
+    ].astype(np.int64) + int(step_offset)
+
+    return e_stat_values_gomc_box_x
+
+
+def get_gomc_e_stat_titles(e_titles_gomc_box_x, stat_titles_gomc_box_x):
+    """
+    Gets the combined GOMC energy and stat titles (ENER_X and STAT_X),
+    which are the same for the GOMC and NAMD units.
+
+    Parameters
+    ----------
+    e_titles_gomc_box_x : list of str
+        The titles in the GOMC 'ETITLE:' line.
+    stat_titles_gomc_box_x : list of str
+        The titles in the GOMC 'STITLE:' line.
+
+    Returns
+    ---------
+    e_stat_titles_gomc_box_x : list of str
+        The combined energy and stat titles without the 'ETITLE:' and
+        'STITLE:' labels and the repeated 'STEP', adding a # symbol on the
+        first entry.
+    """
+    e_stat_titles_gomc_box_x = (
+        e_titles_gomc_box_x[1:] + stat_titles_gomc_box_x[2:]
+    )
+    if str(e_stat_titles_gomc_box_x[0][0]) != "#":
+        e_stat_titles_gomc_box_x[0] = "#" + str(e_stat_titles_gomc_box_x[0])
+
+    return e_stat_titles_gomc_box_x
+
+
+def get_gomc_kcal_per_mol_values(
+    e_stat_values_gomc_box_x, e_titles_gomc_box_x, stat_titles_gomc_box_x
+):
+    """
+    Converts the combined GOMC energy and stat values from the standard
+    GOMC units (energy = K and density = kg/m^3) to the NAMD units
+    (energy = kcal/mol and density = g/cm^3), for all the rows at once.
+
+    Parameters
+    ----------
+    e_stat_values_gomc_box_x : numpy.ndarray, dtype=numpy.float64
+        The combined energy and stat values in the standard GOMC units.
+    e_titles_gomc_box_x : list of str
+        The titles in the GOMC 'ETITLE:' line.
+    stat_titles_gomc_box_x : list of str
+        The titles in the GOMC 'STITLE:' line.
+
+    Returns
+    ---------
+    e_stat_values_gomc_kcal_per_mol_box_x : numpy.ndarray, dtype=numpy.float64
+        The combined energy and stat values in the NAMD units.
+    """
+    # the combined values do not include the 'ETITLE:' label and the
+    # 'STITLE:' label and step
+    e_stat_titles_gomc_box_x = (
+        e_titles_gomc_box_x[1:] + stat_titles_gomc_box_x[2:]
+    )
+    no_e_values = len(e_titles_gomc_box_x) - 1
+
+    e_stat_values_gomc_kcal_per_mol_box_x = e_stat_values_gomc_box_x.copy()
+    e_value_indices = [
+        title_i
+        for title_i in range(0, no_e_values)
+        if e_stat_titles_gomc_box_x[title_i] != "STEP"
+    ]
+    tot_density_indices = [
+        title_i
+        for title_i in range(no_e_values, len(e_stat_titles_gomc_box_x))
+        if e_stat_titles_gomc_box_x[title_i] == "TOT_DENSITY"
+    ]
+    e_stat_values_gomc_kcal_per_mol_box_x[:, e_value_indices] *= K_to_kcal_mol
+    e_stat_values_gomc_kcal_per_mol_box_x[:, tot_density_indices] /= 10**3
+
+    return e_stat_values_gomc_kcal_per_mol_box_x
+
+
+def get_namd_combined_data(e_values_density_namd_box_x_df):
+    """
+    Gets the NAMD columns of the combined NAMD and GOMC data, with the
+    modified step (MOD_STEP) used to merge the NAMD and GOMC data in order.
+
+    Parameters
+    ----------
+    e_values_density_namd_box_x_df : pandas.DataFrame
+        The NAMD log data with the system density.
+
+    Returns
+    ---------
+    namd_combined_data_box_x : dict
+        The NAMD columns of the combined data as numpy.ndarray, and the
+        engine text columns of the NAMD values which are written as printed
+        by NAMD (see get_data_table_df).
+    """
+    namd_step = e_values_density_namd_box_x_df.loc[:, "#TS"].to_numpy()
+
+    namd_text_column_dict = {}
+    for combined_data_title, namd_title in [
+        ("TOTAL_POT", "POTENTIAL"),
+        ("TOTAL_ELECT", "ELECT"),
+        ("PRESSURE", "PRESSURE"),
+        ("VOLUME", "VOLUME"),
+    ]:
+        if (
+            get_text_column_title(namd_title)
+            in e_values_density_namd_box_x_df.columns
+        ):
+            namd_text_column_dict.update(
+                {
+                    get_text_column_title(
+                        combined_data_title
+                    ): e_values_density_namd_box_x_df.loc[
+                        :, get_text_column_title(namd_title)
+                    ].to_numpy()
+                }
+            )
+
+    return {
+        # add 0.2 to the NAMD modified timestep for easy sorting later
+        "MOD_STEP": namd_step + 0.2,
+        "STEP": namd_step,
+        "TOTAL_POT": e_values_density_namd_box_x_df.loc[
+            :, "POTENTIAL"
+        ].to_numpy(),
+        "TOTAL_ELECT": e_values_density_namd_box_x_df.loc[
+            :, "ELECT"
+        ].to_numpy(),
+        "TOTAL_VDW_plus_ELECT": (
+            e_values_density_namd_box_x_df.loc[:, "VDW"].to_numpy()
+            + e_values_density_namd_box_x_df.loc[:, "ELECT"].to_numpy()
+        ),
+        "PRESSURE": e_values_density_namd_box_x_df.loc[
+            :, "PRESSURE"
+        ].to_numpy(),
+        "VOLUME": e_values_density_namd_box_x_df.loc[:, "VOLUME"].to_numpy(),
+        "DENSITY": e_values_density_namd_box_x_df.loc[:, "DENSITY"].to_numpy(),
+        **namd_text_column_dict,
+    }
+
+
+def get_gomc_combined_data(
+    e_stat_kcal_per_mol_gomc_box_x_df,
+    volume=None,
+    first_row_number=0,
+    volume_text=None,
+):
+    """
+    Gets the GOMC columns of the combined NAMD and GOMC data, with the
+    modified step (MOD_STEP) used to merge the NAMD and GOMC data in order.
+
+    Parameters
+    ----------
+    e_stat_kcal_per_mol_gomc_box_x_df : pandas.DataFrame
+        The combined GOMC energy and stat data in the NAMD units
+        (energy = kcal/mol and density = g/cm^3).
+    volume : float or None, default = None
+        The constant volume which is used for all the GOMC steps.  If None,
+        the GOMC 'VOLUME' values are used, or 'NA' if they are not printed.
+    first_row_number : int, default = 0
+        The number of GOMC rows which are before these rows in the
+        combined data, which sets the modified steps of the rows.
+    volume_text : str or None, default = None
+        The constant volume as the text printed by NAMD, which is written
+        for all the GOMC steps.  If None, the volume is written as a number.
+
+    Returns
+    ---------
+    gomc_combined_data_box_x : dict
+        The GOMC columns of the combined data as numpy.ndarray.
+    """
+    gomc_df = e_stat_kcal_per_mol_gomc_box_x_df
+    gomc_step = gomc_df.loc[:, "#STEP"].to_numpy()
+    no_gomc_steps = len(gomc_step)
+
+    if volume is not None:
+        gomc_volume = np.full(no_gomc_steps, volume, dtype=np.float64)
+    elif "VOLUME" in gomc_df.columns:
+        gomc_volume = gomc_df.loc[:, "VOLUME"].to_numpy()
+    else:
+        gomc_volume = np.full(no_gomc_steps, np.nan)
+
+    if "PRESSURE" in gomc_df.columns:
+        gomc_pressure = gomc_df.loc[:, "PRESSURE"].to_numpy()
+    else:
+        gomc_pressure = np.full(no_gomc_steps, np.nan)
+
+    gomc_text_column_dict = {}
+    if volume is not None and volume_text is not None:
+        gomc_text_column_dict.update(
+            {
+                get_text_column_title("VOLUME"): np.full(
+                    no_gomc_steps, volume_text, dtype=object
+                )
+            }
+        )
+
+    return {
+        # add 0.4 or 0.1 to the GOMC modified timestep for easy sorting later
+        "MOD_STEP": gomc_step
+        + np.where(
+            np.arange(first_row_number, first_row_number + no_gomc_steps) % 2
+            == 1,
+            0.4 / 4,
+            0.4,
+        ),
+        "STEP": gomc_step,
+        "TOTAL_POT": gomc_df.loc[:, "TOTAL"].to_numpy(),
+        "TOTAL_ELECT": gomc_df.loc[:, "TOTAL_ELECT"].to_numpy(),
+        "TOTAL_VDW_plus_ELECT": (
+            gomc_df.loc[:, "INTRA(NB)"].to_numpy()
+            + gomc_df.loc[:, "INTER(LJ)"].to_numpy()
+            + gomc_df.loc[:, "TOTAL_ELECT"].to_numpy()
+        ),
+        "PRESSURE": gomc_pressure,
+        "VOLUME": gomc_volume,
+        "DENSITY": gomc_df.loc[:, "TOT_DENSITY"].to_numpy(),
+        **gomc_text_column_dict,
+    }
+
+
+def get_combined_data_df(
+    namd_combined_data_box_x=None, gomc_combined_data_box_x=None
+):
+    """
+    Merges the NAMD and GOMC columns of the combined data by the modified
+    step (MOD_STEP).  The NAMD and GOMC data are each already in MOD_STEP
+    order, so they are merged in a single pass (the GOMC rows are inserted
+    in the NAMD rows), without sorting all the combined data.  If either
+    is not in order, all the combined data is sorted.
+
+    Parameters
+    ----------
+    namd_combined_data_box_x : dict or None, default = None
+        The NAMD columns of the combined data,
+        from the get_namd_combined_data function.
+    gomc_combined_data_box_x : dict or None, default = None
+        The GOMC columns of the combined data,
+        from the get_gomc_combined_data function.
+
+    Returns
+    ---------
+    combined_data_box_x_df : pandas.DataFrame
+        The combined NAMD and GOMC data, in MOD_STEP order.
+    """
+    combined_data_title_list = [
+        "STEP",
+        "TOTAL_POT",
+        "TOTAL_ELECT",
+        "TOTAL_VDW_plus_ELECT",
+        "PRESSURE",
+        "VOLUME",
+        "DENSITY",
+    ]
+    engine_name_list = []
+    engine_combined_data_list = []
+    for engine_name, engine_combined_data in [
+        ("NAMD", namd_combined_data_box_x),
+        ("GOMC", gomc_combined_data_box_x),
+    ]:
+        if engine_combined_data is not None:
+            engine_name_list.append(engine_name)
+            engine_combined_data_list.append(engine_combined_data)
+
+    mod_step_list = [
+        engine_combined_data["MOD_STEP"]
+        for engine_combined_data in engine_combined_data_list
+    ]
+    engine_index = np.concatenate(
+        [
+            np.full(len(mod_step), engine_i, dtype=np.int8)
+            for engine_i, mod_step in enumerate(mod_step_list)
+        ]
+    )
+    if all(np.all(np.diff(mod_step) >= 0) for mod_step in mod_step_list):
+        if len(mod_step_list) == 2:
+            no_first_engine_rows = len(mod_step_list[0])
+            second_engine_merged_rows = np.searchsorted(
+                mod_step_list[0], mod_step_list[1], side="right"
+            ) + np.arange(len(mod_step_list[1]))
+            is_second_engine_row = np.zeros(len(engine_index), dtype=bool)
+            is_second_engine_row[second_engine_merged_rows] = True
+            merged_order = np.empty(len(engine_index), dtype=np.int64)
+            merged_order[~is_second_engine_row] = np.arange(
+                no_first_engine_rows
+            )
+            merged_order[is_second_engine_row] = np.arange(
+                no_first_engine_rows, len(engine_index)
+            )
+        else:
+            merged_order = np.arange(len(engine_index))
+    else:
+        merged_order = np.argsort(np.concatenate(mod_step_list), kind="stable")
+
+    combined_data_box_x_dict = {
+        "#ENGINE": np.array(engine_name_list)[engine_index[merged_order]]
+    }
+    for combined_data_title in combined_data_title_list:
+        combined_data_box_x_dict.update(
+            {
+                combined_data_title: np.concatenate(
+                    [
+                        engine_combined_data[combined_data_title]
+                        for engine_combined_data in engine_combined_data_list
+                    ]
+                )[merged_order]
+            }
+        )
+
+    # the engine text columns, with None for the engines without the text
+    for combined_data_title in combined_data_title_list:
+        text_column_title = get_text_column_title(combined_data_title)
+        if any(
+            text_column_title in engine_combined_data
+            for engine_combined_data in engine_combined_data_list
+        ):
+            combined_data_box_x_dict.update(
+                {
+                    text_column_title: np.concatenate(
+                        [
+                            engine_combined_data.get(
+                                text_column_title,
+                                np.full(
+                                    len(engine_combined_data["MOD_STEP"]),
+                                    None,
+                                    dtype=object,
+                                ),
+                            )
+                            for engine_combined_data in (
+                                engine_combined_data_list
+                            )
+                        ]
+                    )[merged_order]
+                }
+            )
+
+    return pd.DataFrame(combined_data_box_x_dict)
+
+    # ****************************************
+    # ****************************************
+    # GOMC-NAMD hybrid data extraction (start)
+    # ****************************************
+    # ****************************************
+
+
+def get_file_size(data_file):
+    """
+    Gets the size of an opened file, including the data which is not
+    written to the disk yet.
+
+    Parameters
+    ----------
+    data_file : writeable opened file
+        The opened file.
+
+    Returns
+    ---------
+    file_size : int
+        The size of the file in bytes.
+    """
+    data_file.flush()
+
+    return os.fstat(data_file.fileno()).st_size
+
+
+def write_provisional_data_table(
+    table_df,
+    table_filename,
+    no_provisional_rows,
+    append,
+    process_pool_executor=None,
+    output_format_list=None,
+    output_float_type="float64",
+):
+    """
+    Writes a combined data table, where the last rows (the provisional rows)
+    are from the last simulation cycle, and records the size of the table
+    file before them.  The provisional rows are removed and read again
+    when the next simulation cycles are appended, since the last simulation
+    cycle may not have been finished.
+
+    Parameters
+    ----------
+    table_df : pandas.DataFrame
+        The table, which is written with the column titles as the header.
+    table_filename : str
+        The table filename, including the path.
+    no_provisional_rows : int
+        The number of rows from the last simulation cycle.
+    append : bool
+        If True, the rows are appended to the existing table file, without
+        the header.
+    process_pool_executor : concurrent.futures.ProcessPoolExecutor or None,
+        default=None
+        The worker processes used to convert the columns to text at the same
+        time. If None, the columns are converted in this process.
+    output_format_list : list of str or None, default=None
+        The binary formats which the table is also written in
+        (see write_binary_data_tables).  If None, only the text table
+        is written.
+    output_float_type : str ('float64' or 'float32'), default='float64'
+        The float type of the float columns in the binary tables.
+
+    Returns
+    ---------
+    provisional_byte_offset : int
+        The size of the table file in bytes, before the provisional rows.
+    """
+    no_final_rows = len(table_df) - no_provisional_rows
+    write_data_table(
+        table_df.iloc[:no_final_rows],
+        table_filename,
+        process_pool_executor,
+        append=append,
+    )
+    provisional_byte_offset = os.path.getsize(table_filename)
+    write_data_table(
+        table_df.iloc[no_final_rows:],
+        table_filename,
+        process_pool_executor,
+        append=True,
+    )
+    if output_format_list is not None:
+        write_binary_data_tables(
+            table_df, table_filename, output_format_list, output_float_type
+        )
+
+    return provisional_byte_offset
+
+
+def get_combined_data_rows(engine_combined_data, row_selection):
+    """
+    Gets some of the rows of the NAMD or GOMC columns of the combined data.
+
+    Parameters
+    ----------
+    engine_combined_data : dict or None
+        The NAMD or GOMC columns of the combined data.
+    row_selection : slice or numpy.ndarray
+        The selected rows.
+
+    Returns
+    ---------
+    engine_combined_data_rows : dict or None
+        The selected rows of the NAMD or GOMC columns of the combined data,
+        or None if engine_combined_data is None.
+    """
+    if engine_combined_data is None:
+        return None
+
+    return {
+        combined_data_title: combined_data_values[row_selection]
+        for combined_data_title, combined_data_values in (
+            engine_combined_data.items()
+        )
+    }
+
+
+def join_combined_data(pending_engine_combined_data, engine_combined_data):
+    """
+    Joins the pending rows of the NAMD or GOMC columns of the combined data,
+    from the combine manifest, to the new rows.
+
+    Parameters
+    ----------
+    pending_engine_combined_data : dict or None
+        The pending NAMD or GOMC columns of the combined data, from the
+        combine manifest, with the values as lists.  If None, there are
+        no pending rows.
+    engine_combined_data : dict
+        The new NAMD or GOMC columns of the combined data.
+
+    Returns
+    ---------
+    joined_engine_combined_data : dict
+        The pending rows and then the new rows of the NAMD or GOMC columns
+        of the combined data.
+    """
+    if pending_engine_combined_data is None:
+        return engine_combined_data
+
+    # the pending rows have no engine text columns if the combine manifest
+    # was written before they were added, so they are written as numbers
+    no_pending_rows = len(pending_engine_combined_data["MOD_STEP"])
+
+    return {
+        combined_data_title: np.concatenate(
+            (
+                np.array(
+                    pending_engine_combined_data.get(
+                        combined_data_title, [None] * no_pending_rows
+                    ),
+                    dtype=combined_data_values.dtype,
+                ),
+                combined_data_values,
+            )
+        )
+        for combined_data_title, combined_data_values in (
+            engine_combined_data.items()
+        )
+    }
+
+
+def write_provisional_combined_data_table(
+    table_filename,
+    namd_combined_data_box_x,
+    gomc_combined_data_box_x,
+    no_provisional_namd_rows,
+    no_provisional_gomc_rows,
+    append,
+    process_pool_executor=None,
+    drop_volume=False,
+    output_format_list=None,
+    output_float_type="float64",
+):
+    """
+    Writes the combined NAMD and GOMC data table, where the provisional rows
+    are from the last simulation cycle, and records the size of the table
+    file before the rows which can still change when the next simulation
+    cycles are appended.
+
+    The combined rows are in the modified step (MOD_STEP) order, so the rows
+    of the earlier simulation cycles with a modified step at or above the
+    smallest one in the provisional rows (the pending rows) are also written
+    again when the next simulation cycles are appended (i.e., the NAMD
+    minimization timesteps are before the starting step of the NAMD run).
+
+    Parameters
+    ----------
+    table_filename : str
+        The table filename, including the path.
+    namd_combined_data_box_x : dict or None
+        The NAMD columns of the combined data, from the
+        get_namd_combined_data function, or None if there is no NAMD data.
+    gomc_combined_data_box_x : dict or None
+        The GOMC columns of the combined data, from the
+        get_gomc_combined_data function, or None if there is no GOMC data.
+    no_provisional_namd_rows : int
+        The number of NAMD rows from the last simulation cycle.
+    no_provisional_gomc_rows : int
+        The number of GOMC rows from the last simulation cycle.
+    append : bool
+        If True, the rows are appended to the existing table file, without
+        the header.
+    process_pool_executor : concurrent.futures.ProcessPoolExecutor or None,
+        default=None
+        The worker processes used to convert the columns to text at the same
+        time. If None, the columns are converted in this process.
+    drop_volume : bool, default=False
+        If True, the 'VOLUME' column is not written.
+    output_format_list : list of str or None, default=None
+        The binary formats which the table is also written in
+        (see write_binary_data_tables).  If None, only the text table
+        is written.
+    output_float_type : str ('float64' or 'float32'), default='float64'
+        The float type of the float columns in the binary tables.
+
+    Returns
+    ---------
+    combined_table_state : dict
+        The state of the combined data table with the keys:
+        'provisional_byte_offset' : int, the size of the table file in
+        bytes, before the pending and provisional rows.
+        'provisional_min_mod_step' : float, the smallest modified step in
+        the provisional rows.
+        'pending_namd_rows' and 'pending_gomc_rows' : dict or None, the
+        pending NAMD and GOMC columns of the combined data, with the values
+        as lists.
+    """
+    engine_combined_data_list = [
+        (namd_combined_data_box_x, no_provisional_namd_rows),
+        (gomc_combined_data_box_x, no_provisional_gomc_rows),
+    ]
+    provisional_min_mod_step = min(
+        [
+            float(
+                np.min(engine_combined_data["MOD_STEP"][-no_provisional_rows:])
+            )
+            for engine_combined_data, no_provisional_rows in (
+                engine_combined_data_list
+            )
+            if engine_combined_data is not None and no_provisional_rows > 0
+        ],
+        default=float("inf"),
+    )
 
-    # create the combined distribution dictionary
-    for i, line in enumerate(read_gomc_box_0_dist_file):
-        split_line = line.split()
-        new_key = split_line[0]
-        new_value = split_line[1]
+    final_engine_combined_data_list = []
+    provisional_engine_combined_data_list = []
+    pending_engine_combined_data_list = []
+    for engine_combined_data, no_provisional_rows in engine_combined_data_list:
+        if engine_combined_data is None:
+            final_engine_combined_data_list.append(None)
+            provisional_engine_combined_data_list.append(None)
+            pending_engine_combined_data_list.append(None)
+            continue
+
+        no_earlier_rows = len(engine_combined_data["MOD_STEP"]) - (
+            no_provisional_rows
+        )
+        is_final_row = engine_combined_data["MOD_STEP"] < (
+            provisional_min_mod_step
+        )
+        is_final_row[no_earlier_rows:] = False
+        is_pending_row = ~is_final_row
+        is_pending_row[no_earlier_rows:] = False
 
-        if new_key in current_dist_dict.keys():
-            current_value = current_dist_dict[new_key]
-            new_value = str(int(current_value) + int(new_value))
-            current_dist_dict.update({new_key: new_value})
-        else:
-            current_dist_dict.update({new_key: new_value})
+        final_engine_combined_data_list.append(
+            get_combined_data_rows(engine_combined_data, is_final_row)
+        )
+        provisional_engine_combined_data_list.append(
+            get_combined_data_rows(engine_combined_data, ~is_final_row)
+        )
+        pending_engine_combined_data_list.append(
+            {
+                combined_data_title: combined_data_values.tolist()
+                for combined_data_title, combined_data_values in (
+                    get_combined_data_rows(
+                        engine_combined_data, is_pending_row
+                    ).items()
+                )
+            }
+        )
+
+    final_combined_data_box_x_df = get_combined_data_df(
+        *final_engine_combined_data_list
+    )
+    provisional_combined_data_box_x_df = get_combined_data_df(
+        *provisional_engine_combined_data_list
+    )
+    if drop_volume is True:
+        volume_title_list = ["VOLUME", get_text_column_title("VOLUME")]
+        final_combined_data_box_x_df.drop(
+            volume_title_list, axis=1, inplace=True, errors="ignore"
+        )
+        provisional_combined_data_box_x_df.drop(
+            volume_title_list, axis=1, inplace=True, errors="ignore"
+        )
+
+    write_data_table(
+        final_combined_data_box_x_df,
+        table_filename,
+        process_pool_executor,
+        append=append,
+    )
+    provisional_byte_offset = os.path.getsize(table_filename)
+    write_data_table(
+        provisional_combined_data_box_x_df,
+        table_filename,
+        process_pool_executor,
+        append=True,
+    )
+    if output_format_list is not None:
+        write_binary_data_tables(
+            pd.concat(
+                [
+                    final_combined_data_box_x_df,
+                    provisional_combined_data_box_x_df,
+                ],
+                ignore_index=True,
+            ),
+            table_filename,
+            output_format_list,
+            output_float_type,
+        )
 
-    return current_dist_dict
+    return {
+        "provisional_byte_offset": provisional_byte_offset,
+        "provisional_min_mod_step": provisional_min_mod_step,
+        "pending_namd_rows": pending_engine_combined_data_list[0],
+        "pending_gomc_rows": pending_engine_combined_data_list[1],
+    }
 
 
-def get_gomc_log_data(
-    read_gomc_box_x_log_file,
-    gomc_box_x_data_file,
-    run_no,
-    box_no,
-    e_stat_values_gomc_box_x_list=None,
-    e_stat_values_gomc_kcal_per_mol_box_x_list=None,
+def read_combine_manifest(
+    combine_manifest_filename, combine_settings_dict, cycle_directory_dict
 ):
     """
-    Extracts the GOMC log data from every run (energy and state properties),
-    combining it into a list while adding the system density,
-    and also keeping the exact output lines from NAMD.
+    Reads the combine manifest, which records the simulation cycles that
+    are already in the combined data, and checks that the combined data
+    can be appended to.
 
     Parameters
     ----------
-    read_gomc_box_x_log_file : readable opened file with .readlines()
-        The read loaded namd log file with .readlines().
-    gomc_box_x_data_file : writeable opened file
-        The writeable opened file, which is used to write the combined
-        and compact data from the GOMC log file.
-    run_no : int
-        Simulation run number
-    box_no : int
-        The simulation box number, which can only be 0 or 1
-    e_stat_values_gomc_box_x_list : list, default = []
-        The GOMC log data (energy and stat values) output in the
-        standard GOMC units (energy = K and density = kg/m^3).
-        If the default value (empty list) is not used, the
-        provided list will be appended.  This needs provided not
-        reading 1st GOMC simulation.
-    e_stat_values_gomc_kcal_per_mol_box_x_list : list, default = None
-        The GOMC log data (energy and stat values) output in the
-        NAMD units (energy = kcal/mol and density = g/cm^3).
-        If the default value (empty list) is not used, the
-        provided list will be appended.  This needs provided not
-        reading 1st GOMC simulation.
+    combine_manifest_filename : str
+        The combine manifest (combine_manifest.json) filename, including
+        the path.
+    combine_settings_dict : dict
+        The current combining settings, which must be the same as the ones
+        in the combine manifest.
+    cycle_directory_dict : dict
+        The current NAMD and GOMC simulation cycle directories, with the
+        same keys as the combine manifest.  The combine manifest directories
+        must be the first directories in these lists.
 
     Returns
-    --------
-    e_titles_gomc_box_x_iteration : list
-        The energy titles of the GOMC energy data from the systems,
-        log file in GOMC units (energy = K and density = kg/m^3).
-    e_stat_titles_gomc_box_x_iter_list : list
-        The energy titles of the GOMC energy data from the systems
-        log file in GOMC units (energy = K and density = kg/m^3).
-    e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list :
-        The scaled (NAMD units: energy = kcal/mol and density = g/cm^3 ),
-        reorgainized, and combined titles from the GOMC log file.
-    e_stat_values_gomc_box_x_iteration_list :
-        The GOMC log file data output from this iteration
-        (GOMC units:energy = K and density = kg/m^3).
-    e_stat_values_gomc_kcal_per_mol_box_x_list :
-        The scaled (NAMD units: energy = kcal/mol and density = g/cm^3 ),
-        reorgainized, and combined data from the GOMC log file data output
-        from the flag input and whatever is added in this iteration.
-
-    Notes
-    --------
-    The timesteps are rescaled so that the NAMD and GOMC data are added
-    properly in order.
+    ---------
+    combine_manifest : dict
+        The combine manifest.
     """
-    error_for_bad_gomc_input_file_data = (
-        "ERROR: This GOMC file output file does not contain all "
-        "the required information. The Energy and Stat titles/values "
-        "are missing from the GOMC output/log file in "
-        "run number {} in box {}.".format(run_no, box_no)
+    error_for_bad_combine_manifest = (
+        "ERROR: The combine manifest file <{}> does not match the current "
+        "simulation settings or directories, so the new simulation cycles "
+        "can not be appended. Please combine all the simulation cycles again "
+        "with the -o or --overwrite flag as True.".format(
+            combine_manifest_filename
+        )
     )
 
-    if e_stat_values_gomc_box_x_list is None:
-        e_stat_values_gomc_box_x_list = []
-    else:
-        e_stat_values_gomc_box_x_list
-
-    if e_stat_values_gomc_kcal_per_mol_box_x_list is None:
-        e_stat_values_gomc_kcal_per_mol_box_x_list = []
-    else:
-        e_stat_values_gomc_kcal_per_mol_box_x_list
-
-    energy_string_label = "ENER_{}:".format(str(box_no))
-    stat_string_label = "STAT_{}:".format((box_no))
+    with open(combine_manifest_filename, "r") as combine_manifest_file:
+        combine_manifest = json.load(combine_manifest_file)
 
-    get_e_gomc_box_x_titles = True
-    get_stat_box_x_titles = True
+    for combine_setting, combine_setting_value in combine_settings_dict.items():
+        if combine_manifest.get(combine_setting) != combine_setting_value:
+            raise ValueError(error_for_bad_combine_manifest)
 
-    stat_values_box_x_list = []
-
-    for i, line in enumerate(read_gomc_box_x_log_file):
+    for directory_key, directory_list in cycle_directory_dict.items():
+        manifest_directory_list = combine_manifest.get(directory_key)
         if (
-            line.startswith("ETITLE:") is True
-            and get_e_gomc_box_x_titles is True
+            manifest_directory_list is None
+            or len(manifest_directory_list) == 0
+            or directory_list[: len(manifest_directory_list)]
+            != manifest_directory_list
         ):
-            if run_no == 1:
-                gomc_box_x_data_file.write("%s" % read_gomc_box_x_log_file[i])
-            e_titles_gomc_box_x_iteration = read_gomc_box_x_log_file[i]
-            e_titles_gomc_box_x_iteration = (
-                e_titles_gomc_box_x_iteration.split()
-            )
-            e_titles_gomc_box_x_iteration = e_titles_gomc_box_x_iteration[:]
-            if get_e_gomc_box_x_titles is True:
-                get_e_gomc_box_x_titles = False
-
-        if line.startswith(energy_string_label) is True:
-            e_values_gomc_box_x_iteration_list = []
-            e_values_kcal_per_mol_gomc_box_x_iteration_list = []
-            e_values_gomc_box_x_iteration = read_gomc_box_x_log_file[i]
-            e_values_gomc_box_x_iteration = (
-                e_values_gomc_box_x_iteration.split()
-            )
-
-            for j in range(0, len(e_values_gomc_box_x_iteration)):
-                if e_titles_gomc_box_x_iteration[j] == "ETITLE:":
-                    e_values_gomc_box_x_iteration_list.append(
-                        e_values_gomc_box_x_iteration[j]
-                    )
-                    e_values_kcal_per_mol_gomc_box_x_iteration_list.append(
-                        e_values_gomc_box_x_iteration[j]
-                    )
-                elif e_titles_gomc_box_x_iteration[j] == "STEP":
-                    e_values_gomc_box_x_iteration_list.append(
-                        str(
-                            int(
-                                int(e_values_gomc_box_x_iteration[j])
-                                + current_step
-                            )
-                        )
-                    )
-                    e_values_kcal_per_mol_gomc_box_x_iteration_list.append(
-                        str(
-                            int(
-                                int(e_values_gomc_box_x_iteration[j])
-                                + current_step
-                            )
-                        )
-                    )
-                else:
-                    e_values_gomc_box_x_iteration_list.append(
-                        str(float(e_values_gomc_box_x_iteration[j]) * 1)
-                    )
-                    e_values_kcal_per_mol_gomc_box_x_iteration_list.append(
-                        str(
-                            float(e_values_gomc_box_x_iteration[j])
-                            * K_to_kcal_mol
-                        )
-                    )
+            raise ValueError(error_for_bad_combine_manifest)
 
-            gomc_box_x_data_file.write(
-                "%s \n" % str("\t ".join(e_values_gomc_box_x_iteration_list))
-            )
+    return combine_manifest
 
-            # GOMC_box_X_Energies_Stat_file
 
-        if line.startswith("STITLE:") is True and get_stat_box_x_titles is True:
-            if run_no == 1:
-                gomc_box_x_data_file.write("%s" % read_gomc_box_x_log_file[i])
-            stat_titles_box_x_iteration = read_gomc_box_x_log_file[i]
-            stat_titles_box_x_iteration = stat_titles_box_x_iteration.split()
-            stat_titles_box_x_iteration = stat_titles_box_x_iteration[:]
-            if get_stat_box_x_titles is True:
-                get_stat_box_x_titles = False
+def write_combine_manifest(combine_manifest_filename, combine_manifest):
+    """
+    Writes the combine manifest, replacing the old one only after the new
+    one is fully written.
 
-        if line.startswith(stat_string_label) is True:
-            stat_values_box_x_iteration_list = []
-            stat_values_box_x_iteration = read_gomc_box_x_log_file[i]
-            stat_values_box_x_iteration = stat_values_box_x_iteration.split()
+    Parameters
+    ----------
+    combine_manifest_filename : str
+        The combine manifest (combine_manifest.json) filename, including
+        the path.
+    combine_manifest : dict
+        The combine manifest.
+    """
+    with open(
+        "{}.tmp".format(combine_manifest_filename), "w"
+    ) as combine_manifest_file:
+        json.dump(combine_manifest, combine_manifest_file, indent=4)
+    os.replace(
+        "{}.tmp".format(combine_manifest_filename), combine_manifest_filename
+    )
 
-            for j in range(0, len(stat_values_box_x_iteration)):
-                if stat_titles_box_x_iteration[j] == "STITLE:":
-                    stat_values_box_x_iteration_list.append(
-                        stat_values_box_x_iteration[j]
-                    )
-                elif stat_titles_box_x_iteration[j] == "STEP":
-                    stat_values_box_x_iteration_list.append(
-                        str(
-                            int(
-                                int(stat_values_box_x_iteration[j])
-                                + current_step
-                            )
-                        )
-                    )
-                    # stat_values_box_x_iteration_list.append(int(int(stat_values_box_x_iteration[j]) \
-                    # + current_step))
-                else:
-                    stat_values_box_x_iteration_list.append(
-                        str(float(stat_values_box_x_iteration[j]))
-                    )
 
-            gomc_box_x_data_file.write(
-                "%s \n" % str("\t ".join(stat_values_box_x_iteration_list))
-            )
-            stat_values_box_x_list.append(stat_values_box_x_iteration_list)
+def read_dcd_record(dcd_file, byte_order, dcd_filename):
+    """
+    Reads one Fortran unformatted record from a dcd file, which is the record
+    length, the record, and the record length again.
+
+    Parameters
+    ----------
+    dcd_file : file object
+        The dcd file, opened in binary mode at the start of the record.
+    byte_order : str ('<' or '>')
+        The byte order of the dcd file.
+    dcd_filename : str
+        The dcd file name, which is used in the error message.
 
-            # combine the energy and stat data (ENER_X and STAT_X) into 1 line and remove ENER_X and STAT_X) labels
-            e_stat_values_gomc_box_x_iteration_list = (
-                e_values_gomc_box_x_iteration_list[1:]
+    Returns
+    ---------
+    record_bytes : bytes
+        The record, without the record lengths.
+    """
+    record_length_dtype = "{}i4".format(byte_order)
+    record_length_bytes = dcd_file.read(4)
+    record_length = (
+        int(np.frombuffer(record_length_bytes, record_length_dtype)[0])
+        if len(record_length_bytes) == 4
+        else -1
+    )
+    record_bytes = dcd_file.read(max(record_length, 0))
+    end_record_length_bytes = dcd_file.read(4)
+    if (
+        record_length < 0
+        or len(record_bytes) != record_length
+        or len(end_record_length_bytes) != 4
+        or int(np.frombuffer(end_record_length_bytes, record_length_dtype)[0])
+        != record_length
+    ):
+        raise ValueError(
+            "ERROR: The dcd file <{}> has a corrupt header.".format(
+                dcd_filename
             )
-            e_stat_values_gomc_kcal_per_mol_box_x_iteration_list = (
-                e_values_kcal_per_mol_gomc_box_x_iteration_list[1:]
+        )
+
+    return record_bytes
+
+
+def read_dcd_header(dcd_filename):
+    """
+    Reads the header of a CHARMM/NAMD dcd file, which is a series of
+    Fortran unformatted records with 32-bit record markers.
+
+    Parameters
+    ----------
+    dcd_filename : str
+        The dcd file name, including the path.
+
+    Returns
+    ---------
+    dcd_header_dict : dict
+        The dcd header, with the keys:
+        'dcd_filename' (str),
+        'header_bytes' (bytes, the full header as written in the file),
+        'byte_order' (str, '<' or '>'),
+        'no_atoms' (int),
+        'unit_cell' (bool, True if every frame has a unit cell record),
+        'four_dims' (bool, True if every frame has a 4th coordinate record),
+        'frame_dtype' (numpy.dtype, one frame with its record markers),
+        'no_frames' (int, the number of full frames in the file).
+    """
+    with open_run_file(dcd_filename, "rb") as dcd_file:
+        first_record_marker = dcd_file.read(4)
+        if len(first_record_marker) < 4:
+            raise ValueError(
+                "ERROR: The dcd file <{}> is empty or is not a dcd file.".format(
+                    dcd_filename
+                )
             )
-            for z in range(2, len(stat_values_box_x_iteration_list)):
-                e_stat_values_gomc_box_x_iteration_list.append(
-                    stat_values_box_x_iteration_list[z]
+        for byte_order in ["<", ">"]:
+            if np.frombuffer(first_record_marker, "{}i4".format(byte_order))[
+                0
+            ] == int(84):
+                break
+        else:
+            raise ValueError(
+                "ERROR: The dcd file <{}> is not a CHARMM or NAMD dcd file, or "
+                "uses 64-bit record markers, which are not supported.".format(
+                    dcd_filename
                 )
-                if stat_titles_box_x_iteration[z] == "TOT_DENSITY":
-                    e_stat_values_gomc_kcal_per_mol_box_x_iteration_list.append(
-                        str(float(stat_values_box_x_iteration_list[z]) / 10**3)
-                    )
-                else:
-                    e_stat_values_gomc_kcal_per_mol_box_x_iteration_list.append(
-                        stat_values_box_x_iteration_list[z]
-                    )
+            )
 
-            e_stat_values_gomc_box_x_list.append(
-                e_stat_values_gomc_box_x_iteration_list
+        dcd_file.seek(0)
+        control_record = read_dcd_record(dcd_file, byte_order, dcd_filename)
+        if control_record[:4] != b"CORD":
+            raise ValueError(
+                "ERROR: The dcd file <{}> does not contain coordinates "
+                "(i.e., the CORD header).".format(dcd_filename)
             )
-            e_stat_values_gomc_kcal_per_mol_box_x_list.append(
-                e_stat_values_gomc_kcal_per_mol_box_x_iteration_list
+        control_values = np.frombuffer(
+            control_record[4:84], "{}i4".format(byte_order)
+        )
+        read_dcd_record(dcd_file, byte_order, dcd_filename)  # the title record
+        no_atoms = int(
+            np.frombuffer(
+                read_dcd_record(dcd_file, byte_order, dcd_filename),
+                "{}i4".format(byte_order),
+            )[0]
+        )
+        if int(control_values[8]) != 0:
+            raise ValueError(
+                "ERROR: The dcd file <{}> has fixed atoms, which are not "
+                "supported.".format(dcd_filename)
             )
+        header_length = dcd_file.tell()
+        dcd_file.seek(0)
+        header_bytes = dcd_file.read(header_length)
+
+    # the unit cell and 4th dimension flags are only in the CHARMM format,
+    # which has a nonzero CHARMM version as the last control value
+    charmm_format = int(control_values[19]) != 0
+    unit_cell = charmm_format and int(control_values[10]) == 1
+    four_dims = charmm_format and int(control_values[11]) == 1
+
+    frame_dtype_list = []
+    if unit_cell is True:
+        frame_dtype_list += [
+            ("unit_cell_start", "{}i4".format(byte_order)),
+            ("unit_cell", "{}f8".format(byte_order), (6,)),
+            ("unit_cell_end", "{}i4".format(byte_order)),
+        ]
+    for axis in ["x", "y", "z", "w"][: 4 if four_dims is True else 3]:
+        frame_dtype_list += [
+            ("{}_start".format(axis), "{}i4".format(byte_order)),
+            (axis, "{}f4".format(byte_order), (no_atoms,)),
+            ("{}_end".format(axis), "{}i4".format(byte_order)),
+        ]
+    frame_dtype = np.dtype(frame_dtype_list)
 
-            # combine the energy and stat titles (ENER_X and STAT_X) into 1 line and remove ENER_X and STAT_X) labels
-    try:
-        e_stat_titles_gomc_box_x_iter_list = e_titles_gomc_box_x_iteration[1:]
-    except:
-        raise ValueError(error_for_bad_gomc_input_file_data)
-    try:
-        e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list = (
-            e_titles_gomc_box_x_iteration[1:]
+    no_frame_bytes = get_run_file_size(dcd_filename) - header_length
+    if no_frame_bytes % frame_dtype.itemsize != 0:
+        warn(
+            "WARNING: The last frame in the dcd file <{}> is not complete, "
+            "so it is not combined.".format(dcd_filename)
         )
-    except:
-        raise ValueError(error_for_bad_gomc_input_file_data)
 
-    try:
-        isinstance(stat_titles_box_x_iteration, list)
-    except:
-        raise ValueError(error_for_bad_gomc_input_file_data)
+    return {
+        "dcd_filename": dcd_filename,
+        "header_bytes": header_bytes,
+        "byte_order": byte_order,
+        "no_atoms": no_atoms,
+        "unit_cell": unit_cell,
+        "four_dims": four_dims,
+        "frame_dtype": frame_dtype,
+        "no_frames": no_frame_bytes // frame_dtype.itemsize,
+    }
+
+
+def get_dcd_frame_indices(
+    no_frames_list, first_frame=0, frame_stride=1, first_dcd_frame=0
+):
+    """
+    Gets the frames which are taken from each dcd file, when the dcd files
+    are combined one after another and every frame_stride frame is taken,
+    starting at the first_frame of the combined frames.
+
+    Parameters
+    ----------
+    no_frames_list : list of int
+        The number of frames in each dcd file.
+    first_frame : int, default=0
+        The first combined frame which is taken (starting at 0).
+    frame_stride : int, default=1
+        The stride between the combined frames which are taken.
+    first_dcd_frame : int, default=0
+        The combined frame number of the first frame in the first dcd file
+        (i.e., the number of frames in the dcd files before it, when the
+        frames are appended to a combined dcd file).
+
+    Returns
+    ---------
+    dcd_frame_indices_list : list of numpy.ndarray
+        The frame indices which are taken from each dcd file.
+    """
+    dcd_frame_indices_list = []
+    dcd_first_frames = first_dcd_frame + np.concatenate(
+        ([0], np.cumsum(no_frames_list)[:-1])
+    )
+    for no_frames, dcd_first_frame in zip(no_frames_list, dcd_first_frames):
+        combined_frame_indices = np.arange(
+            dcd_first_frame, dcd_first_frame + no_frames
+        )
+        dcd_frame_indices_list.append(
+            np.flatnonzero(
+                (combined_frame_indices >= first_frame)
+                & ((combined_frame_indices - first_frame) % frame_stride == 0)
+            )
+        )
+
+    return dcd_frame_indices_list
+
+
+def get_dcd_frame_stride_indices(
+    dcd_frame_indices_list, frame_stride, first_selected_frame=0
+):
+    """
+    Takes every frame_stride of the selected dcd frames, over all the dcd
+    files (i.e., over the combined frames, not within each dcd file).
+
+    Parameters
+    ----------
+    dcd_frame_indices_list : list of numpy.ndarray
+        The frame indices which are selected from each dcd file.
+    frame_stride : int
+        The stride between the selected frames which are taken.
+    first_selected_frame : int, default=0
+        The number of selected frames before the first dcd file (i.e., the
+        selected frames in the dcd files before it, when the frames are
+        appended to a combined dcd file), so the stride continues from them.
+
+    Returns
+    ---------
+    dcd_frame_indices_list : list of numpy.ndarray
+        The frame indices which are taken from each dcd file.
+    """
+    if frame_stride == 1:
+        return dcd_frame_indices_list
+
+    no_selected_frames_list = [
+        len(dcd_frame_indices) for dcd_frame_indices in dcd_frame_indices_list
+    ]
 
-    for z in range(2, len(stat_titles_box_x_iteration)):
-        e_stat_titles_gomc_box_x_iter_list.append(
-            stat_titles_box_x_iteration[z]
+    return [
+        dcd_frame_indices[stride_frame_positions]
+        for dcd_frame_indices, stride_frame_positions in zip(
+            dcd_frame_indices_list,
+            get_dcd_frame_indices(
+                no_selected_frames_list,
+                frame_stride=frame_stride,
+                first_dcd_frame=first_selected_frame,
+            ),
         )
-        e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list.append(
-            stat_titles_box_x_iteration[z]
+    ]
+
+
+def get_dcd_frame_budget_indices(dcd_frame_indices_list, max_frames):
+    """
+    Takes every Nth of the selected dcd frames, over all the dcd files, so
+    the combined dcd file has no more than the max_frames frames.
+
+    Parameters
+    ----------
+    dcd_frame_indices_list : list of numpy.ndarray
+        The frame indices which are selected from each dcd file.
+    max_frames : int or None
+        The maximum number of frames in the combined dcd file.  If None,
+        all the selected frames are taken.
+
+    Returns
+    ---------
+    dcd_frame_indices_list : list of numpy.ndarray
+        The frame indices which are taken from each dcd file.
+    budget_frame_stride : int
+        The stride between the selected frames which are taken.
+    """
+    no_selected_frames_list = [
+        len(dcd_frame_indices) for dcd_frame_indices in dcd_frame_indices_list
+    ]
+    if max_frames is None or sum(no_selected_frames_list) <= max_frames:
+        return dcd_frame_indices_list, 1
+
+    budget_frame_stride = int(
+        np.ceil(sum(no_selected_frames_list) / max_frames)
+    )
+    dcd_frame_indices_list = [
+        dcd_frame_indices[budget_frame_positions]
+        for dcd_frame_indices, budget_frame_positions in zip(
+            dcd_frame_indices_list,
+            get_dcd_frame_indices(
+                no_selected_frames_list, frame_stride=budget_frame_stride
+            ),
         )
+    ]
+
+    return dcd_frame_indices_list, budget_frame_stride
 
-    # add a pound symbol (#) before some of the titles
-    if str(e_stat_titles_gomc_box_x_iter_list[0][0]) != "#":
-        e_stat_titles_gomc_box_x_iter_list[0] = "#" + str(
-            e_stat_titles_gomc_box_x_iter_list[0]
+
+def get_dcd_frame_blocks(dcd_header, dcd_frame_indices, no_block_frames):
+    """
+    Gets the selected frames of a dcd file in blocks, so the dcd file is
+    not read into memory.  The dcd files in the run folders are memory
+    mapped, and the archived dcd files are read from the archive in order,
+    one block of frames at a time.
+
+    Parameters
+    ----------
+    dcd_header : dict
+        The dcd file header, from the read_dcd_header function.
+    dcd_frame_indices : numpy.ndarray
+        The frame indices which are taken from the dcd file, in order.
+    no_block_frames : int
+        The maximum number of frames in each block.
+
+    Yields
+    ---------
+    dcd_frame_block : numpy.ndarray
+        The next block of the selected frames, with the dcd frame dtype.
+    """
+    frame_dtype = dcd_header["frame_dtype"]
+    header_length = len(dcd_header["header_bytes"])
+    if os.path.exists(dcd_header["dcd_filename"]):
+        dcd_frames = np.memmap(
+            dcd_header["dcd_filename"],
+            dtype=frame_dtype,
+            mode="r",
+            offset=header_length,
+            shape=(dcd_header["no_frames"],),
         )
+        for block_start in range(0, len(dcd_frame_indices), no_block_frames):
+            yield dcd_frames[
+                dcd_frame_indices[block_start : block_start + no_block_frames]
+            ]
+        del dcd_frames
+        return
+
+    dcd_frame_indices = np.asarray(dcd_frame_indices)
+    with open_run_file(dcd_header["dcd_filename"], "rb") as dcd_file:
+        for block_start in range(0, dcd_header["no_frames"], no_block_frames):
+            no_read_frames = min(
+                no_block_frames, dcd_header["no_frames"] - block_start
+            )
+            block_frame_indices = (
+                dcd_frame_indices[
+                    (dcd_frame_indices >= block_start)
+                    & (dcd_frame_indices < block_start + no_read_frames)
+                ]
+                - block_start
+            )
+            if len(block_frame_indices) == 0:
+                continue
+            dcd_file.seek(header_length + block_start * frame_dtype.itemsize)
+            yield np.frombuffer(
+                dcd_file.read(no_read_frames * frame_dtype.itemsize),
+                dtype=frame_dtype,
+                count=no_read_frames,
+            )[block_frame_indices]
+
+
+def write_combined_dcd_file(
+    combined_dcd_filename,
+    dcd_header_list,
+    dcd_frame_indices_list,
+    append_byte_offset=None,
+):
+    """
+    Writes the selected frames of the dcd files into one dcd file, in a
+    single pass. The frames are streamed from each dcd file in blocks, and
+    the number of frames in the header is set after all the frames are
+    written.
 
-        if (
-            str(e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list[0][0])
-            != "#"
-        ):
-            e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list[0] = (
-                "#{}".format(
-                    str(
-                        e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list[
-                            0
-                        ]
+    Parameters
+    ----------
+    combined_dcd_filename : str
+        The combined dcd file name, including the path.
+    dcd_header_list : list of dict
+        The dcd file headers, from the read_dcd_header function.  The
+        combined dcd file uses the header of the first dcd file.
+    dcd_frame_indices_list : list of numpy.ndarray
+        The frame indices which are taken from each dcd file.
+    append_byte_offset : int or None, default=None
+        If not None, the frames are appended to the existing combined dcd
+        file, which is cut at this byte offset first (i.e., the frames of
+        the provisional cycle are removed, as they are written again).
+        The existing combined dcd file header is kept.
+
+    Returns
+    ---------
+    no_combined_frames : int
+        The number of frames in the combined dcd file.
+    """
+    # check all the dcd files can be combined, before writing any frames
+    if append_byte_offset is None:
+        first_dcd_header = dcd_header_list[0]
+    else:
+        first_dcd_header = read_dcd_header(combined_dcd_filename)
+    for dcd_header in dcd_header_list:
+        for dcd_header_key in ["no_atoms", "unit_cell", "four_dims"]:
+            if dcd_header[dcd_header_key] != first_dcd_header[dcd_header_key]:
+                raise ValueError(
+                    "ERROR: The dcd file <{}> can not be combined with the dcd "
+                    "file <{}>, since the {} values are different ({} and {})."
+                    "".format(
+                        dcd_header["dcd_filename"],
+                        first_dcd_header["dcd_filename"],
+                        dcd_header_key,
+                        dcd_header[dcd_header_key],
+                        first_dcd_header[dcd_header_key],
                     )
                 )
-            )
 
-    try:
-        isinstance(e_titles_gomc_box_x_iteration, list)
-        isinstance(e_stat_titles_gomc_box_x_iter_list, list)
-        isinstance(e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list, list)
-        isinstance(e_stat_values_gomc_box_x_iteration_list, list)
-        isinstance(e_stat_values_gomc_box_x_list, list)
-        isinstance(e_stat_values_gomc_kcal_per_mol_box_x_list, list)
-    except:
-        raise ValueError(error_for_bad_gomc_input_file_data)
-
-    return (
-        e_titles_gomc_box_x_iteration,
-        e_stat_titles_gomc_box_x_iter_list,
-        e_titles_kcal_per_mol_stat_titles_gomc_box_x_iter_list,
-        e_stat_values_gomc_box_x_iteration_list,
-        e_stat_values_gomc_box_x_list,
-        e_stat_values_gomc_kcal_per_mol_box_x_list,
-    )
+    combined_frame_dtype = first_dcd_header["frame_dtype"]
+    no_block_frames = max(1, 2**26 // combined_frame_dtype.itemsize)
+    if append_byte_offset is None:
+        no_combined_frames = 0
+        combined_dcd_file_mode = "wb"
+    else:
+        no_combined_frames = (
+            append_byte_offset - len(first_dcd_header["header_bytes"])
+        ) // combined_frame_dtype.itemsize
+        combined_dcd_file_mode = "r+b"
+    with open(
+        combined_dcd_filename, combined_dcd_file_mode
+    ) as combined_dcd_file:
+        if append_byte_offset is None:
+            combined_dcd_file.write(first_dcd_header["header_bytes"])
+        else:
+            combined_dcd_file.truncate(append_byte_offset)
+            combined_dcd_file.seek(append_byte_offset)
+        for dcd_header, dcd_frame_indices in zip(
+            dcd_header_list, dcd_frame_indices_list
+        ):
+            if len(dcd_frame_indices) == 0:
+                continue
+            for dcd_frame_block in get_dcd_frame_blocks(
+                dcd_header, dcd_frame_indices, no_block_frames
+            ):
+                for frame_title in dcd_frame_block.dtype.names:
+                    if frame_title.endswith(("_start", "_end")) and np.any(
+                        dcd_frame_block[frame_title]
+                        != dcd_frame_block.dtype[
+                            frame_title.rsplit("_", 1)[0]
+                        ].itemsize
+                    ):
+                        raise ValueError(
+                            "ERROR: The dcd file <{}> has a corrupt frame."
+                            "".format(dcd_header["dcd_filename"])
+                        )
+                # the frames are byte swapped if the byte order is different
+                dcd_frame_block.astype(combined_frame_dtype, copy=False).tofile(
+                    combined_dcd_file
+                )
+                no_combined_frames += len(dcd_frame_block)
+
+        # the number of frames is the first control value in the header
+        combined_dcd_file.seek(8)
+        combined_dcd_file.write(
+            np.array(
+                [no_combined_frames],
+                dtype="{}i4".format(first_dcd_header["byte_order"]),
+            ).tobytes()
+        )
 
-    # ****************************************
-    # ****************************************
-    # GOMC-NAMD hybrid data extraction (start)
-    # ****************************************
-    # ****************************************
+    return no_combined_frames
 
 
 def combine_dcd_files(
@@ -1042,10 +3293,14 @@ def combine_dcd_files(
     engine_directory_list,
     path_engine_runs,
     box_no=0,
+    combine_dcd_files_frame_stride=1,
+    combine_dcd_files_max_frames=None,
+    combined_dcd_manifest_dict=None,
 ):
     """
     Extracts the GOMC or NAMD dcd data from every run,
-    combining it into one dcd file.
+    combining it into one dcd file.  The frames which are not taken
+    are not read.
 
     Parameters
     ----------
@@ -1068,372 +3323,386 @@ def combine_dcd_files(
         run are stored
     box_no : int
         The simulation box number, which can only be 0 or 1
+    combine_dcd_files_frame_stride : int, default=1
+        The stride between the frames which are taken, over all the
+        combined frames (not within each dcd file).
+        Example: 1 will yield every frame
+        Example: 2 will yield every other frame of the combined frames
+    combine_dcd_files_max_frames : int or None, default=None
+        The maximum number of frames in the combined dcd file. If there
+        are more frames, every Nth frame of all the combined frames is
+        taken (i.e., a cycle stride for the GOMC dcd files, which have one
+        frame per cycle). If None, all the frames are taken.
+    combined_dcd_manifest_dict : dict or None, default=None
+        The combined dcd files in the combine manifest, from the last time
+        the data was combined, {combined dcd file name: combined dcd entry}.
+        If the combined dcd file has an entry with the same dcd settings,
+        only the frames from its provisional simulation folder (the last
+        folder which was combined) onward are read, and they are appended
+        to the combined dcd file.  If None, all the frames are combined.
+
+    Returns
+    ---------
+    dcd_combine_stats_dict : dict or None
+        The 'engine_name', 'box_no', 'no_frames', 'no_bytes' (the combined
+        dcd file size), 'no_written_frames' and 'no_written_bytes' (the
+        frames and bytes written this time), 'seconds' (the combining time),
+        'appended' (if the frames were appended), 'combined_dcd_filename' and
+        'combined_dcd_entry' (the combine manifest entry, or None if the
+        frames can not be appended next time) of the combined dcd file,
+        or None if no dcd files are combined.
     """
 
     # ****************************************************************
     # combine the Engine dcd files (start)
     # ****************************************************************
-    # make all the  dcd filenames (with paths) a list in string form for the dcdcat
+    dcd_combine_start_time = time.perf_counter()
     print(
         "INFO: Starting the dcd combining for box {} the {} simulation.".format(
             str(box_no), str(path_engine_runs)
         )
     )
 
-    # need to iterate thru the dcd files if combining greater than 1000
-    max_no_engine_catdcd_per_run = 1000
     engine_directory_list_with_freq = engine_directory_list[
         ::combine_dcd_files_cycle_freq
     ]
-
     if len(engine_directory_list_with_freq) == 0:
-        engine_dcd_cat_iterations = int(0)
-    else:
-        engine_dcd_cat_iterations = int(
-            len(engine_directory_list_with_freq) / max_no_engine_catdcd_per_run
-            + 1
+        warn(
+            "WARNING: There are no {} dcd files to combine for box {}.".format(
+                str(engine_name), str(box_no)
+            )
         )
+        return None
 
-    engine_dcd_iter_even_name_str = "iter_0_box_{}_{}_dcd_files.dcd".format(
-        str(box_no), str(engine_name)
-    )
-    engine_dcd_iter_odd_name_str = "iter_1_box_{}_{}_dcd_files.dcd".format(
-        str(box_no), str(engine_name)
-    )
-    engine_dcd_combined_for_mod_name_str = (
-        "combined_box_for_mod_{}_{}_dcd_files.dcd".format(
-            str(box_no), str(engine_name)
-        )
-    )
     engine_dcd_combined_name_str = "combined_box_{}_{}_dcd_files.dcd".format(
         str(box_no), str(engine_name)
     )
+    engine_dcd_combined_filename = "{}/{}".format(
+        str(path_combined_data_folder), engine_dcd_combined_name_str
+    )
 
-    nested_list_engine_dcd_filenames = []
-    for q in range(0, engine_dcd_cat_iterations):
-        dcd_cat_engine_box_x_filename_str = ""
-        if q == 0:
-            dcd_starting_cat_engine_box_x_filename_str = ""
-        elif q % 2 == 0 and q != 0:
-            dcd_starting_cat_engine_box_x_filename_str = "{}/{}".format(
-                str(path_combined_data_folder), engine_dcd_iter_odd_name_str
-            )
-        elif q % 2 == 1:
-            dcd_starting_cat_engine_box_x_filename_str = "{}/{}".format(
-                str(path_combined_data_folder), engine_dcd_iter_even_name_str
-            )
-
-        start_engine_file_no = q * max_no_engine_catdcd_per_run
-
-        if (q + 1) * max_no_engine_catdcd_per_run >= len(
-            engine_directory_list_with_freq
-        ):
-            end_engine_file_no = len(engine_directory_list_with_freq)
-
-        else:
-            end_engine_file_no = (q + 1) * max_no_engine_catdcd_per_run
-
-        for dcd_cat_Engine_box_X_file_i in range(
-            start_engine_file_no, end_engine_file_no, 1
-        ):
-            dcd_cat_engine_box_x_filename_str += " {}/{}/{}".format(
-                path_engine_runs,
-                str(
-                    engine_directory_list_with_freq[dcd_cat_Engine_box_X_file_i]
-                ),
-                str(engine_dcd_file_name),
-            )
-        nested_list_engine_dcd_filenames.append(
-            dcd_cat_engine_box_x_filename_str
+    # the frames are appended from the provisional simulation folder, if the
+    # combined dcd file was written with the same settings and folders
+    dcd_settings_list = [
+        engine_dcd_file_name,
+        combine_dcd_files_cycle_freq,
+        combine_dcd_files_frame_stride,
+        combine_dcd_files_max_frames,
+        get_initial_gomc_dcd,
+    ]
+    combined_dcd_entry = None
+    if combined_dcd_manifest_dict is not None:
+        combined_dcd_entry = combined_dcd_manifest_dict.get(
+            engine_dcd_combined_name_str
         )
+    if combined_dcd_entry is not None and (
+        combined_dcd_entry["dcd_settings"] != dcd_settings_list
+        or "provisional_first_selected_frame" not in combined_dcd_entry
+        or combined_dcd_entry["provisional_directory_index"]
+        >= len(engine_directory_list)
+        or engine_directory_list[
+            combined_dcd_entry["provisional_directory_index"]
+        ]
+        != combined_dcd_entry["provisional_directory"]
+        or not os.path.exists(engine_dcd_combined_filename)
+        or os.path.getsize(engine_dcd_combined_filename)
+        < combined_dcd_entry["provisional_byte_offset"]
+    ):
+        combined_dcd_entry = None
 
-        if q == (engine_dcd_cat_iterations - 1):
-            # need to only read the last frame in each cycle as GOMC prints the an intial (step 1) and last frame
-            engine_final_iter_dcdcat_command = "{} -o {}/{} {} {}" "".format(
-                str(rel_path_to_combine_binary_catdcd),
-                str(path_combined_data_folder),
-                engine_dcd_combined_for_mod_name_str,
-                dcd_starting_cat_engine_box_x_filename_str,
-                nested_list_engine_dcd_filenames[q],
-            )
-
-            print(
-                "engine_final_iter_dcdcat_command = {}".format(
-                    str(engine_final_iter_dcdcat_command)
-                )
-            )
-            exec_engine_final_iter_dcdcat_command = subprocess.Popen(
-                engine_final_iter_dcdcat_command,
-                shell=True,
-                stderr=subprocess.STDOUT,
-            )
-            os.waitpid(
-                exec_engine_final_iter_dcdcat_command.pid, os.WSTOPPED
-            )  # pauses python until GOMC sim done
-
-        else:
-            if q == 0:
-                run_engine_dcdcat_box_x_command = "{} -o {}/{} {} {}" "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    engine_dcd_iter_even_name_str,
-                    dcd_starting_cat_engine_box_x_filename_str,
-                    nested_list_engine_dcd_filenames[q],
-                )
-
-            elif q % 2 == 0 and q != 0:
-                run_engine_dcdcat_box_x_command = "{} -o {}/{} {} {}" "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    engine_dcd_iter_even_name_str,
-                    dcd_starting_cat_engine_box_x_filename_str,
-                    nested_list_engine_dcd_filenames[q],
-                )
-
-            elif q % 2 == 1:
-                run_engine_dcdcat_box_x_command = "{} -o {}/{} {} {}" "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    engine_dcd_iter_odd_name_str,
-                    dcd_starting_cat_engine_box_x_filename_str,
-                    nested_list_engine_dcd_filenames[q],
-                )
-
-            exec_engine_dcdcat_box_x_command = subprocess.Popen(
-                run_engine_dcdcat_box_x_command,
-                shell=True,
-                stderr=subprocess.STDOUT,
-            )
-
-            os.waitpid(
-                exec_engine_dcdcat_box_x_command.pid, os.WSTOPPED
-            )  # pauses python until GOMC sim done
-
-    # the combined final Engine dcd file
-    if engine_name == "GOMC":
-
-        if get_initial_gomc_dcd == True:
-            # take only the last frame from GOMC.  Now GOMC only outputs the last frame so only need (i.e., -stride 1)
-            initial_engine_dcd_combined_for_mod_name_str = (
-                "initial_box_for_mod_{}_{}_dcd_files.dcd"
-                "".format(str(box_no), str(engine_name))
-            )
-            mod_engine_dcd_combined_for_mod_name_str = (
-                "mod_box_for_mod_{}_{}_dcd_files.dcd"
-                "".format(str(box_no), str(engine_name))
-            )
-
-            run_initial_engine_dcdcat_box_x_command = (
-                "{} -o {}/{} -first 1 -last 1 {}/{}/{}"
-                "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    initial_engine_dcd_combined_for_mod_name_str,
-                    str(engine_name),
-                    str(engine_directory_list[0]),
-                    str("Output_data_BOX_0.dcd"),
-                )
-            )
-
-            print(
-                "run_initial_engine_dcdcat_box_x_command = "
-                + str(run_initial_engine_dcdcat_box_x_command)
-            )
-            print(
-                "nested_list_engine_dcd_filenames "
-                + str(nested_list_engine_dcd_filenames)
-            )
-            print("engine_directory_list = " + str(engine_directory_list))
-
-            exec_run_initial_engine_dcdcat_box_x_command = subprocess.Popen(
-                run_initial_engine_dcdcat_box_x_command,
-                shell=True,
-                stderr=subprocess.STDOUT,
-            )
-
-            os.waitpid(
-                exec_run_initial_engine_dcdcat_box_x_command.pid, os.WSTOPPED
-            )
-
-            run_mod_engine_dcdcat_box_x_command = (
-                "{} -o {}/{} -first 2 -stride 2 {}/{}"
-                "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    mod_engine_dcd_combined_for_mod_name_str,
-                    str(path_combined_data_folder),
-                    engine_dcd_combined_for_mod_name_str,
-                )
-            )
-
-            exec_run_mod_engine_dcdcat_box_x_command = subprocess.Popen(
-                run_mod_engine_dcdcat_box_x_command,
-                shell=True,
-                stderr=subprocess.STDOUT,
-            )
+    if combined_dcd_entry is None:
+        first_directory_index = 0
+        first_dcd_frame = 0
+        first_selected_frame = 0
+        append_byte_offset = None
+    else:
+        first_directory_index = combined_dcd_entry[
+            "provisional_directory_index"
+        ]
+        first_dcd_frame = combined_dcd_entry["provisional_first_frame"]
+        first_selected_frame = combined_dcd_entry[
+            "provisional_first_selected_frame"
+        ]
+        append_byte_offset = combined_dcd_entry["provisional_byte_offset"]
+    engine_directory_index_list = list(
+        range(
+            first_directory_index,
+            len(engine_directory_list),
+            combine_dcd_files_cycle_freq,
+        )
+    )
 
-            os.waitpid(
-                exec_run_mod_engine_dcdcat_box_x_command.pid, os.WSTOPPED
+    # read all the dcd headers first, so a dcd file which can not be
+    # combined is found before the combined dcd file is written
+    engine_dcd_header_list = [
+        read_dcd_header(
+            "{}/{}/{}".format(
+                path_engine_runs,
+                str(engine_directory_list[engine_directory_index]),
+                str(engine_dcd_file_name),
             )
+        )
+        for engine_directory_index in engine_directory_index_list
+    ]
+    engine_no_frames_list = [
+        engine_dcd_header["no_frames"]
+        for engine_dcd_header in engine_dcd_header_list
+    ]
 
-            run_engine_dcdcat_box_x_command = (
-                "{} -o {}/{} {}/{} {}/{}"
-                "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    engine_dcd_combined_name_str,
-                    str(path_combined_data_folder),
-                    str(initial_engine_dcd_combined_for_mod_name_str),
-                    str(path_combined_data_folder),
-                    str(mod_engine_dcd_combined_for_mod_name_str),
-                )
-            )
+    if engine_name == "GOMC":
+        # GOMC prints the initial (step 1) and last frame in each run, so
+        # only the last frame of each run is taken
+        engine_dcd_frame_indices_list = get_dcd_frame_indices(
+            engine_no_frames_list,
+            first_frame=1,
+            frame_stride=2,
+            first_dcd_frame=first_dcd_frame,
+        )
 
-        else:
-            # take only the last frame from GOMC.  Now GOMC only outputs the last frame so only need (i.e., -stride 1)
-            run_engine_dcdcat_box_x_command = (
-                "{} -o {}/{} -first 2 -stride 2 {}/{}"
-                "".format(
-                    str(rel_path_to_combine_binary_catdcd),
-                    str(path_combined_data_folder),
-                    engine_dcd_combined_name_str,
-                    str(path_combined_data_folder),
-                    engine_dcd_combined_for_mod_name_str,
-                )
+        if get_initial_gomc_dcd == True and append_byte_offset is None:
+            # add the initial frame of the first GOMC run
+            engine_dcd_header_list.insert(
+                0,
+                read_dcd_header(
+                    "{}/{}/{}".format(
+                        path_engine_runs,
+                        str(engine_directory_list[0]),
+                        str(engine_dcd_file_name),
+                    )
+                ),
             )
+            engine_dcd_frame_indices_list.insert(0, np.arange(0, 1))
 
-    # take only the last frame from NAMD.  NAMD only outputs the last frame so only need (i.e., -stride 1)
+    # take all the frames from NAMD.  NAMD only outputs the last frame
     elif engine_name == "NAMD":
-        run_engine_dcdcat_box_x_command = (
-            "{} -o {}/{} -stride 1 {}/{}"
-            "".format(
-                str(rel_path_to_combine_binary_catdcd),
-                str(path_combined_data_folder),
-                engine_dcd_combined_name_str,
-                str(path_combined_data_folder),
-                engine_dcd_combined_for_mod_name_str,
-            )
+        engine_dcd_frame_indices_list = get_dcd_frame_indices(
+            engine_no_frames_list
         )
     else:
         warn(
             "the variable engine_name in the function combine_dcd_files can only be a string"
             " NAMD or GOMC."
         )
+        return None
 
-    exec_run_engine_dcdcat_box_x_command = subprocess.Popen(
-        run_engine_dcdcat_box_x_command, shell=True, stderr=subprocess.STDOUT
-    )
-
-    os.waitpid(exec_run_engine_dcdcat_box_x_command.pid, os.WSTOPPED)
-
-    run_gomc_rm_gomc_final_iter_dcdcat_command = "rm {}/{}".format(
-        str(path_combined_data_folder), engine_dcd_combined_for_mod_name_str
-    )
-
-    exec_gomc_final_iter_dcdcat_command = subprocess.Popen(
-        run_gomc_rm_gomc_final_iter_dcdcat_command,
-        shell=True,
-        stderr=subprocess.STDOUT,
-    )
-    os.waitpid(exec_gomc_final_iter_dcdcat_command.pid, os.WSTOPPED)
-
-    # remove the even iteration Engine dcd file
-    run_engine_rm_dcd_iter_even_box_x_command = "rm {}/{}".format(
-        str(path_combined_data_folder), engine_dcd_iter_even_name_str
-    )
-
-    exec_engine_rm_dcd_iter_even_box_x_command = subprocess.Popen(
-        run_engine_rm_dcd_iter_even_box_x_command,
-        shell=True,
-        stderr=subprocess.STDOUT,
-    )
-
-    os.waitpid(
-        exec_engine_rm_dcd_iter_even_box_x_command.pid, os.WSTOPPED
-    )  # pauses python until GOMC sim done
-
-    # remove the odd iteration Engine dcd file
-    run_engine_rm_dcd_iter_odd_box_x_command = "rm {}/{}".format(
-        str(path_combined_data_folder), engine_dcd_iter_odd_name_str
-    )
-
-    exec_engine_rm_dcd_iter_odd_box_x_command = subprocess.Popen(
-        run_engine_rm_dcd_iter_odd_box_x_command,
-        shell=True,
-        stderr=subprocess.STDOUT,
-    )
-
-    os.waitpid(
-        exec_engine_rm_dcd_iter_odd_box_x_command.pid, os.WSTOPPED
-    )  # pauses python until GOMC sim done
-
-    run_cp_gomc_box_x_psf_command = "cp {}/{}/{} {}/{}".format(
-        str(path_gomc_runs),
-        str(gomc_directory_list[0]),
-        "Output_data_merged.psf",
-        str(path_combined_data_folder),
-        "Output_data_merged.psf",
-    )
-
-    exec_cp_gomc_box_x_psf_command = subprocess.Popen(
-        run_cp_gomc_box_x_psf_command, shell=True, stderr=subprocess.STDOUT
+    # the frame stride is taken over all the combined frames, since each
+    # NAMD and GOMC dcd file normally only has one frame which is taken
+    engine_no_selected_frames_list = [
+        len(engine_dcd_frame_indices)
+        for engine_dcd_frame_indices in engine_dcd_frame_indices_list
+    ]
+    engine_dcd_frame_indices_list = get_dcd_frame_stride_indices(
+        engine_dcd_frame_indices_list,
+        combine_dcd_files_frame_stride,
+        first_selected_frame=first_selected_frame,
     )
-    os.waitpid(
-        exec_cp_gomc_box_x_psf_command.pid, os.WSTOPPED
-    )  # pauses python until GOMC sim done
 
-    # remove the initial and mod (ever run not the start of run dcd) files
-    if engine_name == "GOMC":
-        if get_initial_gomc_dcd == True:
-            run_initial_engine_rm_dcd = "rm {}/{}".format(
-                str(path_combined_data_folder),
-                str(initial_engine_dcd_combined_for_mod_name_str),
+    if append_byte_offset is not None:
+        # the frame budget stride can only be kept if all the frames fit
+        if combine_dcd_files_max_frames is not None and (
+            combined_dcd_entry["provisional_no_frames"]
+            + sum(
+                len(engine_dcd_frame_indices)
+                for engine_dcd_frame_indices in engine_dcd_frame_indices_list
             )
-            exec_initial_engine_rm_dcd_command = subprocess.Popen(
-                run_initial_engine_rm_dcd, shell=True, stderr=subprocess.STDOUT
+            > combine_dcd_files_max_frames
+        ):
+            print(
+                "INFO: The combined dcd file for box {} the {} simulation "
+                "would have more than {} frames, so all the frames are "
+                "combined again.".format(
+                    str(box_no),
+                    str(path_engine_runs),
+                    combine_dcd_files_max_frames,
+                )
             )
-            os.waitpid(
-                exec_initial_engine_rm_dcd_command.pid, os.WSTOPPED
-            )  # pauses python until GOMC sim done
-
-            run_mod_engine_rm_dcd = "rm {}/{}".format(
-                str(path_combined_data_folder),
-                str(mod_engine_dcd_combined_for_mod_name_str),
+            return combine_dcd_files(
+                engine_name,
+                combine_dcd_files_cycle_freq,
+                engine_dcd_file_name,
+                engine_directory_list,
+                path_engine_runs,
+                box_no=box_no,
+                combine_dcd_files_frame_stride=combine_dcd_files_frame_stride,
+                combine_dcd_files_max_frames=combine_dcd_files_max_frames,
+            )
+        budget_frame_stride = 1
+        print(
+            "INFO: Appending the {} dcd files from the simulation folder {} "
+            "onward for box {} the {} simulation.".format(
+                str(engine_name),
+                str(engine_directory_list[first_directory_index]),
+                str(box_no),
+                str(path_engine_runs),
             )
-            exec_mod_engine_rm_dcd_command = subprocess.Popen(
-                run_mod_engine_rm_dcd, shell=True, stderr=subprocess.STDOUT
+        )
+    else:
+        (
+            engine_dcd_frame_indices_list,
+            budget_frame_stride,
+        ) = get_dcd_frame_budget_indices(
+            engine_dcd_frame_indices_list, combine_dcd_files_max_frames
+        )
+        if budget_frame_stride > 1:
+            print(
+                "INFO: One of every {} frames is taken for box {} the {} simulation, so "
+                "the combined dcd file has no more than {} frames.".format(
+                    budget_frame_stride,
+                    str(box_no),
+                    str(path_engine_runs),
+                    combine_dcd_files_max_frames,
+                )
             )
-            os.waitpid(
-                exec_mod_engine_rm_dcd_command.pid, os.WSTOPPED
-            )  # pauses python until GOMC sim done
+
+    no_combined_frames = write_combined_dcd_file(
+        engine_dcd_combined_filename,
+        engine_dcd_header_list,
+        engine_dcd_frame_indices_list,
+        append_byte_offset=append_byte_offset,
+    )
+
+    # the frames of the last simulation folder (the provisional folder) are
+    # written again the next time the frames are appended, since the folder
+    # may not have been finished.  The frames can not be appended if only
+    # every Nth frame is taken for the frame budget.
+    if budget_frame_stride == 1:
+        combined_dcd_header = read_dcd_header(engine_dcd_combined_filename)
+        provisional_no_frames = no_combined_frames - len(
+            engine_dcd_frame_indices_list[-1]
+        )
+        new_combined_dcd_entry = {
+            "dcd_settings": dcd_settings_list,
+            "provisional_directory_index": engine_directory_index_list[-1],
+            "provisional_directory": str(
+                engine_directory_list[engine_directory_index_list[-1]]
+            ),
+            "provisional_first_frame": int(
+                first_dcd_frame + sum(engine_no_frames_list[:-1])
+            ),
+            "provisional_first_selected_frame": int(
+                first_selected_frame + sum(engine_no_selected_frames_list[:-1])
+            ),
+            "provisional_no_frames": int(provisional_no_frames),
+            "provisional_byte_offset": int(
+                len(combined_dcd_header["header_bytes"])
+                + provisional_no_frames
+                * combined_dcd_header["frame_dtype"].itemsize
+            ),
+        }
+    else:
+        new_combined_dcd_entry = None
 
     print(
-        "INFO: Finished the dcd combining for box {} the {} simulation ".format(
-            str(box_no), str(path_engine_runs)
+        "INFO: Finished the dcd combining for box {} the {} simulation "
+        "({} frames).".format(
+            str(box_no), str(path_engine_runs), no_combined_frames
         )
     )
 
+    return {
+        "engine_name": engine_name,
+        "box_no": box_no,
+        "no_frames": no_combined_frames,
+        "no_bytes": os.path.getsize(engine_dcd_combined_filename),
+        "no_written_frames": no_combined_frames
+        - (
+            0
+            if combined_dcd_entry is None
+            else combined_dcd_entry["provisional_no_frames"]
+        ),
+        "no_written_bytes": os.path.getsize(engine_dcd_combined_filename)
+        - (0 if append_byte_offset is None else append_byte_offset),
+        "seconds": time.perf_counter() - dcd_combine_start_time,
+        "appended": append_byte_offset is not None,
+        "combined_dcd_filename": engine_dcd_combined_name_str,
+        "combined_dcd_entry": new_combined_dcd_entry,
+    }
+
+
+# the worker processes used to read the log files and write the tables
+process_pool_executor = get_process_pool_executor(jobs)
 
 if simulation_engine_options == "Hybrid":
 
+    # the simulation cycles which are already in the combined data are in
+    # the combine manifest.  The last simulation cycle in the combine
+    # manifest (the provisional cycle) may not have been finished, so it is
+    # removed from the combined data files and read again.
+    no_cycles = int(total_sims_namd_gomc / 2)
+    combine_settings_dict = {
+        "simulation_type": simulation_type,
+        "only_use_box_0_for_namd_for_gemc": only_use_box_0_for_namd_for_gemc,
+    }
+    cycle_directory_dict = {
+        "namd_box_0_directories": namd_directory_a_list[:no_cycles],
+        "gomc_directories": gomc_directory_list[:no_cycles],
+    }
+    if (
+        simulation_type in ["GEMC"]
+        and only_use_box_0_for_namd_for_gemc is False
+    ):
+        cycle_directory_dict.update(
+            {"namd_box_1_directories": namd_directory_b_list[:no_cycles]}
+        )
+
+    if append_to_combined_data is True:
+        combine_manifest = read_combine_manifest(
+            combine_manifest_filename,
+            combine_settings_dict,
+            cycle_directory_dict,
+        )
+        first_cycle = combine_manifest["provisional_cycle"]
+        first_run_starting_step = combine_manifest[
+            "provisional_run_starting_step"
+        ]
+        gomc_first_row_number_dict = {
+            int(box_no): no_rows
+            for box_no, no_rows in combine_manifest[
+                "provisional_gomc_row_numbers"
+            ].items()
+        }
+        pending_combined_table_dict = combine_manifest["combined_tables"]
+        combined_dcd_manifest_dict = combine_manifest.get("combined_dcds", {})
+        print(
+            "INFO: Appending the simulation cycles {} to {} to the combined data "
+            "(cycle {} is read again, since it may not have been finished when "
+            "the data was last combined).".format(
+                first_cycle, no_cycles - 1, first_cycle
+            )
+        )
+    else:
+        combine_manifest = None
+        first_cycle = 0
+        first_run_starting_step = 0
+        gomc_first_row_number_dict = {0: 0, 1: 0}
+        pending_combined_table_dict = {}
+        combined_dcd_manifest_dict = None
+
     # ****************************************************************
-    # combine the NAMD dcd files (start)
+    # combine the NAMD and GOMC dcd files (start)
     # ****************************************************************
+    if simulation_type in ["GEMC"]:
+        gomc_box_no_list = [0, 1]
+    else:
+        gomc_box_no_list = [0]
 
+    # the dcd files for each engine and box are combined into different
+    # files, so they are combined at the same time in the worker processes
+    dcd_combine_arguments_list = []
     if combine_namd_dcd_file is True:
         if simulation_type in ["NVT", "NPT"]:
-            namd_name = "NAMD"
-            namd_directory_list = namd_directory_a_list
-            namd_directory_dcd_filnames = "namdOut.dcd"
-            namd_path_engine_runs = path_namd_runs
-            namd_box_no = 0
-            combine_dcd_files(
-                namd_name,
-                combine_dcd_files_cycle_freq,
-                namd_directory_dcd_filnames,
-                namd_directory_list,
-                namd_path_engine_runs,
-                namd_box_no,
+            dcd_combine_arguments_list.append(
+                (
+                    "NAMD",
+                    combine_dcd_files_cycle_freq,
+                    "namdOut.dcd",
+                    namd_directory_a_list,
+                    path_namd_runs,
+                    0,
+                    combine_dcd_files_frame_stride,
+                    combine_dcd_files_max_frames,
+                    combined_dcd_manifest_dict,
+                )
             )
 
         else:
@@ -1442,45 +3711,299 @@ if simulation_engine_options == "Hybrid":
                 "in the GCMC and GEMC simulations. "
             )
 
-    # make all the box 0 and 1 dcd filenames (with paths) a list in string form for the dcdcat GOMC program'
     if combine_gomc_dcd_file is True:
+        for gomc_box_no in gomc_box_no_list:
+            dcd_combine_arguments_list.append(
+                (
+                    "GOMC",
+                    combine_dcd_files_cycle_freq,
+                    "Output_data_BOX_{}.dcd".format(gomc_box_no),
+                    gomc_directory_list,
+                    path_gomc_runs,
+                    gomc_box_no,
+                    combine_dcd_files_frame_stride,
+                    combine_dcd_files_max_frames,
+                    combined_dcd_manifest_dict,
+                )
+            )
 
-        gomc_name = "GOMC"
-        gomc_directory_list = gomc_directory_list
-        gomc_directory_dcd_filnames = "Output_data_BOX_0.dcd"
-        gomc_path_engine_runs = path_gomc_runs
-        gomc_box_no = 0
-        combine_dcd_files(
-            gomc_name,
-            combine_dcd_files_cycle_freq,
-            gomc_directory_dcd_filnames,
-            gomc_directory_list,
-            gomc_path_engine_runs,
-            gomc_box_no,
-        )
-
-        if simulation_type in ["GEMC"]:
-            gomc_name = "GOMC"
-            gomc_directory_list = gomc_directory_list
-            gomc_directory_dcd_filnames = "Output_data_BOX_1.dcd"
-            gomc_path_engine_runs = path_gomc_runs
-            gomc_box_no = 1
-            combine_dcd_files(
-                gomc_name,
-                combine_dcd_files_cycle_freq,
-                gomc_directory_dcd_filnames,
-                gomc_directory_list,
-                gomc_path_engine_runs,
-                gomc_box_no,
+    dcd_combine_stats_list = get_run_data_list(
+        combine_dcd_files,
+        dcd_combine_arguments_list,
+        jobs,
+        process_pool_executor,
+    )
+    # the combined dcd files which can be appended to, for the combine manifest
+    new_combined_dcd_manifest_dict = {}
+    for dcd_combine_stats_dict in dcd_combine_stats_list:
+        if dcd_combine_stats_dict is None:
+            continue
+        if dcd_combine_stats_dict["combined_dcd_entry"] is not None:
+            new_combined_dcd_manifest_dict[
+                dcd_combine_stats_dict["combined_dcd_filename"]
+            ] = dcd_combine_stats_dict["combined_dcd_entry"]
+        dcd_combine_seconds = max(dcd_combine_stats_dict["seconds"], 1e-9)
+        print(
+            "INFO: {} the {} box {} dcd files: {} frames and {:.1f} MB "
+            "in {:.2f} s ({:.1f} MB/s, {:.1f} frames/s), {} frames in the "
+            "combined dcd file.".format(
+                (
+                    "Appended"
+                    if dcd_combine_stats_dict["appended"] is True
+                    else "Combined"
+                ),
+                dcd_combine_stats_dict["engine_name"],
+                dcd_combine_stats_dict["box_no"],
+                dcd_combine_stats_dict["no_written_frames"],
+                dcd_combine_stats_dict["no_written_bytes"] / 10**6,
+                dcd_combine_stats_dict["seconds"],
+                dcd_combine_stats_dict["no_written_bytes"]
+                / 10**6
+                / dcd_combine_seconds,
+                dcd_combine_stats_dict["no_written_frames"]
+                / dcd_combine_seconds,
+                dcd_combine_stats_dict["no_frames"],
+            )
+        )
+
+    if any(
+        dcd_combine_stats_dict is not None
+        for dcd_combine_stats_dict in dcd_combine_stats_list
+    ):
+        # the psf file may be in an archive, so it is copied from python
+        gomc_psf_filename = "{}/{}/{}".format(
+            str(path_gomc_runs),
+            str(gomc_directory_list[0]),
+            "Output_data_merged.psf",
+        )
+        try:
+            with open_run_file(gomc_psf_filename, "rb") as read_gomc_psf_file:
+                with open(
+                    "{}/{}".format(
+                        str(path_combined_data_folder), "Output_data_merged.psf"
+                    ),
+                    "wb",
+                ) as gomc_psf_file:
+                    shutil.copyfileobj(read_gomc_psf_file, gomc_psf_file)
+        except FileNotFoundError:
+            warn(
+                "WARNING: The GOMC psf file <{}> does not exist, so it is not "
+                "copied to the combined data folder.".format(gomc_psf_filename)
             )
+    # ****************************************************************
+    # combine the NAMD and GOMC dcd files (end)
+    # ****************************************************************
 
     print(
         "INFO: Started all data combined from the log files for the NAMD-GOMC hybrid simulations "
         "and exported into muliple files and types"
     )
-    current_step = 0
-    # analyze and combine the data for the GOMC and NAMD simulations
-    for run_no in range(0, total_sims_namd_gomc):
+    first_run_no = 2 * first_cycle
+
+    # read the NAMD and GOMC log files from every run on their own, so they
+    # can be read at the same time in the worker processes
+    namd_box_0_log_data_list = get_run_data_list(
+        read_namd_log_data,
+        [
+            (
+                "{}/{}/{}".format(
+                    full_path_to_namd_data_folder,
+                    str(namd_directory_a_list[namd_interation]),
+                    "out.dat",
+                ),
+                2 * namd_interation,
+            )
+            for namd_interation in range(first_cycle, no_cycles)
+        ],
+        jobs,
+        process_pool_executor,
+    )
+    if (
+        simulation_type in ["GEMC"]
+        and only_use_box_0_for_namd_for_gemc is False
+    ):
+        namd_box_1_log_data_list = get_run_data_list(
+            read_namd_log_data,
+            [
+                (
+                    "{}/{}/{}".format(
+                        full_path_to_namd_data_folder,
+                        str(namd_directory_b_list[namd_interation]),
+                        "out.dat",
+                    ),
+                    2 * namd_interation,
+                )
+                for namd_interation in range(first_cycle, no_cycles)
+            ],
+            jobs,
+            process_pool_executor,
+        )
+    gomc_log_data_list = get_run_data_list(
+        read_gomc_log_data,
+        [
+            (
+                "{}/{}/{}".format(
+                    full_path_to_gomc_data_folder,
+                    str(gomc_directory_list[gomc_interation]),
+                    "out.dat",
+                ),
+                2 * gomc_interation + 1,
+                gomc_box_no_list,
+            )
+            for gomc_interation in range(first_cycle, no_cycles)
+        ],
+        jobs,
+        process_pool_executor,
+    )
+
+    # the starting step of each run is the prefix sum of the steps in all
+    # the runs before it. The NAMD minimization timesteps are not counted,
+    # as they are before the starting step of the NAMD run.
+    run_steps = np.zeros(total_sims_namd_gomc - first_run_no, dtype=np.int64)
+    run_steps[0::2] = [
+        namd_box_0_log_data["last_step"]
+        - int(namd_box_0_log_data["minimizing_steps"])
+        for namd_box_0_log_data in namd_box_0_log_data_list
+    ]
+    run_steps[1::2] = [
+        gomc_log_data["box_data"][0]["last_step"]
+        for gomc_log_data in gomc_log_data_list
+    ]
+    run_starting_steps = first_run_starting_step + np.concatenate(
+        ([0], np.cumsum(run_steps)[:-1])
+    )
+
+    e_titles_namd_box_0_density_iteration = get_namd_density_titles(
+        namd_box_0_log_data_list[0]["e_titles"]
+    )
+    if (
+        simulation_type in ["GEMC"]
+        and only_use_box_0_for_namd_for_gemc is False
+    ):
+        e_titles_namd_box_1_density_iteration = get_namd_density_titles(
+            namd_box_1_log_data_list[0]["e_titles"]
+        )
+    e_titles_gomc_iteration = gomc_log_data_list[0]["e_titles"]
+    stat_titles_gomc_iteration = gomc_log_data_list[0]["stat_titles"]
+
+    if combine_manifest is not None:
+        # the NAMD minimization timesteps of the new runs can not be before
+        # the combined data rows which are not written again
+        for namd_interation, namd_box_0_log_data in enumerate(
+            namd_box_0_log_data_list
+        ):
+            namd_step_offset = int(
+                run_starting_steps[2 * namd_interation]
+                - int(namd_box_0_log_data["minimizing_steps"])
+            )
+            namd_box_x_log_data_dict = {"0": namd_box_0_log_data}
+            if (
+                simulation_type in ["GEMC"]
+                and only_use_box_0_for_namd_for_gemc is False
+            ):
+                namd_box_x_log_data_dict.update(
+                    {"1": namd_box_1_log_data_list[namd_interation]}
+                )
+            for box_no, namd_box_x_log_data in namd_box_x_log_data_dict.items():
+                shifted_ts = (
+                    namd_box_x_log_data["e_values"][
+                        :, namd_box_x_log_data["e_titles"].index("TS") - 1
+                    ].astype(np.int64)
+                    + namd_step_offset
+                )
+                shifted_ts = shifted_ts[shifted_ts >= 0]
+                if len(shifted_ts) > 0 and np.min(shifted_ts) + 0.2 < (
+                    pending_combined_table_dict[box_no][
+                        "provisional_min_mod_step"
+                    ]
+                ):
+                    raise ValueError(
+                        "ERROR: The NAMD minimization timesteps in the new "
+                        "simulation cycles are before the data which is "
+                        "already combined, so the new simulation cycles can "
+                        "not be appended. Please combine all the simulation "
+                        "cycles again with the -o or --overwrite flag as True."
+                    )
+
+        # remove the provisional cycle from the combined data files
+        for (
+            combined_data_filename_only,
+            provisional_byte_offset,
+        ) in combine_manifest["provisional_byte_offsets"].items():
+            os.truncate(
+                "{}/{}".format(
+                    full_path_to_combined_data_folder,
+                    combined_data_filename_only,
+                ),
+                provisional_byte_offset,
+            )
+
+        if simulation_type in ["GCMC"]:
+            dict_of_current_dist_dicts = {
+                int(residue_j): dict(res_dict_of_current_dist_dicts)
+                for residue_j, res_dict_of_current_dist_dicts in (
+                    combine_manifest["provisional_dist_data"].items()
+                )
+            }
+
+    # the GOMC dist files for each residue, before and in the last cycle
+    if simulation_type in ["GCMC"]:
+        dist_filename_dict = {
+            residue_j: [] for residue_j in dict_of_current_dist_dicts
+        }
+        provisional_dist_filename_dict = {
+            residue_j: [] for residue_j in dict_of_current_dist_dicts
+        }
+
+    # the NAMD and GOMC data blocks from each run, which are joined at the end
+    e_values_namd_box_0_density_block_list = []
+    e_values_namd_box_1_density_block_list = []
+    e_value_texts_namd_box_0_density_block_list = []
+    e_value_texts_namd_box_1_density_block_list = []
+    e_stat_values_gomc_box_0_block_list = []
+    e_stat_values_gomc_box_1_block_list = []
+
+    # write and combine the data for the GOMC and NAMD simulations in order
+    for run_no in range(first_run_no, total_sims_namd_gomc):
+
+        # record where the last simulation cycle starts in the combined data
+        # files, since it is read again when the next cycles are appended
+        if run_no == total_sims_namd_gomc - 2:
+            provisional_byte_offset_dict = {
+                os.path.basename(namd_box_0_data_filename): get_file_size(
+                    namd_box_0_data_file
+                ),
+                os.path.basename(gomc_box_0_data_filename): get_file_size(
+                    gomc_box_0_data_file
+                ),
+            }
+            if (
+                simulation_type in ["GEMC"]
+                and only_use_box_0_for_namd_for_gemc is False
+            ):
+                provisional_byte_offset_dict.update(
+                    {
+                        os.path.basename(
+                            namd_box_1_data_filename
+                        ): get_file_size(namd_box_1_data_file)
+                    }
+                )
+            if simulation_type in ["GEMC"]:
+                provisional_byte_offset_dict.update(
+                    {
+                        os.path.basename(
+                            gomc_box_1_data_filename
+                        ): get_file_size(gomc_box_1_data_file)
+                    }
+                )
+            if simulation_type in ["GCMC"]:
+                provisional_byte_offset_dict.update(
+                    {
+                        os.path.basename(
+                            gomc_box_0_hist_filename
+                        ): get_file_size(gomc_box_0_hist_file)
+                    }
+                )
 
         if (
             run_no % 2 == 0
@@ -1488,106 +4011,51 @@ if simulation_engine_options == "Hybrid":
             # *************************************
             # get final system energies for box 0 and 1 (start)
             # ***********************initial_Energies**************
-            namd_interation = int(run_no / 2)
-            no_namd_box_0_directory = str(
-                namd_directory_a_list[namd_interation]
-            )
-
-            read_namd_box_0_log_file = open(
-                full_path_to_namd_data_folder
-                + "/"
-                + no_namd_box_0_directory
-                + "/"
-                + "out.dat",
-                "r",
-            ).readlines()
+            namd_interation = int((run_no - first_run_no) / 2)
+            namd_box_0_log_data = namd_box_0_log_data_list[namd_interation]
 
-            for i, line in enumerate(read_namd_box_0_log_file):
-                split_line = line.split()
-                if line.startswith("TCL:") is True:
-                    if split_line[0] == "TCL:" and len(split_line) >= 5:
-                        if (
-                            split_line[1] == "Minimizing"
-                            and split_line[2] == "for"
-                            and split_line[4] == "steps"
-                        ):
-                            namd_minimizing_steps_box_0 = float(split_line[3])
-                            current_step += -1 * namd_minimizing_steps_box_0
-
-            if run_no == 0:
-                (
-                    e_titles_namd_box_0_iteration,
-                    e_titles_namd_box_0_density_iteration,
-                    e_values_namd_box_0_iteration,
-                    e_values_namd_box_0_density_list,
-                    e_property_values_namd_box_0_list,
-                ) = get_namd_log_data(
-                    read_namd_box_0_log_file, namd_box_0_data_file, run_no
-                )
+            # the NAMD minimization timesteps are before the starting step
+            namd_step_offset = int(
+                run_starting_steps[run_no - first_run_no]
+                - int(namd_box_0_log_data["minimizing_steps"])
+            )
+            (
+                e_values_namd_box_0_density_block,
+                e_value_texts_namd_box_0_density_block,
+            ) = write_namd_log_data(
+                namd_box_0_log_data,
+                namd_box_0_data_file,
+                run_no,
+                namd_step_offset,
+            )
+            e_values_namd_box_0_density_block_list.append(
+                e_values_namd_box_0_density_block
+            )
+            e_value_texts_namd_box_0_density_block_list.append(
+                e_value_texts_namd_box_0_density_block
+            )
 
-            else:
-                (
-                    e_titles_namd_box_0_iteration,
-                    e_titles_namd_box_0_density_iteration,
-                    e_values_namd_box_0_iteration,
-                    e_values_namd_box_0_density_list,
-                    e_property_values_namd_box_0_list,
-                ) = get_namd_log_data(
-                    read_namd_box_0_log_file,
-                    namd_box_0_data_file,
-                    run_no,
-                    e_values_namd_box_x_density_list=e_values_namd_box_0_density_list,
-                    e_titles_namd_box_x_iteration=e_titles_namd_box_0_iteration,
-                    e_titles_namd_box_x_density_iteration=e_titles_namd_box_0_density_iteration,
-                )
             # note NAMD energy units in kcal/mol (no modifications required)
             # generate energy file data for box 1
             if (
                 simulation_type in ["GEMC"]
                 and only_use_box_0_for_namd_for_gemc is False
             ):
-
-                namd_interation = str(namd_directory_b_list[namd_interation])
-
-                read_namd_box_1_log_file = open(
-                    full_path_to_namd_data_folder
-                    + "/"
-                    + namd_interation
-                    + "/"
-                    + "out.dat",
-                    "r",
-                ).readlines()
-
-                if run_no == 0:
-                    (
-                        e_titles_namd_box_1_iteration,
-                        e_titles_namd_box_1_density_iteration,
-                        e_values_namdD_box_1_iteration,
-                        e_values_namd_box_1_density_iteration,
-                        e_values_namd_box_1_density_list,
-                        e_property_values_namd_box_1_list,
-                    ) = get_namd_log_data(
-                        read_namd_box_1_log_file, namd_box_1_data_file, run_no
-                    )
-                else:
-                    (
-                        e_titles_namd_box_1_iteration,
-                        e_titles_namd_box_1_density_iteration,
-                        e_values_namdD_box_1_iteration,
-                        e_values_namd_box_1_density_iteration,
-                        e_values_namd_box_1_density_list,
-                        e_property_values_namd_box_1_list,
-                    ) = get_namd_log_data(
-                        read_namd_box_1_log_file,
-                        namd_box_1_data_file,
-                        run_no,
-                        e_values_namd_box_x_density_list=e_values_namd_box_1_density_list,
-                        e_titles_namd_box_x_iteration=e_titles_namd_box_1_iteration,
-                        e_titles_namd_box_x_density_iteration=e_titles_namd_box_1_density_iteration,
-                    )
-
-            current_step = int(e_property_values_namd_box_0_list[-1][1])
-            # print('NAMD current_step = ' + str(int(current_step)))
+                (
+                    e_values_namd_box_1_density_block,
+                    e_value_texts_namd_box_1_density_block,
+                ) = write_namd_log_data(
+                    namd_box_1_log_data_list[namd_interation],
+                    namd_box_1_data_file,
+                    run_no,
+                    namd_step_offset,
+                )
+                e_values_namd_box_1_density_block_list.append(
+                    e_values_namd_box_1_density_block
+                )
+                e_value_texts_namd_box_1_density_block_list.append(
+                    e_value_texts_namd_box_1_density_block
+                )
             # *************************************
             # get final system energies for box 0 and 1 (start)
             # *************************************
@@ -1607,637 +4075,427 @@ if simulation_engine_options == "Hybrid":
             # GOMC's run time.  GOMC starts simulation series
             gomc_interation = int(run_no / 2)
             no_gomc_directory = str(gomc_directory_list[gomc_interation])
+            gomc_log_data = gomc_log_data_list[gomc_interation - first_cycle]
+            gomc_step_offset = int(run_starting_steps[run_no - first_run_no])
 
-            read_gomc_box_0_log_file = open(
-                "{}/{}/{}".format(
-                    full_path_to_gomc_data_folder, no_gomc_directory, "out.dat"
-                ),
-                "r",
-            ).readlines()
-
-            # get box 0 data
-            box_no_0 = int(0)
-            if run_no == 1:
-                (
-                    e_titles_gomc_box_0_iteration,
-                    e_titles_Stat_titles_gomc_box_0_iteration_list,
-                    e_titles_kcal_per_mol_stat_titles_gomc_box_0_iteration_list,
-                    e_stat_values_gomc_box_0_iteration_list,
-                    e_stat_values_gomc_box_0_list,
-                    e_stat_values_gomc_kcal_per_mol_box_0_list,
-                ) = get_gomc_log_data(
-                    read_gomc_box_0_log_file,
+            e_stat_values_gomc_box_0_block_list.append(
+                write_gomc_log_data(
+                    gomc_log_data,
                     gomc_box_0_data_file,
                     run_no,
-                    box_no_0,
-                )
-            else:
-                (
-                    e_titles_gomc_box_0_iteration,
-                    e_titles_Stat_titles_gomc_box_0_iteration_list,
-                    e_titles_kcal_per_mol_stat_titles_gomc_box_0_iteration_list,
-                    e_stat_values_gomc_box_0_iteration_list,
-                    e_stat_values_gomc_box_0_list,
-                    e_stat_values_gomc_kcal_per_mol_box_0_list,
-                ) = get_gomc_log_data(
-                    read_gomc_box_0_log_file,
-                    gomc_box_0_data_file,
-                    run_no,
-                    box_no_0,
-                    e_stat_values_gomc_box_x_list=e_stat_values_gomc_box_0_list,
-                    e_stat_values_gomc_kcal_per_mol_box_x_list=e_stat_values_gomc_kcal_per_mol_box_0_list,
+                    0,
+                    gomc_step_offset,
                 )
+            )
 
             # note GOMC energy units in kcal/mol
             # generate energy and system file data for box 1
             if simulation_type in ["GEMC"]:
-                read_gomc_box_1_log_file = open(
-                    "{}/{}/{}".format(
-                        full_path_to_gomc_data_folder,
-                        no_gomc_directory,
-                        "out.dat",
-                    ),
-                    "r",
-                ).readlines()
-
-                box_no_1 = int(1)
-                if run_no == 1:
-                    (
-                        e_titles_gomc_box_1_iteration,
-                        e_titles_stat_titles_gomc_box_1_iteration_list,
-                        e_titles_kcal_per_mol_stat_titles_gomc_box_1_iteration_list,
-                        e_stat_values_gomc_box_1_iteration_list,
-                        e_stat_values_gomc_box_1_list,
-                        e_stat_values_gomc_kcal_per_mol_box_1_list,
-                    ) = get_gomc_log_data(
-                        read_gomc_box_1_log_file,
-                        gomc_box_1_data_file,
-                        run_no,
-                        box_no_1,
-                    )
-                else:
-                    (
-                        e_titles_gomc_box_1_iteration,
-                        e_titles_stat_titles_gomc_box_1_iteration_list,
-                        e_titles_kcal_per_mol_stat_titles_gomc_box_1_iteration_list,
-                        e_stat_values_gomc_box_1_iteration_list,
-                        e_stat_values_gomc_box_1_list,
-                        e_stat_values_gomc_kcal_per_mol_box_1_list,
-                    ) = get_gomc_log_data(
-                        read_gomc_box_1_log_file,
+                e_stat_values_gomc_box_1_block_list.append(
+                    write_gomc_log_data(
+                        gomc_log_data,
                         gomc_box_1_data_file,
                         run_no,
-                        box_no_1,
-                        e_stat_values_gomc_box_x_list=e_stat_values_gomc_box_1_list,
-                        e_stat_values_gomc_kcal_per_mol_box_x_list=e_stat_values_gomc_kcal_per_mol_box_1_list,
+                        1,
+                        gomc_step_offset,
                     )
+                )
 
             # get histogram data
             if simulation_type in ["GCMC"]:
-                read_gomc_box_0_hist_file = open(
+                with open_run_file(
                     "{}/{}/{}".format(
                         full_path_to_gomc_data_folder,
                         no_gomc_directory,
                         "his1a.dat",
                     ),
-                    "r",
-                ).readlines()
-
-                box_no_0 = 0
-                # output the combined histogram data
-                get_gomc_hist_data(
-                    read_gomc_box_0_hist_file, gomc_box_0_hist_file, run_no
-                )
+                    "rb",
+                ) as read_gomc_box_0_hist_file:
+                    # output the combined histogram data
+                    get_gomc_hist_data(
+                        read_gomc_box_0_hist_file, gomc_box_0_hist_file, run_no
+                    )
 
-                full_path_dist_files_only_list = glob.glob(
-                    "{}/{}/{}".format(
+                full_path_dist_files_only_list = get_run_filename_list(
+                    "{}/{}".format(
                         full_path_to_gomc_data_folder,
                         no_gomc_directory,
-                        "*dis1a.dat",
-                    )
+                    ),
+                    "dis1a.dat",
                 )
 
+                # the dist files are added for each residue after all the runs
                 for dist_i in range(0, len(full_path_dist_files_only_list)):
-                    read_gomc_box_0_dist_file = open(
-                        "{}".format(full_path_dist_files_only_list[dist_i]), "r"
-                    ).readlines()
-
-                    dict_of_current_dist_dicts[dist_i + 1] = get_gomc_dist_data(
-                        read_gomc_box_0_dist_file,
-                        dict_of_current_dist_dicts[dist_i + 1],
-                    )
-
-            current_step = int(e_stat_values_gomc_box_0_iteration_list[0])
-            # print('GOMC current_step = ' + str(int(current_step)))
+                    if run_no == total_sims_namd_gomc - 1:
+                        provisional_dist_filename_dict[dist_i + 1].append(
+                            full_path_dist_files_only_list[dist_i]
+                        )
+                    else:
+                        dist_filename_dict[dist_i + 1].append(
+                            full_path_dist_files_only_list[dist_i]
+                        )
         # *************************************************
         # *************************************************
         # RUN THE NAMD PORTION of the CODE (End)
         # *************************************************
         # *************************************************
 
-    # print the combined dist file from the dict_of_current_dist_dicts
+    # add the dist files for each residue, at the same time in the worker
+    # processes, and print the combined dist files
+    provisional_dist_data_dict = {}
     if simulation_type in ["GCMC"]:
         residue_or_mol_no_dist_key_list = list(
             dict_of_current_dist_dicts.keys()
         )
-        no_residue_mol_dist = len(residue_or_mol_no_dist_key_list)
-        for residue_j in residue_or_mol_no_dist_key_list:
-            gomc_box_0_dist_filename_iter = (
-                "{}/GOMC_dist_data_box_0_res_or_mol_no_{}.txt"
-                "".format(full_path_to_combined_data_folder, str(residue_j))
-            )
-            gomc_box_0_dist_file_iter = open(gomc_box_0_dist_filename_iter, "w")
-            res_dict_of_current_dist_dicts = dict_of_current_dist_dicts[
-                residue_j
-            ]
-            sorted_current_dist_key_list = sorted(
-                res_dict_of_current_dist_dicts
-            )
-            for key in sorted_current_dist_key_list:
-                gomc_box_0_dist_file_iter.write(
-                    "{} {}\n".format(key, res_dict_of_current_dist_dicts[key])
+        residue_dist_data_list = get_run_data_list(
+            get_gomc_residue_dist_data,
+            [
+                (
+                    dist_filename_dict[residue_j],
+                    provisional_dist_filename_dict[residue_j],
+                    get_gomc_dist_histogram(
+                        dict_of_current_dist_dicts[residue_j]
+                    ),
                 )
-
-    e_values_density_namd_box_0_df = pd.DataFrame(
-        data=e_values_namd_box_0_density_list,
-        columns=e_titles_namd_box_0_density_iteration,
-    )
-    e_values_density_namd_box_0_df.to_csv(
-        namd_box_0_data_density_filename, sep="	", index=False
-    )
-
-    if (
-        simulation_type in ["GEMC"]
-        and only_use_box_0_for_namd_for_gemc is False
-    ):
-        e_values_density_namd_box_1_df = pd.DataFrame(
-            data=e_values_namd_box_1_density_list,
-            columns=e_titles_namd_box_1_density_iteration,
-        )
-        e_values_density_namd_box_1_df.to_csv(
-            namd_box_1_data_density_filename, sep="	", index=False
-        )
-
-    e_stat_gomc_box_0_df = pd.DataFrame(
-        data=e_stat_values_gomc_box_0_list,
-        columns=e_titles_Stat_titles_gomc_box_0_iteration_list,
-    )
-    e_stat_gomc_box_0_df.to_csv(
-        gomc_box_0_energies_stat_filename, sep="	", index=False
-    )
-
-    e_stat_kcal_per_mol_gomc_box_0_df = pd.DataFrame(
-        data=e_stat_values_gomc_kcal_per_mol_box_0_list,
-        columns=e_titles_kcal_per_mol_stat_titles_gomc_box_0_iteration_list,
-    )
-    e_stat_kcal_per_mol_gomc_box_0_df.to_csv(
-        gomc_box_0_energies_stat_kcal_per_mol_filename, sep="	", index=False
-    )
-
-    if simulation_type in ["GEMC"]:
-        e_stat_gomc_box_1_df = pd.DataFrame(
-            data=e_stat_values_gomc_box_1_list,
-            columns=e_titles_stat_titles_gomc_box_1_iteration_list,
-        )
-        e_stat_gomc_box_1_df.to_csv(
-            gomc_box_1_energies_stat_filename, sep="	", index=False
-        )
-        e_stat_kcal_per_mol_gomc_box_1_df = pd.DataFrame(
-            data=e_stat_values_gomc_kcal_per_mol_box_1_list,
-            columns=e_titles_kcal_per_mol_stat_titles_gomc_box_1_iteration_list,
-        )
-        e_stat_kcal_per_mol_gomc_box_1_df.to_csv(
-            gomc_box_1_energies_stat_kcal_per_mol_filename, sep="	", index=False
+                for residue_j in residue_or_mol_no_dist_key_list
+            ],
+            jobs,
+            process_pool_executor,
         )
-
-    # ****************************************
-    # write the combined NAMD and GOMC data  (Start)
-    # ****************************************
-
-    e_values_density_namd_box_0_STEP_list = e_values_density_namd_box_0_df.loc[
-        :, "#TS"
-    ].tolist()
-    # add 0.1 to the NAMD modified timestep for easy sorting later
-    e_values_density_namd_box_0_MOD_STEP_list = [
-        str(float(i) + 0.2) for i in e_values_density_namd_box_0_STEP_list
-    ]
-    e_values_density_namd_box_0_ENGINE_list = [
-        "NAMD" for i in e_values_density_namd_box_0_STEP_list
-    ]
-    e_values_density_namd_box_0_TOTAL_POT_list = (
-        e_values_density_namd_box_0_df.loc[:, "POTENTIAL"].tolist()
-    )
-    e_values_density_namd_box_0_TOTAL_ELECT_list = (
-        e_values_density_namd_box_0_df.loc[:, "ELECT"].tolist()
-    )
-    e_values_density_namd_box_0_TOTAL_VDW_list = (
-        e_values_density_namd_box_0_df.loc[:, "VDW"].tolist()
-    )
-    e_values_density_namd_box_0_TOTAL_VDW_plus_ELECT_list = [
-        float(e_values_density_namd_box_0_TOTAL_VDW_list[k_i])
-        + float(e_values_density_namd_box_0_TOTAL_ELECT_list[k_i])
-        for k_i in range(0, len(e_values_density_namd_box_0_TOTAL_VDW_list))
-    ]
-    e_values_density_namd_box_0_PRESSURE_list = (
-        e_values_density_namd_box_0_df.loc[:, "PRESSURE"].tolist()
-    )
-    e_values_density_namd_box_0_VOLUME_list = (
-        e_values_density_namd_box_0_df.loc[:, "VOLUME"].tolist()
+        for residue_j, (
+            provisional_residue_dist_data_dict,
+            residue_dist_histogram,
+        ) in zip(residue_or_mol_no_dist_key_list, residue_dist_data_list):
+            write_gomc_dist_data(
+                residue_dist_histogram,
+                "{}/GOMC_dist_data_box_0_res_or_mol_no_{}.txt"
+                "".format(full_path_to_combined_data_folder, str(residue_j)),
+            )
+            provisional_dist_data_dict.update(
+                {str(residue_j): provisional_residue_dist_data_dict}
+            )
+
+    # join the data blocks from each run into one array per table
+    e_values_density_namd_box_0_df = get_data_table_df(
+        np.concatenate(e_values_namd_box_0_density_block_list),
+        e_titles_namd_box_0_density_iteration,
+        "#TS",
+        table_texts=np.concatenate(e_value_texts_namd_box_0_density_block_list),
     )
-    e_values_density_namd_box_0_DENSITY_list = (
-        e_values_density_namd_box_0_df.loc[:, "DENSITY"].tolist()
+    provisional_byte_offset_dict.update(
+        {
+            os.path.basename(
+                namd_box_0_data_density_filename
+            ): write_provisional_data_table(
+                e_values_density_namd_box_0_df,
+                namd_box_0_data_density_filename,
+                len(e_values_namd_box_0_density_block_list[-1]),
+                append_to_combined_data,
+                process_pool_executor,
+                output_format_list=output_format_list,
+                output_float_type=output_float_type,
+            )
+        }
     )
 
     if (
         simulation_type in ["GEMC"]
         and only_use_box_0_for_namd_for_gemc is False
     ):
-        e_values_density_namd_box_1_STEP_list = (
-            e_values_density_namd_box_1_df.loc[:, "#TS"].tolist()
-        )
-        # add 0.1 to the NAMD modified timestep for easy sorting later
-        e_values_density_namd_box_1_MOD_STEP_list = [
-            str(float(i) + 0.2) for i in e_values_density_namd_box_1_STEP_list
-        ]
-        e_values_density_namd_box_1_ENGINE_list = [
-            "NAMD" for i in e_values_density_namd_box_1_STEP_list
-        ]
-        e_values_density_namd_box_1_TOTAL_POT_list = (
-            e_values_density_namd_box_1_df.loc[:, "POTENTIAL"].tolist()
-        )
-        e_values_density_namd_box_1_TOTAL_ELECT_list = (
-            e_values_density_namd_box_1_df.loc[:, "ELECT"].tolist()
-        )
-        e_values_density_namd_box_1_TOTAL_VDW_list = (
-            e_values_density_namd_box_1_df.loc[:, "VDW"].tolist()
-        )
-        e_values_density_namd_box_1_TOTAL_VDW_plus_ELECT_list = [
-            float(e_values_density_namd_box_1_TOTAL_VDW_list[k_i])
-            + float(e_values_density_namd_box_1_TOTAL_ELECT_list[k_i])
-            for k_i in range(0, len(e_values_density_namd_box_1_TOTAL_VDW_list))
-        ]
-        e_values_density_namd_box_1_PRESSURE_list = (
-            e_values_density_namd_box_1_df.loc[:, "PRESSURE"].tolist()
-        )
-        e_values_density_namd_box_1_PRESSURE_list = (
-            e_values_density_namd_box_1_df.loc[:, "PRESSURE"].tolist()
-        )
-        e_values_density_namd_box_1_VOLUME_list = (
-            e_values_density_namd_box_1_df.loc[:, "VOLUME"].tolist()
+        e_values_density_namd_box_1_df = get_data_table_df(
+            np.concatenate(e_values_namd_box_1_density_block_list),
+            e_titles_namd_box_1_density_iteration,
+            "#TS",
+            table_texts=np.concatenate(
+                e_value_texts_namd_box_1_density_block_list
+            ),
         )
-        e_values_density_namd_box_1_DENSITY_list = (
-            e_values_density_namd_box_1_df.loc[:, "DENSITY"].tolist()
+        provisional_byte_offset_dict.update(
+            {
+                os.path.basename(
+                    namd_box_1_data_density_filename
+                ): write_provisional_data_table(
+                    e_values_density_namd_box_1_df,
+                    namd_box_1_data_density_filename,
+                    len(e_values_namd_box_1_density_block_list[-1]),
+                    append_to_combined_data,
+                    process_pool_executor,
+                    output_format_list=output_format_list,
+                    output_float_type=output_float_type,
+                )
+            }
         )
 
-    e_values_density_gomc_box_0_STEP_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "#STEP"].tolist()
+    e_stat_titles_gomc_iteration = get_gomc_e_stat_titles(
+        e_titles_gomc_iteration, stat_titles_gomc_iteration
     )
-    # add 0.4 or 0.2 to the GOMC modified timestep for easy sorting later
-    e_values_density_gomc_box_0_MOD_STEP_list = []
-    for i in range(0, len(e_values_density_gomc_box_0_STEP_list)):
-        if i % 2 == 1:
-            e_values_density_gomc_box_0_MOD_STEP_iteration = str(
-                float(e_values_density_gomc_box_0_STEP_list[i]) + 0.4 / 4
-            )
-        else:
-            e_values_density_gomc_box_0_MOD_STEP_iteration = str(
-                float(e_values_density_gomc_box_0_STEP_list[i]) + 0.4
-            )
-        e_values_density_gomc_box_0_MOD_STEP_list.append(
-            e_values_density_gomc_box_0_MOD_STEP_iteration
-        )
-    e_values_density_gomc_box_0_ENGINE_list = [
-        "GOMC" for i in e_values_density_gomc_box_0_STEP_list
-    ]
-    e_values_density_gomc_box_0_TOTAL_POT_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "TOTAL"].tolist()
+    e_stat_values_gomc_box_0 = np.concatenate(
+        e_stat_values_gomc_box_0_block_list
     )
-    e_values_density_gomc_box_0_TOTAL_ELECT_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "TOTAL_ELECT"].tolist()
+    e_stat_gomc_box_0_df = get_data_table_df(
+        e_stat_values_gomc_box_0, e_stat_titles_gomc_iteration, "#STEP"
     )
-    try:
-        e_values_density_gomc_box_0_PRESSURE_list = (
-            e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "PRESSURE"].tolist()
-        )
-    except:
-        e_values_density_gomc_box_0_PRESSURE_list = [
-            "NA" for k_i in range(0, len(e_values_density_gomc_box_0_STEP_list))
-        ]
-
-    if simulation_type in ["GCMC", "NVT"]:
-        # use NAMD volume for GCMC and NVT since GOMC is not outputting it
-        NAMD_Volume_for_NVT_or_GCMC_box_0 = (
-            e_values_density_namd_box_0_VOLUME_list[0]
-        )
-        e_values_density_gomc_box_0_VOLUME_list = [
-            NAMD_Volume_for_NVT_or_GCMC_box_0
-            for i in e_values_density_gomc_box_0_STEP_list
-        ]
-    else:
-        try:
-            e_values_density_gomc_box_0_VOLUME_list = (
-                e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "VOLUME"].tolist()
-            )
-        except:
-            e_values_density_gomc_box_0_VOLUME_list = [
-                "NA"
-                for k_i in range(
-                    0, len(e_values_density_gomc_box_0_TOTAL_POT_list)
-                )
-            ]
-
-    e_values_density_gomc_box_0_DENSITY_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "TOT_DENSITY"].tolist()
+    provisional_byte_offset_dict.update(
+        {
+            os.path.basename(
+                gomc_box_0_energies_stat_filename
+            ): write_provisional_data_table(
+                e_stat_gomc_box_0_df,
+                gomc_box_0_energies_stat_filename,
+                len(e_stat_values_gomc_box_0_block_list[-1]),
+                append_to_combined_data,
+                process_pool_executor,
+                output_format_list=output_format_list,
+                output_float_type=output_float_type,
+            )
+        }
     )
-    e_values_density_gomc_box_0_INTRA_NB_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "INTRA(NB)"].tolist()
+
+    e_stat_kcal_per_mol_gomc_box_0_df = get_data_table_df(
+        get_gomc_kcal_per_mol_values(
+            e_stat_values_gomc_box_0,
+            e_titles_gomc_iteration,
+            stat_titles_gomc_iteration,
+        ),
+        e_stat_titles_gomc_iteration,
+        "#STEP",
     )
-    e_values_density_gomc_box_0_INTER_LJ_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "INTER(LJ)"].tolist()
+    provisional_byte_offset_dict.update(
+        {
+            os.path.basename(
+                gomc_box_0_energies_stat_kcal_per_mol_filename
+            ): write_provisional_data_table(
+                e_stat_kcal_per_mol_gomc_box_0_df,
+                gomc_box_0_energies_stat_kcal_per_mol_filename,
+                len(e_stat_values_gomc_box_0_block_list[-1]),
+                append_to_combined_data,
+                process_pool_executor,
+                output_format_list=output_format_list,
+                output_float_type=output_float_type,
+            )
+        }
     )
-    e_values_density_gomc_box_0_TOTAL_VDW_plus_ELECT_list = []
-    for i in range(0, len(e_values_density_gomc_box_0_INTRA_NB_list)):
-        e_values_density_gomc_box_0_TOTAL_VDW_plus_ELECT_list.append(
-            float(e_values_density_gomc_box_0_INTRA_NB_list[i])
-            + float(e_values_density_gomc_box_0_INTER_LJ_list[i])
-            + float(e_values_density_gomc_box_0_TOTAL_ELECT_list[i])
-        )
 
     if simulation_type in ["GEMC"]:
-        e_values_density_gomc_box_1_STEP_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "#STEP"].tolist()
-        )
-        # add 0.4 or 0.2 to the GOMC modified timestep for easy sorting later
-        e_values_density_gomc_box_1_MOD_STEP_list = []
-        for i in range(0, len(e_values_density_gomc_box_1_STEP_list)):
-            if i % 2 == 1:
-                e_values_density_gomc_box_1_MOD_STEP_iteration = str(
-                    float(e_values_density_gomc_box_1_STEP_list[i]) + 0.4 / 4
-                )
-            else:
-                e_values_density_gomc_box_1_MOD_STEP_iteration = str(
-                    float(e_values_density_gomc_box_1_STEP_list[i]) + 0.4
-                )
-            e_values_density_gomc_box_1_MOD_STEP_list.append(
-                e_values_density_gomc_box_1_MOD_STEP_iteration
-            )
-
-        e_values_density_gomc_box_1_ENGINE_list = [
-            "GOMC" for i in e_values_density_gomc_box_1_STEP_list
-        ]
-        e_values_density_gomc_box_1_TOTAL_POT_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "TOTAL"].tolist()
-        )
-        e_values_density_gomc_box_1_TOTAL_ELECT_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "TOTAL_ELECT"].tolist()
+        e_stat_values_gomc_box_1 = np.concatenate(
+            e_stat_values_gomc_box_1_block_list
         )
-        e_values_density_gomc_box_1_PRESSURE_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "PRESSURE"].tolist()
+        e_stat_gomc_box_1_df = get_data_table_df(
+            e_stat_values_gomc_box_1, e_stat_titles_gomc_iteration, "#STEP"
         )
-        try:
-            e_values_density_gomc_box_1_PRESSURE_list = (
-                e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "PRESSURE"].tolist()
-            )
-        except:
-            e_values_density_gomc_box_1_PRESSURE_list = [
-                "NA"
-                for k_i in range(0, len(e_values_density_gomc_box_1_STEP_list))
-            ]
-
-        if simulation_type in ["GCMC", "NVT"]:
-            # use NAMD volume for GCMC and NVT since GOMC is not outputting it
-            NAMD_Volume_for_NVT_or_GCMC_box_1 = (
-                e_values_density_namd_box_1_VOLUME_list[0]
-            )
-            e_values_density_gomc_box_1_VOLUME_list = [
-                NAMD_Volume_for_NVT_or_GCMC_box_1
-                for i in e_values_density_gomc_box_1_STEP_list
-            ]
-        else:
-            try:
-                e_values_density_gomc_box_1_VOLUME_list = (
-                    e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "VOLUME"].tolist()
+        provisional_byte_offset_dict.update(
+            {
+                os.path.basename(
+                    gomc_box_1_energies_stat_filename
+                ): write_provisional_data_table(
+                    e_stat_gomc_box_1_df,
+                    gomc_box_1_energies_stat_filename,
+                    len(e_stat_values_gomc_box_1_block_list[-1]),
+                    append_to_combined_data,
+                    process_pool_executor,
+                    output_format_list=output_format_list,
+                    output_float_type=output_float_type,
                 )
-            except:
-                e_values_density_gomc_box_1_VOLUME_list = [
-                    "NA"
-                    for k_i in range(
-                        0, len(e_values_density_gomc_box_1_TOTAL_POT_list)
-                    )
-                ]
-
-        e_values_density_gomc_box_1_DENSITY_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "TOT_DENSITY"].tolist()
+            }
         )
-        e_values_density_gomc_box_1_INTRA_NB_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "INTRA(NB)"].tolist()
+        e_stat_kcal_per_mol_gomc_box_1_df = get_data_table_df(
+            get_gomc_kcal_per_mol_values(
+                e_stat_values_gomc_box_1,
+                e_titles_gomc_iteration,
+                stat_titles_gomc_iteration,
+            ),
+            e_stat_titles_gomc_iteration,
+            "#STEP",
         )
-        e_values_density_gomc_box_1_INTER_LJ_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "INTER(LJ)"].tolist()
+        provisional_byte_offset_dict.update(
+            {
+                os.path.basename(
+                    gomc_box_1_energies_stat_kcal_per_mol_filename
+                ): write_provisional_data_table(
+                    e_stat_kcal_per_mol_gomc_box_1_df,
+                    gomc_box_1_energies_stat_kcal_per_mol_filename,
+                    len(e_stat_values_gomc_box_1_block_list[-1]),
+                    append_to_combined_data,
+                    process_pool_executor,
+                    output_format_list=output_format_list,
+                    output_float_type=output_float_type,
+                )
+            }
         )
-        e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list = []
-        for i in range(0, len(e_values_density_gomc_box_1_INTRA_NB_list)):
-            e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list.append(
-                float(e_values_density_gomc_box_1_INTRA_NB_list[i])
-                + float(e_values_density_gomc_box_1_INTER_LJ_list[i])
-                + float(e_values_density_gomc_box_1_TOTAL_ELECT_list[i])
-            )
 
     # ****************************************
     # write the combined NAMD and GOMC data for box 0  (Start)
     # ****************************************
-
-    # combine Engine data
-    combined_MOD_STEP_box_0 = []
-    # combine MOD_STEP data
-    for i in range(0, len(e_values_density_namd_box_0_MOD_STEP_list)):
-        combined_MOD_STEP_box_0.append(
-            float(e_values_density_namd_box_0_MOD_STEP_list[i])
+    combined_table_state_dict = {}
+    namd_combined_data_box_0 = get_namd_combined_data(
+        e_values_density_namd_box_0_df
+    )
+    # the first NAMD volume is kept as the text printed by NAMD
+    if combine_manifest is not None:
+        namd_box_0_first_volume = str(
+            combine_manifest["namd_box_0_first_volume"]
         )
-    for i in range(0, len(e_values_density_gomc_box_0_MOD_STEP_list)):
-        combined_MOD_STEP_box_0.append(
-            float(e_values_density_gomc_box_0_MOD_STEP_list[i])
+    else:
+        namd_box_0_first_volume = str(
+            namd_combined_data_box_0[get_text_column_title("VOLUME")][0]
+        )
+    if simulation_type in ["GCMC", "NVT"]:
+        # use NAMD volume for GCMC and NVT since GOMC is not outputting it
+        gomc_combined_data_box_0 = get_gomc_combined_data(
+            e_stat_kcal_per_mol_gomc_box_0_df,
+            volume=float(namd_box_0_first_volume),
+            first_row_number=gomc_first_row_number_dict[0],
+            volume_text=namd_box_0_first_volume,
+        )
+    else:
+        gomc_combined_data_box_0 = get_gomc_combined_data(
+            e_stat_kcal_per_mol_gomc_box_0_df,
+            first_row_number=gomc_first_row_number_dict[0],
         )
 
-    combined_ENGINE_box_0 = (
-        e_values_density_namd_box_0_ENGINE_list
-        + e_values_density_gomc_box_0_ENGINE_list
-    )
-    combined_STEP_box_0 = (
-        e_values_density_namd_box_0_STEP_list
-        + e_values_density_gomc_box_0_STEP_list
-    )
-    combined_TOTAL_POT_box_0 = (
-        e_values_density_namd_box_0_TOTAL_POT_list
-        + e_values_density_gomc_box_0_TOTAL_POT_list
-    )
-    combined_TOTAL_ELECT_box_0 = (
-        e_values_density_namd_box_0_TOTAL_ELECT_list
-        + e_values_density_gomc_box_0_TOTAL_ELECT_list
-    )
-    combined_TOTAL_VDW_plus_ELECT_box_0 = (
-        e_values_density_namd_box_0_TOTAL_VDW_plus_ELECT_list
-        + e_values_density_gomc_box_0_TOTAL_VDW_plus_ELECT_list
-    )
-    combined_PRESSURE_box_0 = (
-        e_values_density_namd_box_0_PRESSURE_list
-        + e_values_density_gomc_box_0_PRESSURE_list
-    )
-    combined_VOLUME_box_0 = (
-        e_values_density_namd_box_0_VOLUME_list
-        + e_values_density_gomc_box_0_VOLUME_list
-    )
-    combined_DENSITY_box_0 = (
-        e_values_density_namd_box_0_DENSITY_list
-        + e_values_density_gomc_box_0_DENSITY_list
-    )
-
-    combined_data_box_0_df = pd.DataFrame(
+    combined_table_state_dict.update(
         {
-            "#ENGINE": combined_ENGINE_box_0,
-            "MOD_STEP": combined_MOD_STEP_box_0,
-            "STEP": combined_STEP_box_0,
-            "TOTAL_POT": combined_TOTAL_POT_box_0,
-            "TOTAL_ELECT": combined_TOTAL_ELECT_box_0,
-            "TOTAL_VDW_plus_ELECT": combined_TOTAL_VDW_plus_ELECT_box_0,
-            "PRESSURE": combined_PRESSURE_box_0,
-            "VOLUME": combined_VOLUME_box_0,
-            "DENSITY": combined_DENSITY_box_0,
+            "0": write_provisional_combined_data_table(
+                combined_box_0_data_filename,
+                join_combined_data(
+                    pending_combined_table_dict.get("0", {}).get(
+                        "pending_namd_rows"
+                    ),
+                    namd_combined_data_box_0,
+                ),
+                join_combined_data(
+                    pending_combined_table_dict.get("0", {}).get(
+                        "pending_gomc_rows"
+                    ),
+                    gomc_combined_data_box_0,
+                ),
+                len(e_values_namd_box_0_density_block_list[-1]),
+                len(e_stat_values_gomc_box_0_block_list[-1]),
+                append_to_combined_data,
+                process_pool_executor,
+                output_format_list=output_format_list,
+                output_float_type=output_float_type,
+            )
         }
     )
-    combined_data_sorted_box_0_df = combined_data_box_0_df.sort_values(
-        by=["MOD_STEP"], axis=0, ascending=True
-    )
-    combined_data_sorted_box_0_df.drop("MOD_STEP", axis=1, inplace=True)
-    combined_data_sorted_box_0_df.to_csv(
-        combined_box_0_data_filename, sep="	", index=False
-    )
     # ****************************************
-    # write the combined NAMD and GOMC data for box 0  (Start)
+    # write the combined NAMD and GOMC data for box 0  (end)
     # ****************************************
 
     # ****************************************
     # write the combined NAMD and GOMC data for box 1  (Start)
     # ****************************************
-
-    # combine Engine data
     if (
         simulation_type in ["GEMC"]
         and only_use_box_0_for_namd_for_gemc is False
     ):
-        combined_MOD_STEP_box_1 = []
-        # combine MOD_STEP data
-        for i in range(0, len(e_values_density_namd_box_1_MOD_STEP_list)):
-            combined_MOD_STEP_box_1.append(
-                float(e_values_density_namd_box_1_MOD_STEP_list[i])
-            )
-        for i in range(0, len(e_values_density_gomc_box_1_MOD_STEP_list)):
-            combined_MOD_STEP_box_1.append(
-                float(e_values_density_gomc_box_1_MOD_STEP_list[i])
-            )
-
-        combined_ENGINE_box_1 = (
-            e_values_density_namd_box_1_ENGINE_list
-            + e_values_density_gomc_box_1_ENGINE_list
-        )
-        combined_STEP_box_1 = (
-            e_values_density_namd_box_1_STEP_list
-            + e_values_density_gomc_box_1_STEP_list
-        )
-        combined_TOTAL_POT_box_1 = (
-            e_values_density_namd_box_1_TOTAL_POT_list
-            + e_values_density_gomc_box_1_TOTAL_POT_list
-        )
-        combined_TOTAL_ELECT_box_1 = (
-            e_values_density_namd_box_1_TOTAL_ELECT_list
-            + e_values_density_gomc_box_1_TOTAL_ELECT_list
-        )
-        combined_TOTAL_VDW_plus_ELECT_box_1 = (
-            e_values_density_namd_box_1_TOTAL_VDW_plus_ELECT_list
-            + e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list
-        )
-        combined_PRESSURE_box_1 = (
-            e_values_density_namd_box_1_PRESSURE_list
-            + e_values_density_gomc_box_1_PRESSURE_list
-        )
-        combined_VOLUME_box_1 = (
-            e_values_density_namd_box_1_VOLUME_list
-            + e_values_density_gomc_box_1_VOLUME_list
-        )
-        combined_DENSITY_box_1 = (
-            e_values_density_namd_box_1_DENSITY_list
-            + e_values_density_gomc_box_1_DENSITY_list
-        )
-
-        combined_data_box_1_df = pd.DataFrame(
+        combined_table_state_dict.update(
             {
-                "#ENGINE": combined_ENGINE_box_1,
-                "MOD_STEP": combined_MOD_STEP_box_1,
-                "STEP": combined_STEP_box_1,
-                "TOTAL_POT": combined_TOTAL_POT_box_1,
-                "TOTAL_ELECT": combined_TOTAL_ELECT_box_1,
-                "TOTAL_VDW_plus_ELECT": combined_TOTAL_VDW_plus_ELECT_box_1,
-                "PRESSURE": combined_PRESSURE_box_1,
-                "VOLUME": combined_VOLUME_box_1,
-                "DENSITY": combined_DENSITY_box_1,
+                "1": write_provisional_combined_data_table(
+                    combined_box_1_data_filename,
+                    join_combined_data(
+                        pending_combined_table_dict.get("1", {}).get(
+                            "pending_namd_rows"
+                        ),
+                        get_namd_combined_data(e_values_density_namd_box_1_df),
+                    ),
+                    join_combined_data(
+                        pending_combined_table_dict.get("1", {}).get(
+                            "pending_gomc_rows"
+                        ),
+                        get_gomc_combined_data(
+                            e_stat_kcal_per_mol_gomc_box_1_df,
+                            first_row_number=gomc_first_row_number_dict[1],
+                        ),
+                    ),
+                    len(e_values_namd_box_1_density_block_list[-1]),
+                    len(e_stat_values_gomc_box_1_block_list[-1]),
+                    append_to_combined_data,
+                    process_pool_executor,
+                    output_format_list=output_format_list,
+                    output_float_type=output_float_type,
+                )
             }
         )
-        combined_data_sorted_box_1_df = combined_data_box_1_df.sort_values(
-            by=["MOD_STEP"], axis=0, ascending=True
-        )
-        combined_data_sorted_box_1_df.drop("MOD_STEP", axis=1, inplace=True)
-        combined_data_sorted_box_1_df.to_csv(
-            combined_box_1_data_filename, sep="	", index=False
-        )
 
     elif (
         simulation_type in ["GEMC"] and only_use_box_0_for_namd_for_gemc is True
     ):
-        combined_MOD_STEP_box_1 = []
-        # combine MOD_STEP data
-        for i in range(0, len(e_values_density_gomc_box_1_MOD_STEP_list)):
-            combined_MOD_STEP_box_1.append(
-                float(e_values_density_gomc_box_1_MOD_STEP_list[i])
-            )
-
-        combined_ENGINE_box_1 = e_values_density_gomc_box_1_ENGINE_list
-        combined_STEP_box_1 = e_values_density_gomc_box_1_STEP_list
-        combined_TOTAL_POT_box_1 = e_values_density_gomc_box_1_TOTAL_POT_list
-        combined_TOTAL_ELECT_box_1 = (
-            e_values_density_gomc_box_1_TOTAL_ELECT_list
-        )
-        combined_TOTAL_VDW_plus_ELECT_box_1 = (
-            e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list
-        )
-        combined_PRESSURE_box_1 = e_values_density_gomc_box_1_PRESSURE_list
-        combined_VOLUME_box_1 = e_values_density_gomc_box_1_VOLUME_list
-        combined_DENSITY_box_1 = e_values_density_gomc_box_1_DENSITY_list
-
-        combined_data_box_1_df = pd.DataFrame(
+        combined_table_state_dict.update(
             {
-                "#ENGINE": combined_ENGINE_box_1,
-                "MOD_STEP": combined_MOD_STEP_box_1,
-                "STEP": combined_STEP_box_1,
-                "TOTAL_POT": combined_TOTAL_POT_box_1,
-                "TOTAL_ELECT": combined_TOTAL_ELECT_box_1,
-                "TOTAL_VDW_plus_ELECT": combined_TOTAL_VDW_plus_ELECT_box_1,
-                "PRESSURE": combined_PRESSURE_box_1,
-                "DENSITY": combined_DENSITY_box_1,
+                "1": write_provisional_combined_data_table(
+                    combined_box_1_data_filename,
+                    None,
+                    join_combined_data(
+                        pending_combined_table_dict.get("1", {}).get(
+                            "pending_gomc_rows"
+                        ),
+                        get_gomc_combined_data(
+                            e_stat_kcal_per_mol_gomc_box_1_df,
+                            first_row_number=gomc_first_row_number_dict[1],
+                        ),
+                    ),
+                    0,
+                    len(e_stat_values_gomc_box_1_block_list[-1]),
+                    append_to_combined_data,
+                    process_pool_executor,
+                    drop_volume=True,
+                    output_format_list=output_format_list,
+                    output_float_type=output_float_type,
+                )
             }
         )
 
-        combined_data_sorted_box_1_df = combined_data_box_1_df.sort_values(
-            by=["MOD_STEP"], axis=0, ascending=True
-        )
-        combined_data_sorted_box_1_df.drop("MOD_STEP", axis=1, inplace=True)
-        combined_data_sorted_box_1_df.to_csv(
-            combined_box_1_data_filename, sep="	", index=False
-        )
-
     # ****************************************
     # write the combined NAMD and GOMC data for box 1  (end)
     # ****************************************
 
+    # record the combined simulation cycles, so the next simulation cycles
+    # can be appended (the last simulation cycle is the provisional cycle)
+    combined_box_x_data_filename_dict = {
+        "0": combined_box_0_data_filename,
+        "1": combined_box_1_data_filename,
+    }
+    for box_no, combined_table_state in combined_table_state_dict.items():
+        provisional_byte_offset_dict.update(
+            {
+                os.path.basename(
+                    combined_box_x_data_filename_dict[box_no]
+                ): combined_table_state.pop("provisional_byte_offset")
+            }
+        )
+    provisional_gomc_row_number_dict = {
+        "0": gomc_first_row_number_dict[0]
+        + len(e_stat_values_gomc_box_0)
+        - len(e_stat_values_gomc_box_0_block_list[-1])
+    }
+    if simulation_type in ["GEMC"]:
+        provisional_gomc_row_number_dict.update(
+            {
+                "1": gomc_first_row_number_dict[1]
+                + len(e_stat_values_gomc_box_1)
+                - len(e_stat_values_gomc_box_1_block_list[-1])
+            }
+        )
+
+    combine_manifest = dict(combine_settings_dict)
+    combine_manifest.update(cycle_directory_dict)
+    combine_manifest.update(
+        {
+            "provisional_cycle": no_cycles - 1,
+            "provisional_run_starting_step": int(
+                run_starting_steps[total_sims_namd_gomc - 2 - first_run_no]
+            ),
+            "provisional_gomc_row_numbers": provisional_gomc_row_number_dict,
+            "provisional_byte_offsets": provisional_byte_offset_dict,
+            "provisional_dist_data": provisional_dist_data_dict,
+            "namd_box_0_first_volume": namd_box_0_first_volume,
+            "combined_tables": combined_table_state_dict,
+            "combined_dcds": new_combined_dcd_manifest_dict,
+        }
+    )
+    write_combine_manifest(combine_manifest_filename, combine_manifest)
+
     # ****************************************
     # write the combined NAMD and GOMC data  (end)
     # ****************************************
@@ -2266,315 +4524,119 @@ elif simulation_engine_options == "GOMC-only":
         "INFO: Started all data extraction for GOMC-only runs and exported into muliple files and types"
     )
 
-    read_gomc_box_0_log_file = open(
-        gomc_or_namd_only_log_filename, "r"
-    ).readlines()
-    # get box 0 data
-    box_no_0 = int(0)
-
-    (
-        e_titles_gomc_box_0_iteration,
-        e_titles_stat_titles_gomc_box_0_iteration_list,
-        e_titles_kcal_per_mol_stat_titles_gomc_box_0_iteration_list,
-        e_stat_values_gomc_box_0_iteration_list,
-        e_stat_values_gomc_box_0_list,
-        e_stat_values_gomc_kcal_per_mol_box_0_list,
-    ) = get_gomc_log_data(
-        read_gomc_box_0_log_file, gomc_box_0_data_file, run_no, box_no_0
-    )
-
-    # note GOMC energy units in kcal/mol
-    # generate energy and system file data for box 1
-    print("simulation_type = " + str(simulation_type))
     if simulation_type in ["GEMC"]:
-        read_gomc_box_1_log_file = open(
-            gomc_or_namd_only_log_filename, "r"
-        ).readlines()
-
-        box_no_1 = int(1)
-
-        (
-            e_titles_gomc_box_1_iteration,
-            e_titles_stat_titles_gomc_box_1_iteration_list,
-            e_titles_kcal_per_mol_stat_titles_gomc_box_1_iteration_list,
-            e_stat_values_gomc_box_1_iteration_list,
-            e_stat_values_gomc_box_1_list,
-            e_stat_values_gomc_kcal_per_mol_box_1_list,
-        ) = get_gomc_log_data(
-            read_gomc_box_1_log_file, gomc_box_1_data_file, run_no, box_no_1
-        )
-
-    # *************************************************
-    # *************************************************
-    # RUN THE NAMD PORTION of the CODE (End)
-    # *************************************************
-    # *************************************************
-
-    e_stat_gomc_box_0_df = pd.DataFrame(
-        data=e_stat_values_gomc_box_0_list,
-        columns=e_titles_stat_titles_gomc_box_0_iteration_list,
-    )
-    e_stat_gomc_box_0_df.to_csv(
-        gomc_box_0_energies_stat_filename, sep="	", index=False
-    )
+        gomc_box_no_list = [0, 1]
+    else:
+        gomc_box_no_list = [0]
 
-    e_stat_kcal_per_mol_gomc_box_0_df = pd.DataFrame(
-        data=e_stat_values_gomc_kcal_per_mol_box_0_list,
-        columns=e_titles_kcal_per_mol_stat_titles_gomc_box_0_iteration_list,
+    # get box 0 and 1 data in one pass thru the GOMC log file
+    gomc_log_data = read_gomc_log_data(
+        gomc_or_namd_only_log_filename, run_no, gomc_box_no_list
     )
-    e_stat_kcal_per_mol_gomc_box_0_df.to_csv(
-        gomc_box_0_energies_stat_kcal_per_mol_filename, sep="	", index=False
+    e_titles_gomc_iteration = gomc_log_data["e_titles"]
+    stat_titles_gomc_iteration = gomc_log_data["stat_titles"]
+    e_stat_titles_gomc_iteration = get_gomc_e_stat_titles(
+        e_titles_gomc_iteration, stat_titles_gomc_iteration
     )
 
-    if simulation_type in ["GEMC"]:
-        e_stat_gomc_box_1_df = pd.DataFrame(
-            data=e_stat_values_gomc_box_1_list,
-            columns=e_titles_stat_titles_gomc_box_1_iteration_list,
-        )
-        e_stat_gomc_box_1_df.to_csv(
-            gomc_box_1_energies_stat_filename, sep="	", index=False
-        )
-        e_stat_kcal_per_mol_gomc_box_1_df = pd.DataFrame(
-            data=e_stat_values_gomc_kcal_per_mol_box_1_list,
-            columns=e_titles_kcal_per_mol_stat_titles_gomc_box_1_iteration_list,
-        )
-        e_stat_kcal_per_mol_gomc_box_1_df.to_csv(
-            gomc_box_1_energies_stat_kcal_per_mol_filename, sep="	", index=False
-        )
-
-    # ****************************************
-    # write the combined NAMD and GOMC data  (Start)
-    # ****************************************
-
-    e_values_density_gomc_box_0_STEP_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "#STEP"].tolist()
-    )
-    # add 0.4 or 0.2 to the GOMC modified timestep for easy sorting later
-    e_values_density_gomc_box_0_MOD_STEP_list = []
-    for i in range(0, len(e_values_density_gomc_box_0_STEP_list)):
-        if i % 2 == 1:
-            e_values_density_gomc_box_0_MOD_STEP_iteration = str(
-                float(e_values_density_gomc_box_0_STEP_list[i]) + 0.4 / 4
+    # note GOMC energy units in kcal/mol
+    # generate energy and system file data for box 0 and 1
+    print("simulation_type = " + str(simulation_type))
+    for box_no_x in gomc_box_no_list:
+        if box_no_x == 0:
+            gomc_box_x_data_file = gomc_box_0_data_file
+            gomc_box_x_energies_stat_filename = (
+                gomc_box_0_energies_stat_filename
             )
+            gomc_box_x_energies_stat_kcal_per_mol_filename = (
+                gomc_box_0_energies_stat_kcal_per_mol_filename
+            )
+            combined_box_x_data_filename = combined_box_0_data_filename
         else:
-            e_values_density_gomc_box_0_MOD_STEP_iteration = str(
-                float(e_values_density_gomc_box_0_STEP_list[i]) + 0.4
+            gomc_box_x_data_file = gomc_box_1_data_file
+            gomc_box_x_energies_stat_filename = (
+                gomc_box_1_energies_stat_filename
             )
-        e_values_density_gomc_box_0_MOD_STEP_list.append(
-            e_values_density_gomc_box_0_MOD_STEP_iteration
-        )
-    e_values_density_gomc_box_0_ENGINE_list = [
-        "GOMC" for i in e_values_density_gomc_box_0_STEP_list
-    ]
-    e_values_density_gomc_box_0_TOTAL_POT_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "TOTAL"].tolist()
-    )
-    e_values_density_gomc_box_0_TOTAL_ELECT_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "TOTAL_ELECT"].tolist()
-    )
-    e_values_density_gomc_box_0_PRESSURE_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "PRESSURE"].tolist()
-    )
-    try:
-        e_values_density_gomc_box_0_VOLUME_list = (
-            e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "VOLUME"].tolist()
-        )
-    except:
-        e_values_density_gomc_box_0_VOLUME_list = [
-            "NA"
-            for k_i in range(0, len(e_values_density_gomc_box_0_TOTAL_POT_list))
-        ]
-    e_values_density_gomc_box_0_DENSITY_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "TOT_DENSITY"].tolist()
-    )
-
-    e_values_density_gomc_box_0_INTRA_NB_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "INTRA(NB)"].tolist()
-    )
-    e_values_density_gomc_box_0_INTER_LJ_list = (
-        e_stat_kcal_per_mol_gomc_box_0_df.loc[:, "INTER(LJ)"].tolist()
-    )
-    e_values_density_gomc_box_0_TOTAL_VDW_plus_ELECT_list = []
-    for i in range(0, len(e_values_density_gomc_box_0_INTRA_NB_list)):
-        e_values_density_gomc_box_0_TOTAL_VDW_plus_ELECT_list.append(
-            float(e_values_density_gomc_box_0_INTRA_NB_list[i])
-            + float(e_values_density_gomc_box_0_INTER_LJ_list[i])
-            + float(e_values_density_gomc_box_0_TOTAL_ELECT_list[i])
-        )
-
-    if simulation_type in ["GEMC"]:
-        e_values_density_gomc_box_1_STEP_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "#STEP"].tolist()
-        )
-        # add 0.4 or 0.2 to the GOMC modified timestep for easy sorting later
-        e_values_density_gomc_box_1_MOD_STEP_list = []
-        for i in range(0, len(e_values_density_gomc_box_1_STEP_list)):
-            if i % 2 == 1:
-                e_values_density_gomc_box_1_MOD_STEP_iteration = str(
-                    float(e_values_density_gomc_box_1_STEP_list[i]) + 0.4 / 4
-                )
-            else:
-                e_values_density_gomc_box_1_MOD_STEP_iteration = str(
-                    float(e_values_density_gomc_box_1_STEP_list[i]) + 0.4
-                )
-            e_values_density_gomc_box_1_MOD_STEP_list.append(
-                e_values_density_gomc_box_1_MOD_STEP_iteration
+            gomc_box_x_energies_stat_kcal_per_mol_filename = (
+                gomc_box_1_energies_stat_kcal_per_mol_filename
             )
+            combined_box_x_data_filename = combined_box_1_data_filename
 
-        e_values_density_gomc_box_1_ENGINE_list = [
-            "GOMC" for i in e_values_density_gomc_box_1_STEP_list
-        ]
-        e_values_density_gomc_box_1_TOTAL_POT_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "TOTAL"].tolist()
+        e_stat_values_gomc_box_x = write_gomc_log_data(
+            gomc_log_data, gomc_box_x_data_file, run_no, box_no_x, current_step
         )
-        e_values_density_gomc_box_1_TOTAL_ELECT_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "TOTAL_ELECT"].tolist()
+
+        e_stat_gomc_box_x_df = get_data_table_df(
+            e_stat_values_gomc_box_x, e_stat_titles_gomc_iteration, "#STEP"
         )
-        e_values_density_gomc_box_1_PRESSURE_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "PRESSURE"].tolist()
+        write_data_table(
+            e_stat_gomc_box_x_df,
+            gomc_box_x_energies_stat_filename,
+            process_pool_executor,
         )
-        e_values_density_gomc_box_1_VOLUME_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "VOLUME"].tolist()
+        write_binary_data_tables(
+            e_stat_gomc_box_x_df,
+            gomc_box_x_energies_stat_filename,
+            output_format_list,
+            output_float_type,
         )
-        try:
-            e_values_density_gomc_box_1_VOLUME_list = (
-                e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "VOLUME"].tolist()
-            )
-        except:
-            e_values_density_gomc_box_1_VOLUME_list = [
-                "NA"
-                for k_i in range(
-                    0, len(e_values_density_gomc_box_1_TOTAL_POT_list)
-                )
-            ]
 
-        e_values_density_gomc_box_1_DENSITY_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "TOT_DENSITY"].tolist()
+        e_stat_kcal_per_mol_gomc_box_x_df = get_data_table_df(
+            get_gomc_kcal_per_mol_values(
+                e_stat_values_gomc_box_x,
+                e_titles_gomc_iteration,
+                stat_titles_gomc_iteration,
+            ),
+            e_stat_titles_gomc_iteration,
+            "#STEP",
         )
-        e_values_density_gomc_box_1_INTRA_NB_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "INTRA(NB)"].tolist()
+        write_data_table(
+            e_stat_kcal_per_mol_gomc_box_x_df,
+            gomc_box_x_energies_stat_kcal_per_mol_filename,
+            process_pool_executor,
         )
-        e_values_density_gomc_box_1_INTER_LJ_list = (
-            e_stat_kcal_per_mol_gomc_box_1_df.loc[:, "INTER(LJ)"].tolist()
+        write_binary_data_tables(
+            e_stat_kcal_per_mol_gomc_box_x_df,
+            gomc_box_x_energies_stat_kcal_per_mol_filename,
+            output_format_list,
+            output_float_type,
         )
-        e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list = []
-        for i in range(0, len(e_values_density_gomc_box_1_INTRA_NB_list)):
-            e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list.append(
-                float(e_values_density_gomc_box_1_INTRA_NB_list[i])
-                + float(e_values_density_gomc_box_1_INTER_LJ_list[i])
-                + float(e_values_density_gomc_box_0_TOTAL_ELECT_list[i])
-            )
-
-    # ****************************************
-    # write the combined NAMD and GOMC data for box 0  (Start)
-    # ****************************************
-    # combine Engine data
-    combined_MOD_STEP_box_0 = []
-    # combine MOD_STEP data
-    for i in range(0, len(e_values_density_gomc_box_0_MOD_STEP_list)):
-        combined_MOD_STEP_box_0.append(
-            float(e_values_density_gomc_box_0_MOD_STEP_list[i])
-        )
-
-    combined_ENGINE_box_0 = e_values_density_gomc_box_0_ENGINE_list
-    combined_STEP_box_0 = e_values_density_gomc_box_0_STEP_list
-    combined_TOTAL_POT_box_0 = e_values_density_gomc_box_0_TOTAL_POT_list
-    combined_TOTAL_ELECT_box_0 = e_values_density_gomc_box_0_TOTAL_ELECT_list
-    combined_TOTAL_VDW_plus_ELECT_box_0 = (
-        e_values_density_gomc_box_0_TOTAL_VDW_plus_ELECT_list
-    )
-    combined_PRESSURE_box_0 = e_values_density_gomc_box_0_PRESSURE_list
-    combined_VOLUME_box_0 = e_values_density_gomc_box_0_VOLUME_list
-    combined_DENSITY_box_0 = e_values_density_gomc_box_0_DENSITY_list
-
-    combined_data_box_0_df = pd.DataFrame(
-        {
-            "ENGINE": combined_ENGINE_box_0,
-            "MOD_STEP": combined_MOD_STEP_box_0,
-            "#STEP": combined_STEP_box_0,
-            "TOTAL_POT": combined_TOTAL_POT_box_0,
-            "TOTAL_ELECT": combined_TOTAL_ELECT_box_0,
-            "TOTAL_VDW_plus_ELECT": combined_TOTAL_VDW_plus_ELECT_box_0,
-            "PRESSURE": combined_PRESSURE_box_0,
-            "VOLUME": combined_VOLUME_box_0,
-            "DENSITY": combined_DENSITY_box_0,
-        }
-    )
-    combined_data_sorted_box_0_df = combined_data_box_0_df.sort_values(
-        by=["MOD_STEP"], axis=0, ascending=True
-    )
-    combined_data_sorted_box_0_df.drop("MOD_STEP", axis=1, inplace=True)
-    combined_data_sorted_box_0_df.to_csv(
-        combined_box_0_data_filename, sep="	", index=False
-    )
-
-    # ****************************************
-    # write the combined NAMD and GOMC data for box 0  (Start)
-    # ****************************************
-
-    # ****************************************
-    # write the combined NAMD and GOMC data for box 1  (Start)
-    # ****************************************
 
-    # combine Engine data
-    if simulation_type in ["GEMC"]:
-        combined_MOD_STEP_box_1 = []
-        # combine MOD_STEP data
-        for i in range(0, len(e_values_density_gomc_box_1_MOD_STEP_list)):
-            combined_MOD_STEP_box_1.append(
-                float(e_values_density_gomc_box_1_MOD_STEP_list[i])
+        # ****************************************
+        # write the combined GOMC data for box 0 or 1 (Start)
+        # ****************************************
+        combined_data_sorted_box_x_df = get_combined_data_df(
+            gomc_combined_data_box_x=get_gomc_combined_data(
+                e_stat_kcal_per_mol_gomc_box_x_df
             )
-
-        combined_ENGINE_box_1 = e_values_density_gomc_box_1_ENGINE_list
-        combined_STEP_box_1 = e_values_density_gomc_box_1_STEP_list
-        combined_TOTAL_POT_box_1 = e_values_density_gomc_box_1_TOTAL_POT_list
-        combined_TOTAL_ELECT_box_1 = (
-            e_values_density_gomc_box_1_TOTAL_ELECT_list
         )
-        combined_TOTAL_VDW_plus_ELECT_box_1 = (
-            e_values_density_gomc_box_1_TOTAL_VDW_plus_ELECT_list
-        )
-        combined_PRESSURE_box_1 = e_values_density_gomc_box_1_PRESSURE_list
-        combined_VOLUME_box_1 = e_values_density_gomc_box_1_VOLUME_list
-        combined_DENSITY_box_1 = e_values_density_gomc_box_1_DENSITY_list
-
-        combined_data_box_1_df = pd.DataFrame(
-            {
-                "ENGINE": combined_ENGINE_box_1,
-                "MOD_STEP": combined_MOD_STEP_box_1,
-                "#STEP": combined_STEP_box_1,
-                "TOTAL_POT": combined_TOTAL_POT_box_1,
-                "TOTAL_ELECT": combined_TOTAL_ELECT_box_1,
-                "TOTAL_VDW_plus_ELECT": combined_TOTAL_VDW_plus_ELECT_box_1,
-                "PRESSURE": combined_PRESSURE_box_1,
-                "VOLUME": combined_VOLUME_box_1,
-                "DENSITY": combined_DENSITY_box_1,
-            }
+        combined_data_sorted_box_x_df.rename(
+            columns={"#ENGINE": "ENGINE", "STEP": "#STEP"}, inplace=True
         )
-        combined_data_sorted_box_1_df = combined_data_box_1_df.sort_values(
-            by=["MOD_STEP"], axis=0, ascending=True
+        write_data_table(
+            combined_data_sorted_box_x_df,
+            combined_box_x_data_filename,
+            process_pool_executor,
         )
-        combined_data_sorted_box_1_df.drop("MOD_STEP", axis=1, inplace=True)
-        combined_data_sorted_box_1_df.to_csv(
-            combined_box_1_data_filename, sep="	", index=False
+        write_binary_data_tables(
+            combined_data_sorted_box_x_df,
+            combined_box_x_data_filename,
+            output_format_list,
+            output_float_type,
         )
-
         # ****************************************
-        # write the combined NAMD and GOMC data for box 1  (end)
+        # write the combined GOMC data for box 0 or 1 (end)
         # ****************************************
 
-        # ****************************************
-        # write the combined NAMD and GOMC data  (end)
-        # ****************************************
-        print(
-            "INFO: Finished all data extraction for GOMC-only runs and exported into muliple files and types"
-        )
+    print(
+        "INFO: Finished all data extraction for GOMC-only runs and exported into muliple files and types"
+    )
 
-        # ****************************************
-        # ****************************************
-        # NAMD-onl data extraction (end)
-        # ****************************************
-        # ****************************************
+    # ****************************************
+    # ****************************************
+    # GOMC-only data extraction (end)
+    # ****************************************
+    # ****************************************
 
 elif simulation_engine_options == "NAMD-only":
 
@@ -2588,122 +4650,60 @@ elif simulation_engine_options == "NAMD-only":
     # *************************************
     # get NAMD- only energies
     # ***********************initial_Energies**************
-    no_namd_box_0_directory = str(gomc_or_namd_only_log_filename)
-
-    read_namd_box_0_log_file = open(
-        gomc_or_namd_only_log_filename, "r"
-    ).readlines()
-
-    for i, line in enumerate(read_namd_box_0_log_file):
-        split_line = line.split()
-        if line.startswith("TCL:") is True:
-            if split_line[0] == "TCL:" and len(split_line) >= 5:
-                if (
-                    split_line[1] == "Minimizing"
-                    and split_line[2] == "for"
-                    and split_line[4] == "steps"
-                ):
-                    namd_minimizing_steps_box_0 = float(split_line[3])
-                    current_step += -1 * namd_minimizing_steps_box_0
-
-    (
-        e_titles_namd_box_0_iteration,
-        e_titles_namd_box_0_density_iteration,
-        e_values_namd_box_0_iteration,
-        e_values_namd_box_0_density_list,
-        e_property_values_namd_box_0_list,
-    ) = get_namd_log_data(
-        read_namd_box_0_log_file, namd_box_0_data_file, run_no
-    )
-
-    e_values_density_namd_box_0_df = pd.DataFrame(
-        data=e_values_namd_box_0_density_list,
-        columns=e_titles_namd_box_0_density_iteration,
+    namd_box_0_log_data = read_namd_log_data(
+        gomc_or_namd_only_log_filename, run_no
     )
-    e_values_density_namd_box_0_df.to_csv(
-        namd_box_0_data_density_filename, sep="	", index=False
+    e_titles_namd_box_0_density_iteration = get_namd_density_titles(
+        namd_box_0_log_data["e_titles"]
     )
 
-    # ****************************************
-    # write the combined NAMD data  (Start)
-    # ****************************************
-
-    e_values_density_namd_box_0_STEP_list = e_values_density_namd_box_0_df.loc[
-        :, "#TS"
-    ].tolist()
-    # add 0.1 to the NAMD modified timestep for easy sorting later
-    e_values_density_namd_box_0_MOD_STEP_list = [
-        str(float(i) + 0.2) for i in e_values_density_namd_box_0_STEP_list
-    ]
-    e_values_density_namd_box_0_ENGINE_list = [
-        "NAMD" for i in e_values_density_namd_box_0_STEP_list
-    ]
-    e_values_density_namd_box_0_TOTAL_POT_list = (
-        e_values_density_namd_box_0_df.loc[:, "POTENTIAL"].tolist()
-    )
-    e_values_density_namd_box_0_TOTAL_ELECT_list = (
-        e_values_density_namd_box_0_df.loc[:, "ELECT"].tolist()
-    )
-    e_values_density_namd_box_0_TOTAL_VDW_list = (
-        e_values_density_namd_box_0_df.loc[:, "VDW"].tolist()
+    # the NAMD minimization timesteps are before the current step
+    (
+        e_values_namd_box_0_density,
+        e_value_texts_namd_box_0_density,
+    ) = write_namd_log_data(
+        namd_box_0_log_data,
+        namd_box_0_data_file,
+        run_no,
+        int(current_step - namd_box_0_log_data["minimizing_steps"]),
     )
-    e_values_density_namd_box_0_TOTAL_VDW_plus_ELECT_list = [
-        float(e_values_density_namd_box_0_TOTAL_VDW_list[k_i])
-        + float(e_values_density_namd_box_0_TOTAL_ELECT_list[k_i])
-        for k_i in range(0, len(e_values_density_namd_box_0_TOTAL_VDW_list))
-    ]
-    e_values_density_namd_box_0_PRESSURE_list = (
-        e_values_density_namd_box_0_df.loc[:, "PRESSURE"].tolist()
+
+    e_values_density_namd_box_0_df = get_data_table_df(
+        e_values_namd_box_0_density,
+        e_titles_namd_box_0_density_iteration,
+        "#TS",
+        table_texts=e_value_texts_namd_box_0_density,
     )
-    e_values_density_namd_box_0_VOLUME_list = (
-        e_values_density_namd_box_0_df.loc[:, "VOLUME"].tolist()
+    write_data_table(
+        e_values_density_namd_box_0_df,
+        namd_box_0_data_density_filename,
+        process_pool_executor,
     )
-    e_values_density_namd_box_0_DENSITY_list = (
-        e_values_density_namd_box_0_df.loc[:, "DENSITY"].tolist()
+    write_binary_data_tables(
+        e_values_density_namd_box_0_df,
+        namd_box_0_data_density_filename,
+        output_format_list,
+        output_float_type,
     )
 
     # ****************************************
-    # write the combined NAMD  data (end)
+    # write the combined NAMD data  (Start)
     # ****************************************
-
-    # combine Engine data
-    namd_MOD_STEP_box_0 = []
-    # combine MOD_STEP data
-    for i in range(0, len(e_values_density_namd_box_0_MOD_STEP_list)):
-        namd_MOD_STEP_box_0.append(
-            float(e_values_density_namd_box_0_MOD_STEP_list[i])
+    namd_data_sorted_box_0_df = get_combined_data_df(
+        namd_combined_data_box_x=get_namd_combined_data(
+            e_values_density_namd_box_0_df
         )
-
-    namd_ENGINE_box_0 = e_values_density_namd_box_0_ENGINE_list
-    namd_STEP_box_0 = e_values_density_namd_box_0_STEP_list
-    namd_TOTAL_POT_box_0 = e_values_density_namd_box_0_TOTAL_POT_list
-    namd_TOTAL_ELECT_box_0 = e_values_density_namd_box_0_TOTAL_ELECT_list
-    namd_TOTAL_VDW_plus_ELECT_box_0 = (
-        e_values_density_namd_box_0_TOTAL_VDW_plus_ELECT_list
-    )
-    namd_PRESSURE_box_0 = e_values_density_namd_box_0_PRESSURE_list
-    namd_VOLUME_box_0 = e_values_density_namd_box_0_VOLUME_list
-    namd_DENSITY_box_0 = e_values_density_namd_box_0_DENSITY_list
-
-    namd_data_box_0_df = pd.DataFrame(
-        {
-            "#ENGINE": namd_ENGINE_box_0,
-            "MOD_STEP": namd_MOD_STEP_box_0,
-            "STEP": namd_STEP_box_0,
-            "TOTAL_POT": namd_TOTAL_POT_box_0,
-            "TOTAL_ELECT": namd_TOTAL_ELECT_box_0,
-            "TOTAL_VDW_plus_ELECT": namd_TOTAL_VDW_plus_ELECT_box_0,
-            "PRESSURE": namd_PRESSURE_box_0,
-            "VOLUME": namd_VOLUME_box_0,
-            "DENSITY": namd_DENSITY_box_0,
-        }
     )
-    namd_data_sorted_box_0_df = namd_data_box_0_df.sort_values(
-        by=["MOD_STEP"], axis=0, ascending=True
+    write_data_table(
+        namd_data_sorted_box_0_df,
+        combined_box_0_data_filename,
+        process_pool_executor,
     )
-    namd_data_sorted_box_0_df.drop("MOD_STEP", axis=1, inplace=True)
-    namd_data_sorted_box_0_df.to_csv(
-        combined_box_0_data_filename, sep="	", index=False
+    write_binary_data_tables(
+        namd_data_sorted_box_0_df,
+        combined_box_0_data_filename,
+        output_format_list,
+        output_float_type,
     )
 
     # ****************************************
@@ -2718,3 +4718,6 @@ elif simulation_engine_options == "NAMD-only":
     # NAMD-only data extraction (end)
     # ****************************************
     # ****************************************
+
+if process_pool_executor is not None:
+    process_pool_executor.shutdown()
@@ -1,19 +1,27 @@
 import argparse
+import concurrent.futures
+import copy
 import datetime
+import io
 import json
+import math
 import os
+import re
+import select
+import selectors
+import shlex
+import shutil
+import signal
 import subprocess
 import sys
+import tarfile
+import threading
+import time
 from warnings import warn
 
 import numpy as np
 import pandas as pd
 
-# MD/MC simulations (NAMD/GOMC) for the NPT, NVT, GEMC, and GCMC ensembles
-# *************************************************
-# Import the user variables from the json file (start)
-# *************************************************
-
 
 # *************************************************
 # The python arguments that need to be selected to run the simulations (start)
@@ -48,6 +56,55 @@ def _get_args():
         type=str,
     )
 
+    arg_parser.add_argument(
+        "-engine_mode",
+        "--engine_mode",
+        help="This sets how the NAMD and GOMC engines are run, 'launch', 'batch' "
+        "or 'resident' (default = launch).  The 'launch' mode starts a new NAMD or "
+        "GOMC process for every simulation.  The 'batch' mode "
+        "writes a batch job script for every simulation and submits it with "
+        "the batch_submit_command (default = sbatch), then waits for the "
+        "job to write its engine_exit_status.txt file.  The 'resident' mode "
+        "keeps one NAMD process running for the whole hybrid simulation, which "
+        "runs each NAMD simulation from its Tcl console, so the NAMD startup is "
+        "only done once.  The GOMC simulations are started as in the 'launch' "
+        "mode.  The 'resident' mode is only for the NVT and NPT ensembles, "
+        "which do not change the number of atoms in the NAMD box.",
+        type=str,
+        default="launch",
+    )
+
+    arg_parser.add_argument(
+        "-namd_core_pinning",
+        "--namd_core_pinning",
+        help="Pin the NAMD box 0 and box 1 simulations to different CPU cores "
+        "(no_core_box_0 and no_core_box_1 cores).  This is only used for the GEMC "
+        "ensemble when both boxes are run in NAMD in parallel "
+        "(-namd_sims_order parallel).",
+        action="store_true",
+    )
+
+    arg_parser.add_argument(
+        "-namd_core_rebalance",
+        "--namd_core_rebalance",
+        help="Move CPU cores between the NAMD box 0 and box 1 simulations after "
+        "each cycle, so both boxes take about the same time.  The total number "
+        "of cores (no_core_box_0 + no_core_box_1) is not changed.  This is only "
+        "used for the GEMC ensemble when both boxes are run in NAMD in parallel "
+        "(-namd_sims_order parallel).",
+        action="store_true",
+    )
+
+    arg_parser.add_argument(
+        "-resume",
+        "--resume",
+        help="Resume the hybrid simulation after the last finished cycle in the "
+        "simulation journal (NAMD_GOMC_journal.jsonl), instead of starting at the "
+        "starting_at_cycle_namd_gomc_sims cycle.  The NAMD and GOMC run folders "
+        "of any partly finished cycle are deleted before the simulation is resumed.",
+        action="store_true",
+    )
+
     parser_arguments = arg_parser.parse_args()
 
     # check to see if the file exists
@@ -89,746 +146,46 @@ def _get_args():
             )
         )
 
+    # set the engine mode
+    if parser_arguments.engine_mode not in ["launch", "batch", "resident"]:
+        print(
+            "ERROR: The engine_mode must be 'launch', 'batch' or 'resident', "
+            "engine_mode = <{}>.".format(parser_arguments.engine_mode)
+        )
+        sys.exit(1)
+
     print("arg_parser.file = " + str(parser_arguments.file))
     print(
         "parser_arguments.namd_simulation_order = "
         + str(parser_arguments.namd_simulation_order)
     )
-    return [parser_arguments.file, parser_arguments.namd_simulation_order]
-
-
-# *************************************************
-# The python arguments that need to be selected to run the simulations (end)
-# *************************************************
-
-# *************************************************
-# Import read and check the user input file for errors (start)
-# *************************************************
-# import and read the users json file
-[json_filename, namd_sim_order] = _get_args()
-print("json_filename = " + str(json_filename))
-print("namd_sim_order = " + str(namd_sim_order))
-
-# just for testing , need to remove later
-manual_testing_filename_input_override = False
-if json_filename is None and manual_testing_filename_input_override is True:
-    json_filename = "user_input_NAMD_GOMC.json"
-
-json_file_data = json.load(
-    open(json_filename)
-)  # standard name is "user_input_NAMD_GOMC.json"
-json_file_data_keys_list = json_file_data.keys()
-
-# get the total_cycles_namd_gomc_sims variable from the json file
-if "total_cycles_namd_gomc_sims" not in json_file_data_keys_list:
-    raise TypeError("The total_cycles_namd_gomc_sims key is not provided.\n")
-total_cycles_namd_gomc_sims = json_file_data["total_cycles_namd_gomc_sims"]
-if not isinstance(total_cycles_namd_gomc_sims, int):
-    raise TypeError(
-        "The total_cycles_namd_gomc_sims values must be an integer.\n"
-    )
-else:
-    if total_cycles_namd_gomc_sims < 0:
-        raise TypeError(
-            "The total_cycles_namd_gomc_sims values must be an integer "
-            "greater than or equal to zero (>=0.\n"
-        )
-
-# get the starting_at_cycle_namd_gomc_sims variable from the json file
-if "starting_at_cycle_namd_gomc_sims" not in json_file_data_keys_list:
-    raise TypeError(
-        "The starting_at_cycle_namd_gomc_sims key is not provided.\n"
-    )
-starting_at_cycle_namd_gomc_sims = json_file_data[
-    "starting_at_cycle_namd_gomc_sims"
-]
-if not isinstance(starting_at_cycle_namd_gomc_sims, int):
-    raise TypeError(
-        "The starting_at_cycle_namd_gomc_sims values must be an integer.\n"
-    )
-else:
-    if starting_at_cycle_namd_gomc_sims < 0:
-        raise TypeError(
-            "The starting_at_cycle_namd_gomc_sims values must be an integer "
-            "greater than or equal to zero (>=0.\n"
-        )
-
-# get the use_CPU_or_GPU variable from the json file
-if "gomc_use_CPU_or_GPU" not in json_file_data_keys_list:
-    raise TypeError("The gomc_use_CPU_or_GPU key is not provided.\n")
-gomc_use_CPU_or_GPU = json_file_data["gomc_use_CPU_or_GPU"]
-if not isinstance(gomc_use_CPU_or_GPU, str):
-    raise TypeError("The gomc_use_CPU_or_GPU is not a string.\n")
-if gomc_use_CPU_or_GPU != "CPU" and gomc_use_CPU_or_GPU != "GPU":
-    raise ValueError("The gomc_use_CPU_or_GPU is the string 'CPU' or 'GPU'.\n")
-
-# get the simulation_type variable from the json file
-if "simulation_type" not in json_file_data_keys_list:
-    raise TypeError("The simulation_type key is not provided.\n")
-simulation_type = json_file_data["simulation_type"]
-if not isinstance(simulation_type, str):
-    raise TypeError("The simulation_type is not a string.\n")
-if simulation_type not in ["GEMC", "GCMC", "NPT", "NVT"]:
-    raise ValueError(
-        "The simulation_type is the string 'GEMC', 'GCMC', 'NPT', or 'NVT'.\n"
-    )
-
-# get the only_use_box_0_for_namd_for_gemc variable from the json file
-if "only_use_box_0_for_namd_for_gemc" not in json_file_data_keys_list:
-    raise TypeError(
-        "The only_use_box_0_for_namd_for_gemc key is not provided.\n"
-    )
-only_use_box_0_for_namd_for_gemc = json_file_data[
-    "only_use_box_0_for_namd_for_gemc"
-]
-if (
-    only_use_box_0_for_namd_for_gemc is not True
-    and only_use_box_0_for_namd_for_gemc is not False
-):
-    raise TypeError(
-        "The only_use_box_0_for_namd_for_gemc not true or false in the json file.\n"
+    print("parser_arguments.engine_mode = " + str(parser_arguments.engine_mode))
+    print(
+        "parser_arguments.namd_core_pinning = "
+        + str(parser_arguments.namd_core_pinning)
     )
-
-# get the no_core_box_0 variable from the json file
-if "no_core_box_0" not in json_file_data_keys_list:
-    raise TypeError("The no_core_box_0 key is not provided.\n")
-no_core_box_0 = json_file_data["no_core_box_0"]
-if not isinstance(no_core_box_0, int):
-    raise TypeError("The no_core_box_0 values must be an interger.\n")
-else:
-    if only_use_box_0_for_namd_for_gemc is False and simulation_type == "GEMC":
-        if no_core_box_0 < 0:
-            raise ValueError(
-                "The no_core_box_{} values must be an interger greater "
-                "than or equal to  zero (>=0)".format(0)
-            )
-
-# get the no_core_box_1 variable from the json file
-if "no_core_box_1" not in json_file_data_keys_list:
-    raise TypeError("The no_core_box_1 key is not provided.\n")
-no_core_box_1 = json_file_data["no_core_box_1"]
-if not isinstance(no_core_box_1, int):
-    raise TypeError("The no_core_box_1 values must be an interger.\n")
-else:
-    if only_use_box_0_for_namd_for_gemc is False and simulation_type == "GEMC":
-        if no_core_box_1 <= 0:
-            raise ValueError(
-                "The no_core_box_{} values must be an interger greater than zero (>0) "
-                "when using only_use_box_0_for_namd_for_gemc is False and "
-                'simulation_type == "GEMC" .\n'.format(1)
-            )
-        if no_core_box_1 < 0:
-            raise ValueError(
-                "The no_core_box_{} values must be an interger greater "
-                "than or equal to  zero (>=0)".format(1)
-            )
-
-# get the simulation_temp_k variable from the json file
-if "simulation_temp_k" not in json_file_data_keys_list:
-    raise TypeError("The simulation_temp_k key is not provided.\n")
-simulation_temp_k = json_file_data["simulation_temp_k"]
-if not isinstance(simulation_temp_k, int) and not isinstance(
-    simulation_temp_k, float
-):
-    raise TypeError(
-        "The simulation_temp_k values must be an interger or float.\n"
+    print(
+        "parser_arguments.namd_core_rebalance = "
+        + str(parser_arguments.namd_core_rebalance)
     )
-else:
-    if simulation_temp_k <= 0:
-        raise ValueError(
-            "The simulation_temp_k value must be an interger or float greater than zero (>0)"
-        )
-
-# get the simulation_pressure_bar variable from the json file
-if "simulation_pressure_bar" not in json_file_data_keys_list:
-    raise TypeError("The simulation_pressure_bar key is not provided.\n")
-simulation_pressure_bar = json_file_data["simulation_pressure_bar"]
-if simulation_type in ["NPT"]:
-    if not isinstance(simulation_pressure_bar, int) and not isinstance(
-        simulation_pressure_bar, float
-    ):
-        raise TypeError(
-            "The simulation_pressure_bar values must be an interger or float.\n"
-        )
-    else:
-        if simulation_pressure_bar < 0:
-            raise ValueError(
-                "The simulation_pressure_bar value must be an interger or float greater "
-                "than or equal to zero (>=0)"
-            )
-elif simulation_type in ["GEMC", "GCMC", "NVT"]:
-    if (
-        not isinstance(simulation_pressure_bar, int)
-        and not isinstance(simulation_pressure_bar, float)
-        and simulation_pressure_bar is not None
-    ):
-        raise TypeError(
-            "The simulation_pressure_bar values must be an interger or float (>=0) or null/None.\n"
-        )
-
-if simulation_type in ["GCMC"]:
-    # get the GCMC_ChemPot_or_Fugacity variable from the json file
-    if "GCMC_ChemPot_or_Fugacity" not in json_file_data_keys_list:
-        raise TypeError("The GCMC_ChemPot_or_Fugacity key is not provided.\n")
-    GCMC_ChemPot_or_Fugacity = json_file_data["GCMC_ChemPot_or_Fugacity"]
-    if not isinstance(GCMC_ChemPot_or_Fugacity, str) or (
-        GCMC_ChemPot_or_Fugacity != "ChemPot"
-        and GCMC_ChemPot_or_Fugacity != "Fugacity"
-    ):
-        raise TypeError(
-            'The GCMC_ChemPot_or_Fugacity values must be the string "ChemPot" or "Fugacity".\n'
-        )
-
-    # get the GCMC_ChemPot_or_Fugacity_dict variable from the json file
-    if "GCMC_ChemPot_or_Fugacity_dict" not in json_file_data_keys_list:
-        raise TypeError(
-            "The GCMC_ChemPot_or_Fugacity_dict key is not provided.\n"
-        )
-    GCMC_ChemPot_or_Fugacity_dict = json_file_data[
-        "GCMC_ChemPot_or_Fugacity_dict"
+    print("parser_arguments.resume = " + str(parser_arguments.resume))
+    return [
+        parser_arguments.file,
+        parser_arguments.namd_simulation_order,
+        parser_arguments.engine_mode,
+        parser_arguments.namd_core_pinning,
+        parser_arguments.namd_core_rebalance,
+        parser_arguments.resume,
     ]
-    if not isinstance(GCMC_ChemPot_or_Fugacity_dict, dict):
-        raise TypeError(
-            "The GCMC_ChemPot_or_Fugacity_dict values must a dictionary.\n"
-        )
-
-    GCMC_ChemPot_or_Fugacity_dict_to_list = GCMC_ChemPot_or_Fugacity_dict.keys()
-    if GCMC_ChemPot_or_Fugacity == "ChemPot":
-        for chempot_i in GCMC_ChemPot_or_Fugacity_dict_to_list:
-            if not isinstance(
-                GCMC_ChemPot_or_Fugacity_dict[chempot_i], int
-            ) and not isinstance(
-                GCMC_ChemPot_or_Fugacity_dict[chempot_i], float
-            ):
-                raise TypeError(
-                    "The GCMC_ChemPot_or_Fugacity_dict values must be floats or integers.\n"
-                )
-    if GCMC_ChemPot_or_Fugacity == "Fugacity":
-        for fugacity_i in GCMC_ChemPot_or_Fugacity_dict_to_list:
-            if not isinstance(
-                GCMC_ChemPot_or_Fugacity_dict[fugacity_i], int
-            ) and not isinstance(
-                GCMC_ChemPot_or_Fugacity_dict[fugacity_i], float
-            ):
-                raise TypeError(
-                    "The GCMC_ChemPot_or_Fugacity_dict values must be floats or integers.\n"
-                )
-            if GCMC_ChemPot_or_Fugacity_dict[fugacity_i] < 0:
-                raise ValueError(
-                    "The GCMC_ChemPot_or_Fugacity_dict values when using "
-                    'GCMC_ChemPot_or_Fugacity != "Fugacity", must be floats or integers '
-                    "greater than of equal to zero (>=) .\n"
-                )
-else:
-    GCMC_ChemPot_or_Fugacity = None
-    GCMC_ChemPot_or_Fugacity_dict = None
-
-# get the gomc_run_steps variable from the json file
-if "gomc_run_steps" not in json_file_data_keys_list:
-    raise TypeError("The gomc_run_steps key is not provided.\n")
-gomc_run_steps = json_file_data["gomc_run_steps"]
-if not isinstance(gomc_run_steps, int):
-    raise TypeError("The gomc_run_steps values must be an interger.\n")
-
-# get the namd_run_steps variable from the json file
-if "namd_run_steps" not in json_file_data_keys_list:
-    raise TypeError("The namd_run_steps key is not provided.\n")
-namd_run_steps = json_file_data["namd_run_steps"]
-if not isinstance(namd_run_steps, int):
-    raise TypeError("The namd_run_steps values must be an interger.\n")
-
-# get the namd_minimize_mult_scalar variable from the json file
-if "namd_minimize_mult_scalar" not in json_file_data_keys_list:
-    raise TypeError("The namd_minimize_mult_scalar key is not provided.\n")
-namd_minimize_mult_scalar = json_file_data["namd_minimize_mult_scalar"]
-if not isinstance(namd_run_steps, int):
-    raise TypeError(
-        "The namd_minimize_mult_scalar values must be an interger.\n"
-    )
-
-# get the set_x_dim_box_0 variable from the json file
-if "set_dims_box_0_list" not in json_file_data_keys_list:
-    raise TypeError("The set_dims_box_0_list key is not provided.\n")
-set_dims_box_0_list = json_file_data["set_dims_box_0_list"]
-if set_dims_box_0_list is not None:
-    print_error_text = (
-        "The set_dims_box_0_list must be a null/None or list and contain three (3) integers or floats"
-        "greater than zero (>0).\n"
-    )
-    if isinstance(set_dims_box_0_list, list):
-        if len(set_dims_box_0_list) == 3:
-            for dims_box_i in set_dims_box_0_list:
-                if (
-                    isinstance(dims_box_i, int) is False
-                    and isinstance(dims_box_i, float) is False
-                    and dims_box_i != None
-                ):
-                    raise TypeError(print_error_text)
-                else:
-                    if dims_box_i != None:
-                        if dims_box_i <= 0:
-                            raise TypeError(print_error_text)
-        else:
-            raise TypeError(print_error_text)
-    else:
-        raise TypeError(print_error_text)
-elif set_dims_box_0_list is None:
-    set_dims_box_0_list = [None, None, None]
-
-# get the set_x_dim_box_1 variable from the json file
-if "set_dims_box_1_list" not in json_file_data_keys_list:
-    raise TypeError("The set_dims_box_1_list key is not provided.\n")
-set_dims_box_1_list = json_file_data["set_dims_box_1_list"]
-if set_dims_box_1_list is not None:
-    print_error_text = (
-        "The set_dims_box_1_list must be a null/None or list and contain three (3) integers or floats"
-        "greater than zero (>0).\n"
-    )
-    if isinstance(set_dims_box_1_list, list):
-        if len(set_dims_box_1_list) == 3:
-            for dims_box_i in set_dims_box_1_list:
-                if (
-                    isinstance(dims_box_i, int) is False
-                    and isinstance(dims_box_i, float) is False
-                    and dims_box_i != None
-                ):
-                    raise TypeError(print_error_text)
-                else:
-                    if dims_box_i != None:
-                        if dims_box_i <= 0:
-                            raise TypeError(print_error_text)
-        else:
-            raise TypeError(print_error_text)
-    else:
-        raise TypeError(print_error_text)
-elif set_dims_box_1_list is None:
-    set_dims_box_1_list = [None, None, None]
-
-# get the set_angle_box_0_list variable from the json file
-if "set_angle_box_0_list" not in json_file_data_keys_list:
-    raise TypeError("The set_angle_box_0_list key is not provided.\n")
-set_angle_box_0_list = json_file_data["set_angle_box_0_list"]
-if set_angle_box_0_list is not None:
-    print_error_text = (
-        "The set_angle_box_0_list must be a null/None or 90 (in degrees). Currently,"
-        "only orthogonal boxes are available.\n"
-    )
-    if isinstance(set_angle_box_0_list, list):
-        if len(set_angle_box_0_list) == 3:
-            for angles_box_i in set_angle_box_0_list:
-                if (
-                    isinstance(angles_box_i, int) is False
-                    and isinstance(angles_box_i, float) is False
-                    and angles_box_i != None
-                ):
-                    raise TypeError(print_error_text)
-                else:
-                    if angles_box_i != None:
-                        if angles_box_i != 90:
-                            raise TypeError(print_error_text)
-        else:
-            raise TypeError(print_error_text)
-    else:
-        raise TypeError(print_error_text)
-elif set_angle_box_0_list is None:
-    set_angle_box_0_list = [None, None, None]
-
-# get the set_angle_box_1_list variable from the json file
-if "set_angle_box_1_list" not in json_file_data_keys_list:
-    raise TypeError("The set_angle_box_1_list key is not provided.\n")
-set_angle_box_1_list = json_file_data["set_angle_box_1_list"]
-if set_angle_box_1_list is not None:
-    print_error_text = (
-        "The set_angle_box_1_list must be a null/None or 90 (in degrees). Currently,"
-        "only orthogonal boxes are available.\n"
-    )
-    if isinstance(set_angle_box_1_list, list):
-        if len(set_angle_box_1_list) == 3:
-            for angles_box_i in set_angle_box_1_list:
-                if (
-                    isinstance(angles_box_i, int) is False
-                    and isinstance(angles_box_i, float) is False
-                    and angles_box_i != None
-                ):
-                    raise TypeError(print_error_text)
-                else:
-                    if angles_box_i != None:
-                        if angles_box_i != 90:
-                            raise TypeError(print_error_text)
-        else:
-            raise TypeError(print_error_text)
-    else:
-        raise TypeError(print_error_text)
-elif set_angle_box_1_list is None:
-    set_angle_box_1_list = [None, None, None]
-
-# get the starting_ff_file_list_gomc variable from the json file
-if "starting_ff_file_list_gomc" not in json_file_data_keys_list:
-    raise TypeError("The starting_ff_file_list_gomc key is not provided.\n")
-starting_ff_file_list_gomc = json_file_data["starting_ff_file_list_gomc"]
-if not isinstance(starting_ff_file_list_gomc, list):
-    raise TypeError(
-        "The starting_ff_file_list_gomc values must be a list of strings.\n"
-    )
-else:
-    for start_ff_gomc_i in starting_ff_file_list_gomc:
-        if not isinstance(start_ff_gomc_i, str):
-            raise TypeError(
-                "The starting_ff_file_list_gomc list values must be strings.\n"
-            )
-
-# get the starting_ff_file_list_namd variable from the json file
-if "starting_ff_file_list_namd" not in json_file_data_keys_list:
-    raise TypeError("The starting_ff_file_list_namd key is not provided.\n")
-starting_ff_file_list_namd = json_file_data["starting_ff_file_list_namd"]
-if not isinstance(starting_ff_file_list_namd, list):
-    raise TypeError(
-        "The starting_ff_file_list_namd values must be a list of strings.\n"
-    )
-else:
-    for start_ff_gomc_i in starting_ff_file_list_namd:
-        if not isinstance(start_ff_gomc_i, str):
-            raise TypeError(
-                "The starting_ff_file_list_namd list values must be strings.\n"
-            )
-
-# get the starting_pdb_box_0_file variable from the json file
-if "starting_pdb_box_0_file" not in json_file_data_keys_list:
-    raise TypeError("The starting_pdb_box_0_file key is not provided.\n")
-starting_pdb_box_0_file = json_file_data["starting_pdb_box_0_file"]
-if not isinstance(starting_pdb_box_0_file, str):
-    raise TypeError("The starting_pdb_box_0_file is not a string.\n")
-
-# get the starting_psf_box_0_file variable from the json file
-if "starting_psf_box_0_file" not in json_file_data_keys_list:
-    raise TypeError("The starting_psf_box_0_file key is not provided.\n")
-starting_psf_box_0_file = json_file_data["starting_psf_box_0_file"]
-if not isinstance(starting_psf_box_0_file, str):
-    raise TypeError("The starting_psf_box_0_file is not a string.\n")
-
-if simulation_type in ["GCMC", "GEMC"]:
-    # get the starting_pdb_box_1_file variable from the json file
-    if "starting_pdb_box_1_file" not in json_file_data_keys_list:
-        raise TypeError("The starting_pdb_box_1_file key is not provided.\n")
-    starting_pdb_box_1_file = json_file_data["starting_pdb_box_1_file"]
-    if not isinstance(starting_pdb_box_0_file, str):
-        raise TypeError("The starting_pdb_box_1_file is not a string.\n")
-
-    # get the starting_psf_box_1_file variable from the json file
-    if "starting_psf_box_1_file" not in json_file_data_keys_list:
-        raise TypeError("The starting_psf_box_1_file key is not provided.\n")
-    starting_psf_box_1_file = json_file_data["starting_psf_box_1_file"]
-    if not isinstance(starting_psf_box_1_file, str):
-        raise TypeError("The starting_psf_box_1_file is not a string.\n")
-else:
-    starting_pdb_box_1_file = ""
-    starting_psf_box_1_file = ""
-# get the namd2_bin_directory variable from the json file
-# json file specifies relative path to the directory where the namd2 is located
-if "namd2_bin_directory" not in json_file_data_keys_list:
-    raise TypeError("The namd2_bin_directory key is not provided.\n")
-namd2_bin_directory = json_file_data["namd2_bin_directory"]
-if isinstance(namd2_bin_directory, str) is False:
-    raise TypeError("The namd2_bin_directory values must be an string.\n")
-else:
-    namd_bin_file = "{}/{}/{}".format(
-        str(os.getcwd()), namd2_bin_directory, "namd2"
-    )
-
-# get the gomc_bin_directory variable from the json file
-# json file specifies relative path to the directory where the GOMC_XXX_XXX binary files are located
-if "gomc_bin_directory" not in json_file_data_keys_list:
-    raise TypeError("The gomc_bin_directory key is not provided.\n")
-gomc_bin_directory = json_file_data["gomc_bin_directory"]
-if isinstance(gomc_bin_directory, str) is False:
-    raise TypeError("The gomc_bin_directory values must be an string.\n")
-else:
-    gomc_bin_file = "{}/{}/GOMC_{}_{}".format(
-        str(os.getcwd()),
-        gomc_bin_directory,
-        gomc_use_CPU_or_GPU,
-        simulation_type,
-    )
-
-# *************************************************
-# Import read and check the user input file for errors (end)
-# *************************************************
-
-
-# *************************************************
-# Potential changable variables in the future (start)
-# *************************************************
-allowable_error_fraction_vdw_plus_elec = 5 * 10 ** (-3)
-allowable_error_fraction_potential = 5 * 10 ** (-3)
-max_absolute_allowable_kcal_fraction_vdw_plus_elec = 0.5
-
-gomc_console_blkavg_hist_steps = int(gomc_run_steps)
-gomc_rst_coor_ckpoint_steps = int(gomc_run_steps)
-
-if gomc_run_steps / 10 > 500:
-    gomc_hist_sample_steps = int(500)
-elif gomc_run_steps / 10 <= 500:
-    gomc_hist_sample_steps = int(gomc_run_steps / 10)
-
-namd_rst_dcd_xst_steps = int(namd_run_steps)
-namd_console_blkavg_e_and_p_steps = int(namd_run_steps)
-
-# *************************************************
-# Potential changable variables in the future (end)
-# *************************************************
-
-# *************************************************
-# check for existing and create NAMD and GOMC folders (start)
-# *************************************************
-if os.path.isdir("NAMD") or os.path.isdir("GOMC"):
-    warn(
-        "INFORMATION: if the system fails to start (with errors) from the beginning of a simulation, "
-        "you may need to delete the main GOMC and NAMD folders.  "
-        "The failure to start/restart may be caused by the last simulation not finishing correctly."
-    )
-    warn(
-        "INFORMATION: If the system fails to restart a previous run (with errors), "
-        "you may need to delete the last subfolders under the main "
-        "NAMD and GOMC (i.e., folders NAMD = 00000000_a or GOMC = 00000001). "
-        "The failure to start/restart may be caused by the last simulation not finishing properly."
-    )
-
-path_namd_runs = "NAMD"
-os.makedirs(path_namd_runs, exist_ok=True)
-
-path_gomc_runs = "GOMC"
-os.makedirs(path_gomc_runs, exist_ok=True)
-# *************************************************
-# create NAMD and GOMC folders (end)
-# *************************************************
 
-# *************************************************
-# create NAMD and GOMC config file templates locations (start)
-# *************************************************
-path_namd_template = "required_data/config_files/NAMD.conf"
 
-path_gomc_template = (
-    "required_data/config_files/GOMC_" + str(simulation_type) + ".conf"
-)
 # *************************************************
-# create NAMD and GOMC config file templates locations (end)
+# The python arguments that need to be selected to run the simulations (end)
 # *************************************************
 
-gomc_ff_error_message = "ERROR: The GOMC force field(s) need to be provided as a list of string(s).\n"
-namd_ff_error_message = "ERROR: The GOMC force field(s) need to be provided as a list of string(s).\n"
-if isinstance(starting_ff_file_list_gomc, list) is False:
-    raise TypeError(gomc_ff_error_message)
-if isinstance(starting_ff_file_list_namd, list) is False:
-    raise TypeError(namd_ff_error_message)
-
-for gomc_ff_i in starting_ff_file_list_gomc:
-    if isinstance(gomc_ff_i, str) is False:
-        raise TypeError(gomc_ff_error_message)
-for namd_ff_i in starting_ff_file_list_namd:
-    if isinstance(namd_ff_i, str) is False:
-        raise TypeError(namd_ff_error_message)
-
-if simulation_type in ["GCMC"]:
-    if isinstance(GCMC_ChemPot_or_Fugacity_dict, dict) is False:
-        raise TypeError(
-            "ERROR: enter the chemical potential or fugacity data (GCMC_ChemPot_or_Fugacity_dict)"
-            "as a dictionary when using the GCMC ensemble.\n"
-        )
-
-    if GCMC_ChemPot_or_Fugacity is None:
-        raise ValueError(
-            "The GCMC_ChemPot_or_Fugacity can not be None when running the GCMC ensemble.\n"
-        )
-    if (
-        GCMC_ChemPot_or_Fugacity != "ChemPot"
-        and GCMC_ChemPot_or_Fugacity != "Fugacity"
-    ):
-        raise ValueError(
-            "The GCMC_ChemPot_or_Fugacity can either be the string "
-            '"ChemPot" or "Fugacity" when running the GCMC ensemble.\n'
-        )
-
-    GCMC_ChemPot_or_Fugacity_dict_keys = GCMC_ChemPot_or_Fugacity_dict.keys()
-    for keys_i in GCMC_ChemPot_or_Fugacity_dict_keys:
-        if (
-            isinstance(GCMC_ChemPot_or_Fugacity_dict[keys_i], int) is False
-            and isinstance(GCMC_ChemPot_or_Fugacity_dict[keys_i], float)
-            is False
-        ):
-            raise TypeError(
-                "The GCMC_ChemPot_or_Fugacity_dict values must be an interger or float.\n"
-            )
-
-        if isinstance(keys_i, str) is False:
-            raise TypeError(
-                "The GCMC_ChemPot_or_Fugacity_dict keys must be a string.\n"
-            )
-
-        if (
-            GCMC_ChemPot_or_Fugacity == "Fugacity"
-            and GCMC_ChemPot_or_Fugacity_dict[keys_i] < 0
-        ):
-            raise ValueError(
-                "When using Fugacity, the GCMC_ChemPot_or_Fugacity values must be "
-                "greater than or equal to zero (>=0).\n"
-            )
-
-# check the pressure values and set to atomospheric if not used
-if simulation_type in ["NPT"] and (
-    isinstance(simulation_pressure_bar, float) is False
-    and isinstance(simulation_pressure_bar, int) is False
-):
-    raise TypeError(
-        "The simulation pressure needs to be set for the NPT simulation type (int or float). \n"
-    )
-if simulation_type in ["NPT"] and (
-    isinstance(simulation_pressure_bar, float) is True
-    or isinstance(simulation_pressure_bar, int) is True
-):
-    if simulation_pressure_bar < 0:
-        raise ValueError(
-            "The simulation pressure needs to be set to a positive or zero [(int of float) >=0 bar] "
-            "value for the NPT simulation type. \n"
-        )
-elif simulation_type in ["NVT", "GEMC", "GCMC"]:
-    # set pressure to atomospheric as it needs a number and it is not used
-    simulation_pressure_bar = 1.01325
 
 K_to_kcal_mol = 1.98720425864083 * 10 ** (-3)
 
-python_file_directory = os.getcwd()
-
-log_template_file = open(
-    "{}/NAMD_GOMC_started_at_cycle_No_{}.log".format(
-        str(python_file_directory), str(starting_at_cycle_namd_gomc_sims)
-    ),
-    "w",
-)
-
-start_time = datetime.datetime.today()
-start_time_s = datetime.datetime.today()
-write_log_data = (
-    "*************************************************\n"
-    "date and time (start) = {} \n"
-    "************************************************* \n".format(
-        str(start_time)
-    )
-)
-log_template_file.write(str(write_log_data))
-print(str(write_log_data))
-
-write_log_data = (
-    "*************************************************\n"
-    + "namd_bin_file = {} \n"
-    "************************************************* \n".format(
-        str(namd_bin_file)
-    )
-)
-log_template_file.write(str(write_log_data))
-print(str(write_log_data))
-
-write_log_data = (
-    "*************************************************\n"
-    + "gomc_bin_file = {} \n"
-    "************************************************* \n".format(
-        str(gomc_bin_file)
-    )
-)
-log_template_file.write(str(write_log_data))
-print(str(write_log_data))
-
-
-namd_minimize_steps = int(int(namd_run_steps) * int(namd_minimize_mult_scalar))
-if simulation_type in ["GEMC"] and only_use_box_0_for_namd_for_gemc is False:
-    total_no_cores = no_core_box_0 + no_core_box_1
-
-    if no_core_box_1 == 0:
-        write_log_data = (
-            "*************************************************\n"
-            "no_core_box_0 = {} \n"
-            "WARNING: the number of CPU cores listed for box 1 is zero (0), and should be an "
-            "interger > 0, or the NAMD simulation for box 1 will not run and the python script "
-            "will crash \n, no_core_box_1 = {} \n"
-            "*************************************************"
-            " \n".format(str(no_core_box_0), str(no_core_box_1))
-        )
-        log_template_file.write(str(write_log_data))
-        warn(str(write_log_data))
-
-    else:
-        write_log_data = (
-            "*************************************************\n"
-            "no_core_box_0 = {} \n"
-            "no_core_box_1 = {} \n"
-            "*************************************************"
-            " \n".format(str(no_core_box_0), str(no_core_box_1))
-        )
-
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
-
-else:
-    if no_core_box_1 != 0:
-        write_log_data = (
-            "*************************************************\n"
-            "no_core_box_0 = {} .\n"
-            "WARNING: the number of CPU cores listed for box 1 are not being used, \n"
-            "no_core_box_1 = {}\n"
-            "*************************************************"
-            " \n".format(str(no_core_box_0), str(no_core_box_1))
-        )
-        log_template_file.write(str(write_log_data))
-        warn(str(write_log_data))
-        no_core_box_1 = 0
-
-    total_no_cores = no_core_box_0
-
-# Check total cores vs per box cores
-if isinstance(no_core_box_0, int) is False:
-    write_log_data = (
-        "*************************************************\n"
-        "Enter no_core_box_0 as an interger, no_core_box_0 = {} \n"
-        "************************************************* \n".format(
-            str(no_core_box_0)
-        )
-    )
-    log_template_file.write(str(write_log_data))
-    print(str(write_log_data))
-
-    if no_core_box_0 == 0:
-        write_log_data = (
-            "*************************************************\n"
-            "Enter no_core_box_0 as a non-zero number, no_core_box_0 = {} \n"
-            "************************************************* \n".format(
-                str(no_core_box_0)
-            )
-        )
-        log_template_file.write(str(write_log_data))
-        raise ValueError(str(write_log_data))
-
-if simulation_type in ["GEMC", "GCMC"]:
-    if isinstance(no_core_box_1, int) is False:
-        write_log_data = (
-            "*************************************************\n"
-            "Enter no_core_box_1 as an interger, no_core_box_1 = {} \n"
-            "************************************************* \n".format(
-                str(no_core_box_1)
-            )
-        )
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
-
-        if no_core_box_1 == 0:
-            write_log_data = (
-                "*************************************************\n"
-                "Enter no_core_box_1 as a non-zero number, no_core_box_1 = {} \n"
-                "************************************************* \n".format(
-                    str(no_core_box_1)
-                )
-            )
-            log_template_file.write(str(write_log_data))
-            raise ValueError(str(write_log_data))
-
 
 def calc_folder_zeros(run_number):
     """
@@ -856,11 +213,6 @@ def calc_folder_zeros(run_number):
     return add_number_of_zeros_at_start_run_no_str
 
 
-# run the GOMC and NAMD simulations
-total_sims_namd_gomc = int(2 * total_cycles_namd_gomc_sims)
-starting_sims_namd_gomc = int(2 * starting_at_cycle_namd_gomc_sims)
-
-
 default_namd_e_titles = [
     "ETITLE:",
     "TS",
@@ -886,1977 +238,6636 @@ default_namd_e_titles = [
 ]
 
 
-def get_namd_run_0_pme_dim(box_number):
+class NamdEnergyData:
     """
-    Gets the number of points for the NAMD PME grid in the x, y, and z-dimensions.
-    It also provides the run 0 (1st NAMD simulation) run directory.
+    The NAMD energy data (ENERGY: rows) stored as a float64 NumPy array,
+    with the columns keyed by the NAMD energy titles (ETITLE: row).
 
     Parameters
     ----------
-    box_number : int
-        The simulation box number, which can only be 0 or 1
-
-    Returns
-    ---------
-    namd_x_pme_grid_dim : int
-        The number of points for the NAMD PME grid in the x-dimension.
-    namd_y_pme_grid_dim : int
-        The number of points for the NAMD PME grid in the y-dimension.
-    namd_z_pme_grid_dim : int
-        The number of points for the NAMD PME grid in the z-dimension.
-    namd_box_x_run_0_dir : str
-        The run 0 (1st NAMD simulation) run directory.
-    """
-
-    if isinstance(box_number, int) is False and (
-        box_number != 0 and box_number != 1
-    ):
-        raise ValueError(
-            "ERROR: Enter an interger of 0 or 1 for box_number "
-            "in the get_namd_run_0_pme_dim function. \n"
-        )
-
-    namd_first_run_no = int(0)
-    add_zeros_for_box_x_run_0 = calc_folder_zeros(namd_first_run_no)
-
-    if box_number == 0:
-        namd_box_x_run_0_dir = "{}/{}/{}{}_a".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_for_box_x_run_0),
-            str(namd_first_run_no),
-        )
-
-    elif box_number == 1:
-        namd_box_x_run_0_dir = "{}/{}/{}{}_b".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_for_box_x_run_0),
-            str(namd_first_run_no),
-        )
-
-    try:
-        read_namd_box_x_run_0_log_file = open(
-            "{}/out.dat".format(namd_box_x_run_0_dir), "r"
-        ).readlines()
-
-        for i, line in enumerate(read_namd_box_x_run_0_log_file):
-            split_line = line.split()
-            if len(split_line) >= 7:
-                if (
-                    split_line[0] == "Info:"
-                    and split_line[1] == "PME"
-                    and split_line[2] == "GRID"
-                    and split_line[3] == "DIMENSIONS"
-                ):
-                    namd_x_pme_grid_dim = int(split_line[4])
-                    namd_y_pme_grid_dim = int(split_line[5])
-                    namd_z_pme_grid_dim = int(split_line[6])
-
-    except:
-        namd_x_pme_grid_dim = None
-        namd_y_pme_grid_dim = None
-        namd_z_pme_grid_dim = None
+    e_titles_namd : list
+        The NAMD energy titles, without the 'ETITLE:' string.
+    e_values_namd : numpy.ndarray
+        The NAMD energy values as a 2D float64 array of shape
+        (number of ENERGY: rows, number of energy titles).
+    """
 
-    return (
-        namd_x_pme_grid_dim,
-        namd_y_pme_grid_dim,
-        namd_z_pme_grid_dim,
-        namd_box_x_run_0_dir,
-    )
+    def __init__(self, e_titles_namd, e_values_namd):
+        self.e_titles_namd = list(e_titles_namd)
+        self.e_values_namd = e_values_namd
+        self._title_columns = {
+            title_i: j for j, title_i in enumerate(self.e_titles_namd)
+        }
 
+    def __len__(self):
+        return len(self.e_values_namd)
 
-def get_namd_run_0_fft_filename(box_number):
+    def _column(self, e_title):
+        if e_title not in self._title_columns:
+            raise ValueError(
+                "The NAMD energy title {} is not in the NAMD energy titles {}.\n".format(
+                    e_title, self.e_titles_namd
+                )
+            )
+        if len(self.e_values_namd) == 0:
+            raise ValueError("There is no NAMD energy data (ENERGY: rows).\n")
+        return self._title_columns[e_title]
+
+    def all(self, e_title):
+        """
+        Gets all the values for the NAMD energy title (i.e., 'POTENTIAL').
+
+        Parameters
+        ----------
+        e_title : str
+            The NAMD energy title.
+
+        Returns
+        ---------
+        numpy.ndarray
+            All the float64 values for the NAMD energy title.
+        """
+        return self.e_values_namd[:, self._column(e_title)]
+
+    def first(self, e_title):
+        """
+        Gets the first value for the NAMD energy title (i.e., 'POTENTIAL').
+
+        Parameters
+        ----------
+        e_title : str
+            The NAMD energy title.
+
+        Returns
+        ---------
+        float
+            The first value for the NAMD energy title.
+        """
+        return float(self.e_values_namd[0, self._column(e_title)])
+
+    def last(self, e_title):
+        """
+        Gets the last value for the NAMD energy title (i.e., 'POTENTIAL').
+
+        Parameters
+        ----------
+        e_title : str
+            The NAMD energy title.
+
+        Returns
+        ---------
+        float
+            The last value for the NAMD energy title.
+        """
+        return float(self.e_values_namd[-1, self._column(e_title)])
+
+
+def read_namd_energy_data(
+    read_namd_box_x_energy_file,
+    e_default_namd_titles=default_namd_e_titles,
+    expected_no_rows=None,
+):
     """
-    Provides the run 0 (1st NAMD simulation) FFT filename.
+    Reads the NAMD energy data (ENERGY: rows) in a single pass, converting
+    each row directly into a preallocated float64 NumPy array.
 
     Parameters
     ----------
-    box_number : int
-        The simulation box number, which can only be 0 or 1
+    read_namd_box_x_energy_file : str or iterable of str
+        The full path/filename of the NAMD energy file (out.dat) for the
+        selected box, or the lines of the NAMD energy file.
+    e_default_namd_titles : list, default=default_namd_e_titles
+        The default NAMD energy output strings, which are split into a
+        list of strings.  These are only used if there is no
+        'ETITLE:' row in the NAMD energy file.
+    expected_no_rows : int, optional, default=None
+        The expected number of ENERGY: rows, which is used to preallocate
+        the array.  The array is grown if more rows are found.
 
     Returns
     ---------
-    namd_box_x_run_0_fft_namd_filename : str
-       The run 0 (1st NAMD simulation) FFT filename.
+    NamdEnergyData
+        The NAMD energy data, keyed by the NAMD energy titles.
     """
+    if isinstance(read_namd_box_x_energy_file, str):
+        with open(read_namd_box_x_energy_file, "r") as namd_energy_file:
+            return read_namd_energy_data(
+                namd_energy_file,
+                e_default_namd_titles=e_default_namd_titles,
+                expected_no_rows=expected_no_rows,
+            )
 
-    if isinstance(box_number, int) is False and (
-        box_number != 0 and box_number != 1
-    ):
-        raise ValueError(
-            "ERROR: Enter an interger of 0 or 1  for box_number in "
-            "the get_namd_run_0_pme_dim function. \n"
-        )
+    if expected_no_rows is None or expected_no_rows < 1:
+        expected_no_rows = 64
+
+    e_titles_namd = None
+    e_values_namd = None
+    no_rows = 0
+    for line in read_namd_box_x_energy_file:
+        if line.startswith("ETITLE:") and e_titles_namd is None:
+            e_titles_namd = line.split()[1:]
+
+        elif line.startswith("ENERGY:"):
+            if e_values_namd is None:
+                if e_titles_namd is None:
+                    e_titles_namd = e_default_namd_titles[1:]
+                e_values_namd = np.empty(
+                    (int(expected_no_rows), len(e_titles_namd)),
+                    dtype=np.float64,
+                )
+            elif no_rows == len(e_values_namd):
+                e_values_namd = np.resize(
+                    e_values_namd, (2 * no_rows, len(e_titles_namd))
+                )
 
-    namd_first_run_no = int(0)
-    add_zeros_for_box_x_run_0 = calc_folder_zeros(namd_first_run_no)
+            e_values_namd_iteration = line.split()[1:]
+            if len(e_values_namd_iteration) != len(e_titles_namd):
+                raise ValueError(
+                    "The NAMD ENERGY: row has {} values, but there are {} "
+                    "NAMD energy titles.\n".format(
+                        len(e_values_namd_iteration), len(e_titles_namd)
+                    )
+                )
+            e_values_namd[no_rows] = e_values_namd_iteration
+            no_rows += 1
 
-    if box_number == 0:
-        namd_box_x_run_0_dir = "{}/{}/{}{}_a".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_for_box_x_run_0),
-            str(namd_first_run_no),
-        )
+    if e_titles_namd is None:
+        e_titles_namd = e_default_namd_titles[1:]
+    if e_values_namd is None:
+        e_values_namd = np.empty((0, len(e_titles_namd)), dtype=np.float64)
 
-    elif box_number == 1:
-        namd_box_x_run_0_dir = "{}/{}/{}{}_b".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_for_box_x_run_0),
-            str(namd_first_run_no),
-        )
-    try:
-        namd_box_x_run_0_file_list = sorted(os.listdir(namd_box_x_run_0_dir))
-    except:
-        namd_box_x_run_0_file_list = None
+    return NamdEnergyData(e_titles_namd, e_values_namd[:no_rows])
 
-    try:
-        for q in range(0, len(namd_box_x_run_0_file_list)):
-            namd_box_x_run_0_fft_1st_9_char_filename = str(
-                namd_box_x_run_0_file_list[q]
-            )[0:9]
-            if namd_box_x_run_0_fft_1st_9_char_filename == "FFTW_NAMD":
-                namd_box_x_run_0_fft_namd_filename = namd_box_x_run_0_file_list[
-                    q
-                ]
 
-        return namd_box_x_run_0_fft_namd_filename, namd_box_x_run_0_dir
+def get_namd_energy_data(
+    read_namd_box_x_energy_file, e_default_namd_titles, expected_no_rows=None
+):
+    """
+    Gets the NAMD run energy data (electrostatic, potential, and VDW energies)
+    in kcal/mol.
 
-    except:
-        write_log_data = (
-            "*************************************************\n"
-            "The NAMD FFT file not deteted from Run 0 in Box {} \n"
-            "************************************************* \n".format(
-                str(box_number)
+    Parameters
+    ----------
+    read_namd_box_x_energy_file : str or iterable of str
+        The full path/filename of the NAMD energy file for the selected box,
+        or the lines of the NAMD energy file.
+    e_default_namd_titles : list
+        The default NAMD energy output strings, which are split into a
+        list of strings.
+    expected_no_rows : int, optional, default=None
+        The expected number of ENERGY: rows, which is used to preallocate
+        the energy array.
+
+    Returns
+    ---------
+    namd_e_electro_box_x : numpy.ndarray
+        The electrostatic energies as floats, as extracted from the
+        the NAMD run data ('ELECT').
+    namd_e_electro_box_x_initial_value : float
+        The initial electrostatic energy as a float, as extracted from the
+        the NAMD run data ('ELECT').
+    namd_e_electro_box_x_final_value : float
+        The final electrostatic energy as a float, as extracted from the
+        the NAMD run data ('ELECT').
+    namd_e_potential_box_x : numpy.ndarray
+        The potential energies as floats, as extracted from the
+        the NAMD run data ('POTENTIAL').
+    namd_e_potential_box_x_initial_value : float
+        The initial potential energy as a float, as extracted from the
+        the NAMD run data ('POTENTIAL').
+    namd_e_potential_box_x_final_value : float
+        The final potential energy as a float, as extracted from the
+        the NAMD run data ('POTENTIAL').
+    namd_e_vdw_plus_elec_box_x : numpy.ndarray
+        The VDW + electrostatic energies as floats, as extracted from the
+        the NAMD run data ('VDW' + 'ELECT').
+    namd_e_vdw_plus_elec_box_x_initial_value : float
+        The intitial VDW + electrostatic energy as a float, as extracted from the
+        the NAMD run data ('VDW' + 'ELECT').
+    namd_e_vdw_plus_elec_box_x_final_value : float
+        The final VDW + electrostatic energy as a float, as extracted from the
+        the NAMD run data ('VDW' + 'ELECT').
+    """
+    namd_energy_data_box_x = read_namd_energy_data(
+        read_namd_box_x_energy_file,
+        e_default_namd_titles=e_default_namd_titles,
+        expected_no_rows=expected_no_rows,
+    )
+
+    # extract energy data from box x
+    namd_e_electro_box_x = namd_energy_data_box_x.all("ELECT")
+    namd_e_potential_box_x = namd_energy_data_box_x.all("POTENTIAL")
+    namd_e_vdw_plus_elec_box_x = namd_e_electro_box_x + (
+        namd_energy_data_box_x.all("VDW")
+    )
+
+    return (
+        namd_e_electro_box_x,
+        float(namd_e_electro_box_x[0]),
+        float(namd_e_electro_box_x[-1]),
+        namd_e_potential_box_x,
+        float(namd_e_potential_box_x[0]),
+        float(namd_e_potential_box_x[-1]),
+        namd_e_vdw_plus_elec_box_x,
+        float(namd_e_vdw_plus_elec_box_x[0]),
+        float(namd_e_vdw_plus_elec_box_x[-1]),
+    )
+
+
+def _gomc_log_rows_to_df(gomc_titles, gomc_rows, current_step, scale=1.0):
+    """
+    Converts the GOMC log file rows for one box into a pandas.DataFrame,
+    with the STEP offset and unit scaling applied to the whole columns.
+    """
+    # remove the 'ETITLE:' or 'STITLE:' label, the row labels are already removed
+    gomc_titles = gomc_titles[1:]
+    gomc_values = np.array(
+        " ".join(gomc_rows).split(), dtype=np.float64
+    ).reshape(len(gomc_rows), len(gomc_titles))
+
+    step_column = None
+    if "STEP" in gomc_titles:
+        step_column = gomc_titles.index("STEP")
+    if scale != 1.0:
+        # scale all the columns, except the STEP column
+        column_scales = np.full(len(gomc_titles), scale, dtype=np.float64)
+        if step_column is not None:
+            column_scales[step_column] = 1.0
+        gomc_values *= column_scales
+
+    gomc_data_df = pd.DataFrame(data=gomc_values, columns=gomc_titles)
+    if step_column is not None:
+        gomc_data_df["STEP"] = np.rint(gomc_values[:, step_column]).astype(
+            np.int64
+        ) + int(current_step)
+
+    return gomc_data_df
+
+
+def read_gomc_log_data(read_gomc_log_file, current_step=0):
+    """
+    Reads the GOMC energy (ENER_x:) and statistics (STAT_x:) data for all
+    the simulation boxes in a single pass of the GOMC log file.
+
+    Parameters
+    ----------
+    read_gomc_log_file : str or iterable of str
+        The path/filename of the GOMC log file (out.dat), or the lines of the
+        GOMC log file.
+    current_step : int, default=0
+        The simulation step which is added to the GOMC steps, so the
+        steps are the totals for the entire hybrid simulation.
+
+    Returns
+    ---------
+    gomc_energy_data_box_df_dict : dict
+        The GOMC energy data for each box, {box_number: pandas.DataFrame},
+        with the energies converted from K to kcal/mol.
+    gomc_stat_data_box_df_dict : dict
+        The GOMC statistics data (volume, pressure, total molecules,
+        density, etc.) for each box, {box_number: pandas.DataFrame}.
+
+    Notes
+    ---------
+    The GOMC energy units in the log file are in K.
+    """
+    if isinstance(read_gomc_log_file, str):
+        with open(read_gomc_log_file, "r") as gomc_log_file:
+            return read_gomc_log_data(gomc_log_file, current_step=current_step)
+
+    e_titles_gomc = None
+    stat_titles_gomc = None
+    e_rows_gomc_box_dict = {}
+    stat_rows_gomc_box_dict = {}
+    for line in read_gomc_log_file:
+        if line.startswith("ENER_"):
+            label_end = line.index(":")
+            e_rows_gomc_box_dict.setdefault(int(line[5:label_end]), []).append(
+                line[label_end + 1 :]
+            )
+        elif line.startswith("STAT_"):
+            label_end = line.index(":")
+            stat_rows_gomc_box_dict.setdefault(
+                int(line[5:label_end]), []
+            ).append(line[label_end + 1 :])
+        elif line.startswith("ETITLE:") and e_titles_gomc is None:
+            e_titles_gomc = line.split()
+        elif line.startswith("STITLE:") and stat_titles_gomc is None:
+            stat_titles_gomc = line.split()
+
+    gomc_energy_data_box_df_dict = {}
+    for box_number, e_rows_gomc in e_rows_gomc_box_dict.items():
+        if e_titles_gomc is None:
+            raise ValueError(
+                "The GOMC log file has ENER_{}: data, but no ETITLE: "
+                "titles.\n".format(box_number)
             )
+        gomc_energy_data_box_df_dict[box_number] = _gomc_log_rows_to_df(
+            e_titles_gomc, e_rows_gomc, current_step, scale=K_to_kcal_mol
         )
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
 
+    gomc_stat_data_box_df_dict = {}
+    for box_number, stat_rows_gomc in stat_rows_gomc_box_dict.items():
+        if stat_titles_gomc is None:
+            raise ValueError(
+                "The GOMC log file has STAT_{}: data, but no STITLE: "
+                "titles.\n".format(box_number)
+            )
+        gomc_stat_data_box_df_dict[box_number] = _gomc_log_rows_to_df(
+            stat_titles_gomc, stat_rows_gomc, current_step
+        )
+
+    return gomc_energy_data_box_df_dict, gomc_stat_data_box_df_dict
 
-def delete_namd_run_0_fft_file(box_number):
+
+def get_gomc_energy_data(read_gomc_box_x_log_file, box_number, current_step=0):
     """
-    Deletes the run 0 (1st NAMD simulation) FFT filename.
+    Generated the energy and system file data for specified
+    box number.  GOMC energy units are in kcal/mol.
 
     Parameters
     ----------
+    read_gomc_box_x_log_file : str or iterable of str
+        The path/filename of the GOMC log file, or the lines of the
+        GOMC log file.
     box_number : int
         The simulation box number, which can only be 0 or 1
+    current_step : int, default=0
+        The simulation step which is added to the GOMC steps, so the
+        steps are the totals for the entire hybrid simulation.
+
+    Returns
+    ---------
+    gomc_energy_data_box_x_df : pandas.dataframe
+        The GOMC log file data in a pandas.dataframe
+
+    Notes
+    ---------
+    GOMC energy units are in K.  When the energies for both boxes are
+    needed, use read_gomc_log_data, which reads the log file only once.
     """
-    if isinstance(box_number, int) is False and (
-        box_number != 0 and box_number != 1
-    ):
+    gomc_energy_data_box_df_dict = read_gomc_log_data(
+        read_gomc_box_x_log_file, current_step=current_step
+    )[0]
+    if box_number not in gomc_energy_data_box_df_dict:
         raise ValueError(
-            "ERROR Enter an interger of 0 or 1  for box_number in "
-            "the get_namd_run_0_pme_dim function. \n"
+            "There is no GOMC energy data for box {} in the "
+            "GOMC log file.\n".format(box_number)
         )
 
-    write_log_data = (
-        "*************************************************\n"
-        "The NAMD FFT file was deleted from Run 0 in Box {} \n"
-        "************************************************* \n".format(
-            str(box_number)
-        )
-    )
-    try:
-        (
-            namd_box_x_run_0_fft_namd_filename,
-            namd_box_x_run_0_dir,
-        ) = get_namd_run_0_fft_filename(box_number)
+    return gomc_energy_data_box_df_dict[box_number]
 
-        # delete the FFT file in the run 0 box
-        rm_namd_fft_box_0_command = "rm {}/{}".format(
-            str(namd_box_x_run_0_dir), str(namd_box_x_run_0_fft_namd_filename)
-        )
 
-        exec_rm_namd_fft_box_0_command = subprocess.Popen(
-            rm_namd_fft_box_0_command, shell=True, stderr=subprocess.STDOUT
-        )
-        os.wait4(exec_rm_namd_fft_box_0_command.pid, os.WSTOPPED)
+def get_gomc_energy_data_kcal_per_mol(gomc_energy_data_box_x_df):
+    """
+    Gets the GOMC run energy data (electrostatic, potential, and VDW energies)
+    in kcal/mol.
 
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
+    Parameters
+    ----------
+    gomc_energy_data_box_x_df : pandas.DataFrame
+        The GOMC energy data in kcal/mol for the selected box, as generated
+        by the read_gomc_log_data or get_gomc_energy_data functions.
 
-    except:
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
+    Returns
+    ---------
+    gomc_e_electro_box_x_kcal_per_mol : numpy.ndarray
+        The electrostatic energies as floats, as extracted from the
+        the GOMC run data ('TOTAL_ELECT').
+    gomc_e_electro_box_x_initial_value_kcal_mol : float
+        The initial electrostatic energy as a float, as extracted from the
+        the GOMC run data ('TOTAL_ELECT').
+    gomc_e_electro_box_x_final_value_kcal_mol : float
+        The final electrostatic energy as a float, as extracted from the
+        the GOMC run data ('TOTAL_ELECT').
+    gomc_e_potential_box_x_kcal_per_mol : numpy.ndarray
+        The potential energies as floats, as extracted from the
+        the GOMC run data ('TOTAL').
+    gomc_e_potential_box_x_initial_value_kcal_mol : float
+        The initial potential energy as a float, as extracted from the
+        the GOMC run data ('TOTAL').
+    gomc_e_potential_box_x_final_value_kcal_mol : float
+        The final potential energy as a float, as extracted from the
+        the GOMC run data ('TOTAL').
+    gomc_e_lrc_box_x_kcal_per_mol : numpy.ndarray
+        The LRC energies as floats, as extracted from the
+        the GOMC run data ('LRC').
+    gomc_e_lrc_box_x_initial_value_kcal_per_mol : float
+        The initial LRC energy as a float, as extracted from the
+        the GOMC run data ('LRC').
+    gomc_e_lrc_box_x_final_value_kcal_per_mol  : float
+        The final LRC energy as a float, as extracted from the
+        the GOMC run data ('LRC').
+    gomc_e_vdw_plus_elec_box_x_kcal_per_mol : numpy.ndarray
+        The VDW + electrostatic energies as floats, as extracted from the
+        the GOMC run data ('INTRA(NB)' + 'INTER(LJ)' + 'TOTAL_ELECT' + 'LRC').
+    gomc_e_vdw_plus_elec_box_x_initial_value_kcal_per_mol : float
+        The intitial VDW + electrostatic energy as a float, as extracted from the
+        the GOMC run data ('INTRA(NB)' + 'INTER(LJ)' + 'TOTAL_ELECT' + 'LRC').
+    gomc_e_vdw_plus_elec_box_x_initial_value_kcal_per_mol : float
+        The final VDW + electrostatic energy as a float, as extracted from the
+        the GOMC run data ('INTRA(NB)' + 'INTER(LJ)' + 'TOTAL_ELECT' + 'LRC').
+
+    Notes
+    ---------
+    GOMC energy units are in kcal/mol
+    """
+    gomc_e_electro_box_x_kcal_per_mol = gomc_energy_data_box_x_df[
+        "TOTAL_ELECT"
+    ].to_numpy(dtype=np.float64)
+    gomc_e_potential_box_x_kcal_per_mol = gomc_energy_data_box_x_df[
+        "TOTAL"
+    ].to_numpy(dtype=np.float64)
+    gomc_e_lrc_box_x_kcal_per_mol = gomc_energy_data_box_x_df["LRC"].to_numpy(
+        dtype=np.float64
+    )
+    gomc_e_vdw_plus_elec_box_x_kcal_per_mol = (
+        gomc_energy_data_box_x_df["INTRA(NB)"].to_numpy(dtype=np.float64)
+        + gomc_energy_data_box_x_df["INTER(LJ)"].to_numpy(dtype=np.float64)
+        + gomc_e_electro_box_x_kcal_per_mol
+        + gomc_e_lrc_box_x_kcal_per_mol
+    )
+
+    return (
+        gomc_e_electro_box_x_kcal_per_mol,
+        float(gomc_e_electro_box_x_kcal_per_mol[0]),
+        float(gomc_e_electro_box_x_kcal_per_mol[-1]),
+        gomc_e_potential_box_x_kcal_per_mol,
+        float(gomc_e_potential_box_x_kcal_per_mol[0]),
+        float(gomc_e_potential_box_x_kcal_per_mol[-1]),
+        gomc_e_lrc_box_x_kcal_per_mol,
+        float(gomc_e_lrc_box_x_kcal_per_mol[0]),
+        float(gomc_e_lrc_box_x_kcal_per_mol[-1]),
+        gomc_e_vdw_plus_elec_box_x_kcal_per_mol,
+        float(gomc_e_vdw_plus_elec_box_x_kcal_per_mol[0]),
+        float(gomc_e_vdw_plus_elec_box_x_kcal_per_mol[-1]),
+    )
 
 
-def check_for_pdb_dims_and_override(
-    dim_axis, run_no, read_dim, set_dim=None, only_on_run_no=0
+def get_watchdog_output_steps(
+    run_steps, no_energy_outputs, step_multiple=1, odd_no_outputs=False
 ):
     """
-    Sets the x, y, or z dimension based on the pdb file values or the user input.
+    Gets the console energy output frequency (steps) of a NAMD or GOMC
+    simulation, which the engine watchdog checks while the engine is
+    running.  The frequency divides the run steps, so the last step is
+    still printed, and it gives the number of energy outputs closest
+    to the requested number (the fewer outputs for a tie).
 
     Parameters
     ----------
-    dim_axis : str
-        The dimension of the axis (only x, y, or z)
-    run_no : int
-        Simulation run number
-    read_dim : int or float
-        The dimension read from the pdb file or the set dim_axis.
-    set_dim : int or float or None, (default = None)
-        The user set dimension is use instead of the dimension
-        read from the pdb file set dim_axis. The set_dim overrides
-        the dimension read from the pdb file (read_dim).
-    only_on_run_no : int, (default = 0)
-        This only overrides the only set dimension on the the set value.
+    run_steps : int
+        The number of steps in the simulation.
+    no_energy_outputs : int
+        The requested number of energy outputs in the simulation.
+    step_multiple : int, default=1
+        The output frequency must be a multiple of this number of steps
+        (i.e., the NAMD stepspercycle).
+    odd_no_outputs : bool, default=False
+        If True, the number of energy outputs (run steps / output frequency)
+        must be odd, so with the step 0 energies, each simulation prints an
+        even number of energy lines, which the GOMC combined data expects.
 
     Returns
     ---------
-    used_dim : int or float:
-        The used dimension.  This is the dimension read from the pdb file
-        (if available) and if no set_dim is provided.  It is the set_dim,
-        if the set_dim is provided.
+    console_output_steps : int
+        The console energy output frequency (steps), or the run steps,
+        if no other output frequency can be used.
     """
-
-    # check user override dimensions
-    if run_no == only_on_run_no:
-        if read_dim is None:
-            if set_dim is not None and (
-                isinstance(set_dim, float) or isinstance(set_dim, int)
-            ):
-                used_dim = set_dim
-            else:
-                write_log_data = (
-                    "ERROR: The user defined {}-dimension is None "
-                    "or not an integer or a float, and the PDB file has no dimension information "
-                    " \n".format(str(dim_axis))
-                )
-                log_template_file.write(str(write_log_data))
-                raise TypeError(str(write_log_data))
-
-        elif (
-            read_dim is not None
-            and set_dim != read_dim
-            and (isinstance(set_dim, float) or isinstance(set_dim, int))
+    run_steps = int(run_steps)
+    console_output_steps = run_steps
+    for no_outputs_i in range(1, run_steps + 1):
+        if no_outputs_i - no_energy_outputs >= abs(
+            run_steps // console_output_steps - no_energy_outputs
         ):
-            write_log_data = (
-                "WARNING: The user defined {}-dimension is different "
-                "than the one read from the starting PDB file {}-dim_PDB = {}, "
-                "{}-dim_user_set = {}. The code is setting the user defined {}-dimension."
-                " \n".format(
-                    str(dim_axis),
-                    str(dim_axis),
-                    str(read_dim),
-                    str(dim_axis),
-                    str(set_dim),
-                    str(dim_axis),
-                )
-            )
-            log_template_file.write(str(write_log_data))
-            warn(str(write_log_data))
-            used_dim = set_dim
+            break
+        if (
+            run_steps % no_outputs_i != 0
+            or (run_steps // no_outputs_i) % step_multiple != 0
+            or (odd_no_outputs is True and no_outputs_i % 2 == 0)
+        ):
+            continue
+        if abs(no_outputs_i - no_energy_outputs) < abs(
+            run_steps // console_output_steps - no_energy_outputs
+        ):
+            console_output_steps = run_steps // no_outputs_i
 
-        else:
-            used_dim = read_dim
+    return console_output_steps
 
-    else:
-        used_dim = read_dim
-
-    return used_dim
-
-
-def write_namd_conf_file(
-    python_file_directory,
-    path_namd_template,
-    path_namd_runs,
-    gomc_newdir,
-    run_no,
-    box_number,
-    namd_run_steps,
-    namd_minimize_steps,
-    namd_rst_dcd_xst_steps,
-    namd_console_blkavg_e_and_p_steps,
-    simulation_temp_k,
-    simulation_pressure_bar,
-    starting_pdb_box_x_file,
-    starting_psf_box_x_file,
-    namd_x_pme_grid_dim,
-    namd_y_pme_grid_dim,
-    namd_z_pme_grid_dim,
-    set_x_dim=None,
-    set_y_dim=None,
-    set_z_dim=None,
-    set_angle_alpha=90,
-    set_angle_beta=90,
-    set_angle_gamma=90,
-    fft_add_namd_ang_to_box_dim=0,
+
+def get_cycle_output_steps(
+    namd_run_steps, gomc_run_steps, no_watchdog_energy_outputs=None
 ):
     """
-    Writes the NAMD control file in the NAMD run numbered folder
+    Gets the NAMD and GOMC output frequencies (steps) for a cycle,
+    which are set from the NAMD and GOMC run steps.
 
     Parameters
     ----------
-    python_file_directory : str
-        The path/directory where this file is located.
-    path_namd_template : str
-        The relative path to the namd template file from where this file is
-        located (he directory where this file is located (python_file_director).
-    path_namd_runs: str
-        The path/directory to the main NAMD folder.
-    gomc_newdir: str
-        The path/dirctory to the GOMC directory that the NAMD control will use
-        to start the on new NAMD simulation.
-    run_no : int
-        Simulation run number
-    box_number : int
-        The simulation box number, which can only be 0 or 1
     namd_run_steps : int
-        The number of steps to run the NAMD simulation.
-    namd_minimize_steps : int
-        The number of minimization steps to run the NAMD simulation.
-    namd_rst_dcd_xst_steps : int
-        The number of steps which the restart, dcd, xst files will be created.
-    namd_console_blkavg_e_and_p_steps : int
-        The number of steps which the energies and pressure data will be output.
-    simulation_temp_k : int or float
-        The NAMD simulation temperature in Kelvin.
-    simulation_pressure_bar : int or float
-        The NAMD simulation pressure in bar.
-    starting_pdb_box_x_file : str
-        The pdb path/filename for box number (box_number) which is written
-        to the NAMD control file.
-    starting_psf_box_x_file : str
-        The psf path/filename for box number (box_number) which is written
-        to the NAMD control file.
-    namd_x_pme_grid_dim : int
-        The number of points for the NAMD PME grid in the x-dimension.
-    namd_y_pme_grid_dim : int
-        The number of points for the NAMD PME grid in the y-dimension.
-    namd_z_pme_grid_dim : int
-        The number of points for the NAMD PME grid in the z-dimension.
-    set_x_dim : int or float or None (optional: default = None)
-        Sets the x dimension from the simulation.
-    set_y_dim : int or float or None (optional: default = None)
-        Sets the y dimension from the simulation.
-    set_z_dim : int or float or None (optional: default = None)
-        Sets the z dimension from the simulation.
-    set_angle_alpha : int of float (default = 90)
-        Sets the alpha angle in degrees, for the orthogonal (90) or
-        non-orthogonal (not 90) box.
-    set_angle_beta : int of float (default = 90)
-        Sets the beta angle in degrees, for the orthogonal (90) or
-        non-orthogonal (not 90) box.
-    set_angle_gamma : int of float (default = 90)
-        Sets the gamma angle in degrees, for the orthogonal (90) or
-        non-orthogonal (not 90) box.
-    fft_add_namd_ang_to_box_dim : int
-        The number of extra point to add to the boxes fft points
+        The number of NAMD steps in the cycle.
+    gomc_run_steps : int
+        The number of GOMC steps in the cycle.
+    no_watchdog_energy_outputs : int or None, default=None
+        The number of console energy outputs in each NAMD and GOMC
+        simulation, which the engine watchdog checks while the engine is
+        running.  If None, the energies are only printed at the start and
+        end of each simulation.
 
     Returns
     ---------
-    namd_box_x_newdir : str
-        The full path/directory of the created NAMD run/box number,
-        which contains the control file.
-
-    Notes
-    ---------
-    The box angles are not currently available and are default set to 90 degress.
-    they can be added later, but for now all simulation but be orthoganol boxes
+    namd_rst_dcd_xst_steps : int
+        The NAMD restart, dcd and xst file output frequency (steps).
+    namd_console_blkavg_e_and_p_steps : int
+        The NAMD pressure output frequency (steps).
+    namd_console_e_steps : int
+        The NAMD console energy output frequency (steps).
+    gomc_rst_coor_ckpoint_steps : int
+        The GOMC restart, coordinate and checkpoint output frequency (steps).
+    gomc_console_blkavg_hist_steps : int
+        The GOMC block average and histogram output frequency (steps).
+    gomc_console_steps : int
+        The GOMC console output frequency (steps).
+    gomc_hist_sample_steps : int
+        The GOMC histogram sample frequency (steps).
     """
+    gomc_console_blkavg_hist_steps = int(gomc_run_steps)
+    gomc_rst_coor_ckpoint_steps = int(gomc_run_steps)
 
-    if isinstance(box_number, int) is False and (
-        box_number != 0 or box_number != 1
-    ):
-        raise ValueError(
-            "Enter an interger of 0 or 1  for box_number in the get_namd_run_0_pme_dim function. \n"
-        )
+    if gomc_run_steps / 10 > 500:
+        gomc_hist_sample_steps = int(500)
+    elif gomc_run_steps / 10 <= 500:
+        gomc_hist_sample_steps = int(gomc_run_steps / 10)
 
-    # get NAMD box_x directory
-    add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
-    if box_number == 0:
-        namd_box_x_newdir = "{}/{}/{}{}_a".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_at_start_run_no_str),
-            str(run_no),
+    namd_rst_dcd_xst_steps = int(namd_run_steps)
+    namd_console_blkavg_e_and_p_steps = int(namd_run_steps)
+
+    if no_watchdog_energy_outputs is None:
+        namd_console_e_steps = int(namd_run_steps)
+        gomc_console_steps = int(gomc_run_steps)
+    else:
+        # the NAMD energies are printed on a multiple of the
+        # stepspercycle (10) in the NAMD control file
+        namd_console_e_steps = get_watchdog_output_steps(
+            namd_run_steps, no_watchdog_energy_outputs, step_multiple=10
         )
-    elif box_number == 1:
-        namd_box_x_newdir = "{}/{}/{}{}_b".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_at_start_run_no_str),
-            str(run_no),
+        gomc_console_steps = get_watchdog_output_steps(
+            gomc_run_steps, no_watchdog_energy_outputs, odd_no_outputs=True
         )
-    os.makedirs(namd_box_x_newdir, exist_ok=True)
-    generate_namd_file = open("{}/in.conf".format(namd_box_x_newdir), "w")
 
-    namd_template_file = open(
-        "{}/{}".format(str(python_file_directory), path_namd_template), "r"
+    return (
+        namd_rst_dcd_xst_steps,
+        namd_console_blkavg_e_and_p_steps,
+        namd_console_e_steps,
+        gomc_rst_coor_ckpoint_steps,
+        gomc_console_blkavg_hist_steps,
+        gomc_console_steps,
+        gomc_hist_sample_steps,
     )
-    namd_template_data = namd_template_file.read()
-    namd_template_file.close()
 
-    if run_no != 0:
 
-        write_log_data = "************************************************* \n"
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
-
-        namd_starting_ff_files = ""
-        for namd_ff_i in starting_ff_file_list_namd:
-            namd_ff_i = os.path.relpath(namd_ff_i, namd_box_x_newdir)
-            namd_starting_ff_files = (
-                namd_starting_ff_files + "parameters \t {}\n".format(namd_ff_i)
-            )
+class AdaptiveCycleSteps:
+    """
+    Adapts the NAMD and GOMC steps in each cycle, so the fixed time in
+    each cycle (the engine startup and python time) is only a small fraction
+    of the total cycle time.
 
-        new_namd_data = namd_template_data.replace(
-            "all_parameter_files", str(namd_starting_ff_files)
-        )
+    Parameters
+    ----------
+    namd_run_steps : int
+        The user input NAMD steps per cycle (namd_run_steps).
+    gomc_run_steps : int
+        The user input GOMC steps per cycle (gomc_run_steps).
+    max_overhead_fraction : float, default=0.1
+        The target maximum fraction of the cycle time used by the
+        engine startup and python time.
+    mult_scalar_range : list of two int or float, default=[1, 10]
+        The [minimum, maximum] multiple of the user input NAMD and
+        GOMC steps which can be used.
+    max_change_mult_scalar : int or float, default=2
+        The maximum factor the steps can grow or shrink in one cycle.
+    no_fit_cycles : int, default=10
+        The number of last cycles used to fit the cycle time model.
 
-        gomc_rel_path = os.path.relpath(str(gomc_newdir), namd_box_x_newdir)
+    Notes
+    ---------
+    The NAMD and GOMC steps are both set to the same multiple (mult_scalar)
+    of the user input steps, so the NAMD and GOMC legs stay the same length
+    relative to each other.  The engine (NAMD + GOMC) time per cycle is fit
+    to engine_time_s = fixed_time_s + scalable_time_s * mult_scalar over the
+    last cycles, and the fixed engine time plus the python time is the cycle
+    overhead time.  Until the cycles have been run with more than one
+    multiple, the fixed engine time is not known, so the multiple is only
+    increased if the measured overhead fraction is above the target, and
+    otherwise it is held.
+    The steps are never increased after a cycle which failed the
+    NAMD/GOMC energy comparison checks.
+    """
 
-        new_namd_data = new_namd_data.replace(
-            "pdb_box_file",
-            "{}/Output_data_BOX_{}_restart.pdb"
-            "".format(gomc_rel_path, str(box_number)),
+    def __init__(
+        self,
+        namd_run_steps,
+        gomc_run_steps,
+        max_overhead_fraction=0.1,
+        mult_scalar_range=[1, 10],
+        max_change_mult_scalar=2,
+        no_fit_cycles=10,
+    ):
+        self.namd_run_steps = int(namd_run_steps)
+        self.gomc_run_steps = int(gomc_run_steps)
+        self.max_overhead_fraction = max_overhead_fraction
+        self.min_mult_scalar = mult_scalar_range[0]
+        self.max_mult_scalar = mult_scalar_range[1]
+        self.max_change_mult_scalar = max_change_mult_scalar
+        self.no_fit_cycles = no_fit_cycles
+
+        self.mult_scalar = float(
+            min(max(1, self.min_mult_scalar), self.max_mult_scalar)
         )
-        new_namd_data = new_namd_data.replace(
-            "psf_box_file",
-            "{}/Output_data_BOX_{}_restart.psf"
-            "".format(gomc_rel_path, str(box_number)),
+        self.overhead_fraction = None
+
+        # the [mult_scalar, engine_time_s, python_time_s] for each cycle
+        self.cycle_time_list = []
+
+    def get_run_steps(self):
+        """
+        Gets the NAMD and GOMC steps for the next cycle.
+
+        Returns
+        ---------
+        namd_run_steps : int
+            The NAMD steps for the next cycle.
+        gomc_run_steps : int
+            The GOMC steps for the next cycle.
+
+        Notes
+        ---------
+        The steps are rounded to a multiple of 10 steps (minimum 10 steps),
+        unless the user input steps are used (mult_scalar = 1).
+        """
+        if self.mult_scalar == 1:
+            return self.namd_run_steps, self.gomc_run_steps
+
+        return [
+            int(max(1, round(run_steps * self.mult_scalar / 10)) * 10)
+            for run_steps in [self.namd_run_steps, self.gomc_run_steps]
+        ]
+
+    def update(
+        self,
+        namd_time_s,
+        gomc_time_s,
+        python_time_s,
+        energy_checks_passed=True,
+    ):
+        """
+        Adds the last cycle times and sets the steps multiple
+        for the next cycle.
+
+        Parameters
+        ----------
+        namd_time_s : float
+            The NAMD time (s) in the last cycle.
+        gomc_time_s : float
+            The GOMC time (s) in the last cycle.
+        python_time_s : float
+            The python time (s) in the last cycle.
+        energy_checks_passed : bool, default=True
+            If all the NAMD/GOMC energy comparison checks passed in the
+            last cycle.  If False, the steps are not increased.
+
+        Returns
+        ---------
+        mult_scalar : float
+            The multiple of the user input steps for the next cycle.
+        """
+        engine_time_s = namd_time_s + gomc_time_s
+        self.cycle_time_list.append(
+            [self.mult_scalar, engine_time_s, python_time_s]
         )
-
-        new_namd_data = new_namd_data.replace(
-            "coor_file",
-            "{}/Output_data_BOX_{}_restart.coor"
-            "".format(gomc_rel_path, str(box_number)),
+        fit_time_array = np.array(
+            self.cycle_time_list[-self.no_fit_cycles :], dtype=np.float64
         )
-        new_namd_data = new_namd_data.replace(
-            "xsc_file",
-            "{}/Output_data_BOX_{}_restart.xsc"
-            "".format(gomc_rel_path, str(box_number)),
+
+        # fit the engine time to fixed_time_s + scalable_time_s * mult_scalar
+        if len(np.unique(fit_time_array[:, 0])) >= 2:
+            scalable_time_s, fixed_time_s = np.polyfit(
+                fit_time_array[:, 0], fit_time_array[:, 1], 1
+            )
+            fixed_time_s = min(
+                max(fixed_time_s, 0), np.min(fit_time_array[:, 1])
+            )
+        else:
+            fixed_time_s = None
+
+        overhead_time_s = np.mean(fit_time_array[:, 2])
+        if fixed_time_s is not None:
+            overhead_time_s += fixed_time_s
+        scalable_time_s = max(
+            engine_time_s - (fixed_time_s if fixed_time_s is not None else 0),
+            1e-9,
         )
-        new_namd_data = new_namd_data.replace(
-            "vel_file",
-            "{}/Output_data_BOX_{}_restart.vel"
-            "".format(gomc_rel_path, str(box_number)),
+        self.overhead_fraction = overhead_time_s / (
+            overhead_time_s + scalable_time_s
         )
-        new_namd_data = new_namd_data.replace("Bool_restart", str("true"))
 
-        # Read the angles from the intital/starting PDB file
-        read_pdb_file = open(
-            "{}/Output_data_BOX_{}_restart.pdb"
-            "".format(str(gomc_newdir), str(box_number)),
-            "r",
-        ).readlines()
-
-    else:
-        namd_starting_ff_files = ""
-        for namd_ff_i in starting_ff_file_list_namd:
-            namd_ff_i = os.path.relpath(namd_ff_i, namd_box_x_newdir)
-            namd_starting_ff_files = (
-                namd_starting_ff_files + "parameters \t {}\n".format(namd_ff_i)
+        if fixed_time_s is None:
+            # the fixed engine time is not known yet, so the steps are only
+            # increased if the measured overhead (python time only) is
+            # already above the target, and otherwise they are held
+            if self.overhead_fraction > self.max_overhead_fraction:
+                new_mult_scalar = self.mult_scalar * self.max_change_mult_scalar
+            else:
+                new_mult_scalar = self.mult_scalar
+        else:
+            # the multiple which gives the max_overhead_fraction
+            new_mult_scalar = (
+                self.mult_scalar
+                * overhead_time_s
+                * (1 - self.max_overhead_fraction)
+                / (self.max_overhead_fraction * scalable_time_s)
             )
 
-        new_namd_data = namd_template_data.replace(
-            "all_parameter_files", str(namd_starting_ff_files)
-        )
-
-        namd_starting_pdb_rel_path = os.path.relpath(
-            "{}/{}".format(str(python_file_directory), starting_pdb_box_x_file),
-            namd_box_x_newdir,
-        )
-        new_namd_data = new_namd_data.replace(
-            "pdb_box_file", "{}".format(namd_starting_pdb_rel_path)
+        new_mult_scalar = min(
+            max(
+                new_mult_scalar, self.mult_scalar / self.max_change_mult_scalar
+            ),
+            self.mult_scalar * self.max_change_mult_scalar,
         )
+        if energy_checks_passed is False:
+            new_mult_scalar = min(new_mult_scalar, self.mult_scalar)
 
-        namd_starting_psf_rel_path = os.path.relpath(
-            "{}/{}".format(str(python_file_directory), starting_psf_box_x_file),
-            namd_box_x_newdir,
-        )
-        new_namd_data = new_namd_data.replace(
-            "psf_box_file", "{}".format(namd_starting_psf_rel_path)
+        self.mult_scalar = float(
+            min(
+                max(new_mult_scalar, self.min_mult_scalar), self.max_mult_scalar
+            )
         )
 
-        new_namd_data = new_namd_data.replace("coor_file", str("NA"))
-        new_namd_data = new_namd_data.replace("xsc_file", str("NA"))
-        new_namd_data = new_namd_data.replace("vel_file", str("NA"))
-        new_namd_data = new_namd_data.replace("Bool_restart", str("false"))
-
-        read_pdb_file = open(
-            "{}/{}".format(str(python_file_directory), starting_pdb_box_x_file),
-            "r",
-        ).readlines()
-
-    read_x_dim = None
-    read_y_dim = None
-    read_z_dim = None
-    read_angle_alpha = None
-    read_angle_beta = None
-    read_angle_gamma = None
-    # Read the angles from the intial/starting PDB file
-    for i, line in enumerate(read_pdb_file):
-        if "CRYST1" in line:
-            read_x_dim = read_pdb_file[i].split()[1:2]
-            read_x_dim = float(read_x_dim[0])
-            read_y_dim = read_pdb_file[i].split()[2:3]
-            read_y_dim = float(read_y_dim[0])
-            read_z_dim = read_pdb_file[i].split()[3:4]
-            read_z_dim = float(read_z_dim[0])
+        return self.mult_scalar
 
-            read_angle_alpha = read_pdb_file[i].split()[4:5]
-            read_angle_alpha = float(read_angle_alpha[0])
-            read_angle_beta = read_pdb_file[i].split()[5:6]
-            read_angle_beta = float(read_angle_beta[0])
-            read_angle_gamma = read_pdb_file[i].split()[6:7]
-            read_angle_gamma = float(read_angle_gamma[0])
 
-    # check user  override x-dimensions
-    used_x_dim = check_for_pdb_dims_and_override(
-        "x", run_no, read_x_dim, set_dim=set_x_dim, only_on_run_no=0
-    )
+def _set_engine_cpu_set(cpu_set):
+    """
+    Pins the current (engine) process to the CPU cores, which is run in the
+    engine process before the engine is started.
+    """
+    if cpu_set is not None:
+        os.sched_setaffinity(0, cpu_set)
 
-    # check user  override y-dimensions
-    used_y_dim = check_for_pdb_dims_and_override(
-        "y", run_no, read_y_dim, set_dim=set_y_dim, only_on_run_no=0
-    )
 
-    # check user  override z-dimensions
-    used_z_dim = check_for_pdb_dims_and_override(
-        "z", run_no, read_z_dim, set_dim=set_z_dim, only_on_run_no=0
-    )
+class LaunchedEngine:
+    """
+    A NAMD or GOMC engine process, which is started for a single
+    simulation ('launch' mode).  The engine is started directly,
+    without a shell.
 
-    # check box for othoganality
-    # check the read_angle_alpha
-    if read_angle_alpha is not None and read_angle_alpha != 90:
-        if run_no == 0:
-            write_log_data = (
-                "ERROR: The alpha angle is not 90 degress as read from the "
-                "starting PDB file, read_angle_alpha_PDB = {}. "
-                "Only alpha angle of 90 degress or None is currently "
-                "allowed. \n".format(str(read_angle_alpha))
-            )
-            log_template_file.write(str(write_log_data))
-            raise ValueError(str(write_log_data))
+    Parameters
+    ----------
+    run_command : list of str
+        The command and its arguments which run the engine simulation
+        (i.e., ["/path/namd2", "+p4", "in.conf"]).
+    cwd : str, optional, default=None
+        The directory which the engine process is started in.
+    cpu_set : set of int, optional, default=None
+        The CPU cores which the engine process is pinned to.
+        If None, the engine process is not pinned.
+    output_filename : str, optional, default=None
+        The file which the engine stdout is written to (i.e., out.dat).
+        If None, the engine stdout is not redirected.
+    stderr : int, optional, default=None
+        The engine stderr, as for subprocess.Popen
+        (i.e., subprocess.STDOUT to also write it to the output_filename).
+        If None, the engine stderr is not redirected.
+    """
 
-    if set_angle_alpha is not None and set_angle_alpha != 90:
-        if run_no == 0:
-            write_log_data = (
-                "ERROR: The alpha angle is not 90 degress as set by the user,"
-                "set_angle_alpha = {}. "
-                "Only alpha angle of 90 degress or None is currently "
-                "allowed. \n".format(str(set_angle_alpha))
+    def __init__(
+        self,
+        run_command,
+        cwd=None,
+        cpu_set=None,
+        output_filename=None,
+        stderr=None,
+    ):
+        self.run_command = list(run_command)
+        self.cpu_set = cpu_set
+        output_file = None
+        if output_filename is not None:
+            output_file = open(output_filename, "wb")
+        try:
+            self.engine_process = subprocess.Popen(
+                self.run_command,
+                cwd=cwd,
+                stdout=output_file,
+                stderr=stderr,
+                preexec_fn=(
+                    None
+                    if cpu_set is None
+                    else lambda: _set_engine_cpu_set(cpu_set)
+                ),
             )
-        log_template_file.write(str(write_log_data))
-        raise ValueError(str(write_log_data))
+        finally:
+            # the engine process has its own copy of the output file
+            if output_file is not None:
+                output_file.close()
+
+        # the process file descriptor becomes readable when the engine
+        # exits, so it can be waited on with the other engines (Linux only)
+        self._pidfd = None
+        if hasattr(os, "pidfd_open"):
+            try:
+                self._pidfd = os.pidfd_open(self.engine_process.pid)
+            except OSError:
+                self._pidfd = None
+
+    def __del__(self):
+        if getattr(self, "_pidfd", None) is not None:
+            os.close(self._pidfd)
+            self._pidfd = None
+
+    def fileno(self):
+        """
+        Gets the file descriptor which is readable when the engine exits.
+
+        Returns
+        ---------
+        int or None
+            The engine process file descriptor, or None if it is not
+            available on this platform.
+        """
+        return self._pidfd
+
+    def poll_done(self):
+        """
+        Checks if the simulation is finished, without waiting.
+
+        Returns
+        ---------
+        exit_status : int or None
+            The engine exit status (0 = successful), or None if the
+            simulation is still running.
+        """
+        return self.engine_process.poll()
+
+    def wait(self):
+        """
+        Waits for the simulation to finish.
+
+        Returns
+        ---------
+        exit_status : int
+            The engine exit status for the simulation (0 = successful).
+        """
+        return self.engine_process.wait()
+
+    def kill(self):
+        """
+        Stops the simulation, without waiting for it to finish.
+        """
+        if self.engine_process.poll() is None:
+            self.engine_process.kill()
+
+
+class BatchEngine:
+    """
+    A NAMD or GOMC simulation, which is submitted as a batch job script
+    (i.e., to Slurm with sbatch), so it can be run on another node
+    ('batch' mode).  The job script writes the engine exit status to the
+    engine_exit_status.txt file in the run directory, which is used to
+    check if the simulation is finished.
 
-    # check the read_angle_beta
-    if read_angle_beta is not None and read_angle_beta != 90:
-        if run_no == 0:
-            write_log_data = (
-                "ERROR: The beta angle is not 90 degress as read from the "
-                "starting PDB file, read_angle_beta_PDB = {}. "
-                "Only beta angle of 90 degress or None is currently "
-                "allowed. \n".format(str(read_angle_beta))
-            )
-            log_template_file.write(str(write_log_data))
-            raise ValueError(str(write_log_data))
-
-    if set_angle_beta is not None and set_angle_beta != 90:
-        if run_no == 0:
-            write_log_data = (
-                "ERROR: The beta angle is not 90 degress as set by the user "
-                "set_angle_beta = {}. Only beta angle of 90 degress or None is currently "
-                "allowed. \n".format(str(set_angle_beta))
-            )
-        log_template_file.write(str(write_log_data))
-        raise ValueError(str(write_log_data))
-
-    # check the read_angle_gamma
-    if read_angle_gamma is not None and read_angle_gamma != 90:
-        if run_no == 0:
-            write_log_data = (
-                "ERROR: The gamma angle is not 90 degress as read from the "
-                "starting PDB file read_angle_gamma_PDB = {}. "
-                "Only gamma angle of 90 degress or None is currently "
-                "allowed. \n".format(str(read_angle_gamma))
-            )
-            log_template_file.write(str(write_log_data))
-            raise ValueError(str(write_log_data))
-
-    if set_angle_gamma is not None and set_angle_gamma != 90:
-        if run_no == 0:
-            write_log_data = (
-                "ERROR: The gamma angle is not 90 degress as set by the user "
-                "set_angle_gamma = {}. Only gamma angle of 90 degress or None is currently "
-                "allowed. \n".format(str(set_angle_gamma))
-            )
-        log_template_file.write(str(write_log_data))
-        raise ValueError(str(write_log_data))
-
-    new_namd_data = new_namd_data.replace("x_dim_box", str(used_x_dim))
-    new_namd_data = new_namd_data.replace("y_dim_box", str(used_y_dim))
-    new_namd_data = new_namd_data.replace("z_dim_box", str(used_z_dim))
-    new_namd_data = new_namd_data.replace("x_origin_box", str(used_x_dim / 2))
-    new_namd_data = new_namd_data.replace("y_origin_box", str(used_y_dim / 2))
-    new_namd_data = new_namd_data.replace("z_origin_box", str(used_z_dim / 2))
-
-    new_namd_data = new_namd_data.replace(
-        "NAMD_Run_Steps", str((int(namd_run_steps)))
-    )
-    new_namd_data = new_namd_data.replace(
-        "NAMD_Minimize", str(int(namd_minimize_steps))
-    )
-    new_namd_data = new_namd_data.replace(
-        "NAMD_RST_DCD_XST_Steps", str((int(namd_rst_dcd_xst_steps)))
-    )
-    new_namd_data = new_namd_data.replace(
-        "NAMD_console_BLKavg_E_and_P_Steps",
-        str(int(namd_console_blkavg_e_and_p_steps)),
-    )
-
-    new_namd_data = new_namd_data.replace("current_step", str((int(0))))
-    new_namd_data = new_namd_data.replace(
-        "System_temp_set", str(simulation_temp_k)
-    )
-    new_namd_data = new_namd_data.replace(
-        "System_press_set", str(simulation_pressure_bar)
-    )
+    Parameters
+    ----------
+    engine_key : str
+        The engine name, which is used as the job name
+        ("NAMD_box_0", "NAMD_box_1", or "GOMC").
+    run_command : list of str
+        The command and its arguments which run the engine simulation
+        (i.e., ["/path/namd2", "+p4", "in.conf"]).
+    run_directory : str
+        The full path/directory of the simulation run, which the job script
+        is written to and run in.
+    no_cores : int
+        The number of CPU cores used by the engine.
+    submit_command : list of str
+        The command which submits the job script, which is added as the
+        last argument (i.e., ["sbatch"]).  The job id is read from the last
+        number the submit command prints, if any.
+    cancel_command : list of str or None, default=None
+        The command which cancels the job, which the job id is added to
+        (i.e., ["scancel"]).  If None, the job is not cancelled when the
+        simulation is stopped.
+    script_header_list : list of str, optional, default=None
+        The extra job script header lines (i.e., ["#SBATCH --partition=cpu"]).
+    poll_time_s : float, default=1.0
+        The time (s) between the checks for the engine exit status file,
+        when waiting for the simulation to finish.
+    """
 
-    if run_no != 0:
-        new_namd_data = new_namd_data.replace(
-            "X_PME_GRID_DIM", str(namd_x_pme_grid_dim)
-        )
-        new_namd_data = new_namd_data.replace(
-            "Y_PME_GRID_DIM", str(namd_y_pme_grid_dim)
+    def __init__(
+        self,
+        engine_key,
+        run_command,
+        run_directory,
+        no_cores,
+        submit_command,
+        cancel_command=None,
+        script_header_list=None,
+        poll_time_s=1.0,
+    ):
+        if script_header_list is None:
+            script_header_list = []
+
+        self.engine_key = engine_key
+        self.run_command = list(run_command)
+        self.run_directory = run_directory
+        self.cancel_command = cancel_command
+        self.poll_time_s = poll_time_s
+        self.script_filename = "{}/run_engine.sh".format(str(run_directory))
+        self.exit_status_filename = "{}/engine_exit_status.txt".format(
+            str(run_directory)
         )
-        new_namd_data = new_namd_data.replace(
-            "Z_PME_GRID_DIM", str(namd_z_pme_grid_dim)
+        self.job_id = None
+        self._exit_status = None
+
+        # a status file from an earlier job would end the wait too early
+        if os.path.exists(self.exit_status_filename):
+            os.remove(self.exit_status_filename)
+
+        script_line_list = [
+            "#!/bin/bash",
+            "#SBATCH --job-name={}".format(engine_key),
+            "#SBATCH --ntasks=1",
+            "#SBATCH --cpus-per-task={}".format(int(no_cores)),
+            "#SBATCH --output={}/run_engine.out".format(str(run_directory)),
+        ]
+        script_line_list += list(script_header_list)
+        script_line_list += [
+            "cd {}".format(shlex.quote(str(run_directory))),
+            "{} > out.dat 2>&1".format(
+                " ".join(shlex.quote(str(arg_i)) for arg_i in self.run_command)
+            ),
+            # the exit status file is moved into place, so it is
+            # never read before it is written
+            "echo $? > engine_exit_status.txt.tmp",
+            "mv engine_exit_status.txt.tmp engine_exit_status.txt",
+        ]
+        with open(self.script_filename, "w") as script_file:
+            script_file.write("\n".join(script_line_list) + "\n")
+        os.chmod(self.script_filename, 0o755)
+
+        submit_output = subprocess.run(
+            list(submit_command) + [self.script_filename],
+            stdout=subprocess.PIPE,
+            check=True,
+        ).stdout.decode(errors="replace")
+        job_id_list = re.findall(r"\d+", submit_output)
+        if len(job_id_list) > 0:
+            self.job_id = job_id_list[-1]
+
+    def fileno(self):
+        """
+        Gets the file descriptor which is readable when the engine exits,
+        which is not available for the batch jobs.
+
+        Returns
+        ---------
+        None
+            The batch jobs are checked with the poll_done method.
+        """
+        return None
+
+    def poll_done(self):
+        """
+        Checks if the simulation is finished, without waiting.
+
+        Returns
+        ---------
+        exit_status : int or None
+            The engine exit status (0 = successful), or None if the
+            simulation is still running.
+        """
+        if self._exit_status is None and os.path.exists(
+            self.exit_status_filename
+        ):
+            with open(self.exit_status_filename, "r") as exit_status_file:
+                self._exit_status = int(exit_status_file.read().strip())
+        return self._exit_status
+
+    def wait(self):
+        """
+        Waits for the simulation to finish.
+
+        Returns
+        ---------
+        exit_status : int
+            The engine exit status for the simulation (0 = successful).
+        """
+        exit_status = self.poll_done()
+        while exit_status is None:
+            time.sleep(self.poll_time_s)
+            exit_status = self.poll_done()
+        return exit_status
+
+    def kill(self):
+        """
+        Stops the simulation, without waiting for it to finish.  The job is
+        cancelled with the cancel command, and the simulation is marked as
+        finished with the SIGKILL exit status.
+        """
+        if self.poll_done() is None:
+            if self.cancel_command is not None and self.job_id is not None:
+                subprocess.run(list(self.cancel_command) + [self.job_id])
+            self._exit_status = -signal.SIGKILL
+
+
+class LocalEngineExecutor:
+    """
+    Starts each NAMD or GOMC simulation as a process on this node
+    ('launch' mode).
+    """
+
+    def start(
+        self, engine_key, engine_bin_file, run_directory, no_cores, cpu_set=None
+    ):
+        """
+        Starts a NAMD or GOMC simulation, without waiting for it to finish.
+
+        Parameters
+        ----------
+        engine_key : str
+            The engine name ("NAMD_box_0", "NAMD_box_1", or "GOMC").
+        engine_bin_file : str
+            The full path/filename of the NAMD or GOMC binary file.
+        run_directory : str
+            The full path/directory of the simulation run, which contains
+            the in.conf control file.
+        no_cores : int
+            The number of CPU cores used by the engine.
+        cpu_set : set of int, optional, default=None
+            The CPU cores which the engine is pinned to.
+            If None, the engine is not pinned.
+
+        Returns
+        ---------
+        LaunchedEngine
+            The engine process running the simulation.
+        """
+        return LaunchedEngine(
+            [
+                str(engine_bin_file),
+                "+p{}".format(str(int(no_cores))),
+                "in.conf",
+            ],
+            cwd=str(run_directory),
+            cpu_set=cpu_set,
+            output_filename="{}/out.dat".format(str(run_directory)),
+            # the engine errors are written in the log file with the
+            # engine output, where the error messages point to
+            stderr=subprocess.STDOUT,
         )
 
-    else:
-        # add x number times more point to the PME grid for "GEMC", "NPT".
-        # scalar_dim_mult = 1.3 --> allows for 2x change in volume,
-        # allowable volume change = scalar_dim_mult^3 = 1.3^3
-        if simulation_type in ["GEMC", "NPT"]:
-            scalar_dim_mult = 1.3
-            used_and_scaled_namd_pme_x_dim = (
-                used_x_dim + fft_add_namd_ang_to_box_dim
-            ) * scalar_dim_mult
-            used_and_scaled_namd_pme_y_dim = (
-                used_y_dim + fft_add_namd_ang_to_box_dim
-            ) * scalar_dim_mult
-            used_and_scaled_namd_pme_z_dim = (
-                used_z_dim + fft_add_namd_ang_to_box_dim
-            ) * scalar_dim_mult
-        else:
-            scalar_dim_mult = 1
-            used_and_scaled_namd_pme_x_dim = (
-                used_x_dim + fft_add_namd_ang_to_box_dim
-            ) * scalar_dim_mult
-            used_and_scaled_namd_pme_y_dim = (
-                used_y_dim + fft_add_namd_ang_to_box_dim
-            ) * scalar_dim_mult
-            used_and_scaled_namd_pme_z_dim = (
-                used_z_dim + fft_add_namd_ang_to_box_dim
-            ) * scalar_dim_mult
+    def close(self):
+        """
+        Stops the engines which are kept running between the simulations,
+        which there are none of, as each engine process only runs one
+        simulation.
+        """
 
-        new_namd_data = new_namd_data.replace(
-            "X_PME_GRID_DIM", str(int(used_and_scaled_namd_pme_x_dim + 1))
-        )
-        new_namd_data = new_namd_data.replace(
-            "Y_PME_GRID_DIM", str(int(used_and_scaled_namd_pme_y_dim + 1))
-        )
-        new_namd_data = new_namd_data.replace(
-            "Z_PME_GRID_DIM", str(int(used_and_scaled_namd_pme_z_dim + 1))
-        )
 
-    generate_namd_file.write(new_namd_data)
-    generate_namd_file.close()
+class BatchEngineExecutor:
+    """
+    Submits each NAMD or GOMC simulation as a batch job script
+    ('batch' mode, see the BatchEngine class).
 
-    write_log_data = (
-        "NAMD simulation data for simulation number {} in box {} is "
-        "completed \n".format(str(run_no), str(box_number))
-    )
-    log_template_file.write(str(write_log_data))
-    print(str(write_log_data))
+    Parameters
+    ----------
+    submit_command : list of str
+        The command which submits the job script (i.e., ["sbatch"]).
+    cancel_command : list of str or None, default=None
+        The command which cancels a job (i.e., ["scancel"]).
+    script_header_list : list of str, optional, default=None
+        The extra job script header lines (i.e., ["#SBATCH --partition=cpu"]).
+    poll_time_s : float, default=1.0
+        The time (s) between the checks for the finished jobs.
+    """
 
-    return namd_box_x_newdir
+    def __init__(
+        self,
+        submit_command,
+        cancel_command=None,
+        script_header_list=None,
+        poll_time_s=1.0,
+    ):
+        self.submit_command = submit_command
+        self.cancel_command = cancel_command
+        self.script_header_list = script_header_list
+        self.poll_time_s = poll_time_s
 
+    def start(
+        self, engine_key, engine_bin_file, run_directory, no_cores, cpu_set=None
+    ):
+        """
+        Submits a NAMD or GOMC simulation, without waiting for it to finish.
+
+        Parameters
+        ----------
+        engine_key : str
+            The engine name ("NAMD_box_0", "NAMD_box_1", or "GOMC").
+        engine_bin_file : str
+            The full path/filename of the NAMD or GOMC binary file.
+        run_directory : str
+            The full path/directory of the simulation run, which contains
+            the in.conf control file.
+        no_cores : int
+            The number of CPU cores used by the engine.
+        cpu_set : set of int, optional, default=None
+            Not used, as the batch system selects the CPU cores.
+
+        Returns
+        ---------
+        BatchEngine
+            The submitted simulation.
+        """
+        return BatchEngine(
+            engine_key,
+            [
+                str(engine_bin_file),
+                "+p{}".format(str(int(no_cores))),
+                "in.conf",
+            ],
+            str(run_directory),
+            no_cores,
+            self.submit_command,
+            cancel_command=self.cancel_command,
+            script_header_list=self.script_header_list,
+            poll_time_s=self.poll_time_s,
+        )
 
-def get_namd_energy_data(read_namd_box_x_energy_file, e_default_namd_titles):
+    def close(self):
+        """
+        Stops the engines which are kept running between the simulations,
+        which there are none of, as each batch job only runs one simulation.
+        """
+
+
+# the resident NAMD console script, which is the NAMD control file the
+# resident NAMD engine is started with, and the line it prints after
+# each simulation is finished
+resident_namd_console_filename = "resident_namd_console.tcl"
+resident_namd_done_label = "RESIDENT_NAMD_DONE:"
+resident_namd_console_script = """\
+# The resident NAMD console (engine_mode = resident), written by the
+# run_NAMD_GOMC.py file.  The full path/filename of the NAMD control file of
+# each simulation is read from stdin, and the control file is run in its
+# run directory.  The exit status of the simulation is printed after it is
+# finished (0 = successful), and EXIT stops the NAMD engine.
+while {{[gets stdin resident_control_file] >= 0}} {{
+	if {{$resident_control_file == "EXIT"}} {{
+		break
+	}}
+	cd [file dirname $resident_control_file]
+	set resident_exit_status [catch {{source [file tail $resident_control_file]}} resident_error]
+	if {{$resident_exit_status != 0}} {{
+		puts "ERROR: $resident_error"
+	}}
+	puts "{} $resident_exit_status"
+	flush stdout
+}}
+""".format(resident_namd_done_label)
+
+
+class ResidentNamdEngine:
     """
-    Gets the NAMD run energy data (electrostatic, potential, and VDW energies)
-    in kcal/mol.
+    A NAMD process, which is kept running for all the NAMD simulations of
+    a box ('resident' mode), so the NAMD startup (force field parsing,
+    PSF/PDB loading and PME/FFTW planning) is only done once.
+
+    The NAMD process runs the resident NAMD console script, which reads the
+    NAMD control file of each simulation from stdin, and runs it in its run
+    directory with the NAMD Tcl interpreter.  The first simulation runs the
+    in.conf control file.  The later simulations run the in_resident.conf
+    control file, which loads the coordinates, velocities and box from the
+    restart files with the NAMD reinitatoms command, and runs the NAMD steps
+    with the NAMD run command.  The atoms can not be changed, so the
+    resident NAMD engine is only used for the NVT and NPT ensembles.
+
+    The NAMD output of each simulation is written to the output file of
+    the simulation (out.dat).  NAMD only prints the startup Info lines
+    (i.e., the TOTAL MASS and the PME GRID DIMENSIONS) once, so they are
+    copied to the start of the output file of each later simulation,
+    so every NAMD output file can be read on its own.
 
     Parameters
     ----------
-    read_namd_box_x_energy_file : str
-        The full path/filename of the NAMD energy file for the selected box.
-    e_default_namd_titles : list
-        The default NAMD energy output strings, which are split into a
-        list of strings.
-
-    Returns
-    ---------
-    namd_e_electro_box_x : list
-        The list of electrostatic energies as strings, as extracted from the
-        the NAMD run data ('ELECT').
-    namd_e_electro_box_x_initial_value : float
-        The initial electrostatic energy as a float, as extracted from the
-        the NAMD run data ('ELECT').
-    namd_e_electro_box_x_final_value : float
-        The final electrostatic energy as a float, as extracted from the
-        the NAMD run data ('ELECT').
-    namd_e_potential_box_x : str
-        The list of potential energies as strings, as extracted from the
-        the NAMD run data ('POTENTIAL').
-    namd_e_potential_box_x_initial_value : float
-        The initial potential energy as a float, as extracted from the
-        the NAMD run data ('POTENTIAL').
-    namd_e_potential_box_x_final_value : float
-        The final potential energy as a float, as extracted from the
-        the NAMD run data ('POTENTIAL').
-    namd_e_vdw_plus_elec_box_x : str
-        The list of VDW + electrostatic energies as strings, as extracted from the
-        the NAMD run data ('VDW' + 'ELECT').
-    namd_e_vdw_plus_elec_box_x_initial_value : float
-        The intitial VDW + electrostatic energy as a float, as extracted from the
-        the NAMD run data ('VDW' + 'ELECT').
-    namd_e_vdw_plus_elec_box_x_final_value : float
-        The final VDW + electrostatic energy as a float, as extracted from the
-        the NAMD run data ('VDW' + 'ELECT').
+    run_command : list of str
+        The command and its arguments which start the NAMD engine with the
+        resident NAMD console script
+        (i.e., ["/path/namd2", "+p4", "resident_namd_console.tcl"]).
+    cwd : str, optional, default=None
+        The directory which the engine process is started in.
+    cpu_set : set of int, optional, default=None
+        The CPU cores which the engine process is pinned to.
+        If None, the engine process is not pinned.
     """
 
-    get_e_titles = True
-    e_values_namd_list = []
-    for i, line in enumerate(read_namd_box_x_energy_file):
-        if line.startswith("ETITLE:") is True and get_e_titles is True:
-            e_titles_namd_iteration = read_namd_box_x_energy_file[i]
-            e_titles_namd_iteration = e_titles_namd_iteration.split()
-            e_titles_namd_iteration = e_titles_namd_iteration[:]
-            if get_e_titles is True:
-                get_e_titles = False
+    def __init__(self, run_command, cwd=None, cpu_set=None):
+        self.run_command = list(run_command)
+        self.cpu_set = cpu_set
+        self.engine_process = subprocess.Popen(
+            self.run_command,
+            cwd=cwd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            preexec_fn=(
+                None
+                if cpu_set is None
+                else lambda: _set_engine_cpu_set(cpu_set)
+            ),
+        )
 
-        if line.startswith("ENERGY:") is True:
-            e_values_namd_iteration = read_namd_box_x_energy_file[i]
-            e_values_namd_iteration = e_values_namd_iteration.split()
-            e_values_namd_list.append(e_values_namd_iteration)
+        self._output_lock = threading.Lock()
+        self._run_done_event = threading.Event()
+        self._run_done_event.set()
+        self._exit_status = None
+        self._output_file = None
+        self._pending_output_line_list = []
+        self._startup_info_line_list = []
+        self._startup_finished = False
+        self._output_thread = threading.Thread(
+            target=self._write_output, daemon=True
+        )
+        self._output_thread.start()
+
+    def _finish_run(self, exit_status):
+        if self._output_file is not None:
+            self._output_file.close()
+            self._output_file = None
+        if not self._run_done_event.is_set():
+            self._exit_status = exit_status
+            self._run_done_event.set()
+
+    def _write_output(self):
+        done_label = resident_namd_done_label.encode()
+        for output_line in self.engine_process.stdout:
+            with self._output_lock:
+                if output_line.startswith(done_label):
+                    try:
+                        exit_status = int(output_line.split()[1])
+                    except (IndexError, ValueError):
+                        exit_status = 1
+                    self._finish_run(exit_status)
+                    continue
+
+                if self._startup_finished is False:
+                    if output_line.startswith(b"ETITLE:"):
+                        self._startup_finished = True
+                    elif output_line.startswith(b"Info:"):
+                        self._startup_info_line_list.append(output_line)
+
+                if self._output_file is None:
+                    self._pending_output_line_list.append(output_line)
+                else:
+                    self._output_file.write(output_line)
+                    self._output_file.flush()
+
+        # the NAMD process stopped, so a running simulation failed
+        exit_status = self.engine_process.wait()
+        with self._output_lock:
+            self._finish_run(exit_status if exit_status != 0 else 1)
+
+    def is_running(self):
+        """
+        Checks if the NAMD process is running.
+
+        Returns
+        ---------
+        bool
+            True if the NAMD process is running.
+        """
+        return self.engine_process.poll() is None
+
+    def start_run(self, control_filename, output_filename):
+        """
+        Sends a simulation to the NAMD engine, without waiting for it
+        to finish.
+
+        Parameters
+        ----------
+        control_filename : str
+            The full path/filename of the NAMD control file, in the run
+            directory of the simulation.
+        output_filename : str
+            The file which the NAMD output of the simulation is written to
+            (i.e., out.dat).
+        """
+        if not self._run_done_event.is_set():
+            raise ValueError(
+                "The resident NAMD engine is already running a simulation.\n"
+            )
 
-    try:
-        e_titles_namd_iteration
-    except:
-        e_titles_namd_iteration = e_default_namd_titles
+        with self._output_lock:
+            self._exit_status = None
+            self._run_done_event.clear()
+            self._output_file = open(output_filename, "wb")
+            if self._startup_finished is True:
+                self._output_file.writelines(self._startup_info_line_list)
+            self._output_file.writelines(self._pending_output_line_list)
+            self._output_file.flush()
+            self._pending_output_line_list = []
 
-    namd_energy_data_box_x_df = pd.DataFrame(
-        data=e_values_namd_list, columns=e_titles_namd_iteration
-    )
+        try:
+            self.engine_process.stdin.write(
+                "{}\n".format(control_filename).encode()
+            )
+            self.engine_process.stdin.flush()
+        except OSError:
+            with self._output_lock:
+                self._finish_run(1)
+
+    def fileno(self):
+        """
+        Gets the file descriptor which is readable when the simulation is
+        finished, which is not available for the resident NAMD engine.
+
+        Returns
+        ---------
+        None
+            The simulations are checked with the poll_done method.
+        """
+        return None
+
+    def poll_done(self):
+        """
+        Checks if the simulation is finished, without waiting.
+
+        Returns
+        ---------
+        exit_status : int or None
+            The exit status of the simulation (0 = successful), or None if
+            the simulation is still running.
+        """
+        if self._run_done_event.is_set():
+            return self._exit_status
+        return None
+
+    def wait(self):
+        """
+        Waits for the simulation to finish.
+
+        Returns
+        ---------
+        exit_status : int
+            The exit status of the simulation (0 = successful).
+        """
+        self._run_done_event.wait()
+        return self._exit_status
+
+    def kill(self):
+        """
+        Stops the simulation and the NAMD process, without waiting for
+        them to finish.
+        """
+        if self.engine_process.poll() is None:
+            self.engine_process.kill()
+
+    def close(self):
+        """
+        Stops the NAMD process, after the simulation it is running.
+        """
+        if self.engine_process.poll() is None:
+            try:
+                self.engine_process.stdin.write(b"EXIT\n")
+                self.engine_process.stdin.close()
+                self.engine_process.wait(timeout=60)
+            except (OSError, subprocess.TimeoutExpired):
+                self.engine_process.kill()
+        self._output_thread.join()
+
+
+class ResidentNamdEngineExecutor(LocalEngineExecutor):
+    """
+    Keeps one NAMD process running for all the NAMD simulations of each box
+    ('resident' mode, see the ResidentNamdEngine class), and starts each
+    GOMC simulation as a process on this node, as in the 'launch' mode.
+    """
 
-    # extract energy data from box 0
-    namd_e_electro_box_x = namd_energy_data_box_x_df.loc[:, "ELECT"]
-    namd_e_electro_box_x_initial_value = float(
-        namd_e_electro_box_x.values.tolist()[0]
-    )
-    namd_e_electro_box_x_final_value = float(
-        namd_e_electro_box_x.values.tolist()[-1]
-    )
-    namd_e_potential_box_x = namd_energy_data_box_x_df.loc[:, "POTENTIAL"]
-    namd_e_potential_box_x_initial_value = float(
-        namd_e_potential_box_x.values.tolist()[0]
-    )
-    namd_e_potential_box_x_final_value = float(
-        namd_e_potential_box_x.values.tolist()[-1]
-    )
-    namd_e_vdw_box_x = namd_energy_data_box_x_df.loc[:, "VDW"]
-    namd_e_vdw_box_x_initial_value = float(namd_e_vdw_box_x.values.tolist()[0])
-    namd_e_vdw_box_x_final_value = float(namd_e_vdw_box_x.values.tolist()[-1])
+    def __init__(self):
+        self.resident_namd_engine_dict = {}
 
-    namd_e_vdw_plus_elec_box_x = [
-        float(namd_e_vdw_box_x[k_i]) + float(namd_e_electro_box_x[k_i])
-        for k_i in range(0, len(namd_e_vdw_box_x))
-    ]
+    def start(
+        self, engine_key, engine_bin_file, run_directory, no_cores, cpu_set=None
+    ):
+        """
+        Starts a NAMD or GOMC simulation, without waiting for it to finish.
+        The NAMD engine is started with the first NAMD simulation, which runs
+        the in.conf control file, and the later NAMD simulations run the
+        in_resident.conf control file in the same NAMD engine.
+
+        Parameters
+        ----------
+        engine_key : str
+            The engine name ("NAMD_box_0" or "GOMC").
+        engine_bin_file : str
+            The full path/filename of the NAMD or GOMC binary file.
+        run_directory : str
+            The full path/directory of the simulation run, which contains
+            the in.conf and in_resident.conf control files.
+        no_cores : int
+            The number of CPU cores used by the engine.
+        cpu_set : set of int, optional, default=None
+            The CPU cores which the engine is pinned to.
+            If None, the engine is not pinned.
+
+        Returns
+        ---------
+        ResidentNamdEngine or LaunchedEngine
+            The resident NAMD engine or the GOMC engine process running
+            the simulation.
+        """
+        if not engine_key.startswith("NAMD"):
+            return super().start(
+                engine_key,
+                engine_bin_file,
+                run_directory,
+                no_cores,
+                cpu_set=cpu_set,
+            )
 
-    namd_e_vdw_plus_elec_box_x_initial_value = float(
-        namd_e_vdw_plus_elec_box_x[0]
-    )
-    namd_e_vdw_plus_elec_box_x_final_value = float(
-        namd_e_vdw_plus_elec_box_x[-1]
-    )
+        resident_namd_engine = self.resident_namd_engine_dict.get(engine_key)
+        if (
+            resident_namd_engine is None
+            or not resident_namd_engine.is_running()
+        ):
+            console_filename = "{}/{}".format(
+                str(run_directory), resident_namd_console_filename
+            )
+            with open(console_filename, "w") as console_file:
+                console_file.write(resident_namd_console_script)
+            resident_namd_engine = ResidentNamdEngine(
+                [
+                    str(engine_bin_file),
+                    "+p{}".format(str(int(no_cores))),
+                    console_filename,
+                ],
+                cwd=str(run_directory),
+                cpu_set=cpu_set,
+            )
+            self.resident_namd_engine_dict[engine_key] = resident_namd_engine
+            control_filename = "in.conf"
+        else:
+            control_filename = "in_resident.conf"
 
-    return (
-        namd_e_electro_box_x,
-        namd_e_electro_box_x_initial_value,
-        namd_e_electro_box_x_final_value,
-        namd_e_potential_box_x,
-        namd_e_potential_box_x_initial_value,
-        namd_e_potential_box_x_final_value,
-        namd_e_vdw_plus_elec_box_x,
-        namd_e_vdw_plus_elec_box_x_initial_value,
-        namd_e_vdw_plus_elec_box_x_final_value,
-    )
+        resident_namd_engine.start_run(
+            "{}/{}".format(str(run_directory), control_filename),
+            "{}/out.dat".format(str(run_directory)),
+        )
+        return resident_namd_engine
 
+    def close(self):
+        """
+        Stops the resident NAMD engines.
+        """
+        for engine_key in list(self.resident_namd_engine_dict.keys()):
+            self.resident_namd_engine_dict.pop(engine_key).close()
 
-def compare_namd_gomc_energies(
-    e_potential_box_x_final_value,
-    e_potential_box_x_initial_value,
-    e_vdw_plus_elec_box_x_final_value,
-    e_vdw_plus_elec_box_x_initial_value,
-    run_no,
-    box_number,
-):
+
+class EngineLogFollower:
     """
-    Compares the NAMD and GOMC energies when switching between
-    simulation engines.  GOMC does not currently (2-26-21)
-    have impropers, so if a simulation in NAMD is using impropers
-    You will recieve warnings since GOMC does not calculate the
-    impropers. Otherwise, they should be the same or nearly the same
-    between GOMC and NAMD.  The data is printing on the screen and
-    the Hybrid GOMC-NAMD log file.  One GOMC and one NAMD file must
-    either be the initial or last values.
+    Follows a NAMD or GOMC log file (out.dat) while the engine is writing
+    it, keeping only the lines which are parsed after the simulation (i.e.,
+    the energy and statistics lines), so the log file is already read
+    when the engine finishes.
 
     Parameters
     ----------
-    e_potential_box_x_final_value : float
-        The final potential energy as a float, as extracted from the
-        the NAMD run data ('POTENTIAL').
-    e_potential_box_x_initial_value : float
-        The initial potential energy as a float, as extracted from the
-        the NAMD run data ('POTENTIAL').
-    e_vdw_plus_elec_box_x_final_value : float
-        The final VDW + electrostatic energy energy as a float, as extracted from the
-        the NAMD run data ('VDW' + 'ELECT').
-    e_vdw_plus_elec_box_x_initial_value : float
-        The initial VDW + electrostatic energy as a float, as extracted from the
-        the NAMD run data ('VDW' + 'ELECT').
-    run_no : int
-        Simulation run number
-    box_number : int
-        The simulation box number, which can only be 0 or 1
+    log_filename : str
+        The full path/filename of the engine log file.
+    line_prefix_list : list of str
+        The starts of the log file lines which are kept
+        (i.e., ["ETITLE:", "ENERGY:"]).
+
+    Notes
+    ---------
+    The follower is created before the engine is started, so a log file
+    which is left in the run directory from an earlier simulation is not
+    read, until the engine starts writing it again (i.e., a new or
+    modified log file).
     """
 
-    # calc error in potential energies box x
-    try:
-        error_fract_in_potential_box_x = np.abs(
-            (e_potential_box_x_final_value - e_potential_box_x_initial_value)
-            / e_potential_box_x_final_value
+    def __init__(self, log_filename, line_prefix_list):
+        self.log_filename = log_filename
+        self.line_prefix_tuple = tuple(
+            line_prefix.encode() for line_prefix in line_prefix_list
         )
-    except:
+        self.log_lines = []
+        self._log_file = None
+        self._no_read_bytes = 0
+        self._partial_line = b""
+        self._old_log_file_stat = self._get_log_file_stat()
+
+    def _get_log_file_stat(self):
+        try:
+            log_file_stat = os.stat(self.log_filename)
+        except FileNotFoundError:
+            return None
+        return log_file_stat.st_ino, log_file_stat.st_mtime_ns
+
+    def _open_log_file(self):
+        if self._old_log_file_stat is not None:
+            if self._get_log_file_stat() == self._old_log_file_stat:
+                return
+            self._old_log_file_stat = None
+        try:
+            self._log_file = open(self.log_filename, "rb")
+        except FileNotFoundError:
+            self._log_file = None
+
+    def read_new_lines(self):
+        """
+        Reads the lines which the engine has written since the last read,
+        without waiting.
+        """
+        if self._log_file is None:
+            self._open_log_file()
+            if self._log_file is None:
+                return
+
+        # start again if the log file is truncated or replaced
+        log_file_stat = self._get_log_file_stat()
+        open_log_file_stat = os.fstat(self._log_file.fileno())
         if (
-            e_potential_box_x_final_value == 0
-            and e_potential_box_x_initial_value == 0
+            log_file_stat is None
+            or log_file_stat[0] != open_log_file_stat.st_ino
+            or open_log_file_stat.st_size < self._no_read_bytes
         ):
-            error_fract_in_potential_box_x = 0
-        else:
-            error_fract_in_potential_box_x = "NA"
+            self._log_file.close()
+            self._log_file = None
+            self._no_read_bytes = 0
+            self._partial_line = b""
+            self.log_lines = []
+            self._open_log_file()
+            if self._log_file is None:
+                return
+
+        log_data = self._log_file.read()
+        if len(log_data) == 0:
+            return
+        self._no_read_bytes += len(log_data)
+        split_log_lines = (self._partial_line + log_data).split(b"\n")
+        # the last line may not be finished, so it is kept for the next read
+        self._partial_line = split_log_lines.pop()
+        self.log_lines.extend(
+            "{}\n".format(log_line.decode(errors="replace"))
+            for log_line in split_log_lines
+            if log_line.startswith(self.line_prefix_tuple)
+        )
 
-    if (
-        error_fract_in_potential_box_x != "NA"
-        and error_fract_in_potential_box_x <= allowable_error_fraction_potential
+    def get_log_lines(self):
+        """
+        Reads the rest of the log file, after the engine is finished, and
+        gets all the kept lines.
+
+        Returns
+        ---------
+        log_lines : list of str
+            The log file lines which start with the line prefixes.
+        """
+        self.read_new_lines()
+        if self._partial_line.startswith(self.line_prefix_tuple):
+            self.log_lines.append(self._partial_line.decode(errors="replace"))
+        self._partial_line = b""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+        if len(self.log_lines) == 0 and not os.path.exists(self.log_filename):
+            raise FileNotFoundError(
+                "The engine log file {} does not exist.\n".format(
+                    self.log_filename
+                )
+            )
+
+        return self.log_lines
+
+
+class EngineWatchdog:
+    """
+    Checks the NAMD or GOMC energies while the engine is running, so a
+    diverging simulation can be stopped early, instead of running all the
+    NAMD or GOMC steps.
+
+    The simulation fails the checks if any energy or statistics value is
+    not a finite number (NaN or inf), if the potential energy (NAMD
+    POTENTIAL or GOMC TOTAL) changes by more than the maximum fraction
+    (or the minimum energy change, if it is larger) between two printed
+    steps, or if the engine has not printed any new energies for the
+    stall time.  The energy changes of the NAMD minimization steps are not
+    checked, since the potential energy normally falls by orders of
+    magnitude during the minimization.
+
+    The stall time is the longer of the stall_time_s and three times the
+    longest engine startup (before the first energies), or three times
+    the longest time between two energy outputs (after the first
+    energies), which are measured in the earlier simulations of the
+    same engine (print_time_dict).
+
+    Parameters
+    ----------
+    log_follower : EngineLogFollower
+        The follower of the engine log file, which reads the energy lines.
+    engine_name : str
+        The engine name ("NAMD" or "GOMC").
+    max_energy_jump_fraction : float or None, default=None
+        The maximum change in the potential energy between two printed steps,
+        as a fraction of the previous potential energy.
+        If None, the energy changes are not checked.
+    min_energy_jump : float, default=0.0
+        The minimum change in the potential energy between two printed
+        steps which can fail the checks, in the engine energy units
+        (NAMD = kcal/mol and GOMC = K), so the small energy changes
+        do not fail the checks when the potential energy is near zero.
+    stall_time_s : float or None, default=None
+        The minimum stall time (s) without any new energies from the engine,
+        including the engine startup.
+        If None, the time is not checked.
+    minimize_end_step : int or None, default=None
+        The last NAMD minimization step.  The energy changes are not
+        checked for the printed steps up to and including this step.
+        If None, the simulation has no minimization steps.
+    energy_output_steps : int or None, default=None
+        The number of steps between two energy outputs.  If None, only
+        the engine startup is measured for the stall time.
+    print_time_dict : dict or None, default=None
+        The longest engine startup ("startup_s") and time per step between
+        two energy outputs ("time_per_step_s"), in s, which are measured
+        in the earlier simulations of the same engine.  The dictionary is
+        updated with the times measured in this simulation.
+        If None, an empty dictionary is used.
+
+    Attributes
+    ----------
+    failure_message : str or None
+        The reason the simulation failed the checks, or None if the
+        simulation has not failed the checks.
+    """
+
+    def __init__(
+        self,
+        log_follower,
+        engine_name,
+        max_energy_jump_fraction=None,
+        min_energy_jump=0.0,
+        stall_time_s=None,
+        minimize_end_step=None,
+        energy_output_steps=None,
+        print_time_dict=None,
     ):
-        write_log_data = (
-            "PASSED: Box {}: Potential energies error fraction between the check "
-            "between the last point in run {}"
-            " and the first point in run {}, error fraction = {}"
-            " \n".format(
-                str(box_number),
-                str(int(run_no - 1)),
-                str(int(run_no)),
-                str(error_fract_in_potential_box_x),
+        if engine_name not in ["NAMD", "GOMC"]:
+            raise ValueError(
+                "The engine_name must be 'NAMD' or 'GOMC', "
+                "engine_name = {}.\n".format(engine_name)
             )
-        )
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
 
-    else:
-        write_log_data = (
-            "FAILED: Box {}: Potential energies error fraction between the last "
-            "point in run {} and the first point in run {}, error fraction =  {}"
-            " \n".format(
-                str(box_number),
-                str(int(run_no - 1)),
-                str(int(run_no)),
-                str(error_fract_in_potential_box_x),
+        self.log_follower = log_follower
+        self.engine_name = engine_name
+        self.max_energy_jump_fraction = max_energy_jump_fraction
+        self.min_energy_jump = min_energy_jump
+        self.stall_time_s = stall_time_s
+        self.minimize_end_step = minimize_end_step
+        self.energy_output_steps = energy_output_steps
+        if print_time_dict is None:
+            print_time_dict = {}
+        self.print_time_dict = print_time_dict
+        if engine_name == "NAMD":
+            self.potential_title = "POTENTIAL"
+            self.title_prefix_tuple = ("ETITLE:",)
+            self.energy_prefix = "ENERGY:"
+        else:
+            self.potential_title = "TOTAL"
+            self.title_prefix_tuple = ("ETITLE:", "STITLE:")
+            self.energy_prefix = "ENER_"
+        self.failure_message = None
+        self._potential_index = None
+        self._last_potential_dict = {}
+        self._no_checked_lines = 0
+        self._start_time_s = time.monotonic()
+        self._last_energy_time_s = None
+        self._last_energy_step = None
+
+    def _check_log_line(self, log_line):
+        split_line = log_line.split()
+        if log_line.startswith(self.title_prefix_tuple):
+            if (
+                log_line.startswith("ETITLE:")
+                and self.potential_title in split_line
+            ):
+                self._potential_index = split_line.index(self.potential_title)
+            return None
+
+        line_label = split_line[0].rstrip(":")
+        try:
+            line_values = [float(value_i) for value_i in split_line[1:]]
+        except ValueError:
+            return "the {} line could not be read: {}".format(
+                line_label, log_line.strip()
+            )
+        if False in [math.isfinite(value_i) for value_i in line_values]:
+            return "the {} line has a NaN or inf value: {}".format(
+                line_label, log_line.strip()
             )
-        )
-        log_template_file.write("WARNING: " + str(write_log_data))
-        warn(write_log_data)
 
-    # calc error in VDW + Electrostatics box x
-    try:
-        error_fract_in_vdw_plus_elec_box_x = np.abs(
-            (
-                e_vdw_plus_elec_box_x_final_value
-                - e_vdw_plus_elec_box_x_initial_value
+        if (
+            self.max_energy_jump_fraction is None
+            or not log_line.startswith(self.energy_prefix)
+            or self._potential_index is None
+            or self._potential_index >= len(split_line)
+        ):
+            return None
+
+        # the first value is the step, and the minimization steps
+        # are not checked
+        if (
+            self.minimize_end_step is not None
+            and line_values[0] <= self.minimize_end_step
+        ):
+            return None
+
+        potential = line_values[self._potential_index - 1]
+        last_potential = self._last_potential_dict.get(line_label)
+        self._last_potential_dict[line_label] = potential
+        if last_potential is not None and abs(potential - last_potential) > max(
+            self.max_energy_jump_fraction * abs(last_potential),
+            self.min_energy_jump,
+        ):
+            return (
+                "the {} {} energy changed from {} to {}, which is more than "
+                "the maximum fraction ({}) of the previous energy and the "
+                "minimum energy change ({})".format(
+                    line_label,
+                    self.potential_title,
+                    last_potential,
+                    potential,
+                    self.max_energy_jump_fraction,
+                    self.min_energy_jump,
+                )
+            )
+        return None
+
+    def _record_energy_time(self, log_line, line_time_s):
+        split_line = log_line.split()
+        if len(split_line) < 2:
+            return
+        # the first value is the step, and the GEMC boxes print
+        # the same step on two lines
+        energy_step = float(split_line[1])
+        if self._last_energy_time_s is None:
+            self.print_time_dict["startup_s"] = max(
+                self.print_time_dict.get("startup_s", 0.0),
+                line_time_s - self._start_time_s,
+            )
+        elif (
+            self._last_energy_step is not None
+            and energy_step > self._last_energy_step
+        ):
+            self.print_time_dict["time_per_step_s"] = max(
+                self.print_time_dict.get("time_per_step_s", 0.0),
+                (line_time_s - self._last_energy_time_s)
+                / (energy_step - self._last_energy_step),
             )
-            / e_vdw_plus_elec_box_x_final_value
-        )
-    except:
         if (
-            e_vdw_plus_elec_box_x_final_value == 0
-            and e_vdw_plus_elec_box_x_initial_value == 0
+            self._last_energy_step is None
+            or energy_step > self._last_energy_step
         ):
-            error_fract_in_vdw_plus_elec_box_x = 0
+            self._last_energy_time_s = line_time_s
+            self._last_energy_step = energy_step
+
+    def get_stall_time_s(self):
+        """
+        Gets the maximum time (s) without any new energies from the engine,
+        which is the longer of the stall_time_s and three times the
+        measured engine startup or time between two energy outputs.
+
+        Returns
+        ---------
+        stall_time_s : float or None
+            The maximum time (s) without any new energies from the engine,
+            or None if the time is not checked.
+        """
+        if self.stall_time_s is None:
+            return None
+
+        if self._last_energy_time_s is None:
+            measured_time_s = self.print_time_dict.get("startup_s", 0.0)
+        elif self.energy_output_steps is None:
+            measured_time_s = 0.0
+        else:
+            measured_time_s = self.print_time_dict.get(
+                "time_per_step_s", 0.0
+            ) * float(self.energy_output_steps)
+
+        return max(float(self.stall_time_s), 3 * measured_time_s)
+
+    def check(self):
+        """
+        Checks the energy lines, which the log follower has read since the
+        last check, and the time since the last new energy line
+        (or the engine start).
+
+        Returns
+        ---------
+        failure_message : str or None
+            The reason the simulation failed the checks, or None if the
+            simulation has not failed the checks.
+        """
+        if self.failure_message is not None:
+            return self.failure_message
+
+        log_lines = self.log_follower.log_lines
+        if len(log_lines) < self._no_checked_lines:
+            # the log file was replaced, so the energies are checked again
+            self._potential_index = None
+            self._last_potential_dict = {}
+            self._no_checked_lines = 0
+            self._last_energy_step = None
+
+        check_time_s = time.monotonic()
+        for log_line in log_lines[self._no_checked_lines :]:
+            self._no_checked_lines += 1
+            failure_message = self._check_log_line(log_line)
+            if failure_message is not None:
+                self.failure_message = failure_message
+                return self.failure_message
+            if log_line.startswith(self.energy_prefix):
+                self._record_energy_time(log_line, check_time_s)
+
+        stall_time_s = self.get_stall_time_s()
+        if self._last_energy_time_s is None:
+            no_energy_time_s = check_time_s - self._start_time_s
         else:
-            error_fract_in_vdw_plus_elec_box_x = "NA"
+            no_energy_time_s = check_time_s - self._last_energy_time_s
+        if stall_time_s is not None and no_energy_time_s > stall_time_s:
+            self.failure_message = (
+                "the {} engine has not printed any new energies for "
+                "{} s, which is more than the stall time ({} s)".format(
+                    self.engine_name,
+                    round(no_energy_time_s, 3),
+                    round(stall_time_s, 3),
+                )
+            )
+            return self.failure_message
 
-    abs_diff_in_vdw_plus_elec_box_x = np.abs(
-        e_vdw_plus_elec_box_x_final_value - e_vdw_plus_elec_box_x_initial_value
-    )
+        return None
 
-    if (
-        error_fract_in_vdw_plus_elec_box_x != "NA"
-        and error_fract_in_vdw_plus_elec_box_x
-        <= allowable_error_fraction_vdw_plus_elec
-    ):
-        write_log_data = (
-            "PASSED: Box {}: VDW + electrostatic fraction between the last point in run {}"
-            " and the first point in run {}, error fraction = {}"
-            " \n".format(
-                str(box_number),
-                str(int(run_no - 1)),
-                str(int(run_no)),
-                str(error_fract_in_vdw_plus_elec_box_x),
-            )
-        )
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
 
-    elif (
-        abs_diff_in_vdw_plus_elec_box_x
-        <= max_absolute_allowable_kcal_fraction_vdw_plus_elec
-    ):
-        write_log_data = (
-            "PASSED: Box {}: The VDW + electrostatic energy error fraction between the last point in run {} "
-            "and the first point in run {}, absolute difference is = {} kcal/mol."
-            " \n".format(
-                str(box_number),
-                str(int(run_no - 1)),
-                str(int(run_no)),
-                str(abs_diff_in_vdw_plus_elec_box_x),
-            )
-        )
-        log_template_file.write(str(write_log_data))
-        print(str(write_log_data))
-    else:
-        write_log_data = (
-            "FAILED: Box {}: vdw_plus_elec energy  error fraction between the last point in run {} "
-            "and the first point in run {}, error fraction = {} or the absolute "
-            "difference is = {} kcal/mol."
-            " \n".format(
-                str(box_number),
-                str(int(run_no - 1)),
-                str(int(run_no)),
-                str(error_fract_in_vdw_plus_elec_box_x),
-                str(abs_diff_in_vdw_plus_elec_box_x),
-            )
-        )
-        log_template_file.write("WARNING: " + str(write_log_data))
-        warn(str(write_log_data))
-
-
-def write_gomc_conf_file(
-    python_file_directory,
-    path_gomc_runs,
-    run_no,
-    gomc_run_steps,
-    gomc_rst_coor_ckpoint_steps,
-    gomc_console_blkavg_hist_steps,
-    gomc_hist_sample_steps,
-    simulation_temp_k,
-    simulation_pressure_bar,
-    starting_pdb_box_0_file,
-    starting_pdb_box_1_file,
-    starting_psf_box_0_file,
-    starting_psf_box_1_file,
+def wait_for_engines(
+    exec_engine_dict,
+    poll_time_s=0.05,
+    log_follower_list=None,
+    engine_watchdog_dict=None,
 ):
     """
-    Writes the NAMD control file in the NAMD run numbered folder
+    Waits for several NAMD or GOMC simulations running at the same time,
+    recording the time each one finishes, instead of waiting for them
+    one after the other.
 
     Parameters
     ----------
-    python_file_directory : str
-        The path/directory where this file is located.
-    path_gomc_template : str
-        The relative path to the GOMC template file from where this file is
-        located (he directory where this file is located (python_file_director).
-    run_no : int
-        Simulation run number
-    gomc_run_steps : int
-        The number of steps to run the GOMC simulation.
-    gomc_rst_coor_ckpoint_steps : int
-        The number of steps which the GOMC restart, dcd, xst, checkpoint and
-        coordinates files will be created.
-    gomc_console_blkavg_hist_steps : int
-        The number of steps which the GOMC consol output (energies and pressure),
-        block average, and histogram data will be output.
-    gomc_hist_sample_steps : int
-        The sample frequency (steps) which the GOMC histogram data
-        will be sampled.
-    simulation_temp_k : int or float
-        The NAMD simulation temperature in Kelvin.
-    simulation_pressure_bar : int or float
-        The NAMD simulation pressure in bar.
-    starting_pdb_box_0_file : str
-        The pdb path/filename for box 0 which is written
-        to the GOMC control file.
-    starting_pdb_box_1_file : str
-        The psf path/filename for box 1 which is written
-        to the GOMC control file.
-    starting_psf_box_0_file : str
-        The psf path/filename for box 0 which is written
-        to the GOMC control file.
-    starting_psf_box_1_file : str
-        The psf path/filename for box 1 which is written
-        to the GOMC control file.
+    exec_engine_dict : dict
+        The running engines, {engine key: LaunchedEngine or BatchEngine}.
+    poll_time_s : float, default=0.05
+        The time (s) between the checks for the engines which can not be
+        waited on with a file descriptor, and between the reads of the
+        engine log files.
+    log_follower_list : list of EngineLogFollower, optional, default=None
+        The engine log files which are read while the engines are running.
+    engine_watchdog_dict : dict, optional, default=None
+        The energy checks for the running engines,
+        {engine key: EngineWatchdog}.  All the engines are stopped when an
+        engine fails the checks, and the log files are read while the
+        engines are running.
 
     Returns
     ---------
-    gomc_newdir : str
-        The full path/directory of the created GOMC run/box number,
-        which contains the control file.
+    engine_done_dict : dict
+        The exit status and end time of each engine,
+        {engine key: [exit_status, datetime.datetime]}.
+    """
+    if log_follower_list is None:
+        log_follower_list = []
+    if engine_watchdog_dict is None:
+        engine_watchdog_dict = {}
+    log_follower_list = list(log_follower_list)
+    for engine_watchdog in engine_watchdog_dict.values():
+        if engine_watchdog.log_follower not in log_follower_list:
+            log_follower_list.append(engine_watchdog.log_follower)
+
+    engine_done_dict = {}
+    engine_selector = selectors.DefaultSelector()
+    no_fileno_engines = len(log_follower_list) > 0
+    for engine_key, exec_engine in exec_engine_dict.items():
+        if exec_engine.fileno() is None:
+            no_fileno_engines = True
+        else:
+            engine_selector.register(
+                exec_engine.fileno(), selectors.EVENT_READ, engine_key
+            )
 
-    Notes
-    ---------
-    The box angles are not currently available and are default set to 90 degress.
-    they can be added later, but for now all simulation but be orthoganol boxes
+    try:
+        while len(engine_done_dict) < len(exec_engine_dict):
+            for engine_key, exec_engine in exec_engine_dict.items():
+                if engine_key in engine_done_dict:
+                    continue
+                exit_status = exec_engine.poll_done()
+                if exit_status is not None:
+                    engine_done_dict[engine_key] = [
+                        exit_status,
+                        datetime.datetime.today(),
+                    ]
+                    if exec_engine.fileno() is not None:
+                        engine_selector.unregister(exec_engine.fileno())
+
+            if len(engine_done_dict) < len(exec_engine_dict):
+                if len(engine_selector.get_map()) == 0:
+                    select.select([], [], [], poll_time_s)
+                else:
+                    engine_selector.select(
+                        timeout=poll_time_s if no_fileno_engines else None
+                    )
+                for log_follower in log_follower_list:
+                    log_follower.read_new_lines()
+                # stop all the engines if one fails the checks, as the
+                # hybrid simulation can not continue
+                if True in [
+                    engine_key not in engine_done_dict
+                    and engine_watchdog.check() is not None
+                    for engine_key, engine_watchdog in engine_watchdog_dict.items()
+                ]:
+                    for engine_key, exec_engine in exec_engine_dict.items():
+                        if engine_key not in engine_done_dict:
+                            exec_engine.kill()
+    finally:
+        engine_selector.close()
+
+    return engine_done_dict
+
+
+# the placeholders in the NAMD and GOMC control file templates
+namd_conf_placeholder_list = [
+    "all_parameter_files",
+    "pdb_box_file",
+    "psf_box_file",
+    "coor_file",
+    "xsc_file",
+    "vel_file",
+    "Bool_restart",
+    "x_dim_box",
+    "y_dim_box",
+    "z_dim_box",
+    "x_origin_box",
+    "y_origin_box",
+    "z_origin_box",
+    "NAMD_Run_Steps",
+    "NAMD_Minimize",
+    "NAMD_RST_DCD_XST_Steps",
+    "NAMD_console_BLKavg_E_and_P_Steps",
+    "NAMD_console_E_Steps",
+    "current_step",
+    "System_temp_set",
+    "System_press_set",
+    "X_PME_GRID_DIM",
+    "Y_PME_GRID_DIM",
+    "Z_PME_GRID_DIM",
+]
+
+gomc_conf_placeholder_list = [
+    "all_parameter_files",
+    "Restart_Checkpoint_file",
+    "restart_true_or_false",
+    "pdb_file_box_0_file",
+    "psf_file_box_0_file",
+    "pdb_file_box_1_file",
+    "psf_file_box_1_file",
+    "coor_box_0_file",
+    "xsc_box_0_file",
+    "vel_box_0_file",
+    "coor_box_1_file",
+    "xsc_box_1_file",
+    "vel_box_1_file",
+    "x_dim_box_0",
+    "y_dim_box_0",
+    "z_dim_box_0",
+    "x_dim_box_1",
+    "y_dim_box_1",
+    "z_dim_box_1",
+    "GOMC_Run_Steps",
+    "GOMC_Equilb_Steps",
+    "GOMC_Adj_Steps",
+    "GOMC_RST_Coor_CKpoint_Steps",
+    "GOMC_console_BLKavg_Hist_Steps",
+    "GOMC_console_Steps",
+    "GOMC_Hist_sample_Steps",
+    "System_temp_set",
+    "System_press_set",
+    "mu_ChemPot_K_or_P_Fugacitiy_bar_all",
+]
+
+
+class ConfigTemplate:
     """
+    A NAMD or GOMC control file template, which is parsed once into its
+    fixed text and placeholder slots, so each control file is written
+    in a single pass.
 
-    # Create the GOMC configuration file
-    gomc_template_file = open(
-        "{}/{}".format(str(python_file_directory), path_gomc_template), "r"
-    )
-    gomc_template_data = gomc_template_file.read()
-    gomc_template_file.close()
-    gomc_newdir = "{}/{}/{}{}".format(
-        str(python_file_directory),
-        path_gomc_runs,
-        str(add_zeros_at_start_run_no_str),
-        str(run_no),
-    )
+    Parameters
+    ----------
+    template_data : str
+        The control file template text.
+    placeholder_list : list of str
+        The placeholder names in the template (i.e., "NAMD_Run_Steps").
+        Like the str.replace function, the placeholders are found anywhere
+        in the template text, and the longest placeholder is used if one
+        placeholder contains another.
+
+    Attributes
+    ----------
+    placeholder_list : list of str
+        The placeholders which are in the template.
+    template_line_list : list of [list of str, list of str]
+        The [first two words, text parts] for each template line, where
+        the odd text parts are the placeholder names.
+    """
 
-    os.makedirs(gomc_newdir, exist_ok=True)
+    def __init__(self, template_data, placeholder_list):
+        self.placeholder_list = [
+            placeholder_i
+            for placeholder_i in dict.fromkeys(placeholder_list)
+            if placeholder_i in template_data
+        ]
+
+        placeholder_regex = None
+        if len(self.placeholder_list) > 0:
+            placeholder_regex = re.compile(
+                "({})".format(
+                    "|".join(
+                        re.escape(placeholder_i)
+                        for placeholder_i in sorted(
+                            self.placeholder_list, key=len, reverse=True
+                        )
+                    )
+                )
+            )
 
-    previous_namd_box_0_rel_path = os.path.relpath(
-        namd_box_0_newdir, gomc_newdir
-    )
+        self.template_line_list = []
+        for line in template_data.splitlines(keepends=True):
+            if placeholder_regex is None:
+                line_parts = [line]
+            else:
+                line_parts = placeholder_regex.split(line)
+            self.template_line_list.append([line.split()[0:2], line_parts])
+
+    @classmethod
+    def from_file(cls, template_filename, placeholder_list):
+        """
+        Reads and parses a NAMD or GOMC control file template.
+
+        Parameters
+        ----------
+        template_filename : str
+            The path/filename of the control file template.
+        placeholder_list : list of str
+            The placeholder names in the template.
+
+        Returns
+        ---------
+        ConfigTemplate
+            The parsed control file template.
+        """
+        with open(template_filename, "r") as template_file:
+            return cls(template_file.read(), placeholder_list)
+
+    def fill(self, placeholder_value_dict):
+        """
+        Fills in some of the placeholders, so the values which are the same
+        for the whole simulation are only written into the template once.
+
+        Parameters
+        ----------
+        placeholder_value_dict : dict, {str: str, int or float}
+            The placeholder names and their values.  The placeholders which
+            are not in the template are not used.
+
+        Returns
+        ---------
+        ConfigTemplate
+            The control file template, with the placeholders filled in.
+            The other placeholders and the removed lines are used as in
+            this template.
+        """
+        filled_template = copy.copy(self)
+        filled_template.placeholder_list = [
+            placeholder_i
+            for placeholder_i in self.placeholder_list
+            if placeholder_i not in placeholder_value_dict
+        ]
+        filled_template.template_line_list = []
+        for line_words, line_parts in self.template_line_list:
+            filled_line_parts = [line_parts[0]]
+            for part_i in range(1, len(line_parts), 2):
+                placeholder_i = line_parts[part_i]
+                if placeholder_i in placeholder_value_dict:
+                    filled_line_parts[-1] += "{}{}".format(
+                        str(placeholder_value_dict[placeholder_i]),
+                        line_parts[part_i + 1],
+                    )
+                else:
+                    filled_line_parts += [placeholder_i, line_parts[part_i + 1]]
+            filled_template.template_line_list.append(
+                [line_words, filled_line_parts]
+            )
 
-    write_log_data = "*************************************************" + " \n"
-    log_template_file.write(str(write_log_data))
-    print(str(write_log_data))
+        return filled_template
+
+    def render(self, placeholder_value_dict, removed_line_list=None):
+        """
+        Fills in the placeholders, to get the control file text.
+
+        Parameters
+        ----------
+        placeholder_value_dict : dict, {str: str, int or float}
+            The placeholder names and their values.  The placeholders which
+            are not in the template are not used.
+        removed_line_list : list of [str, str], optional, default=None
+            The template lines which are not written, selected by their first
+            two words (i.e., [["binCoordinates", "1"]]).
+
+        Returns
+        ---------
+        str
+            The control file text.
+
+        Raises
+        ---------
+        ValueError
+            If a placeholder in the written template lines has no value.
+        """
+        if removed_line_list is None:
+            removed_line_list = []
+
+        rendered_text_list = []
+        missing_placeholder_list = []
+        for line_words, line_parts in self.template_line_list:
+            if line_words in removed_line_list:
+                continue
+
+            rendered_text_list.append(line_parts[0])
+            for part_i in range(1, len(line_parts), 2):
+                placeholder_i = line_parts[part_i]
+                if placeholder_i in placeholder_value_dict:
+                    rendered_text_list.append(
+                        str(placeholder_value_dict[placeholder_i])
+                    )
+                else:
+                    missing_placeholder_list.append(placeholder_i)
+                rendered_text_list.append(line_parts[part_i + 1])
 
-    generate_gomc_file = open("{}/in.conf".format(gomc_newdir), "w")
+        if len(missing_placeholder_list) > 0:
+            raise ValueError(
+                "The {} placeholder(s) in the control file template "
+                "were not filled.\n".format(
+                    list(dict.fromkeys(missing_placeholder_list))
+                )
+            )
 
-    gomc_starting_ff_files = ""
-    for gomc_ff_i in starting_ff_file_list_gomc:
-        gomc_ff_i = os.path.relpath(gomc_ff_i, gomc_newdir)
-        gomc_starting_ff_files = (
-            gomc_starting_ff_files + "Parameters \t {}\n".format(gomc_ff_i)
-        )
+        return "".join(rendered_text_list)
 
-    new_gomc_data = gomc_template_data.replace(
-        "all_parameter_files", str(gomc_starting_ff_files)
-    )
 
-    new_gomc_data = new_gomc_data.replace(
-        "coor_box_0_file",
-        "{}/namdOut.restart.coor".format(previous_namd_box_0_rel_path),
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "xsc_box_0_file",
-        "{}/namdOut.restart.xsc" "".format(previous_namd_box_0_rel_path),
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "vel_box_0_file",
-        "{}/namdOut.restart.vel" "".format(previous_namd_box_0_rel_path),
-    )
+def read_last_line(read_file, block_size=4096):
+    """
+    Reads the last (non-empty) line of a text file, by reading blocks
+    backwards from the end of the file, so only the end of the file is read.
 
-    if previous_gomc_dir == "NA":
-        new_gomc_data = new_gomc_data.replace(
-            "Restart_Checkpoint_file",
-            "false {}" "".format("Output_data_restart.chk"),
-        )
+    Parameters
+    ----------
+    read_file : str
+        The path/filename of the text file.
+    block_size : int, default=4096
+        The number of bytes read at a time.
 
-        gomc_starting_pdb_rel_path_box_0 = os.path.relpath(
-            "{}/{}".format(str(python_file_directory), starting_pdb_box_0_file),
-            gomc_newdir,
-        )
-        new_gomc_data = new_gomc_data.replace(
-            "pdb_file_box_0_file", "{}".format(gomc_starting_pdb_rel_path_box_0)
-        )
+    Returns
+    ---------
+    str
+        The last non-empty line of the file, or an empty string if
+        the file has no non-empty lines.
+    """
+    with open(read_file, "rb") as text_file:
+        read_position = text_file.seek(0, os.SEEK_END)
+        end_data = b""
+        while read_position > 0:
+            read_size = min(block_size, read_position)
+            read_position -= read_size
+            text_file.seek(read_position)
+            end_data = text_file.read(read_size) + end_data
 
-        gomc_starting_psf_rel_path_box_0 = os.path.relpath(
-            "{}/{}".format(str(python_file_directory), starting_psf_box_0_file),
-            gomc_newdir,
-        )
-        new_gomc_data = new_gomc_data.replace(
-            "psf_file_box_0_file", "{}".format(gomc_starting_psf_rel_path_box_0)
-        )
-    else:
-        previous_gomc_rel_path = os.path.relpath(previous_gomc_dir, gomc_newdir)
-        new_gomc_data = new_gomc_data.replace(
-            "pdb_file_box_0_file",
-            "{}/Output_data_BOX_0_restart.pdb".format(previous_gomc_rel_path),
-        )
-        new_gomc_data = new_gomc_data.replace(
-            "psf_file_box_0_file",
-            "{}/Output_data_BOX_0_restart.psf".format(previous_gomc_rel_path),
-        )
-
-    # Read the angles from the intial/starting PDB file
-    namd_xsc_box_0_file = "{}/namdOut.restart.xsc".format(namd_box_0_newdir)
-    read_namd_xsc_box_0_file = open(namd_xsc_box_0_file, "r").readlines()
-
-    read_x_dim_box_0 = read_namd_xsc_box_0_file[-1].split()[1:2]
-    read_x_dim_box_0 = float(read_x_dim_box_0[0])
-    read_y_dim_box_0 = read_namd_xsc_box_0_file[-1].split()[5:6]
-    read_y_dim_box_0 = float(read_y_dim_box_0[0])
-    read_z_dim_box_0 = read_namd_xsc_box_0_file[-1].split()[9:10]
-    read_z_dim_box_0 = float(read_z_dim_box_0[0])
-
-    read_x_dim_origin_box_0 = read_namd_xsc_box_0_file[-1].split()[10:11]
-    read_x_dim_origin_box_0 = float(read_x_dim_origin_box_0[0])
-    read_y_dim_origin_box_0 = read_namd_xsc_box_0_file[-1].split()[11:12]
-    read_y_dim_origin_box_0 = float(read_y_dim_origin_box_0[0])
-    read_z_dim_origin_box_0 = read_namd_xsc_box_0_file[-1].split()[12:13]
-    read_z_dim_origin_box_0 = float(read_z_dim_origin_box_0[0])
-
-    new_gomc_data = new_gomc_data.replace("x_dim_box_0", str(read_x_dim_box_0))
-    new_gomc_data = new_gomc_data.replace("y_dim_box_0", str(read_y_dim_box_0))
-    new_gomc_data = new_gomc_data.replace("z_dim_box_0", str(read_z_dim_box_0))
-
-    if simulation_type in ["GEMC", "GCMC"]:
-        readlines_gomc_template_file = open(
-            "{}/{}".format(str(python_file_directory), path_gomc_template), "r"
-        ).readlines()
-        if simulation_type in ["GCMC"] or (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is True
-        ):
-            if previous_gomc_dir == "NA":
-                for i, line in enumerate(readlines_gomc_template_file):
-                    split_line = line.split()
-                    if (
-                        line.startswith("binCoordinates") is True
-                        or line.startswith("extendedSystem") is True
-                        or line.startswith("binVelocities")
-                    ):
-                        if (
-                            split_line[0] == "binCoordinates"
-                            and split_line[1] == "1"
-                        ):
-                            new_gomc_data = new_gomc_data.replace(line, "")
-                        elif (
-                            split_line[0] == "extendedSystem"
-                            and split_line[1] == "1"
-                        ):
-                            new_gomc_data = new_gomc_data.replace(line, "")
-                        elif (
-                            split_line[0] == "binVelocities"
-                            and split_line[1] == "1"
-                        ):
-                            new_gomc_data = new_gomc_data.replace(line, "")
+            # the last line is complete if a new line is before it
+            if b"\n" in end_data.rstrip():
+                break
 
-                read_pdb_file = open(
-                    "{}/{}".format(
-                        str(python_file_directory), starting_pdb_box_1_file
-                    ),
-                    "r",
-                ).readlines()
-
-                read_x_dim_box_1 = None
-                read_y_dim_box_1 = None
-                read_z_dim_box_1 = None
-                read_angle_alpha = None
-                read_angle_beta = None
-                read_angle_gamma = None
-                # Read the angles from the intial/starting PDB file
-                for i, line in enumerate(read_pdb_file):
-                    if "CRYST1" in line:
-                        read_x_dim_box_1 = read_pdb_file[i].split()[1:2]
-                        read_x_dim_box_1 = float(read_x_dim_box_1[0])
-                        read_x_dim_box_1_origin = read_x_dim_box_1 / 2
-                        read_y_dim_box_1 = read_pdb_file[i].split()[2:3]
-                        read_y_dim_box_1 = float(read_y_dim_box_1[0])
-                        read_y_dim_box_1_origin = read_y_dim_box_1 / 2
-                        read_z_dim_box_1 = read_pdb_file[i].split()[3:4]
-                        read_z_dim_box_1 = float(read_z_dim_box_1[0])
-                        read_z_dim_box_1_origin = read_z_dim_box_1 / 2
-
-                        read_angle_alpha = read_pdb_file[i].split()[4:5]
-                        read_angle_alpha = read_angle_alpha[0]
-                        read_angle_beta = read_pdb_file[i].split()[5:6]
-                        read_angle_beta = read_angle_beta[0]
-                        read_angle_gamma = read_pdb_file[i].split()[6:7]
-                        read_angle_gamma = read_angle_gamma[0]
-
-                gomc_used_x_dim = check_for_pdb_dims_and_override(
-                    "x",
-                    run_no,
-                    read_x_dim_box_1,
-                    set_dim=set_dims_box_1_list[0],
-                    only_on_run_no=1,
-                )
-                gomc_used_y_dim = check_for_pdb_dims_and_override(
-                    "y",
-                    run_no,
-                    read_y_dim_box_1,
-                    set_dim=set_dims_box_1_list[1],
-                    only_on_run_no=1,
-                )
-                gomc_used_z_dim = check_for_pdb_dims_and_override(
-                    "z",
-                    run_no,
-                    read_z_dim_box_1,
-                    set_dim=set_dims_box_1_list[2],
-                    only_on_run_no=1,
-                )
+    end_line_list = end_data.rstrip().splitlines()
+    if len(end_line_list) == 0:
+        return ""
 
-                new_gomc_data = new_gomc_data.replace(
-                    "x_dim_box_1", str(gomc_used_x_dim)
-                )
-                new_gomc_data = new_gomc_data.replace(
-                    "y_dim_box_1", str(gomc_used_y_dim)
-                )
-                new_gomc_data = new_gomc_data.replace(
-                    "z_dim_box_1", str(gomc_used_z_dim)
-                )
+    return end_line_list[-1].decode()
 
+
+def read_xsc_box_dims(read_xsc_file):
+    """
+    Reads the box dimensions and origin from the last line of a
+    NAMD or GOMC xsc file, without reading the rest of the file.
+
+    Parameters
+    ----------
+    read_xsc_file : str
+        The path/filename of the xsc file.
+
+    Returns
+    ---------
+    box_dims : list of three floats
+        The x, y, and z-dimensions of the box in Angstroms.
+    box_origins : list of three floats
+        The x, y, and z-origins of the box in Angstroms.
+    """
+    xsc_last_line = read_last_line(read_xsc_file).split()
+
+    box_dims = [
+        float(xsc_last_line[1]),
+        float(xsc_last_line[5]),
+        float(xsc_last_line[9]),
+    ]
+    box_origins = [
+        float(xsc_last_line[10]),
+        float(xsc_last_line[11]),
+        float(xsc_last_line[12]),
+    ]
+    return box_dims, box_origins
+
+
+def read_pdb_cryst1(read_pdb_file):
+    """
+    Reads the box dimensions and angles from the CRYST1 line of a PDB file.
+    The CRYST1 line is in the PDB header, so the file is only read up to the
+    CRYST1 line or the first atom (ATOM or HETATM) line.
+
+    Parameters
+    ----------
+    read_pdb_file : str
+        The path/filename of the PDB file.
+
+    Returns
+    ---------
+    box_dims : list of three floats or None
+        The x, y, and z-dimensions of the box in Angstroms,
+        which are None if the PDB file has no CRYST1 line.
+    box_angles : list of three floats or None
+        The alpha, beta, and gamma angles of the box in degrees,
+        which are None if the PDB file has no CRYST1 line.
+    """
+    box_dims = [None, None, None]
+    box_angles = [None, None, None]
+    with open(read_pdb_file, "r") as pdb_file:
+        for line in pdb_file:
+            if "CRYST1" in line:
+                split_line = line.split()
+                box_dims = [float(dim_i) for dim_i in split_line[1:4]]
+                box_angles = [float(angle_i) for angle_i in split_line[4:7]]
+                break
+            elif line.startswith("ATOM") or line.startswith("HETATM"):
+                break
+
+    return box_dims, box_angles
+
+
+class BoxState:
+    """
+    The restart files and box dimensions of a simulation box, as written by
+    the engine (NAMD or GOMC) which last ran the box, or the starting
+    PDB and PSF files.
+
+    Parameters
+    ----------
+    box_number : int
+        The simulation box number, which can only be 0 or 1.
+    engine : str
+        The engine which wrote the box ("NAMD" or "GOMC"), or "start" for the
+        starting PDB and PSF files.
+    run_directory : str, optional, default=None
+        The full path/directory of the NAMD or GOMC run.
+        It is not used for the starting files (engine="start").
+    pdb_file : str, optional, default=None
+        The full path/filename of the PDB file.  This is needed for
+        the starting files and NAMD, as NAMD does not write a PDB file.
+    psf_file : str, optional, default=None
+        The full path/filename of the PSF file.  This is needed for
+        the starting files and NAMD, as NAMD does not write a PSF file.
+
+    Attributes
+    ----------
+    restart_file_dict : dict, {str: str or None}
+        The full path/filenames of the box "coor", "xsc", "vel", "pdb"
+        and "psf" files.  The "coor", "xsc" and "vel" files are None
+        for the starting files.
+
+    Notes
+    ---------
+    The box dimensions are only read from the files the first time they are
+    used, and are then kept, so the files are not read again by the next
+    NAMD or GOMC control file.
+    """
+
+    def __init__(
+        self,
+        box_number,
+        engine,
+        run_directory=None,
+        pdb_file=None,
+        psf_file=None,
+    ):
+        if engine not in ["NAMD", "GOMC", "start"]:
+            raise ValueError(
+                "The engine must be 'NAMD', 'GOMC' or 'start', "
+                "engine = {}.\n".format(engine)
+            )
+
+        self.box_number = box_number
+        self.engine = engine
+        self.run_directory = run_directory
+
+        if engine == "NAMD":
+            restart_file_prefix = "{}/namdOut.restart".format(run_directory)
+        elif engine == "GOMC":
+            restart_file_prefix = "{}/Output_data_BOX_{}_restart".format(
+                run_directory, str(box_number)
+            )
+            pdb_file = "{}.pdb".format(restart_file_prefix)
+            psf_file = "{}.psf".format(restart_file_prefix)
+
+        self.restart_file_dict = {"pdb": pdb_file, "psf": psf_file}
+        for extension_i in ["coor", "xsc", "vel"]:
+            if engine == "start":
+                self.restart_file_dict[extension_i] = None
+            else:
+                self.restart_file_dict[extension_i] = "{}.{}".format(
+                    restart_file_prefix, extension_i
+                )
+
+        self._xsc_box_dims = None
+        self._pdb_box_dims = None
+
+    def get_xsc_box_dims(self):
+        """
+        Gets the box dimensions and origin from the xsc file.
+
+        Returns
+        ---------
+        box_dims : list of three floats
+            The x, y, and z-dimensions of the box in Angstroms.
+        box_origins : list of three floats
+            The x, y, and z-origins of the box in Angstroms.
+        """
+        if self._xsc_box_dims is None:
+            self._xsc_box_dims = read_xsc_box_dims(
+                self.restart_file_dict["xsc"]
+            )
+
+        return self._xsc_box_dims
+
+    def get_pdb_box_dims(self):
+        """
+        Gets the box dimensions and angles from the PDB file CRYST1 line.
+
+        Returns
+        ---------
+        box_dims : list of three floats or None
+            The x, y, and z-dimensions of the box in Angstroms.
+        box_angles : list of three floats or None
+            The alpha, beta, and gamma angles of the box in degrees.
+        """
+        if self._pdb_box_dims is None:
+            self._pdb_box_dims = read_pdb_cryst1(self.restart_file_dict["pdb"])
+
+        return self._pdb_box_dims
+
+    def get_journal_data(self):
+        """
+        Gets the box state data which is written to the simulation journal,
+        so the box state can be recreated when the simulation is resumed.
+
+        Returns
+        ---------
+        journal_data : dict
+            The box number, engine, run directory and restart files.
+        """
+        return {
+            "box_number": self.box_number,
+            "engine": self.engine,
+            "run_directory": self.run_directory,
+            "restart_file_dict": self.restart_file_dict,
+        }
+
+    @classmethod
+    def from_journal_data(cls, journal_data):
+        """
+        Recreates the box state from the simulation journal data.
+
+        Parameters
+        ----------
+        journal_data : dict
+            The box state data, as written by the get_journal_data method.
+
+        Returns
+        ---------
+        BoxState
+            The recreated box state.
+        """
+        return cls(
+            journal_data["box_number"],
+            journal_data["engine"],
+            journal_data["run_directory"],
+            pdb_file=journal_data["restart_file_dict"]["pdb"],
+            psf_file=journal_data["restart_file_dict"]["psf"],
+        )
+
+
+class CycleState:
+    """
+    The simulation state which is handed from one engine to the next,
+    which is the last run number, the current step and the state of each box.
+
+    Attributes
+    ----------
+    run_no : int or None
+        The run number which last updated the state.
+    current_step : int or None
+        The current step at the end of the run which last updated the state.
+    box_state_dict : dict, {int: BoxState}
+        The box states, {box_number: BoxState}.
+    """
+
+    def __init__(self):
+        self.run_no = None
+        self.current_step = None
+        self.box_state_dict = {}
+
+    def update(self, run_no, current_step, box_state_list):
+        """
+        Updates the state after a NAMD or GOMC run.
+
+        Parameters
+        ----------
+        run_no : int
+            The run number which wrote the box states.
+        current_step : int
+            The current step at the end of the run.
+        box_state_list : list of BoxState
+            The box states written by the run.  The other boxes are not
+            changed.
+        """
+        self.run_no = run_no
+        self.current_step = current_step
+        for box_state_i in box_state_list:
+            self.box_state_dict[box_state_i.box_number] = box_state_i
+
+
+def read_journal_last_cycle_record(
+    journal_filename, read_block_size=65536, run_no=None
+):
+    """
+    Reads the last finished cycle record from the simulation journal, which
+    is the finish record of the last GOMC run.  The journal is read
+    backwards from the end, so only the last records are read.
+
+    Parameters
+    ----------
+    journal_filename : str
+        The path/filename of the simulation journal
+        (i.e., NAMD_GOMC_journal.jsonl).
+    read_block_size : int, default=65536
+        The number of bytes read at a time from the end of the journal.
+    run_no : int or None, default=None
+        The GOMC run number of the finished cycle record.  If None, the
+        record of the last GOMC run is read.  If the run was run more than
+        once (i.e., after a restart), the last record of the run is read.
+
+    Returns
+    ---------
+    journal_record : dict or None
+        The finish record of the last GOMC run (or the run_no GOMC run), or
+        None if no cycle (or the run_no GOMC run) has finished.  A partly
+        written last record (i.e., if the simulation was killed while
+        writing it) is skipped.
+    """
+    with open(journal_filename, "rb") as journal_file:
+        journal_file.seek(0, os.SEEK_END)
+        block_end = journal_file.tell()
+        line_remainder = b""
+        while block_end > 0:
+            block_start = max(0, block_end - read_block_size)
+            journal_file.seek(block_start)
+            journal_line_list = (
+                journal_file.read(block_end - block_start) + line_remainder
+            ).split(b"\n")
+            block_end = block_start
+            # the first line may start before this block
+            if block_start > 0:
+                line_remainder = journal_line_list.pop(0)
+
+            for journal_line in reversed(journal_line_list):
+                try:
+                    journal_record = json.loads(journal_line)
+                except ValueError:
+                    continue
+                if (
+                    isinstance(journal_record, dict)
+                    and journal_record.get("record") == "finish"
+                    and journal_record.get("engine") == "GOMC"
+                    and (
+                        run_no is None or journal_record.get("run_no") == run_no
+                    )
+                ):
+                    return journal_record
+
+    return None
+
+
+class SimulationJournal:
+    """
+    The append-only simulation journal, which has one record (json line)
+    for the start and finish of every NAMD or GOMC run.  Each record is
+    written to the disk (fsync) before the simulation continues, so the
+    journal always shows which runs finished, and the simulation can be
+    resumed from the last finished cycle (see the -resume flag).
+
+    Parameters
+    ----------
+    journal_filename : str
+        The path/filename of the simulation journal
+        (i.e., NAMD_GOMC_journal.jsonl).
+    append : bool, default=True
+        Add the records to the end of an existing journal.
+        If False, the existing journal records are deleted.
+    """
+
+    def __init__(self, journal_filename, append=True):
+        self.journal_filename = journal_filename
+        journal_file_exists = os.path.exists(journal_filename)
+        self._journal_file = open(journal_filename, "ab" if append else "wb")
+
+        # end a partly written last record, so it is not joined to the
+        # next record
+        if append and self._journal_file.tell() > 0:
+            with open(journal_filename, "rb") as journal_read_file:
+                journal_read_file.seek(-1, os.SEEK_END)
+                if journal_read_file.read(1) != b"\n":
+                    self._journal_file.write(b"\n")
+                    self._sync()
+
+        # the new journal file is only kept if its directory entry is synced
+        if not journal_file_exists:
+            journal_dir_fd = os.open(
+                os.path.dirname(os.path.abspath(journal_filename)),
+                os.O_RDONLY,
+            )
+            try:
+                os.fsync(journal_dir_fd)
+            finally:
+                os.close(journal_dir_fd)
+
+    def _sync(self):
+        self._journal_file.flush()
+        os.fsync(self._journal_file.fileno())
+
+    def write_record(self, journal_record):
+        """
+        Writes a record to the end of the journal, and waits for it to be
+        written to the disk.
+
+        Parameters
+        ----------
+        journal_record : dict
+            The record data, which must be json serializable.
+        """
+        journal_record = dict(journal_record)
+        journal_record["time"] = str(datetime.datetime.today())
+        self._journal_file.write(
+            (json.dumps(journal_record) + "\n").encode("utf-8")
+        )
+        self._sync()
+
+    def close(self):
+        """
+        Closes the journal file.
+        """
+        self._journal_file.close()
+
+
+def write_run_directory_archive(
+    archive_filename, run_directory_list, compression="gz"
+):
+    """
+    Packs the NAMD or GOMC run folders into one compressed tar archive, and
+    then deletes the run folders.  The first member of the archive is the
+    archive_index.json file, which lists the run folders and their files,
+    so the archive contents can be read without reading the whole archive.
+    The archive is written to a temporary file, which only replaces the
+    archive_filename after it is fully written to the disk, so the run
+    folders are only deleted when the archive is complete.
+
+    If the archive already exists, it is rewritten with the run folders
+    merged into it.  The run folders replace the same run folders in the
+    existing archive, and the other run folders in the existing archive
+    are kept.
+
+    Parameters
+    ----------
+    archive_filename : str
+        The full path/filename of the archive
+        (i.e., NAMD/archive_runs_0000000002_0000000018.tar.gz).
+    run_directory_list : list of str
+        The full path/directories of the run folders, which must all be in
+        the same folder as the archive.  The run folders which do not exist
+        are not added.
+    compression : str, default="gz"
+        The archive compression, "gz" (zlib) or "xz" (lzma).
+
+    Returns
+    ---------
+    archived_run_directory_list : list of str
+        The run folders which were added to the archive and deleted.
+    """
+    if compression not in ["gz", "xz"]:
+        raise ValueError(
+            "The compression must be 'gz' or 'xz', "
+            "compression = {}.\n".format(compression)
+        )
+
+    run_directory_list = [
+        run_directory_i
+        for run_directory_i in run_directory_list
+        if os.path.isdir(run_directory_i)
+    ]
+    if len(run_directory_list) == 0:
+        return run_directory_list
+
+    run_directory_name_list = [
+        os.path.basename(run_directory_i)
+        for run_directory_i in run_directory_list
+    ]
+
+    # the run folders and files which are kept from the existing archive
+    archive_index = {"run_directory_list": [], "member_list": []}
+    if os.path.exists(archive_filename):
+        with tarfile.open(archive_filename, "r:*") as existing_archive_file:
+            existing_archive_index = json.load(
+                existing_archive_file.extractfile("archive_index.json")
+            )
+        for run_directory_name in existing_archive_index["run_directory_list"]:
+            if run_directory_name not in run_directory_name_list:
+                archive_index["run_directory_list"].append(run_directory_name)
+        for member_name in existing_archive_index["member_list"]:
+            if member_name.split("/")[0] not in run_directory_name_list:
+                archive_index["member_list"].append(member_name)
+
+    for run_directory_i in run_directory_list:
+        run_directory_name = os.path.basename(run_directory_i)
+        archive_index["run_directory_list"].append(run_directory_name)
+        for walk_directory, _, walk_filename_list in os.walk(run_directory_i):
+            for walk_filename in sorted(walk_filename_list):
+                archive_index["member_list"].append(
+                    os.path.normpath(
+                        os.path.join(
+                            run_directory_name,
+                            os.path.relpath(walk_directory, run_directory_i),
+                            walk_filename,
+                        )
+                    )
+                )
+    archive_index["run_directory_list"].sort()
+    archive_index_bytes = json.dumps(archive_index).encode("utf-8")
+
+    archive_tmp_filename = "{}.tmp".format(archive_filename)
+    with tarfile.open(
+        archive_tmp_filename, "w:{}".format(compression)
+    ) as archive_file:
+        archive_index_info = tarfile.TarInfo("archive_index.json")
+        archive_index_info.size = len(archive_index_bytes)
+        archive_index_info.mtime = int(time.time())
+        archive_file.addfile(
+            archive_index_info, io.BytesIO(archive_index_bytes)
+        )
+        if os.path.exists(archive_filename):
+            with tarfile.open(archive_filename, "r:*") as existing_archive_file:
+                for existing_member_info in existing_archive_file:
+                    if (
+                        existing_member_info.name == "archive_index.json"
+                        or existing_member_info.name.split("/")[0]
+                        in run_directory_name_list
+                    ):
+                        continue
+                    if existing_member_info.isfile():
+                        archive_file.addfile(
+                            existing_member_info,
+                            existing_archive_file.extractfile(
+                                existing_member_info
+                            ),
+                        )
+                    else:
+                        archive_file.addfile(existing_member_info)
+        # the symbolic links (i.e., the NAMD FFT files) are kept as links
+        for run_directory_i in run_directory_list:
+            archive_file.add(
+                run_directory_i, arcname=os.path.basename(run_directory_i)
+            )
+
+    with open(archive_tmp_filename, "rb") as archive_tmp_file:
+        os.fsync(archive_tmp_file.fileno())
+    os.replace(archive_tmp_filename, archive_filename)
+    archive_dir_fd = os.open(
+        os.path.dirname(os.path.abspath(archive_filename)), os.O_RDONLY
+    )
+    try:
+        os.fsync(archive_dir_fd)
+    finally:
+        os.close(archive_dir_fd)
+
+    # only the run folders which were written to the archive are deleted
+    for run_directory_i in run_directory_list:
+        shutil.rmtree(run_directory_i)
+
+    return run_directory_list
+
+
+class HybridSimulationConfig:
+    """
+    The validated user inputs and derived settings for a hybrid
+    NAMD/GOMC simulation.
+
+    Parameters
+    ----------
+    json_file_data : dict
+        The user input data, which is normally read from the
+        user_input_NAMD_GOMC.json file.
+    namd_sim_order : str, default="series"
+        The order to run the NAMD simulations for the GEMC ensemble
+        when both boxes are run in NAMD ("series" or "parallel").
+    engine_mode : str, default="launch"
+        How the NAMD and GOMC engines are run ("launch", "batch" or
+        "resident").  The "launch" mode starts a new engine process for every
+        simulation, the "batch" mode submits a batch job script for every
+        simulation (see the BatchEngine class), and the "resident" mode keeps
+        one NAMD process running for all the NAMD simulations
+        (see the ResidentNamdEngine class, NVT and NPT ensembles only).
+    namd_core_pinning : bool, default=False
+        Pin the parallel NAMD box 0 and box 1 simulations to different
+        CPU cores (GEMC ensemble with namd_sim_order="parallel" only).
+    namd_core_rebalance : bool, default=False
+        Move CPU cores between the parallel NAMD box 0 and box 1 simulations
+        after each cycle, based on the measured box times
+        (GEMC ensemble with namd_sim_order="parallel" only).
+    resume : bool, default=False
+        Resume the simulation after the last finished cycle in the
+        simulation journal (NAMD_GOMC_journal.jsonl), instead of starting
+        at the starting_at_cycle_namd_gomc_sims cycle.  The journal is
+        read when the simulation is set up (see HybridSimulation.setup).
+    python_file_directory : str, optional, default=None
+        The path/directory which the simulation is run from, and all the
+        relative paths in the user input file are relative to.
+        If None, the current working directory is used.
+
+    Notes
+    ---------
+    All the validated variables are stored as attributes of the same name
+    as the variables in the user input file.
+    """
+
+    def __init__(
+        self,
+        json_file_data,
+        namd_sim_order="series",
+        engine_mode="launch",
+        namd_core_pinning=False,
+        namd_core_rebalance=False,
+        resume=False,
+        python_file_directory=None,
+    ):
+        if python_file_directory is None:
+            python_file_directory = os.getcwd()
+
+        if namd_sim_order not in ["series", "parallel"]:
+            raise ValueError(
+                "The namd_sim_order must be 'series' or 'parallel', "
+                "namd_sim_order = {}.\n".format(namd_sim_order)
+            )
+
+        if engine_mode not in ["launch", "batch", "resident"]:
+            raise ValueError(
+                "The engine_mode must be 'launch', 'batch' or 'resident', "
+                "engine_mode = {}.\n".format(engine_mode)
+            )
+
+        if isinstance(namd_core_pinning, bool) is False:
+            raise TypeError("The namd_core_pinning must be a bool.\n")
+        if isinstance(namd_core_rebalance, bool) is False:
+            raise TypeError("The namd_core_rebalance must be a bool.\n")
+        if isinstance(resume, bool) is False:
+            raise TypeError("The resume must be a bool.\n")
+
+        if isinstance(json_file_data, dict) is False:
+            raise TypeError("The json_file_data must be a dictionary.\n")
+        json_file_data_keys_list = json_file_data.keys()
+
+        # get the total_cycles_namd_gomc_sims variable from the json file
+        if "total_cycles_namd_gomc_sims" not in json_file_data_keys_list:
+            raise TypeError(
+                "The total_cycles_namd_gomc_sims key is not provided.\n"
+            )
+        total_cycles_namd_gomc_sims = json_file_data[
+            "total_cycles_namd_gomc_sims"
+        ]
+        if not isinstance(total_cycles_namd_gomc_sims, int):
+            raise TypeError(
+                "The total_cycles_namd_gomc_sims values must be an integer.\n"
+            )
+        else:
+            if total_cycles_namd_gomc_sims < 0:
+                raise TypeError(
+                    "The total_cycles_namd_gomc_sims values must be an integer "
+                    "greater than or equal to zero (>=0.\n"
+                )
+
+        # get the starting_at_cycle_namd_gomc_sims variable from the json file
+        if "starting_at_cycle_namd_gomc_sims" not in json_file_data_keys_list:
+            raise TypeError(
+                "The starting_at_cycle_namd_gomc_sims key is not provided.\n"
+            )
+        starting_at_cycle_namd_gomc_sims = json_file_data[
+            "starting_at_cycle_namd_gomc_sims"
+        ]
+        if not isinstance(starting_at_cycle_namd_gomc_sims, int):
+            raise TypeError(
+                "The starting_at_cycle_namd_gomc_sims values must be an integer.\n"
+            )
+        else:
+            if starting_at_cycle_namd_gomc_sims < 0:
+                raise TypeError(
+                    "The starting_at_cycle_namd_gomc_sims values must be an integer "
+                    "greater than or equal to zero (>=0.\n"
+                )
+
+        # the simulation journal, which the starting cycle is read from
+        # when the simulation is resumed
+        journal_filename = "{}/NAMD_GOMC_journal.jsonl".format(
+            str(python_file_directory)
+        )
+
+        # get the use_CPU_or_GPU variable from the json file
+        if "gomc_use_CPU_or_GPU" not in json_file_data_keys_list:
+            raise TypeError("The gomc_use_CPU_or_GPU key is not provided.\n")
+        gomc_use_CPU_or_GPU = json_file_data["gomc_use_CPU_or_GPU"]
+        if not isinstance(gomc_use_CPU_or_GPU, str):
+            raise TypeError("The gomc_use_CPU_or_GPU is not a string.\n")
+        if gomc_use_CPU_or_GPU != "CPU" and gomc_use_CPU_or_GPU != "GPU":
+            raise ValueError(
+                "The gomc_use_CPU_or_GPU is the string 'CPU' or 'GPU'.\n"
+            )
+
+        # get the simulation_type variable from the json file
+        if "simulation_type" not in json_file_data_keys_list:
+            raise TypeError("The simulation_type key is not provided.\n")
+        simulation_type = json_file_data["simulation_type"]
+        if not isinstance(simulation_type, str):
+            raise TypeError("The simulation_type is not a string.\n")
+        if simulation_type not in ["GEMC", "GCMC", "NPT", "NVT"]:
+            raise ValueError(
+                "The simulation_type is the string 'GEMC', 'GCMC', 'NPT', or 'NVT'.\n"
+            )
+
+        # get the only_use_box_0_for_namd_for_gemc variable from the json file
+        if "only_use_box_0_for_namd_for_gemc" not in json_file_data_keys_list:
+            raise TypeError(
+                "The only_use_box_0_for_namd_for_gemc key is not provided.\n"
+            )
+        only_use_box_0_for_namd_for_gemc = json_file_data[
+            "only_use_box_0_for_namd_for_gemc"
+        ]
+        if (
+            only_use_box_0_for_namd_for_gemc is not True
+            and only_use_box_0_for_namd_for_gemc is not False
+        ):
+            raise TypeError(
+                "The only_use_box_0_for_namd_for_gemc not true or false in the json file.\n"
+            )
+
+        # get the no_core_box_0 variable from the json file
+        if "no_core_box_0" not in json_file_data_keys_list:
+            raise TypeError("The no_core_box_0 key is not provided.\n")
+        no_core_box_0 = json_file_data["no_core_box_0"]
+        if not isinstance(no_core_box_0, int):
+            raise TypeError("The no_core_box_0 values must be an interger.\n")
+        else:
+            if (
+                only_use_box_0_for_namd_for_gemc is False
+                and simulation_type == "GEMC"
+            ):
+                if no_core_box_0 < 0:
+                    raise ValueError(
+                        "The no_core_box_{} values must be an interger greater "
+                        "than or equal to  zero (>=0)".format(0)
+                    )
+
+        # get the no_core_box_1 variable from the json file
+        if "no_core_box_1" not in json_file_data_keys_list:
+            raise TypeError("The no_core_box_1 key is not provided.\n")
+        no_core_box_1 = json_file_data["no_core_box_1"]
+        if not isinstance(no_core_box_1, int):
+            raise TypeError("The no_core_box_1 values must be an interger.\n")
+        else:
+            if (
+                only_use_box_0_for_namd_for_gemc is False
+                and simulation_type == "GEMC"
+            ):
+                if no_core_box_1 <= 0:
+                    raise ValueError(
+                        "The no_core_box_{} values must be an interger greater than zero (>0) "
+                        "when using only_use_box_0_for_namd_for_gemc is False and "
+                        'simulation_type == "GEMC" .\n'.format(1)
+                    )
+                if no_core_box_1 < 0:
+                    raise ValueError(
+                        "The no_core_box_{} values must be an interger greater "
+                        "than or equal to  zero (>=0)".format(1)
+                    )
+
+        # get the simulation_temp_k variable from the json file
+        if "simulation_temp_k" not in json_file_data_keys_list:
+            raise TypeError("The simulation_temp_k key is not provided.\n")
+        simulation_temp_k = json_file_data["simulation_temp_k"]
+        if not isinstance(simulation_temp_k, int) and not isinstance(
+            simulation_temp_k, float
+        ):
+            raise TypeError(
+                "The simulation_temp_k values must be an interger or float.\n"
+            )
+        else:
+            if simulation_temp_k <= 0:
+                raise ValueError(
+                    "The simulation_temp_k value must be an interger or float greater than zero (>0)"
+                )
+
+        # get the simulation_pressure_bar variable from the json file
+        if "simulation_pressure_bar" not in json_file_data_keys_list:
+            raise TypeError(
+                "The simulation_pressure_bar key is not provided.\n"
+            )
+        simulation_pressure_bar = json_file_data["simulation_pressure_bar"]
+        if simulation_type in ["NPT"]:
+            if not isinstance(simulation_pressure_bar, int) and not isinstance(
+                simulation_pressure_bar, float
+            ):
+                raise TypeError(
+                    "The simulation_pressure_bar values must be an interger or float.\n"
+                )
+            else:
+                if simulation_pressure_bar < 0:
+                    raise ValueError(
+                        "The simulation_pressure_bar value must be an interger or float greater "
+                        "than or equal to zero (>=0)"
+                    )
+        elif simulation_type in ["GEMC", "GCMC", "NVT"]:
+            if (
+                not isinstance(simulation_pressure_bar, int)
+                and not isinstance(simulation_pressure_bar, float)
+                and simulation_pressure_bar is not None
+            ):
+                raise TypeError(
+                    "The simulation_pressure_bar values must be an interger or float (>=0) or null/None.\n"
+                )
+
+        if simulation_type in ["GCMC"]:
+            # get the GCMC_ChemPot_or_Fugacity variable from the json file
+            if "GCMC_ChemPot_or_Fugacity" not in json_file_data_keys_list:
+                raise TypeError(
+                    "The GCMC_ChemPot_or_Fugacity key is not provided.\n"
+                )
+            GCMC_ChemPot_or_Fugacity = json_file_data[
+                "GCMC_ChemPot_or_Fugacity"
+            ]
+            if not isinstance(GCMC_ChemPot_or_Fugacity, str) or (
+                GCMC_ChemPot_or_Fugacity != "ChemPot"
+                and GCMC_ChemPot_or_Fugacity != "Fugacity"
+            ):
+                raise TypeError(
+                    'The GCMC_ChemPot_or_Fugacity values must be the string "ChemPot" or "Fugacity".\n'
+                )
+
+            # get the GCMC_ChemPot_or_Fugacity_dict variable from the json file
+            if "GCMC_ChemPot_or_Fugacity_dict" not in json_file_data_keys_list:
+                raise TypeError(
+                    "The GCMC_ChemPot_or_Fugacity_dict key is not provided.\n"
+                )
+            GCMC_ChemPot_or_Fugacity_dict = json_file_data[
+                "GCMC_ChemPot_or_Fugacity_dict"
+            ]
+            if not isinstance(GCMC_ChemPot_or_Fugacity_dict, dict):
+                raise TypeError(
+                    "The GCMC_ChemPot_or_Fugacity_dict values must a dictionary.\n"
+                )
+
+            GCMC_ChemPot_or_Fugacity_dict_to_list = (
+                GCMC_ChemPot_or_Fugacity_dict.keys()
+            )
+            if GCMC_ChemPot_or_Fugacity == "ChemPot":
+                for chempot_i in GCMC_ChemPot_or_Fugacity_dict_to_list:
+                    if not isinstance(
+                        GCMC_ChemPot_or_Fugacity_dict[chempot_i], int
+                    ) and not isinstance(
+                        GCMC_ChemPot_or_Fugacity_dict[chempot_i], float
+                    ):
+                        raise TypeError(
+                            "The GCMC_ChemPot_or_Fugacity_dict values must be floats or integers.\n"
+                        )
+            if GCMC_ChemPot_or_Fugacity == "Fugacity":
+                for fugacity_i in GCMC_ChemPot_or_Fugacity_dict_to_list:
+                    if not isinstance(
+                        GCMC_ChemPot_or_Fugacity_dict[fugacity_i], int
+                    ) and not isinstance(
+                        GCMC_ChemPot_or_Fugacity_dict[fugacity_i], float
+                    ):
+                        raise TypeError(
+                            "The GCMC_ChemPot_or_Fugacity_dict values must be floats or integers.\n"
+                        )
+                    if GCMC_ChemPot_or_Fugacity_dict[fugacity_i] < 0:
+                        raise ValueError(
+                            "The GCMC_ChemPot_or_Fugacity_dict values when using "
+                            'GCMC_ChemPot_or_Fugacity != "Fugacity", must be floats or integers '
+                            "greater than of equal to zero (>=) .\n"
+                        )
+        else:
+            GCMC_ChemPot_or_Fugacity = None
+            GCMC_ChemPot_or_Fugacity_dict = None
+
+        # get the gomc_run_steps variable from the json file
+        if "gomc_run_steps" not in json_file_data_keys_list:
+            raise TypeError("The gomc_run_steps key is not provided.\n")
+        gomc_run_steps = json_file_data["gomc_run_steps"]
+        if not isinstance(gomc_run_steps, int):
+            raise TypeError("The gomc_run_steps values must be an interger.\n")
+
+        # get the namd_run_steps variable from the json file
+        if "namd_run_steps" not in json_file_data_keys_list:
+            raise TypeError("The namd_run_steps key is not provided.\n")
+        namd_run_steps = json_file_data["namd_run_steps"]
+        if not isinstance(namd_run_steps, int):
+            raise TypeError("The namd_run_steps values must be an interger.\n")
+
+        # get the namd_minimize_mult_scalar variable from the json file
+        if "namd_minimize_mult_scalar" not in json_file_data_keys_list:
+            raise TypeError(
+                "The namd_minimize_mult_scalar key is not provided.\n"
+            )
+        namd_minimize_mult_scalar = json_file_data["namd_minimize_mult_scalar"]
+        if not isinstance(namd_run_steps, int):
+            raise TypeError(
+                "The namd_minimize_mult_scalar values must be an interger.\n"
+            )
+
+        # get the optional adaptive_cycle_steps variables from the json file
+        adaptive_cycle_steps = json_file_data.get("adaptive_cycle_steps", False)
+        if not isinstance(adaptive_cycle_steps, bool):
+            raise TypeError(
+                "The adaptive_cycle_steps values must be a bool (true or false).\n"
+            )
+
+        adaptive_cycle_steps_max_overhead_fraction = json_file_data.get(
+            "adaptive_cycle_steps_max_overhead_fraction", 0.1
+        )
+        if (
+            isinstance(adaptive_cycle_steps_max_overhead_fraction, bool)
+            or not isinstance(
+                adaptive_cycle_steps_max_overhead_fraction, (int, float)
+            )
+            or not 0 < adaptive_cycle_steps_max_overhead_fraction < 1
+        ):
+            raise ValueError(
+                "The adaptive_cycle_steps_max_overhead_fraction values must be "
+                "an int or float, which is greater than 0 and less than 1.\n"
+            )
+
+        adaptive_cycle_steps_mult_scalar_range = json_file_data.get(
+            "adaptive_cycle_steps_mult_scalar_range", [1, 10]
+        )
+        if (
+            not isinstance(adaptive_cycle_steps_mult_scalar_range, list)
+            or len(adaptive_cycle_steps_mult_scalar_range) != 2
+            or True
+            in [
+                isinstance(mult_scalar_i, bool)
+                or not isinstance(mult_scalar_i, (int, float))
+                for mult_scalar_i in adaptive_cycle_steps_mult_scalar_range
+            ]
+            or adaptive_cycle_steps_mult_scalar_range[0] <= 0
+            or adaptive_cycle_steps_mult_scalar_range[1]
+            < adaptive_cycle_steps_mult_scalar_range[0]
+        ):
+            raise ValueError(
+                "The adaptive_cycle_steps_mult_scalar_range values must be "
+                "a list of two int or float values, [minimum (>0), "
+                "maximum (>= minimum)].\n"
+            )
+
+        # get the optional engine_watchdog variables from the json file
+        engine_watchdog = json_file_data.get("engine_watchdog", False)
+        if not isinstance(engine_watchdog, bool):
+            raise TypeError(
+                "The engine_watchdog values must be a bool (true or false).\n"
+            )
+
+        engine_watchdog_max_energy_jump_fraction = json_file_data.get(
+            "engine_watchdog_max_energy_jump_fraction", None
+        )
+        if engine_watchdog_max_energy_jump_fraction is not None and (
+            isinstance(engine_watchdog_max_energy_jump_fraction, bool)
+            or not isinstance(
+                engine_watchdog_max_energy_jump_fraction, (int, float)
+            )
+            or engine_watchdog_max_energy_jump_fraction <= 0
+        ):
+            raise ValueError(
+                "The engine_watchdog_max_energy_jump_fraction values must be "
+                "null, or an int or float, which is greater than 0.\n"
+            )
+
+        engine_watchdog_min_energy_jump_kcal_per_mol = json_file_data.get(
+            "engine_watchdog_min_energy_jump_kcal_per_mol", 100
+        )
+        if (
+            isinstance(engine_watchdog_min_energy_jump_kcal_per_mol, bool)
+            or not isinstance(
+                engine_watchdog_min_energy_jump_kcal_per_mol, (int, float)
+            )
+            or engine_watchdog_min_energy_jump_kcal_per_mol < 0
+        ):
+            raise ValueError(
+                "The engine_watchdog_min_energy_jump_kcal_per_mol values must "
+                "be an int or float, which is greater than or equal to 0.\n"
+            )
+
+        engine_watchdog_stall_time_s = json_file_data.get(
+            "engine_watchdog_stall_time_s", None
+        )
+        if engine_watchdog_stall_time_s is not None and (
+            isinstance(engine_watchdog_stall_time_s, bool)
+            or not isinstance(engine_watchdog_stall_time_s, (int, float))
+            or engine_watchdog_stall_time_s <= 0
+        ):
+            raise ValueError(
+                "The engine_watchdog_stall_time_s values must be "
+                "null, or an int or float, which is greater than 0.\n"
+            )
+
+        engine_watchdog_no_energy_outputs = json_file_data.get(
+            "engine_watchdog_no_energy_outputs", 10
+        )
+        if (
+            isinstance(engine_watchdog_no_energy_outputs, bool)
+            or not isinstance(engine_watchdog_no_energy_outputs, int)
+            or engine_watchdog_no_energy_outputs < 1
+        ):
+            raise ValueError(
+                "The engine_watchdog_no_energy_outputs values must be "
+                "an int, which is greater than or equal to 1.\n"
+            )
+
+        # the resident NAMD engine keeps the atoms it was started with, and
+        # the NAMD output frequencies of its first simulation
+        if engine_mode == "resident":
+            if simulation_type not in ["NVT", "NPT"]:
+                raise ValueError(
+                    "The engine_mode 'resident' can only be used for the NVT "
+                    "and NPT ensembles, since the GCMC and GEMC ensembles "
+                    "change the number of atoms in the NAMD box, "
+                    "simulation_type = {}.\n".format(simulation_type)
+                )
+            if adaptive_cycle_steps is True:
+                raise ValueError(
+                    "The engine_mode 'resident' can not be used with the "
+                    "adaptive_cycle_steps, since the NAMD output frequencies "
+                    "can not be changed in the resident NAMD engine.\n"
+                )
+
+        # get the optional batch variables from the json file
+        batch_submit_command = json_file_data.get(
+            "batch_submit_command", ["sbatch"]
+        )
+        if (
+            not isinstance(batch_submit_command, list)
+            or len(batch_submit_command) == 0
+            or False
+            in [isinstance(arg_i, str) for arg_i in batch_submit_command]
+        ):
+            raise TypeError(
+                "The batch_submit_command values must be a list of strings, "
+                "with at least one string.\n"
+            )
+
+        batch_cancel_command = json_file_data.get(
+            "batch_cancel_command", ["scancel"]
+        )
+        if batch_cancel_command is not None and (
+            not isinstance(batch_cancel_command, list)
+            or len(batch_cancel_command) == 0
+            or False
+            in [isinstance(arg_i, str) for arg_i in batch_cancel_command]
+        ):
+            raise TypeError(
+                "The batch_cancel_command values must be null, or a list of "
+                "strings, with at least one string.\n"
+            )
+
+        batch_script_header_list = json_file_data.get(
+            "batch_script_header_list", []
+        )
+        if not isinstance(batch_script_header_list, list) or False in [
+            isinstance(line_i, str) for line_i in batch_script_header_list
+        ]:
+            raise TypeError(
+                "The batch_script_header_list values must be a list of "
+                "strings.\n"
+            )
+
+        batch_poll_time_s = json_file_data.get("batch_poll_time_s", 1)
+        if (
+            isinstance(batch_poll_time_s, bool)
+            or not isinstance(batch_poll_time_s, (int, float))
+            or batch_poll_time_s <= 0
+        ):
+            raise ValueError(
+                "The batch_poll_time_s values must be an int or float, "
+                "which is greater than 0.\n"
+            )
+
+        # get the optional compact_cycles variables from the json file
+        compact_cycles_block_size = json_file_data.get(
+            "compact_cycles_block_size", None
+        )
+        if compact_cycles_block_size is not None and (
+            isinstance(compact_cycles_block_size, bool)
+            or not isinstance(compact_cycles_block_size, int)
+            or compact_cycles_block_size <= 0
+        ):
+            raise ValueError(
+                "The compact_cycles_block_size values must be "
+                "null, or an integer, which is greater than 0.\n"
+            )
+
+        compact_cycles_compression = json_file_data.get(
+            "compact_cycles_compression", "gz"
+        )
+        if compact_cycles_compression not in ["gz", "xz"]:
+            raise ValueError(
+                "The compact_cycles_compression values must be the string "
+                "'gz' or 'xz'.\n"
+            )
+
+        # get the set_x_dim_box_0 variable from the json file
+        if "set_dims_box_0_list" not in json_file_data_keys_list:
+            raise TypeError("The set_dims_box_0_list key is not provided.\n")
+        set_dims_box_0_list = json_file_data["set_dims_box_0_list"]
+        if set_dims_box_0_list is not None:
+            print_error_text = (
+                "The set_dims_box_0_list must be a null/None or list and contain three (3) integers or floats"
+                "greater than zero (>0).\n"
+            )
+            if isinstance(set_dims_box_0_list, list):
+                if len(set_dims_box_0_list) == 3:
+                    for dims_box_i in set_dims_box_0_list:
+                        if (
+                            isinstance(dims_box_i, int) is False
+                            and isinstance(dims_box_i, float) is False
+                            and dims_box_i != None
+                        ):
+                            raise TypeError(print_error_text)
+                        else:
+                            if dims_box_i != None:
+                                if dims_box_i <= 0:
+                                    raise TypeError(print_error_text)
+                else:
+                    raise TypeError(print_error_text)
+            else:
+                raise TypeError(print_error_text)
+        elif set_dims_box_0_list is None:
+            set_dims_box_0_list = [None, None, None]
+
+        # get the set_x_dim_box_1 variable from the json file
+        if "set_dims_box_1_list" not in json_file_data_keys_list:
+            raise TypeError("The set_dims_box_1_list key is not provided.\n")
+        set_dims_box_1_list = json_file_data["set_dims_box_1_list"]
+        if set_dims_box_1_list is not None:
+            print_error_text = (
+                "The set_dims_box_1_list must be a null/None or list and contain three (3) integers or floats"
+                "greater than zero (>0).\n"
+            )
+            if isinstance(set_dims_box_1_list, list):
+                if len(set_dims_box_1_list) == 3:
+                    for dims_box_i in set_dims_box_1_list:
+                        if (
+                            isinstance(dims_box_i, int) is False
+                            and isinstance(dims_box_i, float) is False
+                            and dims_box_i != None
+                        ):
+                            raise TypeError(print_error_text)
+                        else:
+                            if dims_box_i != None:
+                                if dims_box_i <= 0:
+                                    raise TypeError(print_error_text)
+                else:
+                    raise TypeError(print_error_text)
+            else:
+                raise TypeError(print_error_text)
+        elif set_dims_box_1_list is None:
+            set_dims_box_1_list = [None, None, None]
+
+        # get the set_angle_box_0_list variable from the json file
+        if "set_angle_box_0_list" not in json_file_data_keys_list:
+            raise TypeError("The set_angle_box_0_list key is not provided.\n")
+        set_angle_box_0_list = json_file_data["set_angle_box_0_list"]
+        if set_angle_box_0_list is not None:
+            print_error_text = (
+                "The set_angle_box_0_list must be a null/None or 90 (in degrees). Currently,"
+                "only orthogonal boxes are available.\n"
+            )
+            if isinstance(set_angle_box_0_list, list):
+                if len(set_angle_box_0_list) == 3:
+                    for angles_box_i in set_angle_box_0_list:
+                        if (
+                            isinstance(angles_box_i, int) is False
+                            and isinstance(angles_box_i, float) is False
+                            and angles_box_i != None
+                        ):
+                            raise TypeError(print_error_text)
+                        else:
+                            if angles_box_i != None:
+                                if angles_box_i != 90:
+                                    raise TypeError(print_error_text)
+                else:
+                    raise TypeError(print_error_text)
+            else:
+                raise TypeError(print_error_text)
+        elif set_angle_box_0_list is None:
+            set_angle_box_0_list = [None, None, None]
+
+        # get the set_angle_box_1_list variable from the json file
+        if "set_angle_box_1_list" not in json_file_data_keys_list:
+            raise TypeError("The set_angle_box_1_list key is not provided.\n")
+        set_angle_box_1_list = json_file_data["set_angle_box_1_list"]
+        if set_angle_box_1_list is not None:
+            print_error_text = (
+                "The set_angle_box_1_list must be a null/None or 90 (in degrees). Currently,"
+                "only orthogonal boxes are available.\n"
+            )
+            if isinstance(set_angle_box_1_list, list):
+                if len(set_angle_box_1_list) == 3:
+                    for angles_box_i in set_angle_box_1_list:
+                        if (
+                            isinstance(angles_box_i, int) is False
+                            and isinstance(angles_box_i, float) is False
+                            and angles_box_i != None
+                        ):
+                            raise TypeError(print_error_text)
+                        else:
+                            if angles_box_i != None:
+                                if angles_box_i != 90:
+                                    raise TypeError(print_error_text)
+                else:
+                    raise TypeError(print_error_text)
+            else:
+                raise TypeError(print_error_text)
+        elif set_angle_box_1_list is None:
+            set_angle_box_1_list = [None, None, None]
+
+        # get the starting_ff_file_list_gomc variable from the json file
+        if "starting_ff_file_list_gomc" not in json_file_data_keys_list:
+            raise TypeError(
+                "The starting_ff_file_list_gomc key is not provided.\n"
+            )
+        starting_ff_file_list_gomc = json_file_data[
+            "starting_ff_file_list_gomc"
+        ]
+        if not isinstance(starting_ff_file_list_gomc, list):
+            raise TypeError(
+                "The starting_ff_file_list_gomc values must be a list of strings.\n"
+            )
+        else:
+            for start_ff_gomc_i in starting_ff_file_list_gomc:
+                if not isinstance(start_ff_gomc_i, str):
+                    raise TypeError(
+                        "The starting_ff_file_list_gomc list values must be strings.\n"
+                    )
+
+        # get the starting_ff_file_list_namd variable from the json file
+        if "starting_ff_file_list_namd" not in json_file_data_keys_list:
+            raise TypeError(
+                "The starting_ff_file_list_namd key is not provided.\n"
+            )
+        starting_ff_file_list_namd = json_file_data[
+            "starting_ff_file_list_namd"
+        ]
+        if not isinstance(starting_ff_file_list_namd, list):
+            raise TypeError(
+                "The starting_ff_file_list_namd values must be a list of strings.\n"
+            )
+        else:
+            for start_ff_gomc_i in starting_ff_file_list_namd:
+                if not isinstance(start_ff_gomc_i, str):
+                    raise TypeError(
+                        "The starting_ff_file_list_namd list values must be strings.\n"
+                    )
+
+        # get the starting_pdb_box_0_file variable from the json file
+        if "starting_pdb_box_0_file" not in json_file_data_keys_list:
+            raise TypeError(
+                "The starting_pdb_box_0_file key is not provided.\n"
+            )
+        starting_pdb_box_0_file = json_file_data["starting_pdb_box_0_file"]
+        if not isinstance(starting_pdb_box_0_file, str):
+            raise TypeError("The starting_pdb_box_0_file is not a string.\n")
+
+        # get the starting_psf_box_0_file variable from the json file
+        if "starting_psf_box_0_file" not in json_file_data_keys_list:
+            raise TypeError(
+                "The starting_psf_box_0_file key is not provided.\n"
+            )
+        starting_psf_box_0_file = json_file_data["starting_psf_box_0_file"]
+        if not isinstance(starting_psf_box_0_file, str):
+            raise TypeError("The starting_psf_box_0_file is not a string.\n")
+
+        if simulation_type in ["GCMC", "GEMC"]:
+            # get the starting_pdb_box_1_file variable from the json file
+            if "starting_pdb_box_1_file" not in json_file_data_keys_list:
+                raise TypeError(
+                    "The starting_pdb_box_1_file key is not provided.\n"
+                )
+            starting_pdb_box_1_file = json_file_data["starting_pdb_box_1_file"]
+            if not isinstance(starting_pdb_box_0_file, str):
+                raise TypeError(
+                    "The starting_pdb_box_1_file is not a string.\n"
+                )
+
+            # get the starting_psf_box_1_file variable from the json file
+            if "starting_psf_box_1_file" not in json_file_data_keys_list:
+                raise TypeError(
+                    "The starting_psf_box_1_file key is not provided.\n"
+                )
+            starting_psf_box_1_file = json_file_data["starting_psf_box_1_file"]
+            if not isinstance(starting_psf_box_1_file, str):
+                raise TypeError(
+                    "The starting_psf_box_1_file is not a string.\n"
+                )
+        else:
+            starting_pdb_box_1_file = ""
+            starting_psf_box_1_file = ""
+        # get the namd2_bin_directory variable from the json file
+        # json file specifies relative path to the directory where the namd2 is located
+        if "namd2_bin_directory" not in json_file_data_keys_list:
+            raise TypeError("The namd2_bin_directory key is not provided.\n")
+        namd2_bin_directory = json_file_data["namd2_bin_directory"]
+        if isinstance(namd2_bin_directory, str) is False:
+            raise TypeError(
+                "The namd2_bin_directory values must be an string.\n"
+            )
+        else:
+            namd_bin_file = "{}/{}/{}".format(
+                str(python_file_directory), namd2_bin_directory, "namd2"
+            )
+
+        # get the gomc_bin_directory variable from the json file
+        # json file specifies relative path to the directory where the GOMC_XXX_XXX binary files are located
+        if "gomc_bin_directory" not in json_file_data_keys_list:
+            raise TypeError("The gomc_bin_directory key is not provided.\n")
+        gomc_bin_directory = json_file_data["gomc_bin_directory"]
+        if isinstance(gomc_bin_directory, str) is False:
+            raise TypeError(
+                "The gomc_bin_directory values must be an string.\n"
+            )
+        else:
+            gomc_bin_file = "{}/{}/GOMC_{}_{}".format(
+                str(python_file_directory),
+                gomc_bin_directory,
+                gomc_use_CPU_or_GPU,
+                simulation_type,
+            )
+        gomc_ff_error_message = "ERROR: The GOMC force field(s) need to be provided as a list of string(s).\n"
+        namd_ff_error_message = "ERROR: The GOMC force field(s) need to be provided as a list of string(s).\n"
+        if isinstance(starting_ff_file_list_gomc, list) is False:
+            raise TypeError(gomc_ff_error_message)
+        if isinstance(starting_ff_file_list_namd, list) is False:
+            raise TypeError(namd_ff_error_message)
+
+        for gomc_ff_i in starting_ff_file_list_gomc:
+            if isinstance(gomc_ff_i, str) is False:
+                raise TypeError(gomc_ff_error_message)
+        for namd_ff_i in starting_ff_file_list_namd:
+            if isinstance(namd_ff_i, str) is False:
+                raise TypeError(namd_ff_error_message)
+
+        if simulation_type in ["GCMC"]:
+            if isinstance(GCMC_ChemPot_or_Fugacity_dict, dict) is False:
+                raise TypeError(
+                    "ERROR: enter the chemical potential or fugacity data (GCMC_ChemPot_or_Fugacity_dict)"
+                    "as a dictionary when using the GCMC ensemble.\n"
+                )
+
+            if GCMC_ChemPot_or_Fugacity is None:
+                raise ValueError(
+                    "The GCMC_ChemPot_or_Fugacity can not be None when running the GCMC ensemble.\n"
+                )
+            if (
+                GCMC_ChemPot_or_Fugacity != "ChemPot"
+                and GCMC_ChemPot_or_Fugacity != "Fugacity"
+            ):
+                raise ValueError(
+                    "The GCMC_ChemPot_or_Fugacity can either be the string "
+                    '"ChemPot" or "Fugacity" when running the GCMC ensemble.\n'
+                )
+
+            GCMC_ChemPot_or_Fugacity_dict_keys = (
+                GCMC_ChemPot_or_Fugacity_dict.keys()
+            )
+            for keys_i in GCMC_ChemPot_or_Fugacity_dict_keys:
+                if (
+                    isinstance(GCMC_ChemPot_or_Fugacity_dict[keys_i], int)
+                    is False
+                    and isinstance(GCMC_ChemPot_or_Fugacity_dict[keys_i], float)
+                    is False
+                ):
+                    raise TypeError(
+                        "The GCMC_ChemPot_or_Fugacity_dict values must be an interger or float.\n"
+                    )
+
+                if isinstance(keys_i, str) is False:
+                    raise TypeError(
+                        "The GCMC_ChemPot_or_Fugacity_dict keys must be a string.\n"
+                    )
+
+                if (
+                    GCMC_ChemPot_or_Fugacity == "Fugacity"
+                    and GCMC_ChemPot_or_Fugacity_dict[keys_i] < 0
+                ):
+                    raise ValueError(
+                        "When using Fugacity, the GCMC_ChemPot_or_Fugacity values must be "
+                        "greater than or equal to zero (>=0).\n"
+                    )
+
+        # check the pressure values and set to atomospheric if not used
+        if simulation_type in ["NPT"] and (
+            isinstance(simulation_pressure_bar, float) is False
+            and isinstance(simulation_pressure_bar, int) is False
+        ):
+            raise TypeError(
+                "The simulation pressure needs to be set for the NPT simulation type (int or float). \n"
+            )
+        if simulation_type in ["NPT"] and (
+            isinstance(simulation_pressure_bar, float) is True
+            or isinstance(simulation_pressure_bar, int) is True
+        ):
+            if simulation_pressure_bar < 0:
+                raise ValueError(
+                    "The simulation pressure needs to be set to a positive or zero [(int of float) >=0 bar] "
+                    "value for the NPT simulation type. \n"
+                )
+        elif simulation_type in ["NVT", "GEMC", "GCMC"]:
+            # set pressure to atomospheric as it needs a number and it is not used
+            simulation_pressure_bar = 1.01325
+
+        # *************************************************
+        # Potential changable variables in the future (start)
+        # *************************************************
+        allowable_error_fraction_vdw_plus_elec = 5 * 10 ** (-3)
+        allowable_error_fraction_potential = 5 * 10 ** (-3)
+        max_absolute_allowable_kcal_fraction_vdw_plus_elec = 0.5
+
+        (
+            namd_rst_dcd_xst_steps,
+            namd_console_blkavg_e_and_p_steps,
+            namd_console_e_steps,
+            gomc_rst_coor_ckpoint_steps,
+            gomc_console_blkavg_hist_steps,
+            gomc_console_steps,
+            gomc_hist_sample_steps,
+        ) = get_cycle_output_steps(
+            namd_run_steps,
+            gomc_run_steps,
+            no_watchdog_energy_outputs=(
+                engine_watchdog_no_energy_outputs if engine_watchdog else None
+            ),
+        )
+
+        # *************************************************
+        # NAMD and GOMC folders and config file templates locations (start)
+        # *************************************************
+        path_namd_runs = "NAMD"
+        path_gomc_runs = "GOMC"
+
+        path_namd_template = "required_data/config_files/NAMD.conf"
+
+        path_gomc_template = (
+            "required_data/config_files/GOMC_" + str(simulation_type) + ".conf"
+        )
+        # *************************************************
+        # NAMD and GOMC folders and config file templates locations (end)
+        # *************************************************
+
+        # run the GOMC and NAMD simulations
+        total_sims_namd_gomc = int(2 * total_cycles_namd_gomc_sims)
+        starting_sims_namd_gomc = int(2 * starting_at_cycle_namd_gomc_sims)
+
+        namd_minimize_steps = int(
+            int(namd_run_steps) * int(namd_minimize_mult_scalar)
+        )
+
+        if simulation_type not in ["GCMC"]:
+            GCMC_ChemPot_or_Fugacity_dict_keys = None
+
+        self.namd_sim_order = namd_sim_order
+        self.engine_mode = engine_mode
+        self.namd_core_pinning = namd_core_pinning
+        self.namd_core_rebalance = namd_core_rebalance
+        self.resume = resume
+        self.journal_filename = journal_filename
+        self.total_cycles_namd_gomc_sims = total_cycles_namd_gomc_sims
+        self.starting_at_cycle_namd_gomc_sims = starting_at_cycle_namd_gomc_sims
+        self.gomc_use_CPU_or_GPU = gomc_use_CPU_or_GPU
+        self.simulation_type = simulation_type
+        self.only_use_box_0_for_namd_for_gemc = only_use_box_0_for_namd_for_gemc
+        self.no_core_box_0 = no_core_box_0
+        self.no_core_box_1 = no_core_box_1
+        self.simulation_temp_k = simulation_temp_k
+        self.simulation_pressure_bar = simulation_pressure_bar
+        self.gomc_run_steps = gomc_run_steps
+        self.namd_run_steps = namd_run_steps
+        self.namd_minimize_mult_scalar = namd_minimize_mult_scalar
+        self.adaptive_cycle_steps = adaptive_cycle_steps
+        self.adaptive_cycle_steps_max_overhead_fraction = (
+            adaptive_cycle_steps_max_overhead_fraction
+        )
+        self.adaptive_cycle_steps_mult_scalar_range = (
+            adaptive_cycle_steps_mult_scalar_range
+        )
+        self.engine_watchdog = engine_watchdog
+        self.engine_watchdog_max_energy_jump_fraction = (
+            engine_watchdog_max_energy_jump_fraction
+        )
+        self.engine_watchdog_min_energy_jump_kcal_per_mol = (
+            engine_watchdog_min_energy_jump_kcal_per_mol
+        )
+        self.engine_watchdog_stall_time_s = engine_watchdog_stall_time_s
+        self.engine_watchdog_no_energy_outputs = (
+            engine_watchdog_no_energy_outputs
+        )
+        self.batch_submit_command = batch_submit_command
+        self.batch_cancel_command = batch_cancel_command
+        self.batch_script_header_list = batch_script_header_list
+        self.batch_poll_time_s = batch_poll_time_s
+        self.compact_cycles_block_size = compact_cycles_block_size
+        self.compact_cycles_compression = compact_cycles_compression
+        self.set_dims_box_0_list = set_dims_box_0_list
+        self.set_dims_box_1_list = set_dims_box_1_list
+        self.set_angle_box_0_list = set_angle_box_0_list
+        self.set_angle_box_1_list = set_angle_box_1_list
+        self.starting_ff_file_list_gomc = starting_ff_file_list_gomc
+        self.starting_ff_file_list_namd = starting_ff_file_list_namd
+        self.starting_pdb_box_0_file = starting_pdb_box_0_file
+        self.starting_psf_box_0_file = starting_psf_box_0_file
+        self.namd2_bin_directory = namd2_bin_directory
+        self.gomc_bin_directory = gomc_bin_directory
+        self.allowable_error_fraction_vdw_plus_elec = (
+            allowable_error_fraction_vdw_plus_elec
+        )
+        self.allowable_error_fraction_potential = (
+            allowable_error_fraction_potential
+        )
+        self.max_absolute_allowable_kcal_fraction_vdw_plus_elec = (
+            max_absolute_allowable_kcal_fraction_vdw_plus_elec
+        )
+        self.gomc_console_blkavg_hist_steps = gomc_console_blkavg_hist_steps
+        self.gomc_console_steps = gomc_console_steps
+        self.gomc_rst_coor_ckpoint_steps = gomc_rst_coor_ckpoint_steps
+        self.namd_rst_dcd_xst_steps = namd_rst_dcd_xst_steps
+        self.namd_console_blkavg_e_and_p_steps = (
+            namd_console_blkavg_e_and_p_steps
+        )
+        self.namd_console_e_steps = namd_console_e_steps
+        self.path_namd_runs = path_namd_runs
+        self.path_gomc_runs = path_gomc_runs
+        self.path_namd_template = path_namd_template
+        self.path_gomc_template = path_gomc_template
+        self.total_sims_namd_gomc = total_sims_namd_gomc
+        self.starting_sims_namd_gomc = starting_sims_namd_gomc
+        self.namd_minimize_steps = namd_minimize_steps
+        self.python_file_directory = python_file_directory
+        self.GCMC_ChemPot_or_Fugacity = GCMC_ChemPot_or_Fugacity
+        self.GCMC_ChemPot_or_Fugacity_dict = GCMC_ChemPot_or_Fugacity_dict
+        self.starting_pdb_box_1_file = starting_pdb_box_1_file
+        self.starting_psf_box_1_file = starting_psf_box_1_file
+        self.namd_bin_file = namd_bin_file
+        self.gomc_bin_file = gomc_bin_file
+        self.GCMC_ChemPot_or_Fugacity_dict_keys = (
+            GCMC_ChemPot_or_Fugacity_dict_keys
+        )
+        self.gomc_hist_sample_steps = gomc_hist_sample_steps
+
+    @classmethod
+    def from_json_file(
+        cls,
+        json_filename,
+        namd_sim_order="series",
+        engine_mode="launch",
+        namd_core_pinning=False,
+        namd_core_rebalance=False,
+        resume=False,
+        python_file_directory=None,
+    ):
+        """
+        Reads the user input json file and creates the simulation configuration.
+
+        Parameters
+        ----------
+        json_filename : str
+            The path/filename of the json user input file
+            (i.e., the user_input_NAMD_GOMC.json file).
+        namd_sim_order : str, default="series"
+            The order to run the NAMD simulations for the GEMC ensemble
+            when both boxes are run in NAMD ("series" or "parallel").
+        engine_mode : str, default="launch"
+            How the NAMD and GOMC engines are run ("launch", "batch" or
+            "resident").
+        namd_core_pinning : bool, default=False
+            Pin the parallel NAMD box 0 and box 1 simulations to different
+            CPU cores.
+        namd_core_rebalance : bool, default=False
+            Move CPU cores between the parallel NAMD box 0 and box 1
+            simulations, based on the measured box times.
+        resume : bool, default=False
+            Resume the simulation after the last finished cycle in the
+            simulation journal.
+        python_file_directory : str, optional, default=None
+            The path/directory which the simulation is run from.
+            If None, the current working directory is used.
+
+        Returns
+        ---------
+        HybridSimulationConfig
+            The validated hybrid simulation configuration.
+        """
+        with open(json_filename) as json_file:
+            json_file_data = json.load(json_file)
+
+        return cls(
+            json_file_data,
+            namd_sim_order=namd_sim_order,
+            engine_mode=engine_mode,
+            namd_core_pinning=namd_core_pinning,
+            namd_core_rebalance=namd_core_rebalance,
+            resume=resume,
+            python_file_directory=python_file_directory,
+        )
+
+
+class HybridSimulation:
+    """
+    Runs the hybrid NAMD/GOMC simulation, which alternates between
+    the NAMD (MD) and GOMC (MC) simulations.
+
+    Parameters
+    ----------
+    config : HybridSimulationConfig
+        The validated hybrid simulation configuration.
+
+    Notes
+    ---------
+    The simulation state (current step, run directories, PME grid dimensions
+    and last energies) is carried between the NAMD and GOMC runs as attributes,
+    so the simulation can be advanced one run at a time with the step method.
+    """
+
+    def __init__(self, config):
+        if isinstance(config, HybridSimulationConfig) is False:
+            raise TypeError(
+                "The config must be a HybridSimulationConfig object.\n"
+            )
+        self.config = config
+
+        self.log_template_file = None
+        self.start_time = None
+        self.start_time_s = None
+        self.cycle_start_time = None
+        self.current_step = None
+
+        # the starting cycle, which is read from the simulation journal
+        # when the simulation is resumed (see the setup method)
+        self.starting_at_cycle_namd_gomc_sims = (
+            config.starting_at_cycle_namd_gomc_sims
+        )
+        self.starting_sims_namd_gomc = config.starting_sims_namd_gomc
+        self.resume_journal_record = None
+
+        # the simulation journal, and the engine exit status of the current
+        # run, {engine key: exit_status}
+        self.journal = None
+        self.current_run_no = None
+        self.run_exit_status_dict = {}
+
+        self.no_core_box_0 = config.no_core_box_0
+        self.no_core_box_1 = config.no_core_box_1
+        self.total_no_cores = None
+
+        self.namd_box_0_newdir = None
+        self.namd_box_1_newdir = None
+        self.gomc_newdir = "NA"
+        self.previous_gomc_dir = "NA"
+
+        self.namd_x_pme_grid_box_0_dim = None
+        self.namd_y_pme_grid_box_0_dim = None
+        self.namd_z_pme_grid_box_0_dim = None
+        self.namd_x_pme_grid_box_1_dim = None
+        self.namd_y_pme_grid_box_1_dim = None
+        self.namd_z_pme_grid_box_1_dim = None
+        self.namd_box_0_run_0_dir = None
+        self.namd_box_1_run_0_dir = None
+        self.namd_box_0_run_0_fft_namd_filename = None
+        self.namd_box_1_run_0_fft_namd_filename = None
+
+        self.namd_e_potential_box_0_final_value = None
+        self.namd_e_vdw_plus_elec_box_0_final_value = None
+        self.namd_e_potential_box_1_final_value = None
+        self.namd_e_vdw_plus_elec_box_1_final_value = None
+        self.gomc_e_potential_box_0_final_value = None
+        self.gomc_e_vdw_plus_elec_box_0_final_value = None
+        self.gomc_e_potential_box_1_final_value = None
+        self.gomc_e_vdw_plus_elec_box_1_final_value = None
+
+        self.max_namd_cycle_time_s = 0
+        self.gomc_cycle_time_s = 0
+
+        self.namd_box_0_cycle_time_s = 0
+        self.namd_box_1_cycle_time_s = 0
+
+        # the NAMD and GOMC steps and output frequencies for the current cycle,
+        # which are only changed from the user input values if the
+        # adaptive_cycle_steps are used
+        self.adaptive_cycle_steps = None
+        if config.adaptive_cycle_steps is True:
+            self.adaptive_cycle_steps = AdaptiveCycleSteps(
+                config.namd_run_steps,
+                config.gomc_run_steps,
+                max_overhead_fraction=(
+                    config.adaptive_cycle_steps_max_overhead_fraction
+                ),
+                mult_scalar_range=config.adaptive_cycle_steps_mult_scalar_range,
+            )
+        # the NAMD/GOMC energy comparison checks (passed = True) in the cycle,
+        # and the fraction of failed checks in the first cycle
+        self.cycle_energy_checks_list = []
+        self.first_cycle_energy_checks_failed_fraction = 0
+        self.set_cycle_run_steps(config.namd_run_steps, config.gomc_run_steps)
+
+        # the box states handed from one engine to the next
+        self.cycle_state = CycleState()
+
+        # the parsed control file templates, {template filename: ConfigTemplate}
+        self.config_templates = {}
+
+        # the next NAMD or GOMC simulation is prepared in the background,
+        # while the current simulation is running,
+        # {(prepare method, arguments): concurrent.futures.Future}
+        self.run_preparation_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        )
+        self.prepared_run_futures = {}
+
+        # the finished cycles are packed into archives in the background
+        # (compact_cycles_block_size only), starting at the
+        # next_compaction_block_no, which is set in the setup method
+        self.compaction_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1
+        )
+        self.compaction_futures = []
+        self.next_compaction_block_no = None
+
+        # starts the NAMD and GOMC simulations
+        if config.engine_mode == "batch":
+            self.engine_executor = BatchEngineExecutor(
+                config.batch_submit_command,
+                cancel_command=config.batch_cancel_command,
+                script_header_list=config.batch_script_header_list,
+                poll_time_s=config.batch_poll_time_s,
+            )
+        elif config.engine_mode == "resident":
+            self.engine_executor = ResidentNamdEngineExecutor()
+        else:
+            self.engine_executor = LocalEngineExecutor()
+
+        # the engine startup and energy output times, which the engine
+        # watchdogs measure for each engine (key) in all the cycles
+        self.engine_watchdog_print_time_dict = {}
+
+    def setup(self):
+        """
+        Creates the NAMD and GOMC run folders, opens the log file and
+        checks the CPU cores before the first simulation is run.
+        With the -resume flag, the starting cycle is first read from
+        the simulation journal.
+        """
+        config = self.config
+
+        # get the starting cycle from the simulation journal (resume only),
+        # which is the cycle after the last finished cycle
+        if config.resume is True:
+            if not os.path.exists(config.journal_filename):
+                raise ValueError(
+                    "The simulation can not be resumed, because the simulation "
+                    "journal file does not exist, journal_filename = {}.\n".format(
+                        config.journal_filename
+                    )
+                )
+            self.resume_journal_record = read_journal_last_cycle_record(
+                config.journal_filename
+            )
+            if self.resume_journal_record is None:
+                self.starting_at_cycle_namd_gomc_sims = 0
+            else:
+                self.starting_at_cycle_namd_gomc_sims = int(
+                    self.resume_journal_record["run_no"] // 2 + 1
+                )
+            self.starting_sims_namd_gomc = int(
+                2 * self.starting_at_cycle_namd_gomc_sims
+            )
+            print(
+                "INFO: The simulation is resumed at cycle {}, from the "
+                "simulation journal <{}>.".format(
+                    str(self.starting_at_cycle_namd_gomc_sims),
+                    config.journal_filename,
+                )
+            )
+
+        # With the -resume flag, the block before the starting cycle is
+        # packed again, in case it was not packed before the simulation
+        # stopped.  With a manual restart, the first block that is completely
+        # after the restart cycle is the first block packed, since the blocks
+        # before it can have archives with the run folders from before
+        # the restart.
+        if config.compact_cycles_block_size is not None:
+            if self.resume_journal_record is not None:
+                self.next_compaction_block_no = max(
+                    0,
+                    self.starting_at_cycle_namd_gomc_sims
+                    // config.compact_cycles_block_size
+                    - 1,
+                )
+            else:
+                self.next_compaction_block_no = -(
+                    -self.starting_at_cycle_namd_gomc_sims
+                    // config.compact_cycles_block_size
+                )
+
+        # *************************************************
+        # check for existing and create NAMD and GOMC folders (start)
+        # *************************************************
+        path_namd_runs = "{}/{}".format(
+            str(config.python_file_directory), config.path_namd_runs
+        )
+        path_gomc_runs = "{}/{}".format(
+            str(config.python_file_directory), config.path_gomc_runs
+        )
+        if (
+            os.path.isdir(path_namd_runs) or os.path.isdir(path_gomc_runs)
+        ) and config.resume is False:
+            warn(
+                "INFORMATION: if the system fails to start (with errors) from the beginning of a simulation, "
+                "you may need to delete the main GOMC and NAMD folders.  "
+                "The failure to start/restart may be caused by the last simulation not finishing correctly."
+            )
+            warn(
+                "INFORMATION: If the system fails to restart a previous run (with errors), "
+                "you may need to delete the last subfolders under the main "
+                "NAMD and GOMC (i.e., folders NAMD = 00000000_a or GOMC = 00000001), "
+                "or restart the simulation with the -resume flag, which deletes them automatically. "
+                "The failure to start/restart may be caused by the last simulation not finishing properly."
+            )
+
+        os.makedirs(path_namd_runs, exist_ok=True)
+        os.makedirs(path_gomc_runs, exist_ok=True)
+        # *************************************************
+        # create NAMD and GOMC folders (end)
+        # *************************************************
+
+        self.log_template_file = open(
+            "{}/NAMD_GOMC_started_at_cycle_No_{}.log".format(
+                str(config.python_file_directory),
+                str(self.starting_at_cycle_namd_gomc_sims),
+            ),
+            "w",
+        )
+
+        self.start_time = datetime.datetime.today()
+        self.start_time_s = datetime.datetime.today()
+        write_log_data = (
+            "*************************************************\n"
+            "date and time (start) = {} \n"
+            "************************************************* \n".format(
+                str(self.start_time)
+            )
+        )
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
+
+        # the runs after the last finished cycle did not finish, so their
+        # files can not be used by the resumed simulation
+        if config.resume is True:
+            self.discard_partial_runs(self.starting_sims_namd_gomc)
+
+        # a new simulation starts a new journal
+        self.journal = SimulationJournal(
+            config.journal_filename,
+            append=self.starting_sims_namd_gomc != 0,
+        )
+
+        write_log_data = (
+            "*************************************************\n"
+            + "namd_bin_file = {} \n"
+            "************************************************* \n".format(
+                str(config.namd_bin_file)
+            )
+        )
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
+
+        write_log_data = (
+            "*************************************************\n"
+            + "gomc_bin_file = {} \n"
+            "************************************************* \n".format(
+                str(config.gomc_bin_file)
+            )
+        )
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
+
+        if (
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+        ):
+            self.total_no_cores = self.no_core_box_0 + self.no_core_box_1
+
+            if self.no_core_box_1 == 0:
+                write_log_data = (
+                    "*************************************************\n"
+                    "no_core_box_0 = {} \n"
+                    "WARNING: the number of CPU cores listed for box 1 is zero (0), and should be an "
+                    "interger > 0, or the NAMD simulation for box 1 will not run and the python script "
+                    "will crash \n, no_core_box_1 = {} \n"
+                    "*************************************************"
+                    " \n".format(
+                        str(self.no_core_box_0), str(self.no_core_box_1)
+                    )
+                )
+                self.log_template_file.write(str(write_log_data))
+                warn(str(write_log_data))
+
+            else:
+                write_log_data = (
+                    "*************************************************\n"
+                    "no_core_box_0 = {} \n"
+                    "no_core_box_1 = {} \n"
+                    "*************************************************"
+                    " \n".format(
+                        str(self.no_core_box_0), str(self.no_core_box_1)
+                    )
+                )
+
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
+
+        else:
+            if self.no_core_box_1 != 0:
+                write_log_data = (
+                    "*************************************************\n"
+                    "no_core_box_0 = {} .\n"
+                    "WARNING: the number of CPU cores listed for box 1 are not being used, \n"
+                    "no_core_box_1 = {}\n"
+                    "*************************************************"
+                    " \n".format(
+                        str(self.no_core_box_0), str(self.no_core_box_1)
+                    )
+                )
+                self.log_template_file.write(str(write_log_data))
+                warn(str(write_log_data))
+                self.no_core_box_1 = 0
+
+            self.total_no_cores = self.no_core_box_0
+
+        # Check total cores vs per box cores
+        if isinstance(self.no_core_box_0, int) is False:
+            write_log_data = (
+                "*************************************************\n"
+                "Enter no_core_box_0 as an interger, no_core_box_0 = {} \n"
+                "************************************************* \n".format(
+                    str(self.no_core_box_0)
+                )
+            )
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+            if self.no_core_box_0 == 0:
+                write_log_data = (
+                    "*************************************************\n"
+                    "Enter no_core_box_0 as a non-zero number, no_core_box_0 = {} \n"
+                    "************************************************* \n".format(
+                        str(self.no_core_box_0)
+                    )
+                )
+                self.log_template_file.write(str(write_log_data))
+                raise ValueError(str(write_log_data))
+
+        if config.simulation_type in ["GEMC", "GCMC"]:
+            if isinstance(self.no_core_box_1, int) is False:
+                write_log_data = (
+                    "*************************************************\n"
+                    "Enter no_core_box_1 as an interger, no_core_box_1 = {} \n"
+                    "************************************************* \n".format(
+                        str(self.no_core_box_1)
+                    )
+                )
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
+
+                if self.no_core_box_1 == 0:
+                    write_log_data = (
+                        "*************************************************\n"
+                        "Enter no_core_box_1 as a non-zero number, no_core_box_1 = {} \n"
+                        "************************************************* \n".format(
+                            str(self.no_core_box_1)
+                        )
+                    )
+                    self.log_template_file.write(str(write_log_data))
+                    raise ValueError(str(write_log_data))
+
+    def discard_partial_runs(self, first_run_no):
+        """
+        Deletes the NAMD and GOMC run folders from the first_run_no run
+        onward, which are the runs after the last finished cycle that did not
+        finish (or were only prepared).  The folders are checked one run
+        after the other, until a run without any folders is found.
+
+        Parameters
+        ----------
+        first_run_no : int
+            The first run number which is deleted, which is the first run of
+            the resumed simulation.
+        """
+        config = self.config
+
+        run_no = first_run_no
+        while True:
+            add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
+            if run_no % 2 == 0:
+                run_directory_list = [
+                    "{}/{}/{}{}_{}".format(
+                        str(config.python_file_directory),
+                        config.path_namd_runs,
+                        str(add_zeros_at_start_run_no_str),
+                        str(run_no),
+                        box_letter_i,
+                    )
+                    for box_letter_i in ["a", "b"]
+                ]
             else:
-                new_gomc_data = new_gomc_data.replace(
-                    "coor_box_1_file",
-                    "{}/Output_data_BOX_1_restart.coor".format(
-                        previous_gomc_rel_path
-                    ),
+                run_directory_list = [
+                    "{}/{}/{}{}".format(
+                        str(config.python_file_directory),
+                        config.path_gomc_runs,
+                        str(add_zeros_at_start_run_no_str),
+                        str(run_no),
+                    )
+                ]
+
+            run_directory_list = [
+                run_directory_i
+                for run_directory_i in run_directory_list
+                if os.path.isdir(run_directory_i)
+            ]
+            if len(run_directory_list) == 0:
+                break
+
+            for run_directory_i in run_directory_list:
+                shutil.rmtree(run_directory_i)
+                write_log_data = (
+                    "*************************************************\n"
+                    "INFO: The unfinished run {} folder was deleted "
+                    "before resuming the simulation, folder = {} \n"
+                    "************************************************* \n".format(
+                        str(run_no), str(run_directory_i)
+                    )
+                )
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
+
+            run_no += 1
+
+    def get_namd_run_0_pme_dim(self, box_number):
+        """
+        Gets the number of points for the NAMD PME grid in the x, y, and z-dimensions.
+        It also provides the run 0 (1st NAMD simulation) run directory.
+
+        Parameters
+        ----------
+        box_number : int
+            The simulation box number, which can only be 0 or 1
+
+        Returns
+        ---------
+        namd_x_pme_grid_dim : int
+            The number of points for the NAMD PME grid in the x-dimension.
+        namd_y_pme_grid_dim : int
+            The number of points for the NAMD PME grid in the y-dimension.
+        namd_z_pme_grid_dim : int
+            The number of points for the NAMD PME grid in the z-dimension.
+        namd_box_x_run_0_dir : str
+            The run 0 (1st NAMD simulation) run directory.
+        """
+
+        if isinstance(box_number, int) is False and (
+            box_number != 0 and box_number != 1
+        ):
+            raise ValueError(
+                "ERROR: Enter an interger of 0 or 1 for box_number "
+                "in the get_namd_run_0_pme_dim function. \n"
+            )
+
+        namd_first_run_no = int(0)
+        add_zeros_for_box_x_run_0 = calc_folder_zeros(namd_first_run_no)
+
+        if box_number == 0:
+            namd_box_x_run_0_dir = "{}/{}/{}{}_a".format(
+                str(self.config.python_file_directory),
+                self.config.path_namd_runs,
+                str(add_zeros_for_box_x_run_0),
+                str(namd_first_run_no),
+            )
+
+        elif box_number == 1:
+            namd_box_x_run_0_dir = "{}/{}/{}{}_b".format(
+                str(self.config.python_file_directory),
+                self.config.path_namd_runs,
+                str(add_zeros_for_box_x_run_0),
+                str(namd_first_run_no),
+            )
+
+        try:
+            read_namd_box_x_run_0_log_file = open(
+                "{}/out.dat".format(namd_box_x_run_0_dir), "r"
+            ).readlines()
+
+            for i, line in enumerate(read_namd_box_x_run_0_log_file):
+                split_line = line.split()
+                if len(split_line) >= 7:
+                    if (
+                        split_line[0] == "Info:"
+                        and split_line[1] == "PME"
+                        and split_line[2] == "GRID"
+                        and split_line[3] == "DIMENSIONS"
+                    ):
+                        namd_x_pme_grid_dim = int(split_line[4])
+                        namd_y_pme_grid_dim = int(split_line[5])
+                        namd_z_pme_grid_dim = int(split_line[6])
+
+        except:
+            namd_x_pme_grid_dim = None
+            namd_y_pme_grid_dim = None
+            namd_z_pme_grid_dim = None
+
+        return (
+            namd_x_pme_grid_dim,
+            namd_y_pme_grid_dim,
+            namd_z_pme_grid_dim,
+            namd_box_x_run_0_dir,
+        )
+
+    def get_namd_run_0_fft_filename(self, box_number):
+        """
+        Provides the run 0 (1st NAMD simulation) FFT filename.
+
+        Parameters
+        ----------
+        box_number : int
+            The simulation box number, which can only be 0 or 1
+
+        Returns
+        ---------
+        namd_box_x_run_0_fft_namd_filename : str
+           The run 0 (1st NAMD simulation) FFT filename.
+        """
+
+        if isinstance(box_number, int) is False and (
+            box_number != 0 and box_number != 1
+        ):
+            raise ValueError(
+                "ERROR: Enter an interger of 0 or 1  for box_number in "
+                "the get_namd_run_0_pme_dim function. \n"
+            )
+
+        namd_first_run_no = int(0)
+        add_zeros_for_box_x_run_0 = calc_folder_zeros(namd_first_run_no)
+
+        if box_number == 0:
+            namd_box_x_run_0_dir = "{}/{}/{}{}_a".format(
+                str(self.config.python_file_directory),
+                self.config.path_namd_runs,
+                str(add_zeros_for_box_x_run_0),
+                str(namd_first_run_no),
+            )
+
+        elif box_number == 1:
+            namd_box_x_run_0_dir = "{}/{}/{}{}_b".format(
+                str(self.config.python_file_directory),
+                self.config.path_namd_runs,
+                str(add_zeros_for_box_x_run_0),
+                str(namd_first_run_no),
+            )
+        try:
+            namd_box_x_run_0_file_list = sorted(
+                os.listdir(namd_box_x_run_0_dir)
+            )
+        except:
+            namd_box_x_run_0_file_list = None
+
+        try:
+            for q in range(0, len(namd_box_x_run_0_file_list)):
+                namd_box_x_run_0_fft_1st_9_char_filename = str(
+                    namd_box_x_run_0_file_list[q]
+                )[0:9]
+                if namd_box_x_run_0_fft_1st_9_char_filename == "FFTW_NAMD":
+                    namd_box_x_run_0_fft_namd_filename = (
+                        namd_box_x_run_0_file_list[q]
+                    )
+
+            return namd_box_x_run_0_fft_namd_filename, namd_box_x_run_0_dir
+
+        except:
+            write_log_data = (
+                "*************************************************\n"
+                "The NAMD FFT file not deteted from Run 0 in Box {} \n"
+                "************************************************* \n".format(
+                    str(box_number)
+                )
+            )
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+    def delete_namd_run_0_fft_file(self, box_number):
+        """
+        Deletes the run 0 (1st NAMD simulation) FFT filename.
+
+        Parameters
+        ----------
+        box_number : int
+            The simulation box number, which can only be 0 or 1
+        """
+        if isinstance(box_number, int) is False and (
+            box_number != 0 and box_number != 1
+        ):
+            raise ValueError(
+                "ERROR Enter an interger of 0 or 1  for box_number in "
+                "the get_namd_run_0_pme_dim function. \n"
+            )
+
+        write_log_data = (
+            "*************************************************\n"
+            "The NAMD FFT file was deleted from Run 0 in Box {} \n"
+            "************************************************* \n".format(
+                str(box_number)
+            )
+        )
+        try:
+            (
+                namd_box_x_run_0_fft_namd_filename,
+                namd_box_x_run_0_dir,
+            ) = self.get_namd_run_0_fft_filename(box_number)
+
+            # delete the FFT file in the run 0 box
+            rm_namd_fft_box_0_command = "rm {}/{}".format(
+                str(namd_box_x_run_0_dir),
+                str(namd_box_x_run_0_fft_namd_filename),
+            )
+
+            exec_rm_namd_fft_box_0_command = subprocess.Popen(
+                rm_namd_fft_box_0_command, shell=True, stderr=subprocess.STDOUT
+            )
+            os.wait4(exec_rm_namd_fft_box_0_command.pid, os.WSTOPPED)
+
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+        except:
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+    def check_for_pdb_dims_and_override(
+        self, dim_axis, run_no, read_dim, set_dim=None, only_on_run_no=0
+    ):
+        """
+        Sets the x, y, or z dimension based on the pdb file values or the user input.
+
+        Parameters
+        ----------
+        dim_axis : str
+            The dimension of the axis (only x, y, or z)
+        run_no : int
+            Simulation run number
+        read_dim : int or float
+            The dimension read from the pdb file or the set dim_axis.
+        set_dim : int or float or None, (default = None)
+            The user set dimension is use instead of the dimension
+            read from the pdb file set dim_axis. The set_dim overrides
+            the dimension read from the pdb file (read_dim).
+        only_on_run_no : int, (default = 0)
+            This only overrides the only set dimension on the the set value.
+
+        Returns
+        ---------
+        used_dim : int or float:
+            The used dimension.  This is the dimension read from the pdb file
+            (if available) and if no set_dim is provided.  It is the set_dim,
+            if the set_dim is provided.
+        """
+
+        # check user override dimensions
+        if run_no == only_on_run_no:
+            if read_dim is None:
+                if set_dim is not None and (
+                    isinstance(set_dim, float) or isinstance(set_dim, int)
+                ):
+                    used_dim = set_dim
+                else:
+                    write_log_data = (
+                        "ERROR: The user defined {}-dimension is None "
+                        "or not an integer or a float, and the PDB file has no dimension information "
+                        " \n".format(str(dim_axis))
+                    )
+                    self.log_template_file.write(str(write_log_data))
+                    raise TypeError(str(write_log_data))
+
+            elif (
+                read_dim is not None
+                and set_dim != read_dim
+                and (isinstance(set_dim, float) or isinstance(set_dim, int))
+            ):
+                write_log_data = (
+                    "WARNING: The user defined {}-dimension is different "
+                    "than the one read from the starting PDB file {}-dim_PDB = {}, "
+                    "{}-dim_user_set = {}. The code is setting the user defined {}-dimension."
+                    " \n".format(
+                        str(dim_axis),
+                        str(dim_axis),
+                        str(read_dim),
+                        str(dim_axis),
+                        str(set_dim),
+                        str(dim_axis),
+                    )
                 )
-                new_gomc_data = new_gomc_data.replace(
-                    "xsc_box_1_file",
-                    "{}/Output_data_BOX_1_restart.xsc".format(
-                        previous_gomc_rel_path
+                self.log_template_file.write(str(write_log_data))
+                warn(str(write_log_data))
+                used_dim = set_dim
+
+            else:
+                used_dim = read_dim
+
+        else:
+            used_dim = read_dim
+
+        return used_dim
+
+    def get_config_template(self, template_filename, placeholder_list):
+        """
+        Gets the parsed NAMD or GOMC control file template, which is only
+        read from the file the first time it is used.
+
+        Parameters
+        ----------
+        template_filename : str
+            The path/filename of the control file template.
+        placeholder_list : list of str
+            The placeholder names in the template.
+
+        Returns
+        ---------
+        ConfigTemplate
+            The parsed control file template.
+        """
+        if template_filename not in self.config_templates:
+            self.config_templates[template_filename] = ConfigTemplate.from_file(
+                template_filename, placeholder_list
+            )
+
+        return self.config_templates[template_filename]
+
+    def prepare_namd_run(
+        self,
+        python_file_directory,
+        path_namd_template,
+        path_namd_runs,
+        run_no,
+        box_number,
+    ):
+        """
+        Prepares the parts of a NAMD simulation which do not depend on the
+        previous simulations, so they can be done while the previous
+        simulation is running (see the submit_run_preparation method).
+        The NAMD run folder is created, the run 0 FFT file is linked into it,
+        and the force field files are filled in the NAMD control file template.
+
+        Parameters
+        ----------
+        python_file_directory : str
+            The path/directory where this file is located.
+        path_namd_template : str
+            The relative path to the namd template file from where this file is
+            located (python_file_directory).
+        path_namd_runs: str
+            The path/directory to the main NAMD folder.
+        run_no : int
+            Simulation run number
+        box_number : int
+            The simulation box number, which can only be 0 or 1
+
+        Returns
+        ---------
+        namd_box_x_newdir : str
+            The full path/directory of the created NAMD run/box number.
+        namd_template : ConfigTemplate
+            The NAMD control file template, with the fixed values filled in.
+        """
+        add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
+        namd_box_x_newdir = "{}/{}/{}{}_{}".format(
+            str(python_file_directory),
+            path_namd_runs,
+            str(add_zeros_at_start_run_no_str),
+            str(run_no),
+            ["a", "b"][box_number],
+        )
+        os.makedirs(namd_box_x_newdir, exist_ok=True)
+
+        # link the FFT grid.txt file from the first NAMD simulation
+        # (i.e., Run 0) to the new folder
+        if run_no != 0:
+            namd_box_x_run_0_dir, namd_box_x_run_0_fft_namd_filename = [
+                [
+                    self.namd_box_0_run_0_dir,
+                    self.namd_box_0_run_0_fft_namd_filename,
+                ],
+                [
+                    self.namd_box_1_run_0_dir,
+                    self.namd_box_1_run_0_fft_namd_filename,
+                ],
+            ][box_number]
+            namd_box_x_fft_link = "{}/{}".format(
+                namd_box_x_newdir, str(namd_box_x_run_0_fft_namd_filename)
+            )
+            if os.path.lexists(namd_box_x_fft_link):
+                os.remove(namd_box_x_fft_link)
+            os.symlink(
+                "{}/{}".format(
+                    str(namd_box_x_run_0_dir),
+                    str(namd_box_x_run_0_fft_namd_filename),
+                ),
+                namd_box_x_fft_link,
+            )
+
+        namd_starting_ff_files = ""
+        for namd_ff_i in self.config.starting_ff_file_list_namd:
+            namd_ff_i = os.path.relpath(namd_ff_i, namd_box_x_newdir)
+            namd_starting_ff_files = (
+                namd_starting_ff_files + "parameters \t {}\n".format(namd_ff_i)
+            )
+
+        namd_template = self.get_config_template(
+            "{}/{}".format(str(python_file_directory), path_namd_template),
+            namd_conf_placeholder_list,
+        ).fill(
+            {
+                "all_parameter_files": str(namd_starting_ff_files),
+                "current_step": str((int(0))),
+            }
+        )
+
+        return namd_box_x_newdir, namd_template
+
+    def prepare_gomc_run(self, python_file_directory, path_gomc_runs, run_no):
+        """
+        Prepares the parts of a GOMC simulation which do not depend on the
+        previous simulations, so they can be done while the previous
+        simulation is running (see the submit_run_preparation method).
+        The GOMC run folder is created, and the force field files are filled
+        in the GOMC control file template.
+
+        Parameters
+        ----------
+        python_file_directory : str
+            The path/directory where this file is located.
+        path_gomc_runs : str
+            The relative path to the GOMC runs folder from where this file is
+            located (python_file_directory).
+        run_no : int
+            Simulation run number
+
+        Returns
+        ---------
+        gomc_newdir : str
+            The full path/directory of the created GOMC run.
+        gomc_template : ConfigTemplate
+            The GOMC control file template, with the fixed values filled in.
+        """
+        add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
+        gomc_newdir = "{}/{}/{}{}".format(
+            str(python_file_directory),
+            path_gomc_runs,
+            str(add_zeros_at_start_run_no_str),
+            str(run_no),
+        )
+        os.makedirs(gomc_newdir, exist_ok=True)
+
+        gomc_starting_ff_files = ""
+        for gomc_ff_i in self.config.starting_ff_file_list_gomc:
+            gomc_ff_i = os.path.relpath(gomc_ff_i, gomc_newdir)
+            gomc_starting_ff_files = (
+                gomc_starting_ff_files + "Parameters \t {}\n".format(gomc_ff_i)
+            )
+
+        gomc_template = self.get_config_template(
+            "{}/{}".format(
+                str(python_file_directory), self.config.path_gomc_template
+            ),
+            gomc_conf_placeholder_list,
+        ).fill({"all_parameter_files": str(gomc_starting_ff_files)})
+
+        return gomc_newdir, gomc_template
+
+    def submit_run_preparation(self, run_no):
+        """
+        Starts preparing the NAMD or GOMC simulation in the background
+        (see the prepare_namd_run and prepare_gomc_run methods), which is
+        called while the previous simulation is running.
+
+        Parameters
+        ----------
+        run_no : int
+            Simulation run number of the simulation which is prepared.
+        """
+        config = self.config
+        if run_no >= config.total_sims_namd_gomc:
+            return
+
+        if run_no % 2 == 0:
+            prepare_run_list = [
+                [
+                    self.prepare_namd_run,
+                    (
+                        config.python_file_directory,
+                        config.path_namd_template,
+                        config.path_namd_runs,
+                        run_no,
+                        box_number_i,
+                    ),
+                ]
+                for box_number_i in self.get_namd_box_number_list()
+            ]
+        else:
+            prepare_run_list = [
+                [
+                    self.prepare_gomc_run,
+                    (
+                        config.python_file_directory,
+                        config.path_gomc_runs,
+                        run_no,
                     ),
+                ]
+            ]
+
+        for prepare_run_method, prepare_run_args in prepare_run_list:
+            self.prepared_run_futures[
+                (prepare_run_method, prepare_run_args)
+            ] = self.run_preparation_executor.submit(
+                prepare_run_method, *prepare_run_args
+            )
+
+    def get_prepared_run(self, prepare_run_method, *prepare_run_args):
+        """
+        Gets the prepared NAMD or GOMC simulation, waiting for the background
+        preparation if it was started, or preparing it now if not.
+
+        Parameters
+        ----------
+        prepare_run_method : method
+            The prepare_namd_run or prepare_gomc_run method.
+        *prepare_run_args
+            The prepare_run_method arguments.
+
+        Returns
+        ---------
+        tuple
+            The prepare_run_method return values.
+        """
+        prepared_run_future = self.prepared_run_futures.pop(
+            (prepare_run_method, prepare_run_args), None
+        )
+        if prepared_run_future is None:
+            return prepare_run_method(*prepare_run_args)
+
+        return prepared_run_future.result()
+
+    def write_namd_conf_file(
+        self,
+        python_file_directory,
+        path_namd_template,
+        path_namd_runs,
+        box_state,
+        run_no,
+        box_number,
+        namd_run_steps,
+        namd_minimize_steps,
+        namd_rst_dcd_xst_steps,
+        namd_console_blkavg_e_and_p_steps,
+        simulation_temp_k,
+        simulation_pressure_bar,
+        namd_x_pme_grid_dim,
+        namd_y_pme_grid_dim,
+        namd_z_pme_grid_dim,
+        set_x_dim=None,
+        set_y_dim=None,
+        set_z_dim=None,
+        set_angle_alpha=90,
+        set_angle_beta=90,
+        set_angle_gamma=90,
+        fft_add_namd_ang_to_box_dim=0,
+        namd_console_e_steps=None,
+    ):
+        """
+        Writes the NAMD control file in the NAMD run numbered folder
+
+        Parameters
+        ----------
+        python_file_directory : str
+            The path/directory where this file is located.
+        path_namd_template : str
+            The relative path to the namd template file from where this file is
+            located (he directory where this file is located (python_file_director).
+        path_namd_runs: str
+            The path/directory to the main NAMD folder.
+        box_state : BoxState
+            The restart files and box dimensions that the NAMD control will use
+            to start the new NAMD simulation, from the last GOMC run or the
+            starting PDB and PSF files (run 0).
+        run_no : int
+            Simulation run number
+        box_number : int
+            The simulation box number, which can only be 0 or 1
+        namd_run_steps : int
+            The number of steps to run the NAMD simulation.
+        namd_minimize_steps : int
+            The number of minimization steps to run the NAMD simulation.
+        namd_rst_dcd_xst_steps : int
+            The number of steps which the restart, dcd, xst files will be created.
+        namd_console_blkavg_e_and_p_steps : int
+            The number of steps which the pressure data will be output.
+        simulation_temp_k : int or float
+            The NAMD simulation temperature in Kelvin.
+        simulation_pressure_bar : int or float
+            The NAMD simulation pressure in bar.
+        namd_x_pme_grid_dim : int
+            The number of points for the NAMD PME grid in the x-dimension.
+        namd_y_pme_grid_dim : int
+            The number of points for the NAMD PME grid in the y-dimension.
+        namd_z_pme_grid_dim : int
+            The number of points for the NAMD PME grid in the z-dimension.
+        set_x_dim : int or float or None (optional: default = None)
+            Sets the x dimension from the simulation.
+        set_y_dim : int or float or None (optional: default = None)
+            Sets the y dimension from the simulation.
+        set_z_dim : int or float or None (optional: default = None)
+            Sets the z dimension from the simulation.
+        set_angle_alpha : int of float (default = 90)
+            Sets the alpha angle in degrees, for the orthogonal (90) or
+            non-orthogonal (not 90) box.
+        set_angle_beta : int of float (default = 90)
+            Sets the beta angle in degrees, for the orthogonal (90) or
+            non-orthogonal (not 90) box.
+        set_angle_gamma : int of float (default = 90)
+            Sets the gamma angle in degrees, for the orthogonal (90) or
+            non-orthogonal (not 90) box.
+        fft_add_namd_ang_to_box_dim : int
+            The number of extra point to add to the boxes fft points
+        namd_console_e_steps : int or None (optional: default = None)
+            The number of steps which the energies will be output.
+            If None, the namd_console_blkavg_e_and_p_steps is used.
+
+        Returns
+        ---------
+        namd_box_x_newdir : str
+            The full path/directory of the created NAMD run/box number,
+            which contains the control file.
+
+        Notes
+        ---------
+        The box angles are not currently available and are default set to 90 degress.
+        they can be added later, but for now all simulation but be orthoganol boxes
+        """
+
+        if isinstance(box_number, int) is False and (
+            box_number != 0 or box_number != 1
+        ):
+            raise ValueError(
+                "Enter an interger of 0 or 1  for box_number in the get_namd_run_0_pme_dim function. \n"
+            )
+
+        # get NAMD box_x directory and the template with the fixed values,
+        # which are normally prepared while the previous simulation is running
+        namd_box_x_newdir, namd_template = self.get_prepared_run(
+            self.prepare_namd_run,
+            python_file_directory,
+            path_namd_template,
+            path_namd_runs,
+            run_no,
+            box_number,
+        )
+        namd_conf_values = {}
+
+        namd_conf_values["pdb_box_file"] = "{}".format(
+            os.path.relpath(
+                box_state.restart_file_dict["pdb"], namd_box_x_newdir
+            )
+        )
+        namd_conf_values["psf_box_file"] = "{}".format(
+            os.path.relpath(
+                box_state.restart_file_dict["psf"], namd_box_x_newdir
+            )
+        )
+
+        if run_no != 0:
+
+            write_log_data = (
+                "************************************************* \n"
+            )
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+            for namd_file_i, extension_i in [
+                ["coor_file", "coor"],
+                ["xsc_file", "xsc"],
+                ["vel_file", "vel"],
+            ]:
+                namd_conf_values[namd_file_i] = os.path.relpath(
+                    box_state.restart_file_dict[extension_i], namd_box_x_newdir
+                )
+            namd_conf_values["Bool_restart"] = str("true")
+
+        else:
+            namd_conf_values["coor_file"] = str("NA")
+            namd_conf_values["xsc_file"] = str("NA")
+            namd_conf_values["vel_file"] = str("NA")
+            namd_conf_values["Bool_restart"] = str("false")
+
+        # Read the dimensions and angles from the GOMC restart or starting PDB file
+        (
+            [read_x_dim, read_y_dim, read_z_dim],
+            [read_angle_alpha, read_angle_beta, read_angle_gamma],
+        ) = box_state.get_pdb_box_dims()
+
+        # check user  override x-dimensions
+        used_x_dim = self.check_for_pdb_dims_and_override(
+            "x", run_no, read_x_dim, set_dim=set_x_dim, only_on_run_no=0
+        )
+
+        # check user  override y-dimensions
+        used_y_dim = self.check_for_pdb_dims_and_override(
+            "y", run_no, read_y_dim, set_dim=set_y_dim, only_on_run_no=0
+        )
+
+        # check user  override z-dimensions
+        used_z_dim = self.check_for_pdb_dims_and_override(
+            "z", run_no, read_z_dim, set_dim=set_z_dim, only_on_run_no=0
+        )
+
+        # check box for othoganality
+        # check the read_angle_alpha
+        if read_angle_alpha is not None and read_angle_alpha != 90:
+            if run_no == 0:
+                write_log_data = (
+                    "ERROR: The alpha angle is not 90 degress as read from the "
+                    "starting PDB file, read_angle_alpha_PDB = {}. "
+                    "Only alpha angle of 90 degress or None is currently "
+                    "allowed. \n".format(str(read_angle_alpha))
+                )
+                self.log_template_file.write(str(write_log_data))
+                raise ValueError(str(write_log_data))
+
+        if set_angle_alpha is not None and set_angle_alpha != 90:
+            if run_no == 0:
+                write_log_data = (
+                    "ERROR: The alpha angle is not 90 degress as set by the user,"
+                    "set_angle_alpha = {}. "
+                    "Only alpha angle of 90 degress or None is currently "
+                    "allowed. \n".format(str(set_angle_alpha))
+                )
+            self.log_template_file.write(str(write_log_data))
+            raise ValueError(str(write_log_data))
+
+        # check the read_angle_beta
+        if read_angle_beta is not None and read_angle_beta != 90:
+            if run_no == 0:
+                write_log_data = (
+                    "ERROR: The beta angle is not 90 degress as read from the "
+                    "starting PDB file, read_angle_beta_PDB = {}. "
+                    "Only beta angle of 90 degress or None is currently "
+                    "allowed. \n".format(str(read_angle_beta))
+                )
+                self.log_template_file.write(str(write_log_data))
+                raise ValueError(str(write_log_data))
+
+        if set_angle_beta is not None and set_angle_beta != 90:
+            if run_no == 0:
+                write_log_data = (
+                    "ERROR: The beta angle is not 90 degress as set by the user "
+                    "set_angle_beta = {}. Only beta angle of 90 degress or None is currently "
+                    "allowed. \n".format(str(set_angle_beta))
+                )
+            self.log_template_file.write(str(write_log_data))
+            raise ValueError(str(write_log_data))
+
+        # check the read_angle_gamma
+        if read_angle_gamma is not None and read_angle_gamma != 90:
+            if run_no == 0:
+                write_log_data = (
+                    "ERROR: The gamma angle is not 90 degress as read from the "
+                    "starting PDB file read_angle_gamma_PDB = {}. "
+                    "Only gamma angle of 90 degress or None is currently "
+                    "allowed. \n".format(str(read_angle_gamma))
+                )
+                self.log_template_file.write(str(write_log_data))
+                raise ValueError(str(write_log_data))
+
+        if set_angle_gamma is not None and set_angle_gamma != 90:
+            if run_no == 0:
+                write_log_data = (
+                    "ERROR: The gamma angle is not 90 degress as set by the user "
+                    "set_angle_gamma = {}. Only gamma angle of 90 degress or None is currently "
+                    "allowed. \n".format(str(set_angle_gamma))
+                )
+            self.log_template_file.write(str(write_log_data))
+            raise ValueError(str(write_log_data))
+
+        namd_conf_values["x_dim_box"] = str(used_x_dim)
+        namd_conf_values["y_dim_box"] = str(used_y_dim)
+        namd_conf_values["z_dim_box"] = str(used_z_dim)
+        namd_conf_values["x_origin_box"] = str(used_x_dim / 2)
+        namd_conf_values["y_origin_box"] = str(used_y_dim / 2)
+        namd_conf_values["z_origin_box"] = str(used_z_dim / 2)
+
+        namd_conf_values["NAMD_Run_Steps"] = str((int(namd_run_steps)))
+        namd_conf_values["NAMD_Minimize"] = str(int(namd_minimize_steps))
+        namd_conf_values["NAMD_RST_DCD_XST_Steps"] = str(
+            (int(namd_rst_dcd_xst_steps))
+        )
+        namd_conf_values["NAMD_console_BLKavg_E_and_P_Steps"] = str(
+            int(namd_console_blkavg_e_and_p_steps)
+        )
+        if namd_console_e_steps is None:
+            namd_console_e_steps = namd_console_blkavg_e_and_p_steps
+        namd_conf_values["NAMD_console_E_Steps"] = str(
+            int(namd_console_e_steps)
+        )
+        namd_conf_values["System_temp_set"] = str(simulation_temp_k)
+        namd_conf_values["System_press_set"] = str(simulation_pressure_bar)
+
+        if run_no != 0:
+            namd_conf_values["X_PME_GRID_DIM"] = str(namd_x_pme_grid_dim)
+            namd_conf_values["Y_PME_GRID_DIM"] = str(namd_y_pme_grid_dim)
+            namd_conf_values["Z_PME_GRID_DIM"] = str(namd_z_pme_grid_dim)
+
+        else:
+            # add x number times more point to the PME grid for "GEMC", "NPT".
+            # scalar_dim_mult = 1.3 --> allows for 2x change in volume,
+            # allowable volume change = scalar_dim_mult^3 = 1.3^3
+            if self.config.simulation_type in ["GEMC", "NPT"]:
+                scalar_dim_mult = 1.3
+                used_and_scaled_namd_pme_x_dim = (
+                    used_x_dim + fft_add_namd_ang_to_box_dim
+                ) * scalar_dim_mult
+                used_and_scaled_namd_pme_y_dim = (
+                    used_y_dim + fft_add_namd_ang_to_box_dim
+                ) * scalar_dim_mult
+                used_and_scaled_namd_pme_z_dim = (
+                    used_z_dim + fft_add_namd_ang_to_box_dim
+                ) * scalar_dim_mult
+            else:
+                scalar_dim_mult = 1
+                used_and_scaled_namd_pme_x_dim = (
+                    used_x_dim + fft_add_namd_ang_to_box_dim
+                ) * scalar_dim_mult
+                used_and_scaled_namd_pme_y_dim = (
+                    used_y_dim + fft_add_namd_ang_to_box_dim
+                ) * scalar_dim_mult
+                used_and_scaled_namd_pme_z_dim = (
+                    used_z_dim + fft_add_namd_ang_to_box_dim
+                ) * scalar_dim_mult
+
+            namd_conf_values["X_PME_GRID_DIM"] = str(
+                int(used_and_scaled_namd_pme_x_dim + 1)
+            )
+            namd_conf_values["Y_PME_GRID_DIM"] = str(
+                int(used_and_scaled_namd_pme_y_dim + 1)
+            )
+            namd_conf_values["Z_PME_GRID_DIM"] = str(
+                int(used_and_scaled_namd_pme_z_dim + 1)
+            )
+
+        generate_namd_file = open("{}/in.conf".format(namd_box_x_newdir), "w")
+        generate_namd_file.write(namd_template.render(namd_conf_values))
+        generate_namd_file.close()
+
+        # the resident NAMD engine runs the later simulations from the
+        # restart files with the reinitatoms command (in_resident.conf),
+        # which reads them from the <prefix>.coor, .vel, and .xsc files
+        if self.config.engine_mode == "resident" and run_no != 0:
+            for extension_i in ["coor", "vel", "xsc"]:
+                resident_restart_file = "{}/resident_restart.{}".format(
+                    namd_box_x_newdir, extension_i
                 )
-                new_gomc_data = new_gomc_data.replace(
-                    "vel_box_1_file",
-                    "{}/Output_data_BOX_1_restart.vel".format(
-                        previous_gomc_rel_path
+                if os.path.lexists(resident_restart_file):
+                    os.remove(resident_restart_file)
+                os.symlink(
+                    os.path.relpath(
+                        box_state.restart_file_dict[extension_i],
+                        namd_box_x_newdir,
                     ),
+                    resident_restart_file,
+                )
+
+            generate_namd_file = open(
+                "{}/in_resident.conf".format(namd_box_x_newdir), "w"
+            )
+            generate_namd_file.write(
+                "# The NAMD control file for the resident NAMD engine "
+                "(engine_mode = resident)\n"
+                "outputname     namdOut\n"
+                "firsttimestep  {}\n"
+                "reinitatoms    resident_restart\n"
+                "run            {}\n".format(
+                    str(int(0)), str(int(namd_run_steps))
+                )
+            )
+            generate_namd_file.close()
+
+        write_log_data = (
+            "NAMD simulation data for simulation number {} in box {} is "
+            "completed \n".format(str(run_no), str(box_number))
+        )
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
+
+        return namd_box_x_newdir
+
+    def compare_namd_gomc_energies(
+        self,
+        e_potential_box_x_final_value,
+        e_potential_box_x_initial_value,
+        e_vdw_plus_elec_box_x_final_value,
+        e_vdw_plus_elec_box_x_initial_value,
+        run_no,
+        box_number,
+    ):
+        """
+        Compares the NAMD and GOMC energies when switching between
+        simulation engines.  GOMC does not currently (2-26-21)
+        have impropers, so if a simulation in NAMD is using impropers
+        You will recieve warnings since GOMC does not calculate the
+        impropers. Otherwise, they should be the same or nearly the same
+        between GOMC and NAMD.  The data is printing on the screen and
+        the Hybrid GOMC-NAMD log file.  One GOMC and one NAMD file must
+        either be the initial or last values.
+
+        Parameters
+        ----------
+        e_potential_box_x_final_value : float
+            The final potential energy as a float, as extracted from the
+            the NAMD run data ('POTENTIAL').
+        e_potential_box_x_initial_value : float
+            The initial potential energy as a float, as extracted from the
+            the NAMD run data ('POTENTIAL').
+        e_vdw_plus_elec_box_x_final_value : float
+            The final VDW + electrostatic energy energy as a float, as extracted from the
+            the NAMD run data ('VDW' + 'ELECT').
+        e_vdw_plus_elec_box_x_initial_value : float
+            The initial VDW + electrostatic energy as a float, as extracted from the
+            the NAMD run data ('VDW' + 'ELECT').
+        run_no : int
+            Simulation run number
+        box_number : int
+            The simulation box number, which can only be 0 or 1
+
+        Returns
+        ---------
+        energy_checks_passed : bool
+            True if the potential and VDW + electrostatic energy checks
+            both passed, otherwise False.
+        """
+        energy_checks_passed = True
+
+        # calc error in potential energies box x
+        try:
+            error_fract_in_potential_box_x = np.abs(
+                (
+                    e_potential_box_x_final_value
+                    - e_potential_box_x_initial_value
+                )
+                / e_potential_box_x_final_value
+            )
+        except:
+            if (
+                e_potential_box_x_final_value == 0
+                and e_potential_box_x_initial_value == 0
+            ):
+                error_fract_in_potential_box_x = 0
+            else:
+                error_fract_in_potential_box_x = "NA"
+
+        if (
+            error_fract_in_potential_box_x != "NA"
+            and error_fract_in_potential_box_x
+            <= self.config.allowable_error_fraction_potential
+        ):
+            write_log_data = (
+                "PASSED: Box {}: Potential energies error fraction between the check "
+                "between the last point in run {}"
+                " and the first point in run {}, error fraction = {}"
+                " \n".format(
+                    str(box_number),
+                    str(int(run_no - 1)),
+                    str(int(run_no)),
+                    str(error_fract_in_potential_box_x),
+                )
+            )
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+        else:
+            write_log_data = (
+                "FAILED: Box {}: Potential energies error fraction between the last "
+                "point in run {} and the first point in run {}, error fraction =  {}"
+                " \n".format(
+                    str(box_number),
+                    str(int(run_no - 1)),
+                    str(int(run_no)),
+                    str(error_fract_in_potential_box_x),
                 )
+            )
+            self.log_template_file.write("WARNING: " + str(write_log_data))
+            warn(write_log_data)
+            energy_checks_passed = False
 
-                previous_gomc_xsc_box_1_file = (
-                    "{}/Output_data_BOX_1_restart.xsc".format(previous_gomc_dir)
-                )
-                read_previous_gomc_xsc_box_1_file = open(
-                    previous_gomc_xsc_box_1_file, "r"
-                ).readlines()
-
-                read_x_dim_box_1 = read_previous_gomc_xsc_box_1_file[
-                    -1
-                ].split()[1:2]
-                read_x_dim_box_1 = float(read_x_dim_box_1[0])
-                read_y_dim_box_1 = read_previous_gomc_xsc_box_1_file[
-                    -1
-                ].split()[5:6]
-                read_y_dim_box_1 = float(read_y_dim_box_1[0])
-                read_z_dim_box_1 = read_previous_gomc_xsc_box_1_file[
-                    -1
-                ].split()[9:10]
-                read_z_dim_box_1 = float(read_z_dim_box_1[0])
-
-                read_x_dim_origin_box_1 = read_previous_gomc_xsc_box_1_file[
-                    -1
-                ].split()[10:11]
-                read_x_dim_origin_box_1 = float(read_x_dim_origin_box_1[0])
-                read_y_dim_origin_box_1 = read_previous_gomc_xsc_box_1_file[
-                    -1
-                ].split()[11:12]
-                read_y_dim_origin_box_1 = float(read_y_dim_origin_box_1[0])
-                read_z_dim_origin_box_1 = read_previous_gomc_xsc_box_1_file[
-                    -1
-                ].split()[12:13]
-                read_z_dim_origin_box_1 = float(read_z_dim_origin_box_1[0])
-
-                new_gomc_data = new_gomc_data.replace(
-                    "x_dim_box_1", str(read_x_dim_box_1)
-                )
-                new_gomc_data = new_gomc_data.replace(
-                    "y_dim_box_1", str(read_y_dim_box_1)
-                )
-                new_gomc_data = new_gomc_data.replace(
-                    "z_dim_box_1", str(read_z_dim_box_1)
+        # calc error in VDW + Electrostatics box x
+        try:
+            error_fract_in_vdw_plus_elec_box_x = np.abs(
+                (
+                    e_vdw_plus_elec_box_x_final_value
+                    - e_vdw_plus_elec_box_x_initial_value
                 )
+                / e_vdw_plus_elec_box_x_final_value
+            )
+        except:
+            if (
+                e_vdw_plus_elec_box_x_final_value == 0
+                and e_vdw_plus_elec_box_x_initial_value == 0
+            ):
+                error_fract_in_vdw_plus_elec_box_x = 0
+            else:
+                error_fract_in_vdw_plus_elec_box_x = "NA"
+
+        abs_diff_in_vdw_plus_elec_box_x = np.abs(
+            e_vdw_plus_elec_box_x_final_value
+            - e_vdw_plus_elec_box_x_initial_value
+        )
 
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            error_fract_in_vdw_plus_elec_box_x != "NA"
+            and error_fract_in_vdw_plus_elec_box_x
+            <= self.config.allowable_error_fraction_vdw_plus_elec
         ):
-            namd_xsc_box_1_file = "{}/namdOut.restart.xsc".format(
-                namd_box_1_newdir
+            write_log_data = (
+                "PASSED: Box {}: VDW + electrostatic fraction between the last point in run {}"
+                " and the first point in run {}, error fraction = {}"
+                " \n".format(
+                    str(box_number),
+                    str(int(run_no - 1)),
+                    str(int(run_no)),
+                    str(error_fract_in_vdw_plus_elec_box_x),
+                )
             )
-            read_namd_xsc_box_1_file = open(
-                namd_xsc_box_1_file, "r"
-            ).readlines()
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
 
-            previous_namd_box_1_rel_path = os.path.relpath(
-                namd_box_1_newdir, gomc_newdir
-            )
-            new_gomc_data = new_gomc_data.replace(
-                "coor_box_1_file",
-                "{}/namdOut.restart.coor".format(previous_namd_box_1_rel_path),
-            )
-            new_gomc_data = new_gomc_data.replace(
-                "xsc_box_1_file",
-                "{}/namdOut.restart.xsc"
-                "".format(previous_namd_box_1_rel_path),
+        elif (
+            abs_diff_in_vdw_plus_elec_box_x
+            <= self.config.max_absolute_allowable_kcal_fraction_vdw_plus_elec
+        ):
+            write_log_data = (
+                "PASSED: Box {}: The VDW + electrostatic energy error fraction between the last point in run {} "
+                "and the first point in run {}, absolute difference is = {} kcal/mol."
+                " \n".format(
+                    str(box_number),
+                    str(int(run_no - 1)),
+                    str(int(run_no)),
+                    str(abs_diff_in_vdw_plus_elec_box_x),
+                )
             )
-            new_gomc_data = new_gomc_data.replace(
-                "vel_box_1_file",
-                "{}/namdOut.restart.vel"
-                "".format(previous_namd_box_1_rel_path),
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+        else:
+            write_log_data = (
+                "FAILED: Box {}: vdw_plus_elec energy  error fraction between the last point in run {} "
+                "and the first point in run {}, error fraction = {} or the absolute "
+                "difference is = {} kcal/mol."
+                " \n".format(
+                    str(box_number),
+                    str(int(run_no - 1)),
+                    str(int(run_no)),
+                    str(error_fract_in_vdw_plus_elec_box_x),
+                    str(abs_diff_in_vdw_plus_elec_box_x),
+                )
             )
+            self.log_template_file.write("WARNING: " + str(write_log_data))
+            warn(str(write_log_data))
+            energy_checks_passed = False
 
-            read_x_dim_box_1 = read_namd_xsc_box_1_file[-1].split()[1:2]
-            read_x_dim_box_1 = float(read_x_dim_box_1[0])
-            read_y_dim_box_1 = read_namd_xsc_box_1_file[-1].split()[5:6]
-            read_y_dim_box_1 = float(read_y_dim_box_1[0])
-            read_z_dim_box_1 = read_namd_xsc_box_1_file[-1].split()[9:10]
-            read_z_dim_box_1 = float(read_z_dim_box_1[0])
+        return energy_checks_passed
 
-            read_x_dim_origin_box_1 = read_namd_xsc_box_1_file[-1].split()[
-                10:11
-            ]
-            read_x_dim_origin_box_1 = float(read_x_dim_origin_box_1[0])
-            read_y_dim_origin_box_1 = read_namd_xsc_box_1_file[-1].split()[
-                11:12
-            ]
-            read_y_dim_origin_box_1 = float(read_y_dim_origin_box_1[0])
-            read_z_dim_origin_box_1 = read_namd_xsc_box_1_file[-1].split()[
-                12:13
-            ]
-            read_z_dim_origin_box_1 = float(read_z_dim_origin_box_1[0])
+    def write_gomc_conf_file(
+        self,
+        python_file_directory,
+        path_gomc_runs,
+        run_no,
+        gomc_run_steps,
+        gomc_rst_coor_ckpoint_steps,
+        gomc_console_blkavg_hist_steps,
+        gomc_hist_sample_steps,
+        simulation_temp_k,
+        simulation_pressure_bar,
+        box_0_state,
+        box_1_state=None,
+        gomc_console_steps=None,
+    ):
+        """
+        Writes the NAMD control file in the NAMD run numbered folder
+
+        Parameters
+        ----------
+        python_file_directory : str
+            The path/directory where this file is located.
+        path_gomc_runs : str
+            The relative path to the GOMC runs folder from where this file is
+            located (python_file_directory).
+        run_no : int
+            Simulation run number
+        gomc_run_steps : int
+            The number of steps to run the GOMC simulation.
+        gomc_rst_coor_ckpoint_steps : int
+            The number of steps which the GOMC restart, dcd, xst, checkpoint and
+            coordinates files will be created.
+        gomc_console_blkavg_hist_steps : int
+            The number of steps which the GOMC pressure, block average,
+            and histogram data will be output.
+        gomc_hist_sample_steps : int
+            The sample frequency (steps) which the GOMC histogram data
+            will be sampled.
+        simulation_temp_k : int or float
+            The NAMD simulation temperature in Kelvin.
+        simulation_pressure_bar : int or float
+            The NAMD simulation pressure in bar.
+        box_0_state : BoxState
+            The restart files and box dimensions for box 0,
+            from the last NAMD run.
+        box_1_state : BoxState or None, default=None
+            The restart files and box dimensions for box 1, from the last
+            NAMD or GOMC run or the starting PDB and PSF files
+            (GEMC and GCMC only).
+        gomc_console_steps : int or None, default=None
+            The number of steps which the GOMC console output (energies)
+            will be output.  If None, the gomc_console_blkavg_hist_steps
+            is used.
+
+        Returns
+        ---------
+        gomc_newdir : str
+            The full path/directory of the created GOMC run/box number,
+            which contains the control file.
+
+        Notes
+        ---------
+        The box angles are not currently available and are default set to 90 degress.
+        they can be added later, but for now all simulation but be orthoganol boxes
+        """
+
+        # Create the GOMC configuration file, from the GOMC directory and the
+        # template with the fixed values, which are normally prepared
+        # while the previous simulation is running
+        gomc_newdir, gomc_template = self.get_prepared_run(
+            self.prepare_gomc_run, python_file_directory, path_gomc_runs, run_no
+        )
+        gomc_conf_values = {}
+        gomc_removed_line_list = []
+
+        write_log_data = (
+            "*************************************************" + " \n"
+        )
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
 
-            new_gomc_data = new_gomc_data.replace(
-                "x_dim_box_1", str(read_x_dim_box_1)
+        if self.previous_gomc_dir == "NA":
+            # marked as "Restart_Checkpoint_file", 'false' for now until checkpoint is setup
+            gomc_conf_values["Restart_Checkpoint_file"] = "false {}" "".format(
+                "Output_data_restart.chk"
             )
-            new_gomc_data = new_gomc_data.replace(
-                "y_dim_box_1", str(read_y_dim_box_1)
+        else:
+            # make checkpoint true and restart
+            previous_gomc_rel_path = os.path.relpath(
+                self.previous_gomc_dir, gomc_newdir
             )
-            new_gomc_data = new_gomc_data.replace(
-                "z_dim_box_1", str(read_z_dim_box_1)
+            gomc_conf_values["Restart_Checkpoint_file"] = (
+                "true {}/{}"
+                "".format(
+                    str(previous_gomc_rel_path), "Output_data_restart.chk"
+                )
             )
 
-    if simulation_type in ["GEMC", "GCMC"]:
-        if simulation_type in ["GCMC"] and previous_gomc_dir == "NA":
-            new_gomc_data = new_gomc_data.replace(
-                "restart_true_or_false", "false"
+        # the box files and dimensions, from the last NAMD or GOMC run
+        # or the starting PDB and PSF files
+        for box_state_i in [box_0_state, box_1_state]:
+            if box_state_i is None:
+                continue
+
+            box_i = str(box_state_i.box_number)
+            for gomc_file_i, extension_i in [
+                ["pdb_file_box_{}_file", "pdb"],
+                ["psf_file_box_{}_file", "psf"],
+                ["coor_box_{}_file", "coor"],
+                ["xsc_box_{}_file", "xsc"],
+                ["vel_box_{}_file", "vel"],
+            ]:
+                if box_state_i.restart_file_dict[extension_i] is not None:
+                    gomc_conf_values[gomc_file_i.format(box_i)] = (
+                        os.path.relpath(
+                            box_state_i.restart_file_dict[extension_i],
+                            gomc_newdir,
+                        )
+                    )
+
+            if box_state_i.engine == "start":
+                # the box is started from the PDB file only, which is only
+                # box 1, as box 0 is always started from the NAMD run
+                gomc_removed_line_list = [
+                    ["binCoordinates", box_i],
+                    ["extendedSystem", box_i],
+                    ["binVelocities", box_i],
+                ]
+
+                read_box_dims = box_state_i.get_pdb_box_dims()[0]
+                used_box_dims = [
+                    self.check_for_pdb_dims_and_override(
+                        dim_axis_i,
+                        run_no,
+                        read_box_dims[dim_i],
+                        set_dim=self.config.set_dims_box_1_list[dim_i],
+                        only_on_run_no=1,
+                    )
+                    for dim_i, dim_axis_i in enumerate(["x", "y", "z"])
+                ]
+            else:
+                used_box_dims = box_state_i.get_xsc_box_dims()[0]
+
+            gomc_conf_values["x_dim_box_{}".format(box_i)] = str(
+                used_box_dims[0]
             )
-        elif (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is True
-            and previous_gomc_dir == "NA"
-        ):
-            new_gomc_data = new_gomc_data.replace(
-                "restart_true_or_false", "false"
+            gomc_conf_values["y_dim_box_{}".format(box_i)] = str(
+                used_box_dims[1]
             )
-        else:
-            new_gomc_data = new_gomc_data.replace(
-                "restart_true_or_false", "true"
+            gomc_conf_values["z_dim_box_{}".format(box_i)] = str(
+                used_box_dims[2]
             )
-    else:
-        new_gomc_data = new_gomc_data.replace("restart_true_or_false", "true")
 
-    new_gomc_data = new_gomc_data.replace(
-        "GOMC_Run_Steps", str((int(gomc_run_steps)))
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "GOMC_RST_Coor_CKpoint_Steps", str((int(gomc_rst_coor_ckpoint_steps)))
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "GOMC_console_BLKavg_Hist_Steps",
-        str((int(gomc_console_blkavg_hist_steps))),
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "GOMC_Hist_sample_Steps", str(gomc_hist_sample_steps)
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "System_temp_set", str(simulation_temp_k)
-    )
-    new_gomc_data = new_gomc_data.replace(
-        "System_press_set", str(simulation_pressure_bar)
-    )
-
-    # add the Chempot or fugacity data for the GOMC control file
-    if simulation_type in ["GCMC"]:
-        if GCMC_ChemPot_or_Fugacity is None:
-            new_gomc_data = new_gomc_data.replace(
-                "mu_ChemPot_K_or_P_Fugacitiy_bar_all", str("")
-            )
+        if self.config.simulation_type in ["GEMC", "GCMC"]:
+            if (
+                self.config.simulation_type in ["GCMC"]
+                and self.previous_gomc_dir == "NA"
+            ):
+                gomc_conf_values["restart_true_or_false"] = "false"
+            elif (
+                self.config.simulation_type in ["GEMC"]
+                and self.config.only_use_box_0_for_namd_for_gemc is True
+                and self.previous_gomc_dir == "NA"
+            ):
+                gomc_conf_values["restart_true_or_false"] = "false"
+            else:
+                gomc_conf_values["restart_true_or_false"] = "true"
+        else:
+            gomc_conf_values["restart_true_or_false"] = "true"
 
-        elif GCMC_ChemPot_or_Fugacity == "ChemPot":
-            print(
-                "GOMC GCMC simulation is using {} --> Residues and values = {}".format(
-                    GCMC_ChemPot_or_Fugacity, GCMC_ChemPot_or_Fugacity_dict
+        gomc_conf_values["GOMC_Run_Steps"] = str((int(gomc_run_steps)))
+        gomc_conf_values["GOMC_RST_Coor_CKpoint_Steps"] = str(
+            (int(gomc_rst_coor_ckpoint_steps))
+        )
+        gomc_conf_values["GOMC_console_BLKavg_Hist_Steps"] = str(
+            (int(gomc_console_blkavg_hist_steps))
+        )
+        if gomc_console_steps is None:
+            gomc_console_steps = gomc_console_blkavg_hist_steps
+        gomc_conf_values["GOMC_console_Steps"] = str(int(gomc_console_steps))
+        gomc_conf_values["GOMC_Hist_sample_Steps"] = str(gomc_hist_sample_steps)
+        gomc_conf_values["System_temp_set"] = str(simulation_temp_k)
+        gomc_conf_values["System_press_set"] = str(simulation_pressure_bar)
+
+        # add the Chempot or fugacity data for the GOMC control file
+        if self.config.simulation_type in ["GCMC"]:
+            if self.config.GCMC_ChemPot_or_Fugacity is None:
+                gomc_conf_values["mu_ChemPot_K_or_P_Fugacitiy_bar_all"] = str(
+                    ""
                 )
-            )
 
-            chempot_conf_data = ""
-            for GCMC_keys_i in GCMC_ChemPot_or_Fugacity_dict_keys:
-                chempot_conf_data = (
-                    chempot_conf_data + "ChemPot \t {} \t {}"
-                    "\n".format(
-                        GCMC_keys_i, GCMC_ChemPot_or_Fugacity_dict[GCMC_keys_i]
+            elif self.config.GCMC_ChemPot_or_Fugacity == "ChemPot":
+                print(
+                    "GOMC GCMC simulation is using {} --> Residues and values = {}".format(
+                        self.config.GCMC_ChemPot_or_Fugacity,
+                        self.config.GCMC_ChemPot_or_Fugacity_dict,
                     )
                 )
 
-            new_gomc_data = new_gomc_data.replace(
-                "mu_ChemPot_K_or_P_Fugacitiy_bar_all", str(chempot_conf_data)
-            )
+                chempot_conf_data = ""
+                for (
+                    GCMC_keys_i
+                ) in self.config.GCMC_ChemPot_or_Fugacity_dict_keys:
+                    chempot_conf_data = (
+                        chempot_conf_data + "ChemPot \t {} \t {}"
+                        "\n".format(
+                            GCMC_keys_i,
+                            self.config.GCMC_ChemPot_or_Fugacity_dict[
+                                GCMC_keys_i
+                            ],
+                        )
+                    )
 
-        elif GCMC_ChemPot_or_Fugacity == "Fugacity":
-            print(
-                "GOMC GCMC simulation is using {} --> Residues and values = {}".format(
-                    GCMC_ChemPot_or_Fugacity, GCMC_ChemPot_or_Fugacity_dict
+                gomc_conf_values["mu_ChemPot_K_or_P_Fugacitiy_bar_all"] = str(
+                    chempot_conf_data
                 )
-            )
 
-            fugacity_conf_data = ""
-            for GCMC_keys_i in GCMC_ChemPot_or_Fugacity_dict_keys:
-                fugacity_conf_data = (
-                    fugacity_conf_data + "Fugacity \t {} \t {}"
-                    "\n".format(
-                        GCMC_keys_i, GCMC_ChemPot_or_Fugacity_dict[GCMC_keys_i]
+            elif self.config.GCMC_ChemPot_or_Fugacity == "Fugacity":
+                print(
+                    "GOMC GCMC simulation is using {} --> Residues and values = {}".format(
+                        self.config.GCMC_ChemPot_or_Fugacity,
+                        self.config.GCMC_ChemPot_or_Fugacity_dict,
                     )
                 )
 
-            new_gomc_data = new_gomc_data.replace(
-                "mu_ChemPot_K_or_P_Fugacitiy_bar_all", str(fugacity_conf_data)
-            )
-
-        else:
-            write_log_data = "Warning: There is in error in the chemical potential settings for GCMC simulation. \n"
-            log_template_file.write(str(write_log_data))
-            print(str(write_log_data))
-            warn(str(write_log_data))
+                fugacity_conf_data = ""
+                for (
+                    GCMC_keys_i
+                ) in self.config.GCMC_ChemPot_or_Fugacity_dict_keys:
+                    fugacity_conf_data = (
+                        fugacity_conf_data + "Fugacity \t {} \t {}"
+                        "\n".format(
+                            GCMC_keys_i,
+                            self.config.GCMC_ChemPot_or_Fugacity_dict[
+                                GCMC_keys_i
+                            ],
+                        )
+                    )
 
-    set_max_steps_equib_adj = 10 * 10**6
-    if gomc_run_steps >= set_max_steps_equib_adj:
-        new_gomc_data = new_gomc_data.replace(
-            "GOMC_Adj_Steps", str(int((set_max_steps_equib_adj / 10)))
-        )
+                gomc_conf_values["mu_ChemPot_K_or_P_Fugacitiy_bar_all"] = str(
+                    fugacity_conf_data
+                )
 
-        if gomc_run_steps / 10 >= 1000:
-            new_gomc_data = new_gomc_data.replace(
-                "GOMC_Adj_Steps", str(int(1000))
+            else:
+                write_log_data = "Warning: There is in error in the chemical potential settings for GCMC simulation. \n"
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
+                warn(str(write_log_data))
+
+        set_max_steps_equib_adj = 10 * 10**6
+        if gomc_run_steps >= set_max_steps_equib_adj:
+            gomc_conf_values["GOMC_Equilb_Steps"] = str(
+                int((set_max_steps_equib_adj / 10))
             )
-        else:
-            new_gomc_data = new_gomc_data.replace(
-                "GOMC_Adj_Steps", str(int(gomc_run_steps / 10))
+            gomc_conf_values["GOMC_Adj_Steps"] = str(
+                int((set_max_steps_equib_adj / 10))
             )
 
-    elif int(gomc_run_steps / 10) > 0:
-        # make equal to 1000 until the restart true can be enabled
-        new_gomc_data = new_gomc_data.replace(
-            "GOMC_Equilb_Steps", str((int(gomc_run_steps / 10)))
-        )
-        new_gomc_data = new_gomc_data.replace(
-            "GOMC_Adj_Steps", str(int(gomc_run_steps / 10))
-        )
-
-        if gomc_run_steps / 10 >= 1000:
-            new_gomc_data = new_gomc_data.replace(
-                "GOMC_Adj_Steps", str(int(1000))
+        elif int(gomc_run_steps / 10) > 0:
+            # make equal to 1000 until the restart true can be enabled
+            gomc_conf_values["GOMC_Equilb_Steps"] = str(
+                (int(gomc_run_steps / 10))
             )
+            gomc_conf_values["GOMC_Adj_Steps"] = str(int(gomc_run_steps / 10))
+
         else:
-            new_gomc_data = new_gomc_data.replace(
-                "GOMC_Adj_Steps", str(int(gomc_run_steps / 10))
+            # make equal to 1000 until the restart true can be enabled
+            gomc_conf_values["GOMC_Adj_Steps"] = str(int(1))
+            gomc_conf_values["GOMC_Equilb_Steps"] = str((int(1)))
+
+        generate_gomc_file = open("{}/in.conf".format(gomc_newdir), "w")
+        generate_gomc_file.write(
+            gomc_template.render(
+                gomc_conf_values, removed_line_list=gomc_removed_line_list
             )
+        )
+        generate_gomc_file.close()
 
-    else:
-        # make equal to 1000 until the restart true can be enabled
-        new_gomc_data = new_gomc_data.replace("GOMC_Adj_Steps", str(int(1)))
-        new_gomc_data = new_gomc_data.replace(
-            "GOMC_Equilb_Steps", str((int(1)))
+        return gomc_newdir
+
+    def start_engine(
+        self,
+        engine_key,
+        engine_bin_file,
+        run_directory,
+        no_cores,
+        cpu_set=None,
+    ):
+        """
+        Starts a NAMD or GOMC simulation, without waiting for it to finish.
+
+        Parameters
+        ----------
+        engine_key : str
+            The engine name ("NAMD_box_0", "NAMD_box_1", or "GOMC").
+        engine_bin_file : str
+            The full path/filename of the NAMD or GOMC binary file.
+        run_directory : str
+            The full path/directory of the simulation run, which contains
+            the in.conf control file.
+        no_cores : int
+            The number of CPU cores used by the engine.
+        cpu_set : set of int, optional, default=None
+            The CPU cores which the engine is pinned to.
+            If None, the engine is not pinned.
+
+        Returns
+        ---------
+        exec_engine : LaunchedEngine or BatchEngine
+            The engine process running the simulation, which is passed to
+            the wait_for_engine method or the wait_for_engines function.
+        """
+        return self.engine_executor.start(
+            engine_key,
+            engine_bin_file,
+            run_directory,
+            no_cores,
+            cpu_set=cpu_set,
         )
 
-    if simulation_type in ["GEMC", "GCMC"]:
-        if previous_gomc_dir == "NA":
-            # marked as "Restart_Checkpoint_file", 'false' for now until checkpoint is setup
-            new_gomc_data = new_gomc_data.replace(
-                "Restart_Checkpoint_file",
-                "false {}" "".format("Output_data_restart.chk"),
-            )
+    def check_engine_exit_status(
+        self, engine_key, exit_status, engine_watchdog=None
+    ):
+        """
+        Writes a warning to the log file if the NAMD or GOMC simulation
+        did not finish successfully.  If the simulation was stopped by
+        the engine watchdog, the failure is written to the log file and
+        the hybrid simulation is stopped.
+
+        Parameters
+        ----------
+        engine_key : str
+            The engine name ("NAMD_box_0", "NAMD_box_1", or "GOMC").
+        exit_status : int
+            The engine exit status for the simulation (0 = successful).
+        engine_watchdog : EngineWatchdog, optional, default=None
+            The energy checks for the simulation.
+        """
+        self.run_exit_status_dict[engine_key] = exit_status
 
-            gomc_starting_pdb_rel_path_box_1 = os.path.relpath(
-                "{}/{}".format(
-                    str(python_file_directory), starting_pdb_box_1_file
-                ),
-                gomc_newdir,
+        if (
+            engine_watchdog is not None
+            and engine_watchdog.failure_message is not None
+        ):
+            self.journal.write_record(
+                {
+                    "record": "failed",
+                    "run_no": self.current_run_no,
+                    "engine_key": engine_key,
+                    "exit_status_dict": self.run_exit_status_dict,
+                    "failure_message": engine_watchdog.failure_message,
+                }
             )
-            new_gomc_data = new_gomc_data.replace(
-                "pdb_file_box_1_file",
-                "{}".format(gomc_starting_pdb_rel_path_box_1),
+            write_log_data = (
+                "*************************************************\n"
+                "ERROR: The {} simulation was stopped by the engine "
+                "watchdog, because {}. \n"
+                "************************************************* \n".format(
+                    str(engine_key), str(engine_watchdog.failure_message)
+                )
             )
-
-            gomc_starting_psf_rel_path_box_1 = os.path.relpath(
-                "{}/{}".format(
-                    str(python_file_directory), starting_psf_box_1_file
-                ),
-                gomc_newdir,
+            self.log_template_file.write(str(write_log_data))
+            self.log_template_file.flush()
+            print(str(write_log_data))
+            raise RuntimeError(
+                "The {} simulation was stopped by the engine watchdog, "
+                "because {}.\n".format(
+                    engine_key, engine_watchdog.failure_message
+                )
             )
-            new_gomc_data = new_gomc_data.replace(
-                "psf_file_box_1_file",
-                "{}".format(gomc_starting_psf_rel_path_box_1),
+
+        if exit_status != 0:
+            write_log_data = (
+                "*************************************************\n"
+                "WARNING: The {} simulation finished with the exit "
+                "status {}. \n"
+                "************************************************* \n".format(
+                    str(engine_key), str(exit_status)
+                )
             )
+            self.log_template_file.write(str(write_log_data))
+            warn(str(write_log_data))
 
+    def wait_for_engine(
+        self,
+        engine_key,
+        exec_engine,
+        log_follower_list=None,
+        engine_watchdog=None,
+    ):
+        """
+        Waits for the NAMD or GOMC simulation to finish.
+
+        Parameters
+        ----------
+        engine_key : str
+            The engine name ("NAMD_box_0", "NAMD_box_1", or "GOMC").
+        exec_engine : LaunchedEngine or BatchEngine
+            The engine process running the simulation, as returned by
+            the start_engine method.
+        log_follower_list : list of EngineLogFollower, optional, default=None
+            The engine log files which are read while the engine is running.
+        engine_watchdog : EngineWatchdog, optional, default=None
+            The energy checks, which stop the engine if it fails them.
+        """
+        if log_follower_list is None and engine_watchdog is None:
+            self.check_engine_exit_status(engine_key, exec_engine.wait())
         else:
-            new_gomc_data = new_gomc_data.replace(
-                "pdb_file_box_1_file",
-                "{}/Output_data_BOX_1_restart.pdb".format(
-                    previous_gomc_rel_path
-                ),
-            )
-            new_gomc_data = new_gomc_data.replace(
-                "psf_file_box_1_file",
-                "{}/Output_data_BOX_1_restart.psf".format(
-                    previous_gomc_rel_path
-                ),
+            self.check_engine_exit_status(
+                engine_key,
+                wait_for_engines(
+                    {engine_key: exec_engine},
+                    log_follower_list=log_follower_list,
+                    engine_watchdog_dict=(
+                        None
+                        if engine_watchdog is None
+                        else {engine_key: engine_watchdog}
+                    ),
+                )[engine_key][0],
+                engine_watchdog=engine_watchdog,
             )
 
-    else:
-        if previous_gomc_dir == "NA":
-            # marked as "Restart_Checkpoint_file", 'false' for now until checkpoint is setup
-            new_gomc_data = new_gomc_data.replace(
-                "Restart_Checkpoint_file",
-                "false {}" "".format("Output_data_restart.chk"),
+    def get_engine_log_follower(self, engine_name, run_directory):
+        """
+        Gets the follower for the NAMD or GOMC log file (out.dat), which
+        reads the energy and statistics lines while the engine is running.
+        The follower is created before the engine is started.
+
+        Parameters
+        ----------
+        engine_name : str
+            The engine name ("NAMD" or "GOMC").
+        run_directory : str
+            The full path/directory of the simulation run.
+
+        Returns
+        ---------
+        EngineLogFollower
+            The engine log file follower.
+        """
+        if engine_name == "NAMD":
+            line_prefix_list = ["ETITLE:", "ENERGY:"]
+        else:
+            line_prefix_list = ["ETITLE:", "STITLE:", "ENER_", "STAT_"]
+
+        return EngineLogFollower(
+            "{}/out.dat".format(str(run_directory)), line_prefix_list
+        )
+
+    def get_engine_watchdog(
+        self, engine_name, log_follower, minimize_end_step=None, engine_key=None
+    ):
+        """
+        Gets the energy checks for a NAMD or GOMC simulation, which stop the
+        engine if the simulation diverges (engine_watchdog = true).
+
+        Parameters
+        ----------
+        engine_name : str
+            The engine name ("NAMD" or "GOMC").
+        log_follower : EngineLogFollower
+            The engine log file follower, as returned by the
+            get_engine_log_follower method.
+        minimize_end_step : int or None, default=None
+            The last NAMD minimization step, which is only in the first
+            NAMD simulation.  If None, the simulation has no
+            minimization steps.
+        engine_key : str or None, default=None
+            The engine key (i.e., "NAMD_box_0"), which the measured engine
+            startup and energy output times are kept for, so the stall time
+            is set from the earlier simulations of this engine.
+            If None, the engine_name is used.
+
+        Returns
+        ---------
+        EngineWatchdog or None
+            The engine energy checks, or None if the engine watchdog
+            is not used.
+        """
+        if self.config.engine_watchdog is False:
+            return None
+
+        # the GOMC energies are in K
+        min_energy_jump = float(
+            self.config.engine_watchdog_min_energy_jump_kcal_per_mol
+        )
+        if engine_name == "GOMC":
+            min_energy_jump = min_energy_jump / K_to_kcal_mol
+            energy_output_steps = self.gomc_console_steps
+        else:
+            energy_output_steps = self.namd_console_e_steps
+
+        if engine_key is None:
+            engine_key = engine_name
+
+        return EngineWatchdog(
+            log_follower,
+            engine_name,
+            max_energy_jump_fraction=(
+                self.config.engine_watchdog_max_energy_jump_fraction
+            ),
+            min_energy_jump=min_energy_jump,
+            stall_time_s=self.config.engine_watchdog_stall_time_s,
+            minimize_end_step=minimize_end_step,
+            energy_output_steps=energy_output_steps,
+            print_time_dict=self.engine_watchdog_print_time_dict.setdefault(
+                engine_key, {}
+            ),
+        )
+
+    def get_namd_box_cpu_sets(self):
+        """
+        Gets the disjoint CPU core sets for the NAMD box 0 and box 1
+        simulations, when they are run in parallel.
+
+        Returns
+        ---------
+        cpu_set_box_0 : set of int or None
+            The CPU cores for box 0, or None if there are not enough CPU cores
+            available to pin both boxes.
+        cpu_set_box_1 : set of int or None
+            The CPU cores for box 1, or None if there are not enough CPU cores
+            available to pin both boxes.
+        """
+        available_cpu_list = sorted(os.sched_getaffinity(0))
+        no_core_box_0 = int(self.no_core_box_0)
+        no_core_box_1 = int(self.no_core_box_1)
+        if len(available_cpu_list) < no_core_box_0 + no_core_box_1:
+            write_log_data = (
+                "*************************************************\n"
+                "WARNING: The NAMD box 0 and box 1 simulations are not pinned "
+                "to CPU cores, because only {} CPU cores are available, "
+                "and no_core_box_0 + no_core_box_1 = {}. \n"
+                "************************************************* \n".format(
+                    str(len(available_cpu_list)),
+                    str(no_core_box_0 + no_core_box_1),
+                )
             )
+            self.log_template_file.write(str(write_log_data))
+            warn(str(write_log_data))
+            return None, None
 
-    # make checkpoint true and restart
-    if previous_gomc_dir != "NA":
-        new_gomc_data = new_gomc_data.replace(
-            "Restart_Checkpoint_file",
-            "true {}/{}"
-            "".format(str(previous_gomc_rel_path), "Output_data_restart.chk"),
+        cpu_set_box_0 = set(available_cpu_list[0:no_core_box_0])
+        cpu_set_box_1 = set(
+            available_cpu_list[no_core_box_0 : no_core_box_0 + no_core_box_1]
         )
+        return cpu_set_box_0, cpu_set_box_1
 
-    generate_gomc_file.write(new_gomc_data)
-    generate_gomc_file.close()
+    def rebalance_namd_box_cores(
+        self,
+        namd_box_0_cycle_time_s,
+        namd_box_1_cycle_time_s,
+        allowable_time_imbalance_fraction=0.1,
+    ):
+        """
+        Moves CPU cores between the parallel NAMD box 0 and box 1 simulations,
+        so both boxes take about the same time in the next cycle.
+        The total number of cores (no_core_box_0 + no_core_box_1) is not changed.
+
+        Parameters
+        ----------
+        namd_box_0_cycle_time_s : float
+            The NAMD box 0 simulation time (s) in the last cycle.
+        namd_box_1_cycle_time_s : float
+            The NAMD box 1 simulation time (s) in the last cycle.
+        allowable_time_imbalance_fraction : float, default=0.1
+            The cores are only moved if the time difference between the boxes
+            is more than this fraction of the longest box time.
+
+        Notes
+        ---------
+        The work in each box is taken as the box time multiplied by its
+        number of cores, and the cores are split in proportion to the work.
+        """
+        max_cycle_time_s = max(namd_box_0_cycle_time_s, namd_box_1_cycle_time_s)
+        if (
+            max_cycle_time_s <= 0
+            or abs(namd_box_0_cycle_time_s - namd_box_1_cycle_time_s)
+            / max_cycle_time_s
+            <= allowable_time_imbalance_fraction
+        ):
+            return
 
-    return gomc_newdir
+        total_no_cores_box_0_and_1 = int(self.no_core_box_0) + int(
+            self.no_core_box_1
+        )
+        if total_no_cores_box_0_and_1 < 2:
+            return
+
+        namd_box_0_work = namd_box_0_cycle_time_s * int(self.no_core_box_0)
+        namd_box_1_work = namd_box_1_cycle_time_s * int(self.no_core_box_1)
+        new_no_core_box_0 = int(
+            round(
+                total_no_cores_box_0_and_1
+                * namd_box_0_work
+                / (namd_box_0_work + namd_box_1_work)
+            )
+        )
+        new_no_core_box_0 = min(
+            max(new_no_core_box_0, 1), total_no_cores_box_0_and_1 - 1
+        )
 
+        if new_no_core_box_0 != self.no_core_box_0:
+            write_log_data = (
+                "*************************************************\n"
+                "Rebalancing the NAMD cores, no_core_box_0 = {} --> {}, "
+                "no_core_box_1 = {} --> {} \n"
+                "************************************************* \n".format(
+                    str(self.no_core_box_0),
+                    str(new_no_core_box_0),
+                    str(self.no_core_box_1),
+                    str(total_no_cores_box_0_and_1 - new_no_core_box_0),
+                )
+            )
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+            self.no_core_box_0 = new_no_core_box_0
+            self.no_core_box_1 = total_no_cores_box_0_and_1 - new_no_core_box_0
+
+    def get_gomc_box_number_list(self):
+        """
+        Gets the box numbers in the GOMC simulation.
+
+        Returns
+        ---------
+        list of int
+            The box numbers, [0, 1] for the GEMC and GCMC ensembles,
+            and [0] for the NVT and NPT ensembles.
+        """
+        if self.config.simulation_type in ["GEMC", "GCMC"]:
+            return [0, 1]
+
+        return [0]
+
+    def get_namd_box_number_list(self):
+        """
+        Gets the box numbers in the NAMD simulations.
+
+        Returns
+        ---------
+        list of int
+            The box numbers, [0, 1] for the GEMC ensemble when both boxes
+            are run in NAMD, and [0] otherwise.
+        """
+        if (
+            self.config.simulation_type in ["GEMC"]
+            and self.config.only_use_box_0_for_namd_for_gemc is False
+        ):
+            return [0, 1]
+
+        return [0]
+
+    def set_cycle_run_steps(self, namd_run_steps, gomc_run_steps):
+        """
+        Sets the NAMD and GOMC steps and output frequencies for the cycle.
+
+        Parameters
+        ----------
+        namd_run_steps : int
+            The number of NAMD steps in the cycle.
+        gomc_run_steps : int
+            The number of GOMC steps in the cycle.
+        """
+        self.namd_run_steps = int(namd_run_steps)
+        self.gomc_run_steps = int(gomc_run_steps)
+        (
+            self.namd_rst_dcd_xst_steps,
+            self.namd_console_blkavg_e_and_p_steps,
+            self.namd_console_e_steps,
+            self.gomc_rst_coor_ckpoint_steps,
+            self.gomc_console_blkavg_hist_steps,
+            self.gomc_console_steps,
+            self.gomc_hist_sample_steps,
+        ) = get_cycle_output_steps(
+            self.namd_run_steps,
+            self.gomc_run_steps,
+            no_watchdog_energy_outputs=(
+                self.config.engine_watchdog_no_energy_outputs
+                if self.config.engine_watchdog
+                else None
+            ),
+        )
 
-def get_gomc_energy_data(read_gomc_box_x_log_file, box_number):
-    """
-    Generated the energy and system file data for specified
-    box number.  GOMC energy units are in kcal/mol.
+    def restore_cycle_run_steps(self, journal_record):
+        """
+        Sets the NAMD and GOMC steps for the cycle after a restart, from the
+        journal record of the last finished cycle.  The multiple of the
+        user input steps is also set (adaptive_cycle_steps only), so the
+        steps are adapted from the restored steps.
+
+        Parameters
+        ----------
+        journal_record : dict
+            The finish record of the GOMC run before the restart, as read by
+            the read_journal_last_cycle_record function.
+        """
+        self.set_cycle_run_steps(
+            journal_record["namd_run_steps"], journal_record["gomc_run_steps"]
+        )
+        if self.adaptive_cycle_steps is not None:
+            self.adaptive_cycle_steps.mult_scalar = float(
+                self.namd_run_steps / self.config.namd_run_steps
+            )
 
-    Parameters
-    ----------
-    read_gomc_box_x_log_file : str
-        The path/filename of the GOMC log file.
-    box_number : int
-        The simulation box number, which can only be 0 or 1
+    def get_cycle_energy_checks_failed_fraction(self):
+        """
+        Gets the fraction of the NAMD/GOMC energy comparison checks which
+        failed in the current cycle.
+
+        Returns
+        ---------
+        float
+            The fraction of the failed energy comparison checks
+            (0 if there are no checks in the cycle).
+        """
+        if len(self.cycle_energy_checks_list) == 0:
+            return 0
+
+        return self.cycle_energy_checks_list.count(False) / len(
+            self.cycle_energy_checks_list
+        )
 
-    Returns
-    ---------
-    gomc_energy_data_box_x_df : pandas.dataframe
-        The GOMC log file data in a pandas.dataframe
+    def update_adaptive_cycle_steps(
+        self, cycle_no, namd_time_s, gomc_time_s, python_time_s
+    ):
+        """
+        Sets the NAMD and GOMC steps for the next cycle from the last cycle
+        times and energy comparison checks (adaptive_cycle_steps only).
+
+        Parameters
+        ----------
+        cycle_no : int
+            The cycle number of the last cycle, starting at zero.
+        namd_time_s : float
+            The NAMD time (s) in the last cycle.
+        gomc_time_s : float
+            The GOMC time (s) in the last cycle.
+        python_time_s : float
+            The python time (s) in the last cycle.
+
+        Notes
+        ---------
+        The energy checks are only counted as failed if a larger fraction of
+        the checks failed than in the first cycle, so the checks which always
+        fail (e.g., from the impropers, which GOMC does not calculate) do not
+        stop the steps from increasing.
+        """
+        energy_checks_passed = bool(
+            self.get_cycle_energy_checks_failed_fraction()
+            <= self.first_cycle_energy_checks_failed_fraction
+        )
+        mult_scalar = self.adaptive_cycle_steps.update(
+            namd_time_s,
+            gomc_time_s,
+            python_time_s,
+            energy_checks_passed=energy_checks_passed,
+        )
+        namd_run_steps, gomc_run_steps = (
+            self.adaptive_cycle_steps.get_run_steps()
+        )
+        self.set_cycle_run_steps(namd_run_steps, gomc_run_steps)
 
-    Notes
-    ---------
-    GOMC energy units are in K
-    """
-
-    get_e_titles = True
-    get_v_p_totmol_rho_titles = True
-    e_values_gomc_list = []
-    v_p_totmol_rho_values_list = []
-    for i, line in enumerate(read_gomc_box_x_log_file):
-        if line.startswith("ETITLE:") is True and get_e_titles is True:
-            e_titles_gomc_iteration = read_gomc_box_x_log_file[i]
-            e_titles_gomc_iteration = e_titles_gomc_iteration.split()
-            e_titles_gomc_iteration = e_titles_gomc_iteration[:]
-            if get_e_titles is True:
-                get_e_titles = False
-        if line.startswith("ENER_" + str(box_number) + ":") is True:
-            e_values_gomc_iteration_list = []
-            e_values_gomc_iteration = read_gomc_box_x_log_file[i]
-            e_values_gomc_iteration = e_values_gomc_iteration.split()
-
-            for j in range(0, len(e_values_gomc_iteration)):
-                if e_titles_gomc_iteration[j] == "ETITLE:":
-                    e_values_gomc_iteration_list.append(
-                        e_values_gomc_iteration[j]
-                    )
-                elif e_titles_gomc_iteration[j] == "STEP":
-                    e_values_gomc_iteration_list.append(
-                        int(int(e_values_gomc_iteration[j]) + current_step)
+        write_log_data = (
+            "ADAPTIVE_STEPS_DATA:\t{}\t\t{}\t\t{}\t\t{}\t\t{}\t\t{}\n".format(
+                cycle_no,
+                round(self.adaptive_cycle_steps.overhead_fraction, 6),
+                energy_checks_passed,
+                round(mult_scalar, 6),
+                self.namd_run_steps,
+                self.gomc_run_steps,
+            )
+        )
+        self.log_template_file.write(write_log_data)
+        print(write_log_data)
+
+    def compact_cycle_block(self, block_no):
+        """
+        Packs the NAMD and GOMC run folders of a block of finished cycles
+        into one archive for each engine, and deletes the run folders
+        (compact_cycles_block_size only).  The NAMD run 0 folders are not
+        packed, as all the NAMD runs use their FFT file.
+
+        Parameters
+        ----------
+        block_no : int
+            The block number, which has the cycles from
+            block_no * compact_cycles_block_size to
+            (block_no + 1) * compact_cycles_block_size - 1.
+
+        Returns
+        ---------
+        archive_data_list : list of [str, list of str, bool]
+            The archive filename, the run folders packed into it, and
+            whether the archive already existed (i.e., the run folders were
+            merged into it), for the NAMD and GOMC archives.
+        """
+        config = self.config
+
+        first_run_no = int(2 * block_no * config.compact_cycles_block_size)
+        last_run_no = int(
+            2 * (block_no + 1) * config.compact_cycles_block_size - 1
+        )
+
+        namd_run_directory_list = []
+        gomc_run_directory_list = []
+        for run_no in range(first_run_no, last_run_no + 1):
+            add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
+            if run_no % 2 == 0 and run_no != 0:
+                for box_letter_i in ["a", "b"]:
+                    namd_run_directory_list.append(
+                        "{}/{}/{}{}_{}".format(
+                            str(config.python_file_directory),
+                            config.path_namd_runs,
+                            str(add_zeros_at_start_run_no_str),
+                            str(run_no),
+                            box_letter_i,
+                        )
                     )
-                else:
-                    e_values_gomc_iteration_list.append(
-                        float(e_values_gomc_iteration[j]) * K_to_kcal_mol
+            elif run_no % 2 == 1:
+                gomc_run_directory_list.append(
+                    "{}/{}/{}{}".format(
+                        str(config.python_file_directory),
+                        config.path_gomc_runs,
+                        str(add_zeros_at_start_run_no_str),
+                        str(run_no),
                     )
-            e_values_gomc_list.append(e_values_gomc_iteration_list)
+                )
 
-        if (
-            line.startswith("STITLE:") is True
-            and get_v_p_totmol_rho_titles is True
-        ):
-            v_p_totmol_rho_titles_iteration = read_gomc_box_x_log_file[i]
-            v_p_totmol_rho_titles_iteration = (
-                v_p_totmol_rho_titles_iteration.split()
+        archive_data_list = []
+        for path_engine_runs, run_directory_list in [
+            [config.path_namd_runs, namd_run_directory_list],
+            [config.path_gomc_runs, gomc_run_directory_list],
+        ]:
+            archive_filename = "{}/{}/archive_runs_{}{}_{}{}.tar.{}".format(
+                str(config.python_file_directory),
+                path_engine_runs,
+                str(calc_folder_zeros(first_run_no)),
+                str(first_run_no),
+                str(calc_folder_zeros(last_run_no)),
+                str(last_run_no),
+                config.compact_cycles_compression,
             )
-            v_p_totmol_rho_titles_iteration = v_p_totmol_rho_titles_iteration[:]
-            if get_v_p_totmol_rho_titles is True:
-                get_v_p_totmol_rho_titles = False
-
-        if line.startswith("STAT_" + str(box_number) + ":") is True:
-            v_p_totmol_rho_values_iteration_list = []
-            v_p_totmol_rho_values_iteration = read_gomc_box_x_log_file[i]
-            v_p_totmol_rho_values_iteration = (
-                v_p_totmol_rho_values_iteration.split()
+            archive_exists = os.path.exists(archive_filename)
+            archive_data_list.append(
+                [
+                    archive_filename,
+                    write_run_directory_archive(
+                        archive_filename,
+                        run_directory_list,
+                        compression=config.compact_cycles_compression,
+                    ),
+                    archive_exists,
+                ]
             )
 
-            for j in range(0, len(v_p_totmol_rho_values_iteration)):
-                if v_p_totmol_rho_titles_iteration[j] == "STITLE:":
-                    v_p_totmol_rho_values_iteration_list.append(
-                        v_p_totmol_rho_values_iteration[j]
+        return archive_data_list
+
+    def submit_cycle_compaction(self, cycle_no):
+        """
+        Starts packing the blocks of cycles which are no longer needed to
+        restart the simulation into archives, in the background, after the
+        cycle_no cycle is finished (compact_cycles_block_size only).
+        The blocks are only packed when all their cycles are before the
+        finished cycle, so the last finished cycle is always kept in
+        its run folders.
+
+        Parameters
+        ----------
+        cycle_no : int
+            The finished cycle number, starting at zero.
+        """
+        self.log_finished_compactions()
+
+        if self.config.compact_cycles_block_size is None:
+            return
+
+        while (
+            self.next_compaction_block_no + 1
+        ) * self.config.compact_cycles_block_size <= cycle_no:
+            self.compaction_futures.append(
+                self.compaction_executor.submit(
+                    self.compact_cycle_block, self.next_compaction_block_no
+                )
+            )
+            self.next_compaction_block_no += 1
+
+    def log_finished_compactions(self, wait=False):
+        """
+        Writes the finished cycle compactions to the log file.  The log file
+        is only written by the main thread, so the log lines are not mixed.
+
+        Parameters
+        ----------
+        wait : bool, default=False
+            Wait for all the compactions to finish.
+        """
+        for compaction_future in list(self.compaction_futures):
+            if wait is False and compaction_future.done() is False:
+                continue
+            self.compaction_futures.remove(compaction_future)
+            try:
+                archive_data_list = compaction_future.result()
+            except Exception as compaction_error:
+                write_log_data = (
+                    "*************************************************\n"
+                    "WARNING: The run folders could not be packed into an "
+                    "archive, so they are kept, error = {} \n"
+                    "************************************************* \n".format(
+                        str(compaction_error)
                     )
-                elif v_p_totmol_rho_titles_iteration[j] == "STEP":
-                    v_p_totmol_rho_values_iteration_list.append(
-                        int(
-                            int(v_p_totmol_rho_values_iteration[j])
-                            + current_step
+                )
+                self.log_template_file.write(str(write_log_data))
+                warn(str(write_log_data))
+                continue
+
+            for (
+                archive_filename,
+                archived_run_directory_list,
+                archive_exists,
+            ) in archive_data_list:
+                if len(archived_run_directory_list) == 0:
+                    continue
+                if archive_exists is True:
+                    write_log_data = (
+                        "*************************************************\n"
+                        "WARNING: The archive already existed, so {} run "
+                        "folders were merged into it, replacing the same run "
+                        "folders in the archive, archive = {} \n"
+                        "************************************************* \n".format(
+                            str(len(archived_run_directory_list)),
+                            str(archive_filename),
                         )
                     )
-                else:
-                    v_p_totmol_rho_values_iteration_list.append(
-                        float(v_p_totmol_rho_values_iteration[j])
+                    self.log_template_file.write(str(write_log_data))
+                    warn(str(write_log_data))
+                    continue
+                write_log_data = (
+                    "*************************************************\n"
+                    "INFO: {} run folders were packed into the archive, "
+                    "archive = {} \n"
+                    "************************************************* \n".format(
+                        str(len(archived_run_directory_list)),
+                        str(archive_filename),
                     )
-            v_p_totmol_rho_values_list.append(
-                v_p_totmol_rho_values_iteration_list
-            )
-
-    gomc_energy_data_box_x_df = pd.DataFrame(
-        data=e_values_gomc_list, columns=e_titles_gomc_iteration
-    )
-
-    return gomc_energy_data_box_x_df
-
-
-def get_gomc_energy_data_kcal_per_mol(gomc_energy_data_box_x_df):
-    """
-    Gets the GOMC run energy data (electrostatic, potential, and VDW energies)
-    in kcal/mol.
+                )
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
 
-    Parameters
-    ----------
-    read_namd_box_x_energy_file : str
-        The full path/filename of the NAMD energy file for the selected box.
-    e_default_namd_titles : list
-        The default NAMD energy output strings, which are split into a
-        list of strings.
+    def step(self, run_no):
+        """
+        Runs a single NAMD or GOMC simulation in the hybrid simulation series.
 
-    Returns
-    ---------
-    gomc_e_electro_box_x_kcal_per_mol : list
-        The list of electrostatic energies as strings, as extracted from the
-        the GOMC run data ('TOTAL_ELECT').
-    gomc_e_electro_box_x_initial_value_kcal_mol : float
-        The initial electrostatic energy as a float, as extracted from the
-        the GOMC run data ('TOTAL_ELECT').
-    gomc_e_electro_box_x_final_value_kcal_mol : float
-        The final electrostatic energy as a float, as extracted from the
-        the GOMC run data ('TOTAL_ELECT').
-    gomc_e_potential_box_x_kcal_per_mol : str
-        The list of potential energies as strings, as extracted from the
-        the GOMC run data ('TOTAL').
-    gomc_e_potential_box_x_initial_value_kcal_mol : float
-        The initial potential energy as a float, as extracted from the
-        the GOMC run data ('TOTAL').
-    gomc_e_potential_box_x_final_value_kcal_mol : float
-        The final potential energy as a float, as extracted from the
-        the GOMC run data ('TOTAL').
-    gomc_e_lrc_box_x_kcal_per_mol : float
-        The list of LRC energy as a float, as extracted from the
-        the GOMC run data ('LRC').
-    gomc_e_lrc_box_x_initial_value_kcal_per_mol : float
-        The initial LRC energy as a float, as extracted from the
-        the GOMC run data ('LRC').
-    gomc_e_lrc_box_x_final_value_kcal_per_mol  : float
-        The final LRC energy as a float, as extracted from the
-        the GOMC run data ('LRC').
-    gomc_e_vdw_plus_elec_box_x_kcal_per_mol : str
-        The list of VDW + electrostatic energies as strings, as extracted from the
-        the GOMC run data ('INTRA(NB)' + 'INTER(LJ)' + 'TOTAL_ELECT' + 'LRC').
-    gomc_e_vdw_plus_elec_box_x_initial_value_kcal_per_mol : float
-        The intitial VDW + electrostatic energy as a float, as extracted from the
-        the GOMC run data ('INTRA(NB)' + 'INTER(LJ)' + 'TOTAL_ELECT' + 'LRC').
-    gomc_e_vdw_plus_elec_box_x_initial_value_kcal_per_mol : float
-        The final VDW + electrostatic energy as a float, as extracted from the
-        the GOMC run data ('INTRA(NB)' + 'INTER(LJ)' + 'TOTAL_ELECT' + 'LRC').
-        Generated the energy and system file data for specified
-        box number.
+        Parameters
+        ----------
+        run_no : int
+            Simulation run number.  The even run numbers are NAMD simulations
+            and the odd run numbers are GOMC simulations.
+        """
+        config = self.config
 
-    Notes
-    ---------
-    GOMC energy units are in kcal/mol
-    """
-    gomc_e_electro_box_x_kcal_per_mol = gomc_energy_data_box_x_df.loc[
-        :, "TOTAL_ELECT"
-    ].tolist()
-    gomc_e_electro_box_x_initial_value_kcal_mol = float(
-        gomc_e_electro_box_x_kcal_per_mol[0]
-    )
-    gomc_e_electro_box_x_final_value_kcal_mol = float(
-        gomc_e_electro_box_x_kcal_per_mol[-1]
-    )
+        # *************************************************
+        # *************************************************
+        # Simulation initial running or restart setup and run (Start)
+        # *************************************************
+        # *************************************************
 
-    gomc_e_potential_box_x_kcal_per_mol = gomc_energy_data_box_x_df.loc[
-        :, "TOTAL"
-    ].tolist()
-    gomc_e_potential_box_x_initial_value_kcal_mol = float(
-        gomc_e_potential_box_x_kcal_per_mol[0]
-    )
-    gomc_e_potential_box_x_final_value_kcal_mol = float(
-        gomc_e_potential_box_x_kcal_per_mol[-1]
-    )
+        # get the cycle start runtime.  it can only be even as the runs always start with NAMD
+        if run_no % 2 == 0:
+            self.cycle_start_time = datetime.datetime.today()
+            self.cycle_energy_checks_list = []
+        # set_box_numbers
+        box_number_0 = 0
+        box_number_1 = 1
 
-    gomc_e_intra_nb_box_x_kcal_per_mol = gomc_energy_data_box_x_df.loc[
-        :, "INTRA(NB)"
-    ].tolist()
-    gomc_e_intra_nb_box_x_initial_value = float(
-        gomc_e_intra_nb_box_x_kcal_per_mol[0]
-    )
-    gomc_e_intra_nb_box_x_final_value = float(
-        gomc_e_intra_nb_box_x_kcal_per_mol[-1]
-    )
+        try:
+            print(
+                "current step = {} (negative (-) for minimize "
+                "steps)".format(
+                    str(int(self.current_step - config.namd_minimize_steps))
+                )
+            )
+        except:
+            print("current step = NA (negative (-) for minimize steps)")
 
-    gomc_e_inter_lj_box_x_kcal_per_mol = gomc_energy_data_box_x_df.loc[
-        :, "INTER(LJ)"
-    ].tolist()
-    gomc_e_inter_lj_box_x_initial_value = float(
-        gomc_e_inter_lj_box_x_kcal_per_mol[0]
-    )
-    gomc_e_inter_lj_box_x_final_value = float(
-        gomc_e_inter_lj_box_x_kcal_per_mol[-1]
-    )
+        add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
 
-    gomc_e_lrc_box_x_kcal_per_mol = gomc_energy_data_box_x_df.loc[
-        :, "LRC"
-    ].tolist()
-    gomc_e_lrc_box_x_initial_value_kcal_per_mol = float(
-        gomc_e_lrc_box_x_kcal_per_mol[0]
-    )
-    gomc_e_lrc_box_x_final_value_kcal_per_mol = float(
-        gomc_e_lrc_box_x_kcal_per_mol[-1]
-    )
+        # setting the past file name in a restart
+        if (
+            run_no == self.starting_sims_namd_gomc
+            and self.starting_sims_namd_gomc != 0
+        ):
+            add_zeros_at_start_run_no_str = calc_folder_zeros(
+                int(self.starting_sims_namd_gomc - 2)
+            )
+            self.namd_box_0_newdir = "{}/{}/{}{}_a".format(
+                str(config.python_file_directory),
+                config.path_namd_runs,
+                str(add_zeros_at_start_run_no_str),
+                str(int(self.starting_sims_namd_gomc - 2)),
+            )
 
-    gomc_e_vdw_plus_elec_box_x_kcal_per_mol = []
-    for vwd_elec_i in range(0, len(gomc_e_intra_nb_box_x_kcal_per_mol)):
-        gomc_e_vdw_plus_elec_box_x_kcal_per_mol.append(
-            float(gomc_e_intra_nb_box_x_kcal_per_mol[vwd_elec_i])
-            + float(gomc_e_inter_lj_box_x_kcal_per_mol[vwd_elec_i])
-            + float(gomc_e_electro_box_x_kcal_per_mol[vwd_elec_i])
-            + float(gomc_e_lrc_box_x_kcal_per_mol[vwd_elec_i])
-        )
-    gomc_e_vdw_plus_elec_box_x_initial_value_kcal_mol = float(
-        gomc_e_vdw_plus_elec_box_x_kcal_per_mol[0]
-    )
-    gomc_e_vdw_plus_elec_box_x_final_value_kcal_mol = float(
-        gomc_e_vdw_plus_elec_box_x_kcal_per_mol[-1]
-    )
+            if (
+                config.simulation_type in ["GEMC"]
+                and config.only_use_box_0_for_namd_for_gemc is False
+            ):
+                self.namd_box_1_newdir = "{}/{}/{}{}_b".format(
+                    str(config.python_file_directory),
+                    config.path_namd_runs,
+                    str(add_zeros_at_start_run_no_str),
+                    str(int(self.starting_sims_namd_gomc - 2)),
+                )
 
-    return (
-        gomc_e_electro_box_x_kcal_per_mol,
-        gomc_e_electro_box_x_initial_value_kcal_mol,
-        gomc_e_electro_box_x_final_value_kcal_mol,
-        gomc_e_potential_box_x_kcal_per_mol,
-        gomc_e_potential_box_x_initial_value_kcal_mol,
-        gomc_e_potential_box_x_final_value_kcal_mol,
-        gomc_e_lrc_box_x_kcal_per_mol,
-        gomc_e_lrc_box_x_initial_value_kcal_per_mol,
-        gomc_e_lrc_box_x_final_value_kcal_per_mol,
-        gomc_e_vdw_plus_elec_box_x_kcal_per_mol,
-        gomc_e_vdw_plus_elec_box_x_initial_value_kcal_mol,
-        gomc_e_vdw_plus_elec_box_x_final_value_kcal_mol,
-    )
+            add_zeros_at_start_run_no_str = calc_folder_zeros(
+                int(self.starting_sims_namd_gomc - 1)
+            )
+            self.gomc_newdir = "{}/{}/{}{}".format(
+                str(config.python_file_directory),
+                config.path_gomc_runs,
+                str(add_zeros_at_start_run_no_str),
+                str(int(self.starting_sims_namd_gomc - 1)),
+            )
 
+            if self.resume_journal_record is None:
+                # the current step and the (adaptive) cycle steps are from
+                # the journal record of the GOMC run before the restart
+                restart_journal_record = None
+                if os.path.exists(config.journal_filename):
+                    restart_journal_record = read_journal_last_cycle_record(
+                        config.journal_filename,
+                        run_no=int(self.starting_sims_namd_gomc - 1),
+                    )
 
-for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
-    # *************************************************
-    # *************************************************
-    # Simulation initial running or restart setup and run (Start)
-    # *************************************************
-    # *************************************************
+                if restart_journal_record is not None:
+                    self.current_step = int(
+                        restart_journal_record["current_step"]
+                    )
+                    self.restore_cycle_run_steps(restart_journal_record)
+                elif config.adaptive_cycle_steps is True:
+                    # the cycle steps may not be the user input steps
+                    write_log_data = (
+                        "ERROR: The current step can not be calculated for "
+                        "the restart with the adaptive_cycle_steps, because "
+                        "the simulation journal <{}> has no finish record "
+                        "for the GOMC run {}.  Use the -resume flag, or "
+                        "restart without the adaptive_cycle_steps. \n".format(
+                            config.journal_filename,
+                            str(int(self.starting_sims_namd_gomc - 1)),
+                        )
+                    )
+                    self.log_template_file.write(str(write_log_data))
+                    raise ValueError(str(write_log_data))
+                else:
+                    # steps in number of cycles
+                    self.current_step = (
+                        (config.namd_run_steps + config.gomc_run_steps)
+                        * self.starting_at_cycle_namd_gomc_sims
+                        + config.namd_minimize_steps
+                    )
 
-    # get the cycle start runtime.  it can only be even as the runs always start with NAMD
-    if run_no % 2 == 0:
-        cycle_start_time = datetime.datetime.today()
-    # set_box_numbers
-    box_number_0 = 0
-    box_number_1 = 1
+                # the restart files are from the last GOMC run
+                self.cycle_state.update(
+                    int(self.starting_sims_namd_gomc - 1),
+                    self.current_step,
+                    [
+                        BoxState(box_number_i, "GOMC", self.gomc_newdir)
+                        for box_number_i in self.get_gomc_box_number_list()
+                    ],
+                )
+            else:
+                # the current step, the (adaptive) cycle steps and the
+                # restart files are from the last finished cycle in the journal
+                resume_journal_record = self.resume_journal_record
+                self.current_step = int(resume_journal_record["current_step"])
+                self.restore_cycle_run_steps(resume_journal_record)
+                self.cycle_state.update(
+                    int(resume_journal_record["run_no"]),
+                    self.current_step,
+                    [
+                        BoxState.from_journal_data(box_journal_data_i)
+                        for box_journal_data_i in resume_journal_record[
+                            "box_state_list"
+                        ]
+                    ],
+                )
 
-    try:
-        print(
-            "current step = {} (negative (-) for minimize "
-            "steps)".format(str(int(current_step - namd_minimize_steps)))
-        )
-    except:
-        print("current step = NA (negative (-) for minimize steps)")
+        elif (
+            run_no == self.starting_sims_namd_gomc
+            and self.starting_sims_namd_gomc == 0
+        ):
+            self.current_step = 0
+
+            # the first runs are started from the starting PDB and PSF files
+            starting_box_state_list = []
+            for box_number_i in self.get_gomc_box_number_list():
+                starting_box_state_list.append(
+                    BoxState(
+                        box_number_i,
+                        "start",
+                        pdb_file="{}/{}".format(
+                            str(config.python_file_directory),
+                            [
+                                config.starting_pdb_box_0_file,
+                                config.starting_pdb_box_1_file,
+                            ][box_number_i],
+                        ),
+                        psf_file="{}/{}".format(
+                            str(config.python_file_directory),
+                            [
+                                config.starting_psf_box_0_file,
+                                config.starting_psf_box_1_file,
+                            ][box_number_i],
+                        ),
+                    )
+                )
+            self.cycle_state.update(
+                None, self.current_step, starting_box_state_list
+            )
 
-    add_zeros_at_start_run_no_str = calc_folder_zeros(run_no)
+        # Delete FFT info from NAMD if starting a new simulation (i.e., run_no at start of running == 0)
+        if (
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+            and run_no == 0
+        ):
+            self.delete_namd_run_0_fft_file(box_number_0)
+            self.delete_namd_run_0_fft_file(box_number_1)
 
-    # setting the past file name in a restart
-    if run_no == starting_sims_namd_gomc and starting_sims_namd_gomc != 0:
-        add_zeros_at_start_run_no_str = calc_folder_zeros(
-            int(starting_sims_namd_gomc - 2)
-        )
-        namd_box_0_newdir = "{}/{}/{}{}_a".format(
-            str(python_file_directory),
-            path_namd_runs,
-            str(add_zeros_at_start_run_no_str),
-            str(int(starting_sims_namd_gomc - 2)),
-        )
+        elif run_no == 0:
+            self.delete_namd_run_0_fft_file(box_number_0)
 
+        # Get the NAMD_PME_GRID_DIMs upon restarting a simulation
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+            and (run_no == self.starting_sims_namd_gomc)
         ):
-            namd_box_1_newdir = "{}/{}/{}{}_b".format(
-                str(python_file_directory),
-                path_namd_runs,
-                str(add_zeros_at_start_run_no_str),
-                str(int(starting_sims_namd_gomc - 2)),
-            )
+            (
+                self.namd_x_pme_grid_box_0_dim,
+                self.namd_y_pme_grid_box_0_dim,
+                self.namd_z_pme_grid_box_0_dim,
+                self.namd_box_0_run_0_dir,
+            ) = self.get_namd_run_0_pme_dim(box_number_0)
+            (
+                self.namd_x_pme_grid_box_1_dim,
+                self.namd_y_pme_grid_box_1_dim,
+                self.namd_z_pme_grid_box_1_dim,
+                self.namd_box_1_run_0_dir,
+            ) = self.get_namd_run_0_pme_dim(box_number_1)
+
+        elif self.starting_sims_namd_gomc == run_no and (
+            run_no == self.starting_sims_namd_gomc
+        ):
+            (
+                self.namd_x_pme_grid_box_0_dim,
+                self.namd_y_pme_grid_box_0_dim,
+                self.namd_z_pme_grid_box_0_dim,
+                self.namd_box_0_run_0_dir,
+            ) = self.get_namd_run_0_pme_dim(box_number_0)
 
-        add_zeros_at_start_run_no_str = calc_folder_zeros(
-            int(starting_sims_namd_gomc - 1)
+        write_log_data = (
+            "*************************************************\n"
+            "*************************************************\n"
+            "run_no = {} (START)\n"
+            "************************************************* \n".format(
+                str(run_no)
+            )
         )
-        gomc_newdir = "{}/{}/{}{}".format(
-            str(python_file_directory),
-            path_gomc_runs,
-            str(add_zeros_at_start_run_no_str),
-            str(int(starting_sims_namd_gomc - 1)),
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
+
+        self.current_run_no = run_no
+        self.run_exit_status_dict = {}
+        self.journal.write_record(
+            {
+                "record": "start",
+                "run_no": run_no,
+                "engine": "NAMD" if run_no % 2 == 0 else "GOMC",
+                "current_step": self.current_step,
+            }
         )
 
-        # steps in number of cycles
-        current_step = (
-            namd_run_steps + gomc_run_steps
-        ) * starting_at_cycle_namd_gomc_sims + namd_minimize_steps
+        # the run 0 FFT file names do not change, so only search for them once
+        if run_no != 0 and self.namd_box_0_run_0_fft_namd_filename is None:
+            if (
+                config.simulation_type in ["GEMC"]
+                and config.only_use_box_0_for_namd_for_gemc is False
+                and self.starting_sims_namd_gomc == run_no
+            ):
+                (
+                    self.namd_box_0_run_0_fft_namd_filename,
+                    self.namd_box_0_run_0_dir,
+                ) = self.get_namd_run_0_fft_filename(box_number_0)
 
-    elif run_no == starting_sims_namd_gomc and starting_sims_namd_gomc == 0:
-        current_step = 0
+                (
+                    self.namd_box_1_run_0_fft_namd_filename,
+                    self.namd_box_1_run_0_dir,
+                ) = self.get_namd_run_0_fft_filename(box_number_1)
 
-    # Delete FFT info from NAMD if starting a new simulation (i.e., run_no at start of running == 0)
-    if (
-        simulation_type in ["GEMC"]
-        and only_use_box_0_for_namd_for_gemc is False
-        and run_no == 0
-    ):
-        delete_namd_run_0_fft_file(box_number_0)
-        delete_namd_run_0_fft_file(box_number_1)
+            else:
+                (
+                    self.namd_box_0_run_0_fft_namd_filename,
+                    self.namd_box_0_run_0_dir,
+                ) = self.get_namd_run_0_fft_filename(box_number_0)
+        # *************************************************
+        # *************************************************
+        # Simulation initial or restart setup (end)
+        # *************************************************
+        # *************************************************
 
-    elif run_no == 0:
-        delete_namd_run_0_fft_file(box_number_0)
+        if run_no % 2 == 0:
+            self.run_namd_simulations(run_no)
+        else:
+            self.run_gomc_simulation(run_no)
 
-    # Get the NAMD_PME_GRID_DIMs upon restarting a simulation
-    if (
-        simulation_type in ["GEMC"]
-        and only_use_box_0_for_namd_for_gemc is False
-        and (run_no == starting_sims_namd_gomc)
-    ):
-        (
-            namd_x_pme_grid_box_0_dim,
-            namd_y_pme_grid_box_0_dim,
-            namd_z_pme_grid_box_0_dim,
-            namd_box_0_run_0_dir,
-        ) = get_namd_run_0_pme_dim(box_number_0)
-        (
-            namd_x_pme_grid_box_1_dim,
-            namd_y_pme_grid_box_1_dim,
-            namd_z_pme_grid_box_1_dim,
-            namd_box_1_run_0_dir,
-        ) = get_namd_run_0_pme_dim(box_number_1)
-
-    elif starting_sims_namd_gomc == run_no and (
-        run_no == starting_sims_namd_gomc
-    ):
-        (
-            namd_x_pme_grid_box_0_dim,
-            namd_y_pme_grid_box_0_dim,
-            namd_z_pme_grid_box_0_dim,
-            namd_box_0_run_0_dir,
-        ) = get_namd_run_0_pme_dim(box_number_0)
-
-    write_log_data = (
-        "*************************************************\n"
-        "*************************************************\n"
-        "run_no = {} (START)\n"
-        "************************************************* \n".format(
-            str(run_no)
+        # get the cycle end runtime.  it can only be odd as the runs always ends with GOMC
+        if run_no % 2 == 1:
+            cycle_end_time = datetime.datetime.today()
+            cycle_run_time_s = round(
+                (cycle_end_time - self.cycle_start_time).total_seconds(), 6
+            )
+            python_only_time_s = round(
+                cycle_run_time_s
+                - (self.max_namd_cycle_time_s + self.gomc_cycle_time_s),
+                6,
+            )
+        # print the times stats for NAMD GOMC and total time header
+        if run_no == self.starting_sims_namd_gomc + 1:
+            write_log_data = (
+                "*************************************************\n"
+                "TIME_STATS_TITLE:\t#Cycle_No\t\tNAMD_time_s\t\t"
+                "GOMC_time_s\t\tPython_time_s\t\tTotal_time_s\n"
+            )
+            self.log_template_file.write(str(write_log_data))
+            print(str(write_log_data))
+
+        # print the times stats for NAMD GOMC and total time if on the end of the first cycle
+        if run_no >= self.starting_sims_namd_gomc + 1 and run_no % 2 == 1:
+            # cycle number will start at zero
+            cycle_no = int(run_no / 2)
+            if run_no != self.starting_sims_namd_gomc + 1:
+                write_log_data = (
+                    "*************************************************\n"
+                )
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
+            write_log_data = (
+                "TIME_STATS_DATA:\t{}\t\t{}\t\t{}\t\t{}\t\t{}\n".format(
+                    cycle_no,
+                    self.max_namd_cycle_time_s,
+                    self.gomc_cycle_time_s,
+                    python_only_time_s,
+                    cycle_run_time_s,
+                )
+            )
+            self.log_template_file.write(write_log_data)
+            print(write_log_data)
+
+            # the first cycle includes the engine startup and the
+            # minimization, so it is not used for the adaptive steps
+            if self.adaptive_cycle_steps is not None:
+                if run_no == self.starting_sims_namd_gomc + 1:
+                    write_log_data = (
+                        "ADAPTIVE_STEPS_TITLE:\t#Cycle_No\t\tOverhead_fraction\t\t"
+                        "Energy_checks_passed\t\tMult_scalar\t\t"
+                        "Next_NAMD_run_steps\t\tNext_GOMC_run_steps\n"
+                    )
+                    self.log_template_file.write(str(write_log_data))
+                    print(str(write_log_data))
+                    self.first_cycle_energy_checks_failed_fraction = (
+                        self.get_cycle_energy_checks_failed_fraction()
+                    )
+                else:
+                    self.update_adaptive_cycle_steps(
+                        cycle_no,
+                        self.max_namd_cycle_time_s,
+                        self.gomc_cycle_time_s,
+                        python_only_time_s,
+                    )
+        # *************************************************
+        # *************************************************
+        # Simulation initial running or restart setup and run (End)
+        # *************************************************
+        # *************************************************
+
+        write_log_data = (
+            "*************************************************\n"
+            "run_no = {} (End) \n".format(str(run_no))
         )
-    )
-    log_template_file.write(str(write_log_data))
-    print(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
+        print(str(write_log_data))
 
-    if run_no != 0:
-        if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
-            and starting_sims_namd_gomc == run_no
-        ):
-            (
-                namd_box_0_run_0_fft_namd_filename,
-                namd_box_0_run_0_dir,
-            ) = get_namd_run_0_fft_filename(box_number_0)
+        # the finish record of a GOMC run marks a finished cycle, and has the
+        # current step, the next cycle steps and the restart files for resuming
+        self.journal.write_record(
+            {
+                "record": "finish",
+                "run_no": run_no,
+                "engine": "NAMD" if run_no % 2 == 0 else "GOMC",
+                "exit_status_dict": self.run_exit_status_dict,
+                "current_step": self.current_step,
+                "namd_run_steps": self.namd_run_steps,
+                "gomc_run_steps": self.gomc_run_steps,
+                "box_state_list": [
+                    box_state_i.get_journal_data()
+                    for box_state_i in self.cycle_state.box_state_dict.values()
+                ],
+            }
+        )
 
-            (
-                namd_box_1_run_0_fft_namd_filename,
-                namd_box_1_run_0_dir,
-            ) = get_namd_run_0_fft_filename(box_number_1)
+        # the older cycles can be packed after the cycle is in the journal
+        if run_no % 2 == 1:
+            self.submit_cycle_compaction(int(run_no / 2))
+
+    def run_namd_simulations(self, run_no):
+        """
+        Writes the NAMD control file(s), runs the NAMD simulation(s)
+        and gets the final NAMD energies for the box(es).
+
+        Parameters
+        ----------
+        run_no : int
+            Simulation run number, which is always even for NAMD.
+        """
+        config = self.config
+        box_number_0 = 0
+        box_number_1 = 1
 
-        else:
-            (
-                namd_box_0_run_0_fft_namd_filename,
-                namd_box_0_run_0_dir,
-            ) = get_namd_run_0_fft_filename(box_number_0)
-    # *************************************************
-    # *************************************************
-    # Simulation initial or restart setup (end)
-    # *************************************************
-    # *************************************************
-
-    # *************************************************
-    # *************************************************
-    # RUN THE NAMD PORTION of the CODE (Start)
-    # *************************************************
-    # *************************************************
-    if (
-        run_no % 2 == 0
-    ):  # NAMD's staring run.  NAMD starts simulation series with energy minimization
         # *************************************************
         # build input file from template for box 0 (start)
         # *************************************************
 
-        try:
-            gomc_newdir
-        except:
-            gomc_newdir = "NA"
-
-        namd_box_0_newdir = write_namd_conf_file(
-            python_file_directory,
-            path_namd_template,
-            path_namd_runs,
-            gomc_newdir,
+        self.namd_box_0_newdir = self.write_namd_conf_file(
+            config.python_file_directory,
+            config.path_namd_template,
+            config.path_namd_runs,
+            self.cycle_state.box_state_dict[box_number_0],
             run_no,
             box_number_0,
-            namd_run_steps,
-            namd_minimize_steps,
-            namd_rst_dcd_xst_steps,
-            namd_console_blkavg_e_and_p_steps,
-            simulation_temp_k,
-            simulation_pressure_bar,
-            starting_pdb_box_0_file,
-            starting_psf_box_0_file,
-            namd_x_pme_grid_box_0_dim,
-            namd_y_pme_grid_box_0_dim,
-            namd_z_pme_grid_box_0_dim,
-            set_x_dim=set_dims_box_0_list[0],
-            set_y_dim=set_dims_box_0_list[1],
-            set_z_dim=set_dims_box_0_list[2],
+            self.namd_run_steps,
+            config.namd_minimize_steps,
+            self.namd_rst_dcd_xst_steps,
+            self.namd_console_blkavg_e_and_p_steps,
+            config.simulation_temp_k,
+            config.simulation_pressure_bar,
+            self.namd_x_pme_grid_box_0_dim,
+            self.namd_y_pme_grid_box_0_dim,
+            self.namd_z_pme_grid_box_0_dim,
+            set_x_dim=config.set_dims_box_0_list[0],
+            set_y_dim=config.set_dims_box_0_list[1],
+            set_z_dim=config.set_dims_box_0_list[2],
+            namd_console_e_steps=self.namd_console_e_steps,
         )
 
         # *************************************************
@@ -2867,32 +6878,31 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
         # build input file from template for box 1 (start)
         # *************************************************
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
         ):
 
-            namd_box_1_newdir = write_namd_conf_file(
-                python_file_directory,
-                path_namd_template,
-                path_namd_runs,
-                gomc_newdir,
+            self.namd_box_1_newdir = self.write_namd_conf_file(
+                config.python_file_directory,
+                config.path_namd_template,
+                config.path_namd_runs,
+                self.cycle_state.box_state_dict[box_number_1],
                 run_no,
                 box_number_1,
-                namd_run_steps,
-                namd_minimize_steps,
-                namd_rst_dcd_xst_steps,
-                namd_console_blkavg_e_and_p_steps,
-                simulation_temp_k,
-                simulation_pressure_bar,
-                starting_pdb_box_1_file,
-                starting_psf_box_1_file,
-                namd_x_pme_grid_box_1_dim,
-                namd_y_pme_grid_box_1_dim,
-                namd_z_pme_grid_box_1_dim,
-                set_x_dim=set_dims_box_1_list[0],
-                set_y_dim=set_dims_box_1_list[1],
-                set_z_dim=set_dims_box_1_list[2],
+                self.namd_run_steps,
+                config.namd_minimize_steps,
+                self.namd_rst_dcd_xst_steps,
+                self.namd_console_blkavg_e_and_p_steps,
+                config.simulation_temp_k,
+                config.simulation_pressure_bar,
+                self.namd_x_pme_grid_box_1_dim,
+                self.namd_y_pme_grid_box_1_dim,
+                self.namd_z_pme_grid_box_1_dim,
+                set_x_dim=config.set_dims_box_1_list[0],
+                set_y_dim=config.set_dims_box_1_list[1],
+                set_z_dim=config.set_dims_box_1_list[2],
                 fft_add_namd_ang_to_box_dim=0,
+                namd_console_e_steps=self.namd_console_e_steps,
             )
             # *************************************************
             # build input file from template for box 1 (end)
@@ -2905,164 +6915,206 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
             "*************************************************\n"
             "Running the initial NAMD simulations now. \n"
         )
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
 
-        # copy the old FFT files into the new folder
-        if run_no != 0:
-            # copy the FFT grid.txt file from the first NAMD simulation (i.e., Run 0) to the current dir
-            # for box_0
-            cp_namd_box_0_fft_run_0_new_dir_cmd = "ln -sf {}/{} {}".format(
-                str(namd_box_0_run_0_dir),
-                str(namd_box_0_run_0_fft_namd_filename),
-                str(namd_box_0_newdir),
-            )
-
-            exec_namd_box_0_cp_fft_run_0_new_dir_cmd = subprocess.Popen(
-                cp_namd_box_0_fft_run_0_new_dir_cmd,
-                shell=True,
-                stderr=subprocess.STDOUT,
-            )
-            os.wait4(exec_namd_box_0_cp_fft_run_0_new_dir_cmd.pid, os.WSTOPPED)
-        if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
-        ):
-            # find the FFT grid.txt file from the first NAMD simulation (i.e., Run 0) and copy it to
-            # to the current dir for box 0
-            if run_no != 0:
-                # copy the FFT grid.txt file from the first NAMD simulation (i.e., Run 0) to the current dir
-                # for box_0 and box_1
-
-                cp_namd_box_1_fft_run_0_new_dir_cmd = "ln -sf {}/{} {}".format(
-                    str(namd_box_1_run_0_dir),
-                    str(namd_box_1_run_0_fft_namd_filename),
-                    str(namd_box_1_newdir),
-                )
-
-                exec_namd_box1_cp_fft_run_0_new_dir_cmd = subprocess.Popen(
-                    cp_namd_box_1_fft_run_0_new_dir_cmd,
-                    shell=True,
-                    stderr=subprocess.STDOUT,
-                )
-                os.wait4(
-                    exec_namd_box1_cp_fft_run_0_new_dir_cmd.pid, os.WSTOPPED
-                )
-
         # run NAMD for box 0
         if (
-            simulation_type in ["GCMC", "NVT", "NPT"]
+            config.simulation_type in ["GCMC", "NVT", "NPT"]
             or (
-                simulation_type in ["GEMC"]
-                and only_use_box_0_for_namd_for_gemc is True
+                config.simulation_type in ["GEMC"]
+                and config.only_use_box_0_for_namd_for_gemc is True
             )
-            or namd_sim_order == "series"
+            or config.namd_sim_order == "series"
         ):
-            run_box_0_command = "cd {} && {} +p{} in.conf > out.dat".format(
-                str(namd_box_0_newdir),
-                str(namd_bin_file),
-                str(int(total_no_cores)),
-            )
+            no_cores_box_0_run = self.total_no_cores
 
         elif (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
-            and namd_sim_order == "parallel"
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+            and config.namd_sim_order == "parallel"
         ):
-            run_box_0_command = "cd {} && {} +p{} in.conf > out.dat".format(
-                str(namd_box_0_newdir),
-                str(namd_bin_file),
-                str(int(no_core_box_0)),
+            no_cores_box_0_run = self.no_core_box_0
+
+        # pin the parallel NAMD boxes to different CPU cores
+        cpu_set_box_0, cpu_set_box_1 = None, None
+        if (
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+            and config.namd_sim_order == "parallel"
+            and config.namd_core_pinning is True
+        ):
+            cpu_set_box_0, cpu_set_box_1 = self.get_namd_box_cpu_sets()
+
+        # the first NAMD simulation starts with the minimization steps
+        if run_no == 0:
+            namd_minimize_end_step = int(
+                self.current_step + config.namd_minimize_steps
             )
+        else:
+            namd_minimize_end_step = None
 
+        namd_box_0_log_follower = self.get_engine_log_follower(
+            "NAMD", self.namd_box_0_newdir
+        )
+        namd_box_0_watchdog = self.get_engine_watchdog(
+            "NAMD",
+            namd_box_0_log_follower,
+            minimize_end_step=namd_minimize_end_step,
+            engine_key="NAMD_box_0",
+        )
         namd_box_0_exec_start_time = datetime.datetime.today()
-        exec_run_box_0_command = subprocess.Popen(
-            run_box_0_command, shell=True, stderr=subprocess.STDOUT
+        exec_run_box_0_command = self.start_engine(
+            "NAMD_box_0",
+            config.namd_bin_file,
+            self.namd_box_0_newdir,
+            no_cores_box_0_run,
+            cpu_set=cpu_set_box_0,
         )
+        # prepare the next GOMC simulation while NAMD is running
+        self.submit_run_preparation(run_no + 1)
 
-        if namd_sim_order == "series":
+        if config.namd_sim_order == "series":
             write_log_data = "Waiting for initial NAMD simulation to finish. \n"
-            log_template_file.write(str(write_log_data))
+            self.log_template_file.write(str(write_log_data))
             print(str(write_log_data))
 
-            os.wait4(
-                exec_run_box_0_command.pid, os.WSTOPPED
+            self.wait_for_engine(
+                "NAMD_box_0",
+                exec_run_box_0_command,
+                log_follower_list=[namd_box_0_log_follower],
+                engine_watchdog=namd_box_0_watchdog,
             )  # pauses python until box 0 sim done
             namd_box_0_exec_end_time = datetime.datetime.today()
 
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
         ):
             # Run NAMD for box_1
-            if namd_sim_order == "series":
-                run_box_1_command = "cd {} && {} +p{} in.conf > out.dat".format(
-                    str(namd_box_1_newdir),
-                    str(namd_bin_file),
-                    str(int(total_no_cores)),
-                )
-            elif namd_sim_order == "parallel":
-                run_box_1_command = "cd {} && {} +p{} in.conf > out.dat".format(
-                    str(namd_box_1_newdir),
-                    str(namd_bin_file),
-                    str(int(no_core_box_1)),
-                )
+            if config.namd_sim_order == "series":
+                no_cores_box_1_run = self.total_no_cores
+            elif config.namd_sim_order == "parallel":
+                no_cores_box_1_run = self.no_core_box_1
 
+            namd_box_1_log_follower = self.get_engine_log_follower(
+                "NAMD", self.namd_box_1_newdir
+            )
+            namd_box_1_watchdog = self.get_engine_watchdog(
+                "NAMD",
+                namd_box_1_log_follower,
+                minimize_end_step=namd_minimize_end_step,
+                engine_key="NAMD_box_1",
+            )
             namd_box_1_exec_start_time = datetime.datetime.today()
-            exec_run_box_1_command = subprocess.Popen(
-                run_box_1_command, shell=True, stderr=subprocess.STDOUT
+            exec_run_box_1_command = self.start_engine(
+                "NAMD_box_1",
+                config.namd_bin_file,
+                self.namd_box_1_newdir,
+                no_cores_box_1_run,
+                cpu_set=cpu_set_box_1,
             )
-            if namd_sim_order == "series":
-                os.wait4(
-                    exec_run_box_1_command.pid, os.WSTOPPED
+            if config.namd_sim_order == "series":
+                self.wait_for_engine(
+                    "NAMD_box_1",
+                    exec_run_box_1_command,
+                    log_follower_list=[namd_box_1_log_follower],
+                    engine_watchdog=namd_box_1_watchdog,
                 )  # pauses python until box 1 sim done
                 namd_box_1_exec_end_time = datetime.datetime.today()
 
-        if namd_sim_order == "parallel":
+        if config.namd_sim_order == "parallel":
             write_log_data = "Waiting for initial NAMD simulation to finish. \n"
-            log_template_file.write(str(write_log_data))
+            self.log_template_file.write(str(write_log_data))
             print(str(write_log_data))
 
-            os.wait4(
-                exec_run_box_0_command.pid, os.WSTOPPED
-            )  # pauses python until box 0 sim done
-            namd_box_0_exec_end_time = datetime.datetime.today()
-
+            # wait for both boxes at the same time, so the end time of
+            # each box is recorded when that box finishes
+            exec_namd_engine_dict = {"NAMD_box_0": exec_run_box_0_command}
+            namd_log_follower_list = [namd_box_0_log_follower]
+            namd_watchdog_dict = {"NAMD_box_0": namd_box_0_watchdog}
             if (
-                simulation_type in ["GEMC"]
-                and only_use_box_0_for_namd_for_gemc is False
+                config.simulation_type in ["GEMC"]
+                and config.only_use_box_0_for_namd_for_gemc is False
             ):
-                os.wait4(
-                    exec_run_box_1_command.pid, os.WSTOPPED
-                )  # pauses python until box 1 sim done
-                namd_box_1_exec_end_time = datetime.datetime.today()
+                exec_namd_engine_dict["NAMD_box_1"] = exec_run_box_1_command
+                namd_log_follower_list.append(namd_box_1_log_follower)
+                namd_watchdog_dict["NAMD_box_1"] = namd_box_1_watchdog
+
+            namd_engine_done_dict = wait_for_engines(
+                exec_namd_engine_dict,
+                log_follower_list=namd_log_follower_list,
+                engine_watchdog_dict={
+                    engine_key: engine_watchdog
+                    for engine_key, engine_watchdog in namd_watchdog_dict.items()
+                    if engine_watchdog is not None
+                },
+            )  # pauses python until the box 0 and 1 sims are done
+            for engine_key, engine_done_list in namd_engine_done_dict.items():
+                self.check_engine_exit_status(
+                    engine_key,
+                    engine_done_list[0],
+                    engine_watchdog=namd_watchdog_dict[engine_key],
+                )
+
+            namd_box_0_exec_end_time = namd_engine_done_dict["NAMD_box_0"][1]
+            if "NAMD_box_1" in namd_engine_done_dict:
+                namd_box_1_exec_end_time = namd_engine_done_dict["NAMD_box_1"][
+                    1
+                ]
 
-        namd_box_0_cycle_time_s = (
-            namd_box_0_exec_end_time - namd_box_0_exec_start_time
-        ).total_seconds()
+        self.namd_box_0_cycle_time_s = round(
+            (
+                namd_box_0_exec_end_time - namd_box_0_exec_start_time
+            ).total_seconds(),
+            6,
+        )
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
         ):
-            namd_box_1_cycle_time_s = (
-                namd_box_1_exec_end_time - namd_box_1_exec_start_time
-            ).total_seconds()
-            if namd_sim_order == "series":
-                max_namd_cycle_time_s = round(
-                    namd_box_0_cycle_time_s + namd_box_1_cycle_time_s, 6
-                )
-            elif namd_sim_order == "parallel":
-                max_namd_cycle_time_s = round(
+            self.namd_box_1_cycle_time_s = round(
+                (
+                    namd_box_1_exec_end_time - namd_box_1_exec_start_time
+                ).total_seconds(),
+                6,
+            )
+            if config.namd_sim_order == "series":
+                self.max_namd_cycle_time_s = round(
+                    self.namd_box_0_cycle_time_s + self.namd_box_1_cycle_time_s,
+                    6,
+                )
+            elif config.namd_sim_order == "parallel":
+                self.max_namd_cycle_time_s = round(
                     np.maximum(
-                        namd_box_0_cycle_time_s, namd_box_1_cycle_time_s
+                        self.namd_box_0_cycle_time_s,
+                        self.namd_box_1_cycle_time_s,
                     ),
                     6,
                 )
+
+                write_log_data = (
+                    "NAMD_BOX_TIME_STATS:\tbox 0 = {} s ({} cores)\t\t"
+                    "box 1 = {} s ({} cores)\n".format(
+                        self.namd_box_0_cycle_time_s,
+                        no_cores_box_0_run,
+                        self.namd_box_1_cycle_time_s,
+                        no_cores_box_1_run,
+                    )
+                )
+                self.log_template_file.write(str(write_log_data))
+                print(str(write_log_data))
+
+                if config.namd_core_rebalance is True:
+                    self.rebalance_namd_box_cores(
+                        self.namd_box_0_cycle_time_s,
+                        self.namd_box_1_cycle_time_s,
+                    )
         else:
-            max_namd_cycle_time_s = round(namd_box_0_cycle_time_s, 6)
+            self.max_namd_cycle_time_s = self.namd_box_0_cycle_time_s
 
         write_log_data = "The NAMD simulation are finished. \n"
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
 
         # *************************************************
@@ -3072,9 +7124,17 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
         # *****************************************************
         # get final system energies for box 0 and 1 (start)
         # ***********************initial_Energies**************
-        read_namd_box_0_energy_file = open(
-            "{}/out.dat".format(str(namd_box_0_newdir)), "r"
-        ).readlines()
+        # the energy lines were read while NAMD was running
+        read_namd_box_0_energy_file = namd_box_0_log_follower.get_log_lines()
+        # the ENERGY: rows are printed every namd_console_e_steps,
+        # including the minimization steps, plus the starting step
+        namd_expected_no_energy_rows = (
+            int(
+                (self.namd_run_steps + config.namd_minimize_steps)
+                / self.namd_console_e_steps
+            )
+            + 1
+        )
         # note NAMD energy units in kcal/mol (no modifications required)
         # generate energy file data for box 0
 
@@ -3084,23 +7144,25 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
             namd_e_electro_box_0_final_value,
             namd_e_potential_box_0,
             namd_e_potential_box_0_initial_value,
-            namd_e_potential_box_0_final_value,
+            self.namd_e_potential_box_0_final_value,
             namd_e_vdw_plus_elec_box_0,
             namd_e_vdw_plus_elec_box_0_initial_value,
-            namd_e_vdw_plus_elec_box_0_final_value,
+            self.namd_e_vdw_plus_elec_box_0_final_value,
         ) = get_namd_energy_data(
-            read_namd_box_0_energy_file, default_namd_e_titles
+            read_namd_box_0_energy_file,
+            default_namd_e_titles,
+            expected_no_rows=namd_expected_no_energy_rows,
         )
 
         # note NAMD energy units in kcal/mol (no modifications required)
         # generate energy file data for box 1
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
         ):
-            read_namd_box_1_energy_file = open(
-                "{}/out.dat".format(str(namd_box_1_newdir)), "r"
-            ).readlines()
+            read_namd_box_1_energy_file = (
+                namd_box_1_log_follower.get_log_lines()
+            )
 
             (
                 namd_e_electro_box_1,
@@ -3108,137 +7170,176 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
                 namd_e_electro_box_1_final_value,
                 namd_e_potential_box_1,
                 namd_e_potential_box_1_initial_value,
-                namd_e_potential_box_1_final_value,
+                self.namd_e_potential_box_1_final_value,
                 namd_e_vdw_plus_elec_box_1,
                 namd_e_vdw_plus_elec_box_1_initial_value,
-                namd_e_vdw_plus_elec_box_1_final_value,
+                self.namd_e_vdw_plus_elec_box_1_final_value,
             ) = get_namd_energy_data(
-                read_namd_box_1_energy_file, default_namd_e_titles
+                read_namd_box_1_energy_file,
+                default_namd_e_titles,
+                expected_no_rows=namd_expected_no_energy_rows,
             )
 
-        if run_no != 0 and run_no != starting_sims_namd_gomc:
+        if run_no != 0 and run_no != self.starting_sims_namd_gomc:
             # Compare the Last GOMC and first NAMD value to confirm the simulation data
             # VMD comparison between NAMD and GOMC data box 0
 
-            compare_namd_gomc_energies(
-                gomc_e_potential_box_0_final_value,
-                namd_e_potential_box_0_initial_value,
-                gomc_e_vdw_plus_elec_box_0_final_value,
-                namd_e_vdw_plus_elec_box_0_initial_value,
-                run_no,
-                box_number_0,
+            self.cycle_energy_checks_list.append(
+                self.compare_namd_gomc_energies(
+                    self.gomc_e_potential_box_0_final_value,
+                    namd_e_potential_box_0_initial_value,
+                    self.gomc_e_vdw_plus_elec_box_0_final_value,
+                    namd_e_vdw_plus_elec_box_0_initial_value,
+                    run_no,
+                    box_number_0,
+                )
             )
             if (
-                simulation_type in ["GEMC"]
-                and only_use_box_0_for_namd_for_gemc is False
+                config.simulation_type in ["GEMC"]
+                and config.only_use_box_0_for_namd_for_gemc is False
             ):
-                compare_namd_gomc_energies(
-                    gomc_e_potential_box_1_final_value,
-                    namd_e_potential_box_1_initial_value,
-                    gomc_e_vdw_plus_elec_box_1_final_value,
-                    namd_e_vdw_plus_elec_box_1_initial_value,
-                    run_no,
-                    box_number_1,
+                self.cycle_energy_checks_list.append(
+                    self.compare_namd_gomc_energies(
+                        self.gomc_e_potential_box_1_final_value,
+                        namd_e_potential_box_1_initial_value,
+                        self.gomc_e_vdw_plus_elec_box_1_final_value,
+                        namd_e_vdw_plus_elec_box_1_initial_value,
+                        run_no,
+                        box_number_1,
+                    )
                 )
 
         # get the NAMD FFT file name to copy for future NAMD simulations if starting a new NAMD/GOMC simulation
         if run_no == 0:
             if (
-                simulation_type in ["GEMC"]
-                and only_use_box_0_for_namd_for_gemc is False
-                and starting_sims_namd_gomc == run_no
+                config.simulation_type in ["GEMC"]
+                and config.only_use_box_0_for_namd_for_gemc is False
+                and self.starting_sims_namd_gomc == run_no
             ):
                 (
-                    namd_box_0_run_0_fft_namd_filename,
-                    namd_box_0_run_0_dir,
-                ) = get_namd_run_0_fft_filename(box_number_0)
+                    self.namd_box_0_run_0_fft_namd_filename,
+                    self.namd_box_0_run_0_dir,
+                ) = self.get_namd_run_0_fft_filename(box_number_0)
                 (
-                    namd_box_1_run_0_fft_namd_filename,
-                    namd_box_1_run_0_dir,
-                ) = get_namd_run_0_fft_filename(box_number_1)
+                    self.namd_box_1_run_0_fft_namd_filename,
+                    self.namd_box_1_run_0_dir,
+                ) = self.get_namd_run_0_fft_filename(box_number_1)
             else:
                 (
-                    namd_box_0_run_0_fft_namd_filename,
-                    namd_box_0_run_0_dir,
-                ) = get_namd_run_0_fft_filename(box_number_0)
+                    self.namd_box_0_run_0_fft_namd_filename,
+                    self.namd_box_0_run_0_dir,
+                ) = self.get_namd_run_0_fft_filename(box_number_0)
 
         # Get the NAMD_PME_GRID_DIMs upon finishing a new simulation
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
-            and (run_no == starting_sims_namd_gomc)
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+            and (run_no == self.starting_sims_namd_gomc)
         ):
             (
-                namd_x_pme_grid_box_0_dim,
-                namd_y_pme_grid_box_0_dim,
-                namd_z_pme_grid_box_0_dim,
-                namd_box_0_run_0_dir,
-            ) = get_namd_run_0_pme_dim(box_number_0)
+                self.namd_x_pme_grid_box_0_dim,
+                self.namd_y_pme_grid_box_0_dim,
+                self.namd_z_pme_grid_box_0_dim,
+                self.namd_box_0_run_0_dir,
+            ) = self.get_namd_run_0_pme_dim(box_number_0)
             (
-                namd_x_pme_grid_box_1_dim,
-                namd_y_pme_grid_box_1_dim,
-                namd_z_pme_grid_box_1_dim,
-                namd_box_1_run_0_dir,
-            ) = get_namd_run_0_pme_dim(box_number_1)
-
-        elif starting_sims_namd_gomc == run_no and (
-            run_no == starting_sims_namd_gomc
+                self.namd_x_pme_grid_box_1_dim,
+                self.namd_y_pme_grid_box_1_dim,
+                self.namd_z_pme_grid_box_1_dim,
+                self.namd_box_1_run_0_dir,
+            ) = self.get_namd_run_0_pme_dim(box_number_1)
+
+        elif self.starting_sims_namd_gomc == run_no and (
+            run_no == self.starting_sims_namd_gomc
         ):
             (
-                namd_x_pme_grid_box_0_dim,
-                namd_y_pme_grid_box_0_dim,
-                namd_z_pme_grid_box_0_dim,
-                namd_box_0_run_0_dir,
-            ) = get_namd_run_0_pme_dim(box_number_0)
+                self.namd_x_pme_grid_box_0_dim,
+                self.namd_y_pme_grid_box_0_dim,
+                self.namd_z_pme_grid_box_0_dim,
+                self.namd_box_0_run_0_dir,
+            ) = self.get_namd_run_0_pme_dim(box_number_0)
 
         if run_no != 0:
-            current_step += namd_run_steps
+            self.current_step += self.namd_run_steps
         else:
-            current_step += namd_run_steps + namd_minimize_steps
+            self.current_step += (
+                self.namd_run_steps + config.namd_minimize_steps
+            )
+
+        # the NAMD boxes keep the PDB and PSF files they were started from
+        namd_box_state_list = [
+            BoxState(
+                box_number_0,
+                "NAMD",
+                self.namd_box_0_newdir,
+                pdb_file=self.cycle_state.box_state_dict[
+                    box_number_0
+                ].restart_file_dict["pdb"],
+                psf_file=self.cycle_state.box_state_dict[
+                    box_number_0
+                ].restart_file_dict["psf"],
+            )
+        ]
+        if (
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
+        ):
+            namd_box_state_list.append(
+                BoxState(
+                    box_number_1,
+                    "NAMD",
+                    self.namd_box_1_newdir,
+                    pdb_file=self.cycle_state.box_state_dict[
+                        box_number_1
+                    ].restart_file_dict["pdb"],
+                    psf_file=self.cycle_state.box_state_dict[
+                        box_number_1
+                    ].restart_file_dict["psf"],
+                )
+            )
+        self.cycle_state.update(run_no, self.current_step, namd_box_state_list)
         # *************************************
         # get final system energies for box 0 and 1 (end)
-        # *************************************
-    # *************************************************
-    # *************************************************
-    # RUN THE NAMD PORTION of the CODE (End)
-    # *************************************************
-    # *************************************************
-
-    # *************************************************
-    # *************************************************
-    # RUN THE GOMC PORTION of the CODE (Start)
-    # *************************************************
-    # *************************************************
-    elif run_no % 2 == 1:  # GOMC's run time.  GOMC starts simulation series
+
+    def run_gomc_simulation(self, run_no):
+        """
+        Writes the GOMC control file, runs the GOMC simulation and
+        compares the initial GOMC energies to the final NAMD energies.
+
+        Parameters
+        ----------
+        run_no : int
+            Simulation run number, which is always odd for GOMC.
+        """
+        config = self.config
+        box_number_0 = 0
+        box_number_1 = 1
+
         # GOMC runs
         # *************************************************
         # build input file from template the GOMC simulation (start)
         # *************************************************
-        try:
-            previous_gomc_dir = gomc_newdir
-        except:
-            previous_gomc_dir = "NA"
+        self.previous_gomc_dir = self.gomc_newdir
 
-        gomc_newdir = write_gomc_conf_file(
-            python_file_directory,
-            path_gomc_runs,
+        self.gomc_newdir = self.write_gomc_conf_file(
+            config.python_file_directory,
+            config.path_gomc_runs,
             run_no,
-            gomc_run_steps,
-            gomc_rst_coor_ckpoint_steps,
-            gomc_console_blkavg_hist_steps,
-            gomc_hist_sample_steps,
-            simulation_temp_k,
-            simulation_pressure_bar,
-            starting_pdb_box_0_file,
-            starting_pdb_box_1_file,
-            starting_psf_box_0_file,
-            starting_psf_box_1_file,
+            self.gomc_run_steps,
+            self.gomc_rst_coor_ckpoint_steps,
+            self.gomc_console_blkavg_hist_steps,
+            self.gomc_hist_sample_steps,
+            config.simulation_temp_k,
+            config.simulation_pressure_bar,
+            self.cycle_state.box_state_dict[box_number_0],
+            box_1_state=self.cycle_state.box_state_dict.get(box_number_1),
+            gomc_console_steps=self.gomc_console_steps,
         )
 
         write_log_data = "GOMC simulation data for simulation number {} is completed. \n".format(
             str(run_no)
         )
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
 
         # *************************************************
@@ -3253,37 +7354,45 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
             "*************************************************\n"
             "Running the GOMC simulations now. \n"
         )
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
-        run_gomc_command = "cd {} && {} +p{} in.conf > out.dat".format(
-            str(gomc_newdir), str(gomc_bin_file), str(int(total_no_cores))
+        gomc_log_follower = self.get_engine_log_follower(
+            "GOMC", self.gomc_newdir
         )
-
+        gomc_watchdog = self.get_engine_watchdog("GOMC", gomc_log_follower)
         previous_namd_dir = datetime.datetime.today()
-        exec_gomc_run_command = subprocess.Popen(
-            run_gomc_command, shell=True, stderr=subprocess.STDOUT
+        exec_gomc_run_command = self.start_engine(
+            "GOMC",
+            config.gomc_bin_file,
+            self.gomc_newdir,
+            self.total_no_cores,
         )
+        # prepare the next NAMD simulation while GOMC is running
+        self.submit_run_preparation(run_no + 1)
 
         write_log_data = "Waiting for initial GOMC simulation to finish."
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
-        os.wait4(
-            exec_gomc_run_command.pid, os.WSTOPPED
+        self.wait_for_engine(
+            "GOMC",
+            exec_gomc_run_command,
+            log_follower_list=[gomc_log_follower],
+            engine_watchdog=gomc_watchdog,
         )  # pauses python until box 0 sim done
         gomc_exec_end_time = datetime.datetime.today()
-        gomc_cycle_time_s = round(
+        self.gomc_cycle_time_s = round(
             (gomc_exec_end_time - previous_namd_dir).total_seconds(), 6
         )
 
         write_log_data = "The GOMC simulation(s) are finished."
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
 
         write_log_data = (
             "Completed simulation in GOMC command\n"
             "************************************************* \n"
         )
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
 
         # *************************************************
@@ -3293,17 +7402,21 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
         # *******************************************************
         # get final system energies for box 0 and 1 (start)
         # ***********************initial_Energies**************
-        read_gomc_log_file = open(
-            "{}/out.dat".format(str(gomc_newdir)), "r"
-        ).readlines()
-        gomc_energy_data_box_0_df = get_gomc_energy_data(
-            read_gomc_log_file, box_number_0
+        # read the energies for both boxes from the log file lines, which
+        # were read while GOMC was running
+        (
+            gomc_energy_data_box_df_dict,
+            gomc_stat_data_box_df_dict,
+        ) = read_gomc_log_data(
+            gomc_log_follower.get_log_lines(),
+            current_step=self.current_step,
         )
+        gomc_energy_data_box_0_df = gomc_energy_data_box_df_dict[box_number_0]
 
-        if simulation_type in ["GEMC", "GCMC"]:
-            gomc_energy_data_box_1_df = get_gomc_energy_data(
-                read_gomc_log_file, box_number_1
-            )
+        if config.simulation_type in ["GEMC", "GCMC"]:
+            gomc_energy_data_box_1_df = gomc_energy_data_box_df_dict[
+                box_number_1
+            ]
 
         # retrieve energy data from the printed file for the first and last points for box 0
         # extrated in units of kcal per mol
@@ -3313,17 +7426,17 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
             gomc_e_electro_box_0_final_value,
             gomc_e_potential_box_0_kcal_per_mol,
             gomc_e_potential_box_0_initial_value,
-            gomc_e_potential_box_0_final_value,
+            self.gomc_e_potential_box_0_final_value,
             gomc_e_lrc_box_0_kcal_per_mol,
             gomc_e_lrc_box_0_initial_value_kcal_per_mol,
             gomc_e_lrc_box_0_final_value_kcal_per_mol,
             gomc_e_vdw_plus_elec_box_0_kcal_per_mol,
             gomc_e_vdw_plus_elec_box_0_initial_value,
-            gomc_e_vdw_plus_elec_box_0_final_value,
+            self.gomc_e_vdw_plus_elec_box_0_final_value,
         ) = get_gomc_energy_data_kcal_per_mol(gomc_energy_data_box_0_df)
 
         # retrieve energy data from the printed file for the first and last points for box 1s
-        if simulation_type in ["GEMC", "GCMC"]:
+        if config.simulation_type in ["GEMC", "GCMC"]:
             # extrated in units of kcal per mol
             (
                 gomc_e_electro_box_1_kcal_per_mol,
@@ -3331,13 +7444,13 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
                 gomc_e_electro_box_1_final_value,
                 gomc_e_potential_box_1_kcal_per_mol,
                 gomc_e_potential_box_1_initial_value,
-                gomc_e_potential_box_1_final_value,
+                self.gomc_e_potential_box_1_final_value,
                 gomc_e_lrc_box_1_kcal_per_mol,
                 gomc_e_lrc_box_1_initial_value_kcal_per_mol,
                 gomc_e_lrc_box_1_final_value_kcal_per_mol,
                 gomc_e_vdw_plus_elec_box_1_kcal_per_mol,
                 gomc_e_vdw_plus_elec_box_1_initial_value,
-                gomc_e_vdw_plus_elec_box_1_final_value,
+                self.gomc_e_vdw_plus_elec_box_1_final_value,
             ) = get_gomc_energy_data_kcal_per_mol(gomc_energy_data_box_1_df)
 
         # *******************************************************
@@ -3346,96 +7459,134 @@ for run_no in range(starting_sims_namd_gomc, total_sims_namd_gomc):
 
         # Compare the Last NAMD and first GOMC value to confirm the simulation data
         # VMD comparison between NAMD and GOMC data box 0
-        compare_namd_gomc_energies(
-            namd_e_potential_box_0_final_value,
-            gomc_e_potential_box_0_initial_value,
-            namd_e_vdw_plus_elec_box_0_final_value,
-            gomc_e_vdw_plus_elec_box_0_initial_value,
-            run_no,
-            box_number_0,
+        self.cycle_energy_checks_list.append(
+            self.compare_namd_gomc_energies(
+                self.namd_e_potential_box_0_final_value,
+                gomc_e_potential_box_0_initial_value,
+                self.namd_e_vdw_plus_elec_box_0_final_value,
+                gomc_e_vdw_plus_elec_box_0_initial_value,
+                run_no,
+                box_number_0,
+            )
         )
         if (
-            simulation_type in ["GEMC"]
-            and only_use_box_0_for_namd_for_gemc is False
+            config.simulation_type in ["GEMC"]
+            and config.only_use_box_0_for_namd_for_gemc is False
         ):
-            compare_namd_gomc_energies(
-                namd_e_potential_box_1_final_value,
-                gomc_e_potential_box_1_initial_value,
-                namd_e_vdw_plus_elec_box_1_final_value,
-                gomc_e_vdw_plus_elec_box_1_initial_value,
-                run_no,
-                box_number_1,
+            self.cycle_energy_checks_list.append(
+                self.compare_namd_gomc_energies(
+                    self.namd_e_potential_box_1_final_value,
+                    gomc_e_potential_box_1_initial_value,
+                    self.namd_e_vdw_plus_elec_box_1_final_value,
+                    gomc_e_vdw_plus_elec_box_1_initial_value,
+                    run_no,
+                    box_number_1,
+                )
             )
 
-        current_step += gomc_run_steps
+        self.current_step += self.gomc_run_steps
 
-    # get the cycle end runtime.  it can only be odd as the runs always ends with GOMC
-    if run_no % 2 == 1:
-        cycle_end_time = datetime.datetime.today()
-        cycle_run_time_s = round(
-            (cycle_end_time - cycle_start_time).total_seconds(), 6
-        )
-        python_only_time_s = round(
-            cycle_run_time_s - (max_namd_cycle_time_s + gomc_cycle_time_s), 6
+        self.cycle_state.update(
+            run_no,
+            self.current_step,
+            [
+                BoxState(box_number_i, "GOMC", self.gomc_newdir)
+                for box_number_i in self.get_gomc_box_number_list()
+            ],
         )
-    # print the times stats for NAMD GOMC and total time header
-    if run_no == starting_sims_namd_gomc + 1:
+
+    def run_cycle(self, cycle_no):
+        """
+        Runs one full hybrid cycle, which is a NAMD simulation followed
+        by a GOMC simulation.
+
+        Parameters
+        ----------
+        cycle_no : int
+            The cycle number, starting at zero.
+        """
+        self.step(int(2 * cycle_no))
+        self.step(int(2 * cycle_no + 1))
+
+    def run(self):
+        """
+        Runs all the hybrid NAMD/GOMC simulations, from the starting
+        cycle to the total number of cycles.
+        """
+        self.setup()
+        try:
+            for run_no in range(
+                self.starting_sims_namd_gomc,
+                self.config.total_sims_namd_gomc,
+            ):
+                self.step(run_no)
+        finally:
+            self.engine_executor.close()
+            self.run_preparation_executor.shutdown(wait=True)
+            self.compaction_executor.shutdown(wait=True)
+            if self.log_template_file is not None:
+                self.log_finished_compactions(wait=True)
+            if self.journal is not None:
+                self.journal.close()
+        self.finish()
+
+    def finish(self):
+        """
+        Writes the end time and total simulation time to the log file
+        and closes the log file.
+        """
+        end_time = datetime.datetime.today()
+        end_time_s = datetime.datetime.today()
+        total_time = end_time - self.start_time
+        total_time_s = (end_time_s - self.start_time_s).total_seconds()
         write_log_data = (
             "*************************************************\n"
-            "TIME_STATS_TITLE:\t#Cycle_No\t\tNAMD_time_s\t\t"
-            "GOMC_time_s\t\tPython_time_s\t\tTotal_time_s\n"
+            "date and time (end) = {} \n"
+            "total simulation time = {} \n"
+            "total simulation time (s) = {} \n"
+            "************************************************* \n".format(
+                str(end_time), str(total_time), str(total_time_s)
+            )
         )
-        log_template_file.write(str(write_log_data))
+        self.log_template_file.write(str(write_log_data))
         print(str(write_log_data))
 
-    # print the times stats for NAMD GOMC and total time if on the end of the first cycle
-    if run_no >= starting_sims_namd_gomc + 1 and run_no % 2 == 1:
-        # cycle number will start at zero
-        cycle_no = int(run_no / 2)
-        if run_no != starting_sims_namd_gomc + 1:
-            write_log_data = (
-                "*************************************************\n"
-            )
-            log_template_file.write(str(write_log_data))
-            print(str(write_log_data))
-        write_log_data = (
-            "TIME_STATS_DATA:\t{}\t\t{}\t\t{}\t\t{}\t\t{}\n".format(
-                cycle_no,
-                max_namd_cycle_time_s,
-                gomc_cycle_time_s,
-                python_only_time_s,
-                cycle_run_time_s,
-            )
-        )
-        log_template_file.write(write_log_data)
-        print(write_log_data)
-    # *************************************************
-    # *************************************************
-    # Simulation initial running or restart setup and run (End)
-    # *************************************************
-    # *************************************************
-
-    write_log_data = (
-        "*************************************************\n"
-        "run_no = {} (End) \n".format(str(run_no))
-    )
-    log_template_file.write(str(write_log_data))
-    print(str(write_log_data))
-
-end_time = datetime.datetime.today()
-end_time_s = datetime.datetime.today()
-total_time = end_time - start_time
-total_time_s = (end_time_s - start_time_s).total_seconds()
-write_log_data = (
-    "*************************************************\n"
-    "date and time (end) = {} \n"
-    "total simulation time = {} \n"
-    "total simulation time (s) = {} \n"
-    "************************************************* \n".format(
-        str(end_time), str(total_time), str(total_time_s)
+        self.log_template_file.close()
+
+
+def main():
+    """
+    Runs the hybrid NAMD/GOMC simulation from the command line.
+    """
+    # import and read the users json file
+    [
+        json_filename,
+        namd_sim_order,
+        engine_mode,
+        namd_core_pinning,
+        namd_core_rebalance,
+        resume,
+    ] = _get_args()
+    print("json_filename = " + str(json_filename))
+    print("namd_sim_order = " + str(namd_sim_order))
+    print("engine_mode = " + str(engine_mode))
+
+    # just for testing , need to remove later
+    manual_testing_filename_input_override = False
+    if json_filename is None and manual_testing_filename_input_override is True:
+        json_filename = "user_input_NAMD_GOMC.json"
+
+    # standard name is "user_input_NAMD_GOMC.json"
+    config = HybridSimulationConfig.from_json_file(
+        json_filename,
+        namd_sim_order=namd_sim_order,
+        engine_mode=engine_mode,
+        namd_core_pinning=namd_core_pinning,
+        namd_core_rebalance=namd_core_rebalance,
+        resume=resume,
     )
-)
-log_template_file.write(str(write_log_data))
-print(str(write_log_data))
+    HybridSimulation(config).run()
+
 
-log_template_file.close()
+if __name__ == "__main__":
+    main()
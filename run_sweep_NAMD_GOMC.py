@@ -0,0 +1,620 @@
+import argparse
+import datetime
+import itertools
+import json
+import os
+import select
+import subprocess
+import sys
+
+from run_NAMD_GOMC import HybridSimulationConfig, LaunchedEngine
+
+
+# *************************************************
+# The python arguments that need to be selected to run the sweep (start)
+# *************************************************
+def _get_args():
+    arg_parser = argparse.ArgumentParser()
+
+    # get the filename with the user required input
+    arg_parser.add_argument(
+        "-f",
+        "--file",
+        help="Defines the variable inputs file used for the hybrid NAMD/GOMC "
+        "simulation sweep.  This file (i.e., the user_input_sweep_NAMD_GOMC.json "
+        "file) is required to run the sweep.",
+        type=str,
+    )
+
+    parser_arguments = arg_parser.parse_args()
+
+    # check to see if the file exists
+    if parser_arguments.file:
+        if os.path.exists(parser_arguments.file):
+            print(
+                "INFO: Reading data from <{}> file.".format(
+                    parser_arguments.file
+                )
+            )
+        else:
+            print(
+                "ERROR: Console file <{}> does not exist!".format(
+                    parser_arguments.file
+                )
+            )
+            sys.exit(1)
+
+    print("arg_parser.file = " + str(parser_arguments.file))
+    return parser_arguments.file
+
+
+# *************************************************
+# The python arguments that need to be selected to run the sweep (end)
+# *************************************************
+
+# the user input keys which are relative paths to the files and folders,
+# which are linked into each replica folder
+replica_path_key_list = [
+    "starting_ff_file_list_gomc",
+    "starting_ff_file_list_namd",
+    "starting_pdb_box_0_file",
+    "starting_psf_box_0_file",
+    "starting_pdb_box_1_file",
+    "starting_psf_box_1_file",
+    "namd2_bin_directory",
+    "gomc_bin_directory",
+]
+
+
+def get_sweep_parameter_list(sweep_parameter_grid):
+    """
+    Gets the user input values for each replica, which are all the
+    combinations of the values in the parameter grid.
+
+    Parameters
+    ----------
+    sweep_parameter_grid : dict, {str: list}
+        The user input keys (i.e., "simulation_temp_k") and the list of values
+        for each key (i.e., [298, 310, 320]).
+
+    Returns
+    ---------
+    sweep_parameter_list : list of dict
+        The user input keys and values for each replica, in the order of the
+        parameter grid, with the last key changing the fastest.
+    """
+    if isinstance(sweep_parameter_grid, dict) is False:
+        raise TypeError("The sweep_parameter_grid must be a dictionary.\n")
+
+    for parameter_key, parameter_values in sweep_parameter_grid.items():
+        if (
+            isinstance(parameter_values, list) is False
+            or len(parameter_values) == 0
+        ):
+            raise ValueError(
+                "The sweep_parameter_grid values must be a list with at least "
+                "one value, {} = {}.\n".format(parameter_key, parameter_values)
+            )
+
+    return [
+        dict(zip(sweep_parameter_grid.keys(), parameter_values))
+        for parameter_values in itertools.product(
+            *sweep_parameter_grid.values()
+        )
+    ]
+
+
+def get_replica_no_cores(replica_json_data):
+    """
+    Gets the number of CPU cores which the hybrid simulation uses, as
+    the run_NAMD_GOMC.py file uses them.
+
+    Parameters
+    ----------
+    replica_json_data : dict
+        The user input data of the replica.
+
+    Returns
+    ---------
+    int
+        The number of CPU cores, which is no_core_box_0 + no_core_box_1 for the
+        GEMC ensemble when both boxes are run in NAMD, and no_core_box_0
+        otherwise.
+    """
+    if (
+        replica_json_data["simulation_type"] in ["GEMC"]
+        and replica_json_data["only_use_box_0_for_namd_for_gemc"] is False
+    ):
+        return int(replica_json_data["no_core_box_0"]) + int(
+            replica_json_data["no_core_box_1"]
+        )
+
+    return int(replica_json_data["no_core_box_0"])
+
+
+def setup_replica_directory(
+    base_directory, replica_directory, replica_json_data
+):
+    """
+    Creates the replica folder, with the user input file and links to the
+    required_data folder and the other files and folders in the user input
+    file, so each replica is run in its own folder.
+
+    Parameters
+    ----------
+    base_directory : str
+        The path/directory which the relative paths in the user input
+        file are relative to.
+    replica_directory : str
+        The path/directory of the replica.
+    replica_json_data : dict
+        The user input data of the replica, which is written to the
+        user_input_NAMD_GOMC.json file in the replica folder.
+    """
+    os.makedirs(replica_directory, exist_ok=True)
+
+    replica_path_list = ["required_data"]
+    for path_key in replica_path_key_list:
+        path_values = replica_json_data.get(path_key)
+        if isinstance(path_values, str):
+            path_values = [path_values]
+        if isinstance(path_values, list):
+            replica_path_list += [
+                os.path.normpath(path_i).split(os.sep)[0]
+                for path_i in path_values
+                if isinstance(path_i, str) and not os.path.isabs(path_i)
+            ]
+
+    for replica_path_i in dict.fromkeys(replica_path_list):
+        replica_link_i = os.path.join(replica_directory, replica_path_i)
+        base_path_i = os.path.join(base_directory, replica_path_i)
+        if replica_path_i in ["", ".", ".."] or os.path.lexists(replica_link_i):
+            continue
+        if os.path.exists(base_path_i):
+            os.symlink(os.path.abspath(base_path_i), replica_link_i)
+
+    with open(
+        os.path.join(replica_directory, "user_input_NAMD_GOMC.json"), "w"
+    ) as replica_json_file:
+        json.dump(replica_json_data, replica_json_file, indent=1)
+
+
+class SweepReplica:
+    """
+    A hybrid NAMD/GOMC simulation in the sweep, which is run in its own
+    folder by the run_NAMD_GOMC.py file.
+
+    Parameters
+    ----------
+    replica_no : int
+        The replica number, starting at zero.
+    replica_directory : str
+        The path/directory of the replica.
+    sweep_parameters : dict
+        The user input keys and values which are changed for this replica.
+    no_cores : int
+        The number of CPU cores which the replica uses.
+    """
+
+    def __init__(
+        self, replica_no, replica_directory, sweep_parameters, no_cores
+    ):
+        self.replica_no = replica_no
+        self.replica_directory = replica_directory
+        self.sweep_parameters = sweep_parameters
+        self.no_cores = no_cores
+        self.cpu_list = []
+        self.exec_replica = None
+        self.start_time = None
+        self.run_time_s = None
+        self.exit_status = None
+
+    def start(self, run_namd_gomc_file, run_namd_gomc_flags, cpu_list):
+        """
+        Starts the replica hybrid simulation, without waiting for it to finish.
+
+        Parameters
+        ----------
+        run_namd_gomc_file : str
+            The path/filename of the run_NAMD_GOMC.py file.
+        run_namd_gomc_flags : list of str
+            The extra run_NAMD_GOMC.py flags (i.e., ["-namd_sims_order", "parallel"]).
+        cpu_list : list of int
+            The CPU cores which the replica is pinned to.  If empty, the
+            replica is not pinned.
+        """
+        run_command = [
+            sys.executable,
+            run_namd_gomc_file,
+            "-f",
+            "user_input_NAMD_GOMC.json",
+        ] + list(run_namd_gomc_flags)
+        self.cpu_list = cpu_list
+        self.start_time = datetime.datetime.today()
+        self.exec_replica = LaunchedEngine(
+            run_command,
+            cwd=self.replica_directory,
+            cpu_set=set(cpu_list) if len(cpu_list) > 0 else None,
+            output_filename="{}/run_NAMD_GOMC.out".format(
+                self.replica_directory
+            ),
+            stderr=subprocess.STDOUT,
+        )
+
+    def poll_done(self):
+        """
+        Checks if the replica hybrid simulation is finished, without waiting.
+
+        Returns
+        ---------
+        exit_status : int or None
+            The replica exit status (0 = successful), or None if the replica
+            is still running.
+        """
+        exit_status = self.exec_replica.poll_done()
+        if exit_status is not None and self.exit_status is None:
+            self.exit_status = exit_status
+            self.run_time_s = round(
+                (datetime.datetime.today() - self.start_time).total_seconds(), 6
+            )
+        return exit_status
+
+
+class SimulationSweep:
+    """
+    Runs many independent hybrid NAMD/GOMC simulations (replicas), which
+    are the same simulation with the user input values changed
+    (i.e., simulation_temp_k or GCMC_ChemPot_or_Fugacity_dict).
+    The replicas are run on a shared pool of CPU cores, and a new replica is
+    started as soon as there are enough free CPU cores, so all the CPU cores
+    are used while the replicas finish at different times.
+
+    Parameters
+    ----------
+    sweep_json_data : dict
+        The sweep user input data, which is normally read from the
+        user_input_sweep_NAMD_GOMC.json file.
+    python_file_directory : str, optional, default=None
+        The path/directory which the sweep is run from, and all the
+        relative paths in the user input files are relative to.
+        If None, the current working directory is used.
+
+    Notes
+    ---------
+    The sweep user input keys are:
+    base_user_input_file : str
+        The hybrid simulation user input file (user_input_NAMD_GOMC.json),
+        which is used for all the replicas.
+    sweep_parameter_grid : dict, {str: list}
+        The user input keys and the list of values for each key.  A replica is
+        run for every combination of the values.
+    sweep_directory : str, default="sweep"
+        The folder which the replica folders are created in.
+    total_no_cores : int or null, default=null
+        The number of CPU cores shared by the replicas.
+        If null, all the available CPU cores are used.
+    max_concurrent_replicas : int or null, default=null
+        The maximum number of replicas which are run at the same time.
+        If null, the number of replicas is only limited by the CPU cores.
+    pin_replica_cores : bool, default=true
+        Pin each replica to its own CPU cores (Linux only).
+    run_NAMD_GOMC_flags : list of str, default=[]
+        The extra run_NAMD_GOMC.py flags for all the replicas
+        (i.e., ["-namd_sims_order", "parallel"]).
+    """
+
+    def __init__(self, sweep_json_data, python_file_directory=None):
+        if python_file_directory is None:
+            python_file_directory = os.getcwd()
+
+        if isinstance(sweep_json_data, dict) is False:
+            raise TypeError("The sweep_json_data must be a dictionary.\n")
+
+        if "base_user_input_file" not in sweep_json_data.keys():
+            raise TypeError("The base_user_input_file key is not provided.\n")
+        base_user_input_file = sweep_json_data["base_user_input_file"]
+        if isinstance(base_user_input_file, str) is False:
+            raise TypeError("The base_user_input_file must be a string.\n")
+
+        if "sweep_parameter_grid" not in sweep_json_data.keys():
+            raise TypeError("The sweep_parameter_grid key is not provided.\n")
+        sweep_parameter_list = get_sweep_parameter_list(
+            sweep_json_data["sweep_parameter_grid"]
+        )
+
+        sweep_directory = sweep_json_data.get("sweep_directory", "sweep")
+        if isinstance(sweep_directory, str) is False:
+            raise TypeError("The sweep_directory must be a string.\n")
+
+        if hasattr(os, "sched_getaffinity"):
+            available_cpu_list = sorted(os.sched_getaffinity(0))
+        else:
+            available_cpu_list = list(range(os.cpu_count()))
+        total_no_cores = sweep_json_data.get("total_no_cores", None)
+        if total_no_cores is None:
+            total_no_cores = len(available_cpu_list)
+        if (
+            isinstance(total_no_cores, bool)
+            or not isinstance(total_no_cores, int)
+            or total_no_cores <= 0
+        ):
+            raise ValueError("The total_no_cores must be null or an int > 0.\n")
+
+        max_concurrent_replicas = sweep_json_data.get(
+            "max_concurrent_replicas", None
+        )
+        if max_concurrent_replicas is not None and (
+            isinstance(max_concurrent_replicas, bool)
+            or not isinstance(max_concurrent_replicas, int)
+            or max_concurrent_replicas <= 0
+        ):
+            raise ValueError(
+                "The max_concurrent_replicas must be null or an int > 0.\n"
+            )
+
+        pin_replica_cores = sweep_json_data.get("pin_replica_cores", True)
+        if isinstance(pin_replica_cores, bool) is False:
+            raise TypeError(
+                "The pin_replica_cores must be a bool (true or false).\n"
+            )
+        if pin_replica_cores is True and (
+            not hasattr(os, "sched_setaffinity")
+            or total_no_cores > len(available_cpu_list)
+        ):
+            print(
+                "WARNING: The replicas are not pinned to CPU cores, because "
+                "only {} CPU cores are available to pin, and total_no_cores "
+                "= {}.".format(len(available_cpu_list), total_no_cores)
+            )
+            pin_replica_cores = False
+
+        run_namd_gomc_flags = sweep_json_data.get("run_NAMD_GOMC_flags", [])
+        if isinstance(run_namd_gomc_flags, list) is False or False in [
+            isinstance(flag_i, str) for flag_i in run_namd_gomc_flags
+        ]:
+            raise TypeError(
+                "The run_NAMD_GOMC_flags must be a list of strings.\n"
+            )
+
+        with open(
+            os.path.join(python_file_directory, base_user_input_file)
+        ) as base_json_file:
+            base_json_data = json.load(base_json_file)
+
+        # check all the replica user inputs before any replica is run
+        no_zeros_replica_no = len(str(len(sweep_parameter_list) - 1))
+        self.replica_list = []
+        self.replica_json_data_list = []
+        for replica_no, sweep_parameters in enumerate(sweep_parameter_list):
+            replica_json_data = dict(base_json_data)
+            replica_json_data.update(sweep_parameters)
+            HybridSimulationConfig(
+                replica_json_data, python_file_directory=python_file_directory
+            )
+
+            replica_no_cores = get_replica_no_cores(replica_json_data)
+            if replica_no_cores > total_no_cores:
+                raise ValueError(
+                    "The replica {} uses {} CPU cores, which is more than "
+                    "the total_no_cores = {}.\n".format(
+                        replica_no, replica_no_cores, total_no_cores
+                    )
+                )
+
+            self.replica_list.append(
+                SweepReplica(
+                    replica_no,
+                    os.path.join(
+                        python_file_directory,
+                        sweep_directory,
+                        "replica_{}".format(
+                            str(replica_no).zfill(no_zeros_replica_no)
+                        ),
+                    ),
+                    sweep_parameters,
+                    replica_no_cores,
+                )
+            )
+            self.replica_json_data_list.append(replica_json_data)
+
+        self.python_file_directory = python_file_directory
+        self.sweep_directory = os.path.join(
+            python_file_directory, sweep_directory
+        )
+        self.total_no_cores = total_no_cores
+        self.max_concurrent_replicas = max_concurrent_replicas
+        self.pin_replica_cores = pin_replica_cores
+        self.run_namd_gomc_flags = run_namd_gomc_flags
+        if pin_replica_cores is True:
+            self.cpu_pool_list = available_cpu_list[0:total_no_cores]
+        else:
+            self.cpu_pool_list = []
+        self.run_namd_gomc_file = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "run_NAMD_GOMC.py"
+        )
+
+    @classmethod
+    def from_json_file(cls, json_filename, python_file_directory=None):
+        """
+        Reads the sweep user input json file and creates the sweep.
+
+        Parameters
+        ----------
+        json_filename : str
+            The path/filename of the json sweep user input file
+            (i.e., the user_input_sweep_NAMD_GOMC.json file).
+        python_file_directory : str, optional, default=None
+            The path/directory which the sweep is run from.
+            If None, the current working directory is used.
+
+        Returns
+        ---------
+        SimulationSweep
+            The validated simulation sweep.
+        """
+        with open(json_filename) as json_file:
+            sweep_json_data = json.load(json_file)
+
+        return cls(sweep_json_data, python_file_directory=python_file_directory)
+
+    def setup(self):
+        """
+        Creates the replica folders and writes the sweep_replicas.json file,
+        which lists the replica folders and their user input values.
+        """
+        for replica_i, replica_json_data in zip(
+            self.replica_list, self.replica_json_data_list
+        ):
+            setup_replica_directory(
+                self.python_file_directory,
+                replica_i.replica_directory,
+                replica_json_data,
+            )
+
+        with open(
+            os.path.join(self.sweep_directory, "sweep_replicas.json"), "w"
+        ) as replica_list_file:
+            json.dump(
+                {
+                    os.path.basename(replica_i.replica_directory): (
+                        replica_i.sweep_parameters
+                    )
+                    for replica_i in self.replica_list
+                },
+                replica_list_file,
+                indent=1,
+            )
+
+    def run(self, poll_time_s=0.5):
+        """
+        Runs all the replicas, starting a replica whenever there are enough
+        free CPU cores, until all the replicas are finished.
+
+        Parameters
+        ----------
+        poll_time_s : float, default=0.5
+            The time (s) between the checks for the replicas which can not be
+            waited on with a file descriptor.
+
+        Returns
+        ---------
+        failed_replica_list : list of SweepReplica
+            The replicas which did not finish successfully.
+        """
+        self.setup()
+
+        waiting_replica_list = list(self.replica_list)
+        running_replica_list = []
+        free_no_cores = self.total_no_cores
+        free_cpu_list = list(self.cpu_pool_list)
+        while len(waiting_replica_list) > 0 or len(running_replica_list) > 0:
+            # start the waiting replicas which fit in the free CPU cores,
+            # in order, so a smaller replica can use the cores which are too
+            # few for the next replica
+            for replica_i in list(waiting_replica_list):
+                if (
+                    self.max_concurrent_replicas is not None
+                    and len(running_replica_list)
+                    >= self.max_concurrent_replicas
+                ):
+                    break
+                if replica_i.no_cores > free_no_cores:
+                    continue
+
+                replica_cpu_list = free_cpu_list[0 : replica_i.no_cores]
+                del free_cpu_list[0 : replica_i.no_cores]
+                free_no_cores -= replica_i.no_cores
+                replica_i.start(
+                    self.run_namd_gomc_file,
+                    self.run_namd_gomc_flags,
+                    replica_cpu_list,
+                )
+                waiting_replica_list.remove(replica_i)
+                running_replica_list.append(replica_i)
+                print(
+                    "INFO: Started replica {} with {} CPU cores {}: {}".format(
+                        replica_i.replica_no,
+                        replica_i.no_cores,
+                        replica_cpu_list,
+                        replica_i.sweep_parameters,
+                    )
+                )
+
+            # wait for any of the running replicas to finish
+            replica_fileno_list = [
+                replica_i.exec_replica.fileno()
+                for replica_i in running_replica_list
+            ]
+            if len(replica_fileno_list) == 0:
+                continue
+            elif None in replica_fileno_list:
+                select.select([], [], [], poll_time_s)
+            else:
+                select.select(replica_fileno_list, [], [])
+
+            for replica_i in list(running_replica_list):
+                if replica_i.poll_done() is None:
+                    continue
+
+                running_replica_list.remove(replica_i)
+                free_no_cores += replica_i.no_cores
+                free_cpu_list = sorted(free_cpu_list + replica_i.cpu_list)
+                print(
+                    "INFO: Finished replica {} with exit status {} "
+                    "in {} s.".format(
+                        replica_i.replica_no,
+                        replica_i.exit_status,
+                        replica_i.run_time_s,
+                    )
+                )
+
+        self.write_sweep_data()
+
+        return [
+            replica_i
+            for replica_i in self.replica_list
+            if replica_i.exit_status != 0
+        ]
+
+    def write_sweep_data(self):
+        """
+        Writes the exit status and run time of each replica to the
+        sweep_replica_data.txt file.
+        """
+        with open(
+            os.path.join(self.sweep_directory, "sweep_replica_data.txt"), "w"
+        ) as sweep_data_file:
+            sweep_data_file.write(
+                "#Replica\tNo_cores\tExit_status\tTime_s\tParameters\n"
+            )
+            for replica_i in self.replica_list:
+                sweep_data_file.write(
+                    "{}\t{}\t{}\t{}\t{}\n".format(
+                        os.path.basename(replica_i.replica_directory),
+                        replica_i.no_cores,
+                        replica_i.exit_status,
+                        replica_i.run_time_s,
+                        json.dumps(replica_i.sweep_parameters),
+                    )
+                )
+
+
+def main():
+    """
+    Runs the hybrid NAMD/GOMC simulation sweep from the command line.
+    """
+    json_filename = _get_args()
+
+    # standard name is "user_input_sweep_NAMD_GOMC.json"
+    failed_replica_list = SimulationSweep.from_json_file(json_filename).run()
+    if len(failed_replica_list) > 0:
+        print(
+            "WARNING: The replica(s) {} did not finish successfully.".format(
+                [replica_i.replica_no for replica_i in failed_replica_list]
+            )
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,720 @@
+#!/usr/bin/env python
+"""
+A stub NAMD and GOMC engine for testing the hybrid NAMD/GOMC simulation
+scripts without NAMD or GOMC installed.
+
+The stub engine reads the NAMD or GOMC control file (in.conf) written by the
+run_NAMD_GOMC.py file, and writes the console output (energies, PME grid,
+total mass and statistics), the restart files, the dcd files, and the GCMC
+histogram and distribution files that the hybrid simulation and the
+combine_data_NAMD_GOMC.py file read.  The energies and coordinates are random
+numbers, so the simulation data is only for testing.
+
+The engine type is taken from the --engine flag, or from the name the stub
+is called as (i.e., a copy or link named namd2 is a NAMD engine and a copy or
+link named GOMC_CPU_GEMC is a GOMC engine).  For example, to run the hybrid
+simulation with the stub engine:
+
+    ln -s $PWD/stub_engine_NAMD_GOMC.py NAMD_bin_dir/namd2
+    ln -s $PWD/stub_engine_NAMD_GOMC.py GOMC_bin_dir/GOMC_CPU_GEMC
+
+The stub engine is run the same way as NAMD and GOMC
+(namd2 +pN in.conf > out.dat), in the 'launch' and 'batch' modes.  In the
+'resident' mode, the stub NAMD engine is started with the resident NAMD
+console script (see the ResidentNamdEngine class in run_NAMD_GOMC.py),
+and runs the NAMD control file of each simulation read from stdin, like the
+NAMD Tcl console.  Only the NAMD commands which are written by the
+run_NAMD_GOMC.py file are emulated.
+
+The environment variables STUB_ENGINE_STARTUP_S and STUB_ENGINE_S_PER_STEP
+set the engine startup time and the time per simulation step (seconds), so
+the engine startup and run times can be emulated.
+"""
+
+import argparse
+import os
+import random
+import shutil
+import struct
+import sys
+import time
+
+K_to_kcal_mol = 1.98720425864083 * 10 ** (-3)
+
+# the line the resident NAMD console script prints after each simulation
+resident_namd_done_label = "RESIDENT_NAMD_DONE:"
+
+namd_e_titles = [
+    "TS",
+    "BOND",
+    "ANGLE",
+    "DIHED",
+    "IMPRP",
+    "ELECT",
+    "VDW",
+    "BOUNDARY",
+    "MISC",
+    "KINETIC",
+    "TOTAL",
+    "TEMP",
+    "POTENTIAL",
+    "TOTAL3",
+    "TEMPAVG",
+    "PRESSURE",
+    "GPRESSURE",
+    "VOLUME",
+    "PRESSAVG",
+    "GPRESSAVG",
+]
+
+gomc_e_titles = [
+    "STEP",
+    "TOTAL",
+    "INTRA(B)",
+    "INTRA(NB)",
+    "INTER(LJ)",
+    "LRC",
+    "TOTAL_ELECT",
+    "REAL",
+    "RECIP",
+    "SELF",
+    "CORR",
+]
+
+gomc_stat_titles = ["STEP", "VOLUME", "PRESSURE", "TOTALMOL", "TOT_DENSITY"]
+
+
+def _get_args():
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument(
+        "--engine",
+        help="The engine type to emulate, 'namd' or 'gomc'.  If not provided, "
+        "it is taken from the name the stub engine is called as.",
+        type=str,
+        default=None,
+    )
+    arg_parser.add_argument(
+        "control_file",
+        help="The engine control file, or the resident NAMD console script.",
+        type=str,
+    )
+    # the charm++ style flags (i.e., +pN number of cores) are ignored
+    parser_arguments = arg_parser.parse_args(
+        [arg_i for arg_i in sys.argv[1:] if not arg_i.startswith("+")]
+    )
+
+    if parser_arguments.engine is None:
+        engine_name = os.path.basename(sys.argv[0]).lower()
+        if engine_name.startswith("gomc"):
+            parser_arguments.engine = "gomc"
+        else:
+            parser_arguments.engine = "namd"
+
+    if parser_arguments.engine not in ["namd", "gomc"]:
+        print(
+            "ERROR: The engine must be 'namd' or 'gomc', engine = <{}>.".format(
+                parser_arguments.engine
+            )
+        )
+        sys.exit(1)
+
+    return parser_arguments
+
+
+def read_control_file(control_file):
+    """
+    Reads the engine control file into a list of split lines.
+
+    Parameters
+    ----------
+    control_file : str
+        The path/filename of the engine control file.
+
+    Returns
+    ---------
+    control_file_lines : list
+        The split lines of the control file, without the empty lines.
+    """
+    control_file_lines = []
+    with open(control_file, "r") as control_data:
+        for line in control_data:
+            split_line = line.split()
+            if len(split_line) > 0 and not split_line[0].startswith("#"):
+                control_file_lines.append(split_line)
+    return control_file_lines
+
+
+def read_psf_atoms(psf_file):
+    """
+    Reads the number of atoms and the total mass from a psf file.
+
+    Parameters
+    ----------
+    psf_file : str
+        The path/filename of the psf file.
+
+    Returns
+    ---------
+    no_atoms : int
+        The number of atoms, which is 1 if the psf file can not be read.
+    total_mass_amu : float
+        The total mass of the atoms (amu).
+    """
+    no_atoms, total_mass_amu = 0, 0.0
+    if psf_file is None:
+        return 1, total_mass_amu
+    try:
+        with open(psf_file, "r") as psf_data:
+            for line in psf_data:
+                split_line = line.split()
+                if len(split_line) >= 2 and split_line[1] == "!NATOM":
+                    for _ in range(int(split_line[0])):
+                        total_mass_amu += float(psf_data.readline().split()[7])
+                        no_atoms += 1
+                    break
+    except (OSError, ValueError, IndexError):
+        pass
+
+    return max(no_atoms, 1), total_mass_amu
+
+
+def _write_xsc_file(xsc_file, step, box_dims):
+    with open(xsc_file, "w") as xsc_data:
+        xsc_data.write(
+            "# stub engine extended system\n"
+            "#$LABELS step a_x a_y a_z b_x b_y b_z c_x c_y c_z o_x o_y o_z\n"
+        )
+        xsc_data.write(
+            "{} {} 0 0 0 {} 0 0 0 {} {} {} {}\n".format(
+                step,
+                box_dims[0],
+                box_dims[1],
+                box_dims[2],
+                box_dims[0] / 2,
+                box_dims[1] / 2,
+                box_dims[2] / 2,
+            )
+        )
+
+
+def _read_xsc_box_dims(xsc_file):
+    with open(xsc_file, "r") as xsc_data:
+        split_line = [
+            line.split() for line in xsc_data if not line.startswith("#")
+        ][-1]
+    return [float(split_line[1]), float(split_line[5]), float(split_line[9])]
+
+
+def _write_dcd_record(dcd_data, record_bytes):
+    record_length = struct.pack("<i", len(record_bytes))
+    dcd_data.write(record_length + record_bytes + record_length)
+
+
+def write_dcd_file(dcd_file, no_frames, no_atoms, box_dims, first_step, steps):
+    """
+    Writes a CHARMM dcd file with a unit cell, where the atoms are put at
+    random coordinates in the box.
+
+    Parameters
+    ----------
+    dcd_file : str
+        The path/filename of the dcd file.
+    no_frames : int
+        The number of frames.
+    no_atoms : int
+        The number of atoms in each frame.
+    box_dims : list of float
+        The box x, y and z dimensions (Angstroms).
+    first_step : int
+        The step of the first frame (ISTART).
+    steps : int
+        The steps between the frames (NSAVC).
+    """
+    control_values = [0] * 20
+    control_values[0:4] = [no_frames, first_step, steps, no_frames * steps]
+    control_values[10] = 1
+    control_values[19] = 24
+    with open(dcd_file, "wb") as dcd_data:
+        _write_dcd_record(
+            dcd_data,
+            b"CORD"
+            + struct.pack("<9i", *control_values[:9])
+            + struct.pack("<f", 0.002)
+            + struct.pack("<10i", *control_values[10:]),
+        )
+        _write_dcd_record(
+            dcd_data,
+            struct.pack("<i", 1) + b"stub engine dcd file".ljust(80),
+        )
+        _write_dcd_record(dcd_data, struct.pack("<i", no_atoms))
+        for _ in range(no_frames):
+            _write_dcd_record(
+                dcd_data,
+                struct.pack(
+                    "<6d", box_dims[0], 90, box_dims[1], 90, 90, box_dims[2]
+                ),
+            )
+            for dim_i in box_dims:
+                _write_dcd_record(
+                    dcd_data,
+                    struct.pack(
+                        "<{}f".format(no_atoms),
+                        *[random.random() * dim_i for _ in range(no_atoms)]
+                    ),
+                )
+
+
+def new_namd_state():
+    """
+    Gets the NAMD settings and state, which are kept between the simulations
+    in the resident NAMD engine.
+
+    Returns
+    ---------
+    namd_state : dict
+        The NAMD settings and state.
+    """
+    return {
+        "structure": None,
+        "no_atoms": 1,
+        "total_mass_amu": 0.0,
+        "energy_steps": 1,
+        "dcd_steps": 0,
+        "outputname": "namdOut",
+        "step": 0,
+        "box_dims": [1.0, 1.0, 1.0],
+        "pme_grid_dims": [1, 1, 1],
+    }
+
+
+def run_namd_steps(namd_state, run_steps, minimize_steps, console_output):
+    """
+    Emulates the NAMD minimization and run steps, writing the energies to
+    the NAMD console output, and the NAMD restart and dcd files.
+
+    Parameters
+    ----------
+    namd_state : dict
+        The NAMD settings and state (see the new_namd_state function).
+    run_steps : int
+        The number of NAMD run steps.
+    minimize_steps : int
+        The number of NAMD minimization steps.
+    console_output : file object
+        The file object which the NAMD console output is written to.
+    """
+    total_steps = run_steps + minimize_steps
+    s_per_step = float(os.environ.get("STUB_ENGINE_S_PER_STEP", "0"))
+
+    first_step = namd_state["step"]
+    box_dims = namd_state["box_dims"]
+    if minimize_steps > 0:
+        console_output.write(
+            "TCL: Minimizing for {} steps\n".format(minimize_steps)
+        )
+    if run_steps > 0:
+        console_output.write("TCL: Running for {} steps\n".format(run_steps))
+    console_output.write("ETITLE:      " + "  ".join(namd_e_titles) + "\n")
+    for step_i in range(
+        first_step, first_step + total_steps + 1, namd_state["energy_steps"]
+    ):
+        # the steps are run between the printed energies
+        if step_i > first_step:
+            time.sleep(namd_state["energy_steps"] * s_per_step)
+        e_elect = -1000.0 + random.random()
+        e_vdw = 100.0 + random.random()
+        e_potential = e_elect + e_vdw + 10.0
+        e_values = [step_i, 1, 2, 3, 4, e_elect, e_vdw, 0, 0, 10]
+        e_values += [e_potential + 10, 298, e_potential, 0, 298, 1, 1]
+        e_values += [box_dims[0] * box_dims[1] * box_dims[2], 1, 1]
+        console_output.write(
+            "ENERGY: " + "  ".join(str(value_i) for value_i in e_values) + "\n"
+        )
+        console_output.flush()
+    namd_state["step"] = first_step + total_steps
+
+    outputname = namd_state["outputname"]
+    _write_xsc_file(
+        "{}.restart.xsc".format(outputname), namd_state["step"], box_dims
+    )
+    for restart_extension in ["coor", "vel"]:
+        with open(
+            "{}.restart.{}".format(outputname, restart_extension), "w"
+        ) as file:
+            file.write("stub engine restart file\n")
+    if namd_state["dcd_steps"] > 0:
+        write_dcd_file(
+            "{}.dcd".format(outputname),
+            total_steps // namd_state["dcd_steps"],
+            namd_state["no_atoms"],
+            box_dims,
+            first_step + namd_state["dcd_steps"],
+            namd_state["dcd_steps"],
+        )
+
+
+def run_namd(control_file, console_output, namd_state=None):
+    """
+    Emulates a NAMD simulation, writing the NAMD console output and the
+    NAMD restart and dcd files in the current directory.
+
+    Parameters
+    ----------
+    control_file : str
+        The path/filename of the NAMD control file.
+    console_output : file object
+        The file object which the NAMD console output is written to.
+    namd_state : dict, optional, default=None
+        The NAMD settings and state, which are kept between the simulations
+        in the resident NAMD engine.  If None, a new NAMD engine is started.
+    """
+    if namd_state is None:
+        namd_state = new_namd_state()
+
+    namd_run_steps = 0
+    namd_minimize_steps = 0
+    namd_restart = False
+    box_dims = namd_state["box_dims"]
+    pme_grid_dims = namd_state["pme_grid_dims"]
+    for split_line in read_control_file(control_file):
+        if split_line[0] == "structure" and len(split_line) >= 2:
+            namd_state["structure"] = split_line[1]
+        elif split_line[0] == "outputEnergies" and len(split_line) >= 2:
+            namd_state["energy_steps"] = max(1, int(split_line[1]))
+        elif split_line[0] == "dcdfreq" and len(split_line) >= 2:
+            namd_state["dcd_steps"] = int(split_line[1])
+        elif split_line[0] == "firsttimestep" and len(split_line) >= 2:
+            namd_state["step"] = int(split_line[1])
+        elif split_line[0] == "set" and len(split_line) >= 3:
+            set_name, set_value = split_line[1], split_line[2]
+            if set_name == "NAMD_RUN_STEPS":
+                namd_run_steps = int(set_value)
+            elif set_name == "NAMD_MINIMIZE":
+                namd_minimize_steps = int(set_value)
+            elif set_name == "RESTART_STATUS":
+                namd_restart = set_value.lower() in ["true", "yes", "on", "1"]
+            elif set_name == "outputname":
+                namd_state["outputname"] = set_value
+            elif set_name in ["X_DIM_box", "Y_DIM_box", "Z_DIM_box"]:
+                box_dims[["X", "Y", "Z"].index(set_name[0])] = float(set_value)
+            elif set_name in [
+                "PME_Grid_Size_X",
+                "PME_Grid_Size_Y",
+                "PME_Grid_Size_Z",
+            ]:
+                try:
+                    pme_grid_dims[["X", "Y", "Z"].index(set_name[-1])] = int(
+                        set_value
+                    )
+                except ValueError:
+                    pme_grid_dims[["X", "Y", "Z"].index(set_name[-1])] = int(
+                        box_dims[["X", "Y", "Z"].index(set_name[-1])]
+                    )
+
+    # NAMD prints the system information once, when the engine starts
+    time.sleep(float(os.environ.get("STUB_ENGINE_STARTUP_S", "0")))
+    (
+        namd_state["no_atoms"],
+        namd_state["total_mass_amu"],
+    ) = read_psf_atoms(namd_state["structure"])
+    console_output.write(
+        "Info: PME GRID DIMENSIONS {} {} {}\n".format(*pme_grid_dims)
+    )
+    console_output.write(
+        "Info: TOTAL MASS = {} amu\n".format(namd_state["total_mass_amu"])
+    )
+
+    # NAMD only minimizes when it is not restarted
+    if namd_restart is True:
+        namd_minimize_steps = 0
+    run_namd_steps(
+        namd_state, namd_run_steps, namd_minimize_steps, console_output
+    )
+    if not any(
+        file_i.startswith("FFTW_NAMD") for file_i in sorted(os.listdir("."))
+    ):
+        with open("FFTW_NAMD_stub_engine.txt", "w") as fft_file:
+            fft_file.write("stub engine FFT plan\n")
+
+
+def run_namd_resident(control_file, console_output, namd_state):
+    """
+    Emulates the NAMD commands which continue a simulation in the
+    resident NAMD engine (outputname, firsttimestep, reinitatoms and run).
+
+    Parameters
+    ----------
+    control_file : str
+        The path/filename of the NAMD control file.
+    console_output : file object
+        The file object which the NAMD console output is written to.
+    namd_state : dict
+        The NAMD settings and state of the resident NAMD engine.
+    """
+    for split_line in read_control_file(control_file):
+        if split_line[0] == "outputname" and len(split_line) >= 2:
+            namd_state["outputname"] = split_line[1]
+        elif split_line[0] == "firsttimestep" and len(split_line) >= 2:
+            namd_state["step"] = int(split_line[1])
+        elif split_line[0] == "reinitatoms" and len(split_line) >= 2:
+            for restart_extension in ["coor", "vel"]:
+                if not os.path.exists(
+                    "{}.{}".format(split_line[1], restart_extension)
+                ):
+                    raise FileNotFoundError(
+                        "The {}.{} file does not exist.".format(
+                            split_line[1], restart_extension
+                        )
+                    )
+            namd_state["box_dims"] = _read_xsc_box_dims(
+                "{}.xsc".format(split_line[1])
+            )
+        elif split_line[0] == "run" and len(split_line) >= 2:
+            run_namd_steps(namd_state, int(split_line[1]), 0, console_output)
+        else:
+            raise ValueError(
+                "The resident NAMD command <{}> is not emulated.".format(
+                    " ".join(split_line)
+                )
+            )
+
+
+def run_namd_console(console_output):
+    """
+    Emulates the resident NAMD console script, which reads the NAMD control
+    file of each simulation from stdin, runs it in its run directory and
+    prints the exit status after it is finished.
+
+    Parameters
+    ----------
+    console_output : file object
+        The file object which the NAMD console output is written to.
+    """
+    namd_state = None
+    for stdin_line in sys.stdin:
+        control_file = stdin_line.strip()
+        if control_file == "EXIT":
+            break
+
+        os.chdir(os.path.dirname(control_file))
+        exit_status = 0
+        try:
+            if namd_state is None:
+                namd_state = new_namd_state()
+                run_namd(
+                    os.path.basename(control_file), console_output, namd_state
+                )
+            else:
+                run_namd_resident(
+                    os.path.basename(control_file), console_output, namd_state
+                )
+        except (OSError, ValueError) as resident_error:
+            console_output.write("ERROR: {}\n".format(resident_error))
+            exit_status = 1
+        console_output.write(
+            "{} {}\n".format(resident_namd_done_label, exit_status)
+        )
+        console_output.flush()
+
+
+def run_gomc(control_file, console_output):
+    """
+    Emulates a GOMC simulation, writing the GOMC console output and the
+    GOMC restart, dcd, histogram and distribution files in the current
+    directory.
+
+    Parameters
+    ----------
+    control_file : str
+        The path/filename of the GOMC control file.
+    console_output : file object
+        The file object which the GOMC console output is written to.
+    """
+    time.sleep(float(os.environ.get("STUB_ENGINE_STARTUP_S", "0")))
+
+    gomc_run_steps = 0
+    gomc_energy_steps = 1
+    gomc_dcd_steps = 0
+    gomc_hist_steps = 0
+    gcmc_ensemble = False
+    output_name = "Output_data"
+    hist_name, dist_name = "his", "dis"
+    box_numbers = [0]
+    box_dims = {0: [1.0, 1.0, 1.0], 1: [1.0, 1.0, 1.0]}
+    psf_files = {}
+    for split_line in read_control_file(control_file):
+        if split_line[0] == "RunSteps":
+            gomc_run_steps = int(split_line[1])
+        elif split_line[0] == "ConsoleFreq" and len(split_line) >= 3:
+            gomc_energy_steps = max(1, int(split_line[2]))
+        elif split_line[0] == "DCDFreq" and len(split_line) >= 3:
+            if split_line[1].lower() == "true":
+                gomc_dcd_steps = max(1, int(split_line[2]))
+        elif split_line[0] == "HistogramFreq" and len(split_line) >= 3:
+            if split_line[1].lower() == "true":
+                gomc_hist_steps = max(1, int(split_line[2]))
+        elif split_line[0] in ["ChemPot", "Fugacity"]:
+            gcmc_ensemble = True
+        elif split_line[0] == "OutputName" and len(split_line) >= 2:
+            output_name = split_line[1]
+        elif split_line[0] == "HistName" and len(split_line) >= 2:
+            hist_name = split_line[1]
+        elif split_line[0] == "DistName" and len(split_line) >= 2:
+            dist_name = split_line[1]
+        elif split_line[0] == "Structure" and len(split_line) >= 3:
+            psf_files[int(split_line[1])] = split_line[2]
+        elif split_line[0] == "Coordinates" and split_line[1] == "1":
+            box_numbers = [0, 1]
+        elif (
+            split_line[0].startswith("CellBasisVector") and len(split_line) >= 5
+        ):
+            box_number_i = int(split_line[1])
+            vector_i = int(split_line[0][-1]) - 1
+            try:
+                box_dims[box_number_i][vector_i] = float(
+                    split_line[2 + vector_i]
+                )
+            except ValueError:
+                pass
+
+    s_per_step = float(os.environ.get("STUB_ENGINE_S_PER_STEP", "0"))
+
+    console_output.write("ETITLE:      " + "  ".join(gomc_e_titles) + "\n")
+    console_output.write("STITLE:      " + "  ".join(gomc_stat_titles) + "\n")
+    for step_i in range(0, gomc_run_steps + 1, gomc_energy_steps):
+        # the steps are run between the printed energies
+        if step_i > 0:
+            time.sleep(gomc_energy_steps * s_per_step)
+        for box_number_i in box_numbers:
+            e_elect = (-1000.0 + random.random()) / K_to_kcal_mol
+            e_inter_lj = (100.0 + random.random()) / K_to_kcal_mol
+            e_values = [step_i, e_elect + e_inter_lj, 0, 0, e_inter_lj, 0]
+            e_values += [e_elect, e_elect, 0, 0, 0]
+            console_output.write(
+                "ENER_{}:     ".format(box_number_i)
+                + "  ".join(str(value_i) for value_i in e_values)
+                + "\n"
+            )
+            volume = (
+                box_dims[box_number_i][0]
+                * box_dims[box_number_i][1]
+                * box_dims[box_number_i][2]
+            )
+            console_output.write(
+                "STAT_{}:     {}  {}  1.0  900  1000.0\n".format(
+                    box_number_i, step_i, volume
+                )
+            )
+        console_output.flush()
+
+    for box_number_i in box_numbers:
+        _write_xsc_file(
+            "{}_BOX_{}_restart.xsc".format(output_name, box_number_i),
+            gomc_run_steps,
+            box_dims[box_number_i],
+        )
+        with open(
+            "{}_BOX_{}_restart.pdb".format(output_name, box_number_i), "w"
+        ) as pdb_file:
+            pdb_file.write(
+                "CRYST1{:9.3f}{:9.3f}{:9.3f}  90.00  90.00  90.00 P 1           1\n"
+                "END\n".format(*box_dims[box_number_i])
+            )
+        # the molecules are not moved between the boxes, so the restart
+        # psf file is the same as the starting psf file
+        restart_psf_file = "{}_BOX_{}_restart.psf".format(
+            output_name, box_number_i
+        )
+        if box_number_i in psf_files and os.path.exists(
+            psf_files[box_number_i]
+        ):
+            shutil.copyfile(psf_files[box_number_i], restart_psf_file)
+        else:
+            with open(restart_psf_file, "w") as file:
+                file.write("stub engine restart file\n")
+        for restart_extension in ["coor", "vel"]:
+            with open(
+                "{}_BOX_{}_restart.{}".format(
+                    output_name, box_number_i, restart_extension
+                ),
+                "w",
+            ) as file:
+                file.write("stub engine restart file\n")
+
+        # GOMC writes the starting coordinates as the first dcd frame
+        if gomc_dcd_steps > 0:
+            write_dcd_file(
+                "{}_BOX_{}.dcd".format(output_name, box_number_i),
+                gomc_run_steps // gomc_dcd_steps + 1,
+                read_psf_atoms(psf_files.get(box_number_i))[0],
+                box_dims[box_number_i],
+                0,
+                gomc_dcd_steps,
+            )
+    with open("{}_restart.chk".format(output_name), "w") as checkpoint_file:
+        checkpoint_file.write("stub engine checkpoint file\n")
+    if 0 in psf_files and os.path.exists(psf_files[0]):
+        shutil.copyfile(psf_files[0], "{}_merged.psf".format(output_name))
+
+    if gcmc_ensemble is True and gomc_hist_steps > 0:
+        with open("{}1a.dat".format(hist_name), "w") as hist_file:
+            hist_file.write("T mu_1 x y z\n")
+            for _ in range(gomc_run_steps // gomc_hist_steps):
+                hist_file.write(
+                    "{} {}\n".format(
+                        random.randint(880, 920), -1000.0 + random.random()
+                    )
+                )
+        with open("n1{}1a.dat".format(dist_name), "w") as dist_file:
+            for no_molecules in range(880, 921):
+                dist_file.write(
+                    "{} {}\n".format(no_molecules, random.randint(0, 100))
+                )
+
+
+def run_simulation(engine, run_directory, control_file, console_output):
+    """
+    Runs the emulated NAMD or GOMC simulation in the run directory.
+
+    Parameters
+    ----------
+    engine : str
+        The engine type, 'namd' or 'gomc'.
+    run_directory : str
+        The directory which the simulation is run in.
+    control_file : str
+        The control file in the run directory.
+    console_output : file object
+        The file object which the console output is written to.
+    """
+    start_directory = os.getcwd()
+    os.chdir(run_directory)
+    try:
+        if engine == "namd":
+            run_namd(control_file, console_output)
+        else:
+            run_gomc(control_file, console_output)
+    finally:
+        os.chdir(start_directory)
+
+
+def main():
+    parser_arguments = _get_args()
+
+    # the resident NAMD console script reads the control files from stdin
+    if parser_arguments.engine == "namd":
+        with open(parser_arguments.control_file, "r") as control_data:
+            if "gets stdin" in control_data.read():
+                run_namd_console(sys.stdout)
+                return
+
+    run_simulation(
+        parser_arguments.engine,
+        ".",
+        parser_arguments.control_file,
+        sys.stdout,
+    )
+
+
+if __name__ == "__main__":
+    main()